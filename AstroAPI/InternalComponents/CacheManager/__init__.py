@@ -0,0 +1,4 @@
+from .cache import response_cache, ResponseCache
+from .id_map import id_map, IDMap
+from .single_flight import single_flight, SingleFlight
+from .batcher import Batcher
\ No newline at end of file
@@ -0,0 +1,93 @@
+from contextvars import Context
+import asyncio
+
+
+
+"""
+	--- THE BATCHERS ---
+
+	Converting a playlist means looking up dozens of IDs on the same service at the same time,
+	and one request per ID gets slow (and rate limited) fast, even though some services can
+	look up a whole bunch of IDs in a single request (Spotify's `/tracks?ids=`, iTunes'
+	`/lookup?id=a,b,c`).
+
+	A batcher collects the IDs that get looked up within a few milliseconds of each other
+	(grouped by whatever has to be the same for all of them, like the country code) and fetches
+	them all with one bulk request. Everyone gets the raw data of their own ID back, and builds
+	their media object out of it like they would have from a single lookup.
+
+	IDs the bulk request didn't return (or a bulk request that failed) come back as None, and
+	their lookups go on with a regular single request, which takes care of reporting what went
+	wrong. The response cache and single-flight registry sit in front of the lookups like always,
+	so only IDs that actually have to go to the upstream end up in a batch.
+"""
+
+
+
+default_window = 0.005 # Seconds a batch waits for more IDs before it gets fetched
+
+
+
+class Batcher:
+	def __init__(self, fetch, max_size: int, window: float = default_window):
+		"""
+			:param fetch: Async function that takes a group and a list of IDs, and returns a dict of the data it found for each of them.
+			:param max_size: The most IDs the bulk request can take, full batches get fetched right away.
+			:param window: Seconds a batch waits for more IDs before it gets fetched.
+		"""
+		self.fetch = fetch
+		self.max_size = max_size
+		self.window = window
+		self.pending = {}
+		self.tasks = set()
+		self.stats = {
+			'batches': 0,
+			'ids': 0,
+			'failed_batches': 0
+		}
+
+	async def load(self, id: str, group: str = None) -> object | None:
+		"""
+			Get the raw data of an ID from a bulk request, or None if the bulk request didn't have it.
+
+			:param id: The ID.
+			:param group: IDs only get batched with IDs of the same group.
+		"""
+		loop = asyncio.get_running_loop()
+		batch = self.pending.get(group)
+		if batch is None:
+			batch = {}
+			self.pending[group] = batch
+			loop.call_later(self.window, self.flush, group, batch)
+
+		future = batch.get(id)
+		if future is None:
+			future = loop.create_future()
+			batch[id] = future
+			if len(batch) >= self.max_size:
+				self.flush(group, batch)
+		# Someone giving up on their lookup shouldn't cancel it for everyone else waiting on the same ID
+		return await asyncio.shield(future)
+
+	def flush(self, group: str, batch: dict) -> None:
+		# Full batches get flushed before their timer goes off, the timer shouldn't flush them again
+		if self.pending.get(group) is not batch:
+			return
+		del self.pending[group]
+		# The batch belongs to everyone in it, so it doesn't run in the context (stage timer, stream listener) of whoever happened to start it
+		task = asyncio.create_task(self.run(group, batch), context = Context())
+		self.tasks.add(task)
+		task.add_done_callback(self.tasks.discard)
+
+	async def run(self, group: str, batch: dict) -> None:
+		ids = list(batch)
+		self.stats['batches'] += 1
+		self.stats['ids'] += len(ids)
+		try:
+			results = await self.fetch(group, ids)
+		except Exception:
+			self.stats['failed_batches'] += 1
+			results = {}
+		for id, future in batch.items():
+			if not future.done():
+				future.set_result(results.get(id))
@@ -0,0 +1,255 @@
+from AstroAPI.InternalComponents.Legacy.ini import config
+from AstroAPI.InternalComponents.SessionManager import executor_manager
+from .single_flight import single_flight
+from .keys import request_key
+from collections import OrderedDict
+from functools import wraps
+from time import time
+import threading
+import inspect
+import sqlite3
+import pickle
+import zlib
+
+
+
+"""
+	--- THE RESPONSE CACHE ---
+
+	The same chart songs get linked thousands of times a day, and without a cache every
+	single one of those goes all the way to the upstream service.
+
+	The response cache sits in front of each service's search and lookup components. It keys
+	results by the normalized request (the same parameters the component puts in its request
+	dict) and stores them pickled and compressed in two tiers:
+
+	  1. An in-process LRU with a TTL, per uvicorn worker
+	  2. An optional on-disk SQLite database shared by every worker on the machine
+	     (toggled by `disk` in the [cache] section of config.ini)
+
+	Empty responses are cached too, but only for a short while, since the upstream might just
+	be having a moment. Errors are never cached. Every hit hands out a fresh copy, so nobody
+	can mess with the cached object. Components opt in with:
+
+		@response_cache.cached(service)
+		async def search_song(...):
+			...
+"""
+
+
+
+ttl = 6 * 60 * 60 # Seconds a result stays cached
+negative_ttl = 5 * 60 # Seconds an empty response stays cached
+memory_entries = 10000 # Maximum amount of results in the in-process tier
+disk_purge_interval = 1000 # Expired results get purged from disk every this many stores
+
+disk_enabled = config.getboolean('cache', 'disk', fallback = False)
+disk_path = config.get('cache', 'disk_path', fallback = 'AstroAPI/cache.sqlite3')
+
+
+
+class MemoryTier:
+	def __init__(self, max_entries: int):
+		self.max_entries = max_entries
+		self.entries = OrderedDict()
+
+	def get(self, key: str) -> tuple[bytes, float] | None:
+		entry = self.entries.get(key)
+		if entry is None:
+			return None
+		self.entries.move_to_end(key)
+		return entry
+
+	def set(self, key: str, value: bytes, expires: float) -> int:
+		"""
+			Store a value and return how many entries had to be evicted to make room for it.
+		"""
+		self.entries[key] = (value, expires)
+		self.entries.move_to_end(key)
+		evicted = 0
+		while len(self.entries) > self.max_entries:
+			self.entries.popitem(last = False)
+			evicted += 1
+		return evicted
+
+	def delete(self, key: str) -> None:
+		self.entries.pop(key, None)
+
+	def clear(self) -> None:
+		self.entries.clear()
+
+
+
+class DiskTier:
+	def __init__(self, path: str):
+		self.path = path
+		self.local = threading.local() # SQLite connections can't be shared between threads
+
+	@property
+	def connection(self) -> sqlite3.Connection:
+		connection = getattr(self.local, 'connection', None)
+		if connection is None:
+			connection = sqlite3.connect(self.path, timeout = 5)
+			connection.execute('PRAGMA journal_mode = WAL') # Lets every worker read while one writes
+			connection.execute('PRAGMA synchronous = NORMAL')
+			connection.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL)')
+			connection.commit()
+			self.local.connection = connection
+		return connection
+
+	def get(self, key: str) -> tuple[bytes, float] | None:
+		row = self.connection.execute('SELECT value, expires FROM cache WHERE key = ?', (key,)).fetchone()
+		return (row[0], row[1]) if row is not None else None
+
+	def set(self, key: str, value: bytes, expires: float) -> None:
+		with self.connection as connection:
+			connection.execute('INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)', (key, value, expires))
+
+	def delete(self, key: str) -> None:
+		with self.connection as connection:
+			connection.execute('DELETE FROM cache WHERE key = ?', (key,))
+
+	def purge(self) -> int:
+		"""
+			Delete every expired result and return how many there were.
+		"""
+		with self.connection as connection:
+			return connection.execute('DELETE FROM cache WHERE expires <= ?', (time(),)).rowcount
+
+	def clear(self) -> None:
+		with self.connection as connection:
+			connection.execute('DELETE FROM cache')
+
+
+
+class ResponseCache:
+	def __init__(self):
+		self.memory = MemoryTier(memory_entries)
+		self.disk = DiskTier(disk_path) if disk_enabled else None
+		self.stores = 0
+		self.stats = {
+			'hits': 0,
+			'memory_hits': 0,
+			'disk_hits': 0,
+			'misses': 0,
+			'stores': 0,
+			'negative_stores': 0,
+			'evictions': 0,
+			'expirations': 0,
+			'errors': 0
+		}
+
+	async def get(self, key: str) -> object | None:
+		"""
+			Get a cached result, or None if there isn't a fresh one in either tier.
+
+			:param key: The cache key.
+		"""
+		now = time()
+		entry = self.memory.get(key)
+		tier = 'memory_hits'
+		if entry is not None and entry[1] <= now:
+			self.memory.delete(key)
+			self.stats['expirations'] += 1
+			entry = None
+
+		if entry is None and self.disk is not None:
+			try:
+				entry = await executor_manager.run('cache', self.disk.get, key)
+			except Exception:
+				self.stats['errors'] += 1
+				entry = None
+			tier = 'disk_hits'
+			if entry is not None and entry[1] <= now:
+				self.stats['expirations'] += 1
+				entry = None
+			elif entry is not None:
+				# Pull it into memory so the next one doesn't have to go to disk
+				self.stats['evictions'] += self.memory.set(key, entry[0], entry[1])
+
+		if entry is None:
+			self.stats['misses'] += 1
+			return None
+
+		try:
+			result = pickle.loads(zlib.decompress(entry[0]))
+		except Exception:
+			self.stats['errors'] += 1
+			self.stats['misses'] += 1
+			self.memory.delete(key)
+			return None
+		self.stats['hits'] += 1
+		self.stats[tier] += 1
+		return result
+
+	async def set(self, key: str, result: object) -> None:
+		"""
+			Cache a result. Errors are skipped and empty responses get the short TTL.
+
+			:param key: The cache key.
+			:param result: The media object to cache.
+		"""
+		if result.type == 'error':
+			return
+		try:
+			value = zlib.compress(pickle.dumps(result, protocol = pickle.HIGHEST_PROTOCOL))
+		except Exception:
+			self.stats['errors'] += 1
+			return
+
+		is_empty = result.type == 'empty_response'
+		expires = time() + (negative_ttl if is_empty else ttl)
+		self.stats['evictions'] += self.memory.set(key, value, expires)
+		self.stats['negative_stores' if is_empty else 'stores'] += 1
+
+		if self.disk is not None:
+			self.stores += 1
+			try:
+				await executor_manager.run('cache', self.disk.set, key, value, expires)
+				if self.stores % disk_purge_interval == 0:
+					self.stats['expirations'] += await executor_manager.run('cache', self.disk.purge)
+			except Exception:
+				self.stats['errors'] += 1
+
+	async def clear(self) -> None:
+		"""
+			Throw out every cached result in both tiers.
+		"""
+		self.memory.clear()
+		if self.disk is not None:
+			await executor_manager.run('cache', self.disk.clear)
+
+	async def fetch(self, key: str, function, *args, **kwargs) -> object:
+		result = await function(*args, **kwargs)
+		await self.set(key, result)
+		return result
+
+	def cached(self, service: str):
+		"""
+			Decorator that puts the cache in front of a search or lookup component.
+
+			:param service: The service the component belongs to.
+		"""
+		def decorator(function):
+			signature = inspect.signature(function)
+
+			@wraps(function)
+			async def wrapper(*args, **kwargs):
+				# Build the same request dict the component builds for itself
+				arguments = signature.bind(*args, **kwargs)
+				arguments.apply_defaults()
+				key = request_key(service, {'request': function.__name__, **arguments.arguments})
+
+				result = await self.get(key)
+				if result is not None:
+					return result
+				# Identical requests that miss at the same time share one trip to the upstream
+				return await single_flight.run(key, self.fetch, key, function, *args, **kwargs)
+			return wrapper
+		return decorator
+
+
+
+response_cache = ResponseCache()
+
+print('[ServiceCatalogAPI] Response cache initialized')
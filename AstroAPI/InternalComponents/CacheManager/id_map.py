@@ -0,0 +1,165 @@
+from AstroAPI.InternalComponents.Legacy.ini import config
+from AstroAPI.InternalComponents.SessionManager import executor_manager
+from time import time
+import threading
+import sqlite3
+
+
+
+"""
+	--- THE ID MAP ---
+
+	Converting a link from one service to the others is by far the most common thing people
+	use Astro for, and the same links get converted over and over again. Every time, the
+	Global Interface looks the song up and then searches every other service for it.
+
+	The ID map remembers which IDs across services point to the same song, music video or
+	collection (per country, since catalogs differ between storefronts). It gets filled in by
+	every successful Global Interface result, and Global Interface lookups check it first, so
+	they can do point lookups by ID instead of searching, and only search the services whose
+	IDs are missing or stale.
+
+	The map lives in a SQLite database, so it survives restarts and is shared by every worker.
+"""
+
+
+
+stale_after = 30 * 24 * 60 * 60 # Seconds after which a mapped ID isn't trusted anymore and gets searched for again
+id_map_path = config.get('cache', 'id_map_path', fallback = 'AstroAPI/id_map.sqlite3')
+
+
+
+class IDMap:
+	def __init__(self, path: str):
+		self.path = path
+		self.local = threading.local() # SQLite connections can't be shared between threads
+		self.stats = {
+			'hits': 0,
+			'misses': 0,
+			'records': 0,
+			'forgotten': 0,
+			'errors': 0
+		}
+
+	@property
+	def connection(self) -> sqlite3.Connection:
+		connection = getattr(self.local, 'connection', None)
+		if connection is None:
+			connection = sqlite3.connect(self.path, timeout = 5)
+			connection.execute('PRAGMA journal_mode = WAL')
+			connection.execute('PRAGMA synchronous = NORMAL')
+			connection.execute('''
+				CREATE TABLE IF NOT EXISTS id_map (
+					media_type TEXT NOT NULL,
+					country_code TEXT NOT NULL,
+					service TEXT NOT NULL,
+					id TEXT NOT NULL,
+					entity TEXT NOT NULL,
+					updated REAL NOT NULL,
+					PRIMARY KEY (media_type, country_code, service, id)
+				)
+			''')
+			connection.execute('CREATE INDEX IF NOT EXISTS id_map_entity ON id_map (entity)')
+			connection.commit()
+			self.local.connection = connection
+		return connection
+
+	def get_sync(self, media_type: str, service: str, id: str, country_code: str) -> dict:
+		rows = self.connection.execute(
+			'''
+				SELECT service, id, updated FROM id_map
+				WHERE entity = (SELECT entity FROM id_map WHERE media_type = ? AND country_code = ? AND service = ? AND id = ?)
+				AND updated > ?
+				ORDER BY updated
+			''',
+			(media_type, country_code, service, id, time() - stale_after)
+		).fetchall()
+		# If a service has more than one ID mapped, the newest one wins
+		return {row[0]: row[1] for row in rows}
+
+	def record_sync(self, media_type: str, ids: dict, country_code: str) -> None:
+		with self.connection as connection:
+			entities = []
+			for service, id in ids.items():
+				row = connection.execute(
+					'SELECT entity FROM id_map WHERE media_type = ? AND country_code = ? AND service = ? AND id = ?',
+					(media_type, country_code, service, id)
+				).fetchone()
+				if row is not None and row[0] not in entities:
+					entities.append(row[0])
+
+			# If some of these IDs were known under different entities, they're all the same thing, so merge them
+			service, id = next(iter(ids.items()))
+			entity = entities[0] if entities != [] else f'{media_type}:{country_code}:{service}:{id}'
+			for other_entity in entities[1:]:
+				connection.execute('UPDATE id_map SET entity = ? WHERE entity = ?', (entity, other_entity))
+
+			now = time()
+			connection.executemany(
+				'INSERT OR REPLACE INTO id_map (media_type, country_code, service, id, entity, updated) VALUES (?, ?, ?, ?, ?, ?)',
+				[(media_type, country_code, service, id, entity, now) for service, id in ids.items()]
+			)
+
+	def forget_sync(self, media_type: str, service: str, id: str, country_code: str) -> None:
+		with self.connection as connection:
+			connection.execute(
+				'DELETE FROM id_map WHERE media_type = ? AND country_code = ? AND service = ? AND id = ?',
+				(media_type, country_code, service, id)
+			)
+
+	async def get(self, media_type: str, service: str, id: str, country_code: str) -> dict:
+		"""
+			Get every known, fresh ID of the media that a service's ID points to, including the given one.
+			Returns an empty dict if the ID isn't mapped.
+
+			:param media_type: Type of media (song, music_video, collection).
+			:param service: Service the ID is from.
+			:param id: The ID.
+			:param country_code: The country code of the country the IDs are mapped for.
+		"""
+		try:
+			ids = await executor_manager.run('cache', self.get_sync, media_type, service, str(id), country_code)
+		except Exception:
+			self.stats['errors'] += 1
+			return {}
+		self.stats['hits' if ids != {} else 'misses'] += 1
+		return ids
+
+	async def record(self, media_type: str, ids: dict, country_code: str) -> None:
+		"""
+			Remember that these IDs all point to the same media.
+
+			:param media_type: Type of media (song, music_video, collection).
+			:param ids: Dict of service IDs (service: id).
+			:param country_code: The country code of the country the IDs are mapped for.
+		"""
+		ids = {service: str(id) for service, id in ids.items() if id is not None}
+		# One ID on its own doesn't map to anything
+		if len(ids) < 2:
+			return
+		try:
+			await executor_manager.run('cache', self.record_sync, media_type, ids, country_code)
+			self.stats['records'] += 1
+		except Exception:
+			self.stats['errors'] += 1
+
+	async def forget(self, media_type: str, service: str, id: str, country_code: str) -> None:
+		"""
+			Remove a mapped ID, ex. when it doesn't resolve on its service anymore.
+
+			:param media_type: Type of media (song, music_video, collection).
+			:param service: Service the ID is from.
+			:param id: The ID.
+			:param country_code: The country code of the country the ID is mapped for.
+		"""
+		try:
+			await executor_manager.run('cache', self.forget_sync, media_type, service, str(id), country_code)
+			self.stats['forgotten'] += 1
+		except Exception:
+			self.stats['errors'] += 1
+
+
+
+id_map = IDMap(id_map_path)
+
+print('[ServiceCatalogAPI] ID map initialized')
@@ -0,0 +1,34 @@
+import json
+
+
+
+free_text_arguments = ['artists', 'title', 'collection', 'query'] # Only these get normalized, IDs (ex. YouTube's) are case-sensitive
+
+
+
+def describe(value) -> object:
+	# Media objects are told apart by their IDs, service objects by their name
+	if hasattr(value, 'ids'):
+		return {'service': value.service, 'ids': value.ids}
+	if hasattr(value, 'service'):
+		return value.service
+	return str(value)
+
+def normalize(value) -> object:
+	if isinstance(value, str):
+		return ' '.join(value.casefold().split())
+	if isinstance(value, (list, tuple)):
+		return [normalize(item) for item in value]
+	if isinstance(value, dict):
+		return {key: normalize(item) for key, item in value.items()}
+	return value
+
+def request_key(service: str, request: dict) -> str:
+	"""
+		Turn a request dict into a key, so that requests whose free text (artists, title, collection, query) only differs in casing or whitespace are treated as the same request.
+		Everything else, like IDs, is kept as it is.
+
+		:param service: The service the request is for.
+		:param request: The request dict.
+	"""
+	return f'{service}:{json.dumps({name: normalize(value) if name in free_text_arguments else value for name, value in request.items()}, sort_keys = True, default = describe, separators = (',', ':'))}'
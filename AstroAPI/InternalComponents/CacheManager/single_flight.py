@@ -0,0 +1,88 @@
+from .keys import request_key
+from functools import wraps
+from copy import copy
+import asyncio
+import inspect
+
+
+
+"""
+	--- THE SINGLE-FLIGHT REGISTRY ---
+
+	When a song goes viral, dozens of identical requests for it land within the same second,
+	and before the first one finishes, the response cache has nothing to give the others.
+
+	The single-flight registry keeps track of requests that are in flight, keyed by their
+	normalized parameters. If an identical request comes in while one is already running, it
+	doesn't start another one, it waits for the running one and gets the same result (the same
+	object, so treat it as read-only). Callers that need to change a result's meta (ex. swapping in
+	their own request) change the copy they get from own() instead.
+
+	The in-flight request runs as its own task, so if the client that started it disconnects,
+	everyone else waiting on it still gets their result.
+"""
+
+
+
+class SingleFlight:
+	def __init__(self):
+		self.flights = {}
+		self.stats = {
+			'flights': 0,
+			'coalesced': 0
+		}
+
+	def land(self, key: str, flight: asyncio.Task) -> None:
+		# Only remove the flight if it's still the one registered under the key
+		if self.flights.get(key) is flight:
+			del self.flights[key]
+
+	async def run(self, key: str, function, *args, **kwargs) -> object:
+		"""
+			Run an async function, or if an identical call is already running, wait for that one instead.
+
+			:param key: The key identical calls share.
+			:param function: The async function.
+		"""
+		flight = self.flights.get(key)
+		if flight is None or flight.get_loop() is not asyncio.get_running_loop():
+			flight = asyncio.create_task(function(*args, **kwargs))
+			self.flights[key] = flight
+			flight.add_done_callback(lambda flight: self.land(key, flight))
+			self.stats['flights'] += 1
+		else:
+			self.stats['coalesced'] += 1
+		return await asyncio.shield(flight)
+
+	def own(self, result: object) -> object:
+		"""
+			A copy of a (possibly coalesced) result with a Meta of its own, so changing its meta doesn't change it for everyone else who got the result.
+			Everything else is still shared, so still read-only.
+
+			:param result: The media, Empty or Error object.
+		"""
+		result = copy(result)
+		result.meta = copy(result.meta)
+		return result
+
+	def coalesced(self, service: str):
+		"""
+			Decorator that coalesces identical concurrent calls of a component.
+
+			:param service: The service the component belongs to.
+		"""
+		def decorator(function):
+			signature = inspect.signature(function)
+
+			@wraps(function)
+			async def wrapper(*args, **kwargs):
+				arguments = signature.bind(*args, **kwargs)
+				arguments.apply_defaults()
+				key = request_key(service, {'request': function.__name__, **arguments.arguments})
+				return await self.run(key, function, *args, **kwargs)
+			return wrapper
+		return decorator
+
+
+
+single_flight = SingleFlight()
@@ -4,6 +4,7 @@ from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.InternalComponents.Legacy.ini import keys
 from .components.about import *
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
 
 
 
@@ -20,7 +21,7 @@ class Credentials:
 			self.client_token = path['token']
 		else:
 			if self.client_token == None:
-				async with aiohttp.ClientSession() as session:
+				async with session_manager.session('credentials') as session:
 					request = {'request': 'get_credentials'}
 					creds_url = keys['cred_endpoints'][self.service]
 					start_time = current_unix_time_ms()
@@ -4,6 +4,7 @@ from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.InternalComponents.Legacy.ini import keys
 from .components.about import *
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
 
 
 
@@ -20,7 +21,7 @@ class Token:
 	async def get_token(self) -> str:
 		if self.token == None or (self.token_expiration_date == None or current_unix_time() > self.token_expiration_date):
 			await self.get_credentials()
-			async with aiohttp.ClientSession() as session:
+			async with session_manager.session('credentials') as session:
 				request = {'request': 'get_token'}
 				api_url = api
 				api_data = f'grant_type=client_credentials&client_id={self.client_id}&client_secret={self.client_secret}'
@@ -57,7 +58,7 @@ class Token:
 			self.client_secret = path['secret']
 		else:
 			if self.client_id == None:
-				async with aiohttp.ClientSession() as session:
+				async with session_manager.session('credentials') as session:
 					request = {'request': 'get_credentials'}
 					creds_url = keys['cred_endpoints'][self.service]
 					start_time = current_unix_time_ms()
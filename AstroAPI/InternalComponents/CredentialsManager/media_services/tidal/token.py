@@ -4,6 +4,7 @@ from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.InternalComponents.Legacy.ini import keys
 from .components.about import *
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
 import base64
 
 
@@ -23,7 +24,7 @@ class Token:
 			await self.get_credentials()
 			creds = f'{self.client_id}:{self.client_secret}'
 			b64_creds = base64.b64encode(creds.encode()).decode()
-			async with aiohttp.ClientSession() as session:
+			async with session_manager.session('credentials') as session:
 				request = {'request': 'get_token'}
 				api_url = api
 				api_data = {'grant_type': 'client_credentials'}
@@ -60,7 +61,7 @@ class Token:
 			self.client_secret = path['secret']
 		else:
 			if self.client_id == None:
-				async with aiohttp.ClientSession() as session:
+				async with session_manager.session('credentials') as session:
 					request = {'request': 'get_credentials'}
 					creds_url = keys['cred_endpoints'][self.service]
 					start_time = current_unix_time_ms()
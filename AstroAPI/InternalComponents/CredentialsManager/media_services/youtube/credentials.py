@@ -3,12 +3,15 @@ from AstroAPI.InternalComponents.SystemMediaObjects import *
 from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.InternalComponents.Legacy.ini import keys
 from AstroAPI.InternalComponents.Legacy.time import current_unix_time
+from AstroAPI.InternalComponents.SessionManager import executor_manager, session_manager
+from AstroAPI.InternalComponents.ServiceManager import lazy_import
 from .components.about import *
-from ytmusicapi import YTMusic, OAuthCredentials
 import aiohttp
 import json
 import requests, asyncio
 
+ytmusicapi = lazy_import('ytmusicapi') # Only gets imported when ytmusicapi is set up
+
 
 
 
@@ -22,7 +25,31 @@ class Credentials:
 		self.api_key = None
 		self.oauth = None
 		self.browser = None
-		self.ytmusicapi = self.initialize_ytmusicapi()
+		self.ytmusicapi = None
+		self.loop = None
+		self.lock = None
+
+	async def initialize(self) -> 'ytmusicapi.YTMusic':
+		"""
+			Set up ytmusicapi on a worker thread the first time it's needed, so fetching the credentials doesn't block the event loop.
+		"""
+		if self.ytmusicapi is None:
+			loop = asyncio.get_running_loop()
+			if self.loop is not loop:
+				self.loop = loop
+				self.lock = asyncio.Lock()
+			# Only one request gets to set it up, the rest wait for it
+			async with self.lock:
+				if self.ytmusicapi is None:
+					self.ytmusicapi = await executor_manager.run('youtube_music', self.initialize_ytmusicapi) # Same pool as the ytmusicapi calls
+		return self.ytmusicapi
+
+	def report(self, error: Error) -> None:
+		# Credentials get fetched on a worker thread, so the log is handed over to the event loop that asked for them
+		if self.loop is not None and self.loop.is_running():
+			asyncio.run_coroutine_threadsafe(log(error), self.loop)
+		else:
+			asyncio.run(log(error))
 
 	def initialize_ytmusicapi(self):
 		self.get_browser()
@@ -31,15 +58,16 @@ class Credentials:
 		# A YouTube API update broke the way ytmusicapi does authentication, so for the time being we're
 		# emulating a browser session by reusing sushi's Firefox request headers. If these break, check
 		# if the OAuth issues have been solved. If not, make some new headers.
-		# return YTMusic(
+		# return ytmusicapi.YTMusic(
 		# 	auth = self.oauth,
 		# 	oauth_credentials = 
-		# 		OAuthCredentials(
+		# 		ytmusicapi.OAuthCredentials(
 		# 			client_id = self.client_id,
 		# 			client_secret = self.client_secret
 		# 		)
 		# 	)
-		return YTMusic(auth = self.browser)
+		# ytmusicapi goes through the shared requests session, so it gets pooled connections and the upstream recorder like everything else
+		return ytmusicapi.YTMusic(auth = self.browser, requests_session = session_manager.blocking_session('youtube_music'))
 	
 	def get_browser(self) -> None:
 		if self.PREFER_LOCAL_CREDS:
@@ -67,13 +95,7 @@ class Credentials:
 								http_code = response.status_code
 							)
 						)
-						# schedule or run logging depending on loop state
-						try:
-							loop = asyncio.get_running_loop()
-						except RuntimeError:
-							asyncio.run(log(error))
-						else:
-							loop.create_task(log(error))
+						self.report(error)
 				except requests.RequestException as e:
 					error = Error(
 						service = self.service,
@@ -86,12 +108,7 @@ class Credentials:
 							http_code = None
 						)
 					)
-					try:
-						loop = asyncio.get_running_loop()
-					except RuntimeError:
-						asyncio.run(log(error))
-					else:
-						loop.create_task(log(error))
+					self.report(error)
 
 	def get_oauth(self) -> None:
 		if self.PREFER_LOCAL_CREDS:
@@ -119,12 +136,7 @@ class Credentials:
 								http_code = response.status_code
 							)
 						)
-						try:
-							loop = asyncio.get_running_loop()
-						except RuntimeError:
-							asyncio.run(log(error))
-						else:
-							loop.create_task(log(error))
+						self.report(error)
 				except requests.RequestException as e:
 					error = Error(
 						service = self.service,
@@ -137,12 +149,7 @@ class Credentials:
 							http_code = None
 						)
 					)
-					try:
-						loop = asyncio.get_running_loop()
-					except RuntimeError:
-						asyncio.run(log(error))
-					else:
-						loop.create_task(log(error))
+					self.report(error)
 
 	def get_credentials(self) -> None:
 		if self.PREFER_LOCAL_CREDS:
@@ -174,12 +181,7 @@ class Credentials:
 								http_code = response.status_code
 							)
 						)
-						try:
-							loop = asyncio.get_running_loop()
-						except RuntimeError:
-							asyncio.run(log(error))
-						else:
-							loop.create_task(log(error))
+						self.report(error)
 				except requests.RequestException as e:
 					error = Error(
 						service = self.service,
@@ -192,12 +194,7 @@ class Credentials:
 							http_code = None
 						)
 					)
-					try:
-						loop = asyncio.get_running_loop()
-					except RuntimeError:
-						asyncio.run(log(error))
-					else:
-						loop.create_task(log(error))
+					self.report(error)
 
 
 
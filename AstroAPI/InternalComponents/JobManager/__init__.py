@@ -0,0 +1,2 @@
+from .store import job_store, JobStore
+from .jobs import job_manager, JobManager
\ No newline at end of file
@@ -0,0 +1,308 @@
+from .store import job_store, JobStore
+from AstroAPI.InternalComponents.SessionManager import executor_manager
+from collections import deque
+from uuid import uuid4
+import asyncio
+import json
+
+
+
+"""
+	--- THE JOB MANAGER ---
+
+	Converting a whole album or playlist means hundreds of Global Interface lookups, and doing
+	them on the request path either takes forever or hogs the services everyone else is waiting
+	on. Jobs take a list of IDs, answer right away with a job ID, and convert the IDs in the
+	background, where the client can poll (or stream) their progress.
+
+	A fixed pool of workers (started on FastAPI startup) does the converting, so jobs never take
+	up more than a set share of the upstreams no matter how many of them get submitted, and every
+	service the IDs come from has its own cap on top of that. Items wait in a queue per service, and
+	workers only take items from services that are under their cap (taking turns between them), so
+	a big job from a slow service doesn't hold up everyone else's. An ID that's in more than one job at
+	the same time (ex. the same playlist pasted twice) only gets converted once, and every job it
+	is in gets the result. Results go to the job store as soon as they're done.
+
+	With more than one process (ex. uvicorn --workers), each of them only converts the items it holds
+	a lease on in the job store: the ones submitted to it, and ones it claimed because nobody else
+	held them (ex. after a restart). Leases get renewed while the process runs, and a process that
+	dies without handing its items back loses them once its leases run out. IDs are only shared
+	between jobs within the same process.
+"""
+
+
+
+workers = 8 # Conversions that run at the same time, every one of them can hit every service
+upstream_limits = {
+	'default': 4,
+	'youtube_music': 2
+} # Conversions that can start from the same service at the same time
+store_retries = 3 # Times a failed store write gets tried again before its conversion gets queued again
+store_retry_delay = 0.5 # Seconds before the first retry, doubled after every one
+lease_length = 60 # Seconds a process holds on to the items it's converting without renewing the lease
+lease_renewal = 20 # Seconds between renewing leases (and claiming items other processes left behind)
+
+
+
+class JobManager:
+	def __init__(self, store: JobStore):
+		self.store = store
+		self.convert = None
+		self.queues = {} # Keys waiting to be converted, per service
+		self.active = {} # Conversions running right now, per service
+		self.ready = None # Set whenever a worker might find something to convert
+		self.workers = []
+		self.leaser = None
+		self.owner = None # What this process goes by in the job store's leases
+		self.loop = None
+		self.waiting = {}
+		self.listeners = {}
+		self.stats = {
+			'jobs': 0,
+			'items': 0,
+			'conversions': 0,
+			'deduplicated': 0,
+			'failed': 0,
+			'claimed': 0,
+			'store_errors': 0
+		}
+
+	@property
+	def running(self) -> bool:
+		try:
+			return self.workers != [] and self.loop is asyncio.get_running_loop()
+		except RuntimeError:
+			return False
+
+	async def start(self, convert) -> None:
+		"""
+			Start the worker pool and claim the items no other process is converting (ex. the ones the last run didn't get to). Run on app startup.
+
+			:param convert: Async function that takes a media type, service, ID and country code, and returns the HTTP code and JSON of the converted media.
+		"""
+		if self.running:
+			return
+		self.convert = convert
+		self.loop = asyncio.get_running_loop()
+		# Every process gets its own, even ones forked from the same parent
+		self.owner = uuid4().hex
+		self.queues = {}
+		self.active = {}
+		self.ready = asyncio.Event()
+		self.waiting = {}
+		self.workers = [asyncio.create_task(self.work(), name = f'job_worker_{index}') for index in range(workers)]
+		await self.claim()
+		self.leaser = asyncio.create_task(self.keep_leases(), name = 'job_leaser')
+
+	async def stop(self) -> None:
+		"""
+			Stop the worker pool. Items that weren't done yet stay in the store, handed back for whichever process starts (or claims them) next. Run on app shutdown.
+		"""
+		if not self.running:
+			return
+		for task in [*self.workers, self.leaser]:
+			task.cancel()
+		await asyncio.gather(*self.workers, self.leaser, return_exceptions = True)
+		self.workers = []
+		self.leaser = None
+		self.queues = {}
+		self.active = {}
+		try:
+			await executor_manager.run('jobs', self.store.release_sync, self.owner)
+		except Exception:
+			self.stats['store_errors'] += 1
+
+	async def claim(self) -> None:
+		# Renew this process' leases and queue whatever items nobody else is converting
+		try:
+			claimed = await executor_manager.run('jobs', self.store.claim_sync, self.owner, lease_length)
+		except Exception:
+			self.stats['store_errors'] += 1
+			return
+		for item in claimed:
+			self.enqueue(item['job_id'], item['position'], item)
+		self.stats['claimed'] += len(claimed)
+
+	async def keep_leases(self) -> None:
+		while True:
+			await asyncio.sleep(lease_renewal)
+			await self.claim()
+
+	@property
+	def queued(self) -> int:
+		return sum(len(queue) for queue in self.queues.values())
+
+	def put(self, key: tuple) -> None:
+		service = key[1]
+		self.queues.setdefault(service, deque()).append(key)
+		self.ready.set()
+
+	def take(self) -> tuple | None:
+		# The first service (in turn order) that has something queued and is under its cap goes next, then goes to the back of the line
+		for service, queue in self.queues.items():
+			if self.active.get(service, 0) < upstream_limits.get(service, upstream_limits['default']):
+				key = queue.popleft()
+				del self.queues[service]
+				if queue:
+					self.queues[service] = queue
+				self.active[service] = self.active.get(service, 0) + 1
+				return key
+		return None
+
+	async def next(self) -> tuple:
+		while (key := self.take()) is None:
+			self.ready.clear()
+			await self.ready.wait()
+		return key
+
+	def enqueue(self, job_id: str, position: int, item: dict) -> None:
+		# Items with the same ID share one conversion, whichever job they're in
+		key = (item['media_type'], item['service'], item['id'], item['country_code'])
+		waiters = self.waiting.get(key)
+		if waiters is None:
+			self.waiting[key] = [(job_id, position)]
+			self.put(key)
+		else:
+			waiters.append((job_id, position))
+			self.stats['deduplicated'] += 1
+
+	async def submit(self, items: list[dict], country_code: str = 'us') -> str:
+		"""
+			Store a new job and queue its items for conversion. Returns the job ID.
+
+			:param items: List of dicts with the media type, service and ID of every item.
+			:param country_code: The country code of the country in which the items get converted.
+		"""
+		job_id = uuid4().hex
+		await executor_manager.run('jobs', self.store.create_sync, job_id, items, country_code, self.owner, lease_length)
+		for position, item in enumerate(items):
+			self.enqueue(job_id, position, {**item, 'country_code': country_code})
+		self.stats['jobs'] += 1
+		self.stats['items'] += len(items)
+		return job_id
+
+	async def work(self) -> None:
+		while True:
+			key = await self.next()
+			media_type, service, id, country_code = key
+			try:
+				http_code, result = await self.convert(media_type, service, id, country_code)
+				self.stats['conversions'] += 1
+			except asyncio.CancelledError:
+				raise
+			except Exception:
+				http_code, result = 500, None
+				self.stats['failed'] += 1
+			finally:
+				# The service has room for another conversion, whichever worker gets to it first
+				self.active[service] -= 1
+				self.ready.set()
+
+			waiters = self.waiting.pop(key, [])
+			saved = await self.save(waiters, http_code, result)
+			# Listeners hear about the result either way, streaming clients shouldn't hang on a store that's having a moment
+			for job_id, position in waiters:
+				self.notify(job_id, {'position': position, 'media_type': media_type, 'service': service, 'id': id, 'http_code': http_code, 'result': result})
+			if not saved:
+				# The items are still unfinished in the store, so they get converted (most likely from the response cache) and saved again
+				self.requeue(key, waiters)
+
+	async def save(self, waiters: list[tuple[str, int]], http_code: int, result: str | None) -> bool:
+		# Store writes are idempotent (only unfinished items get updated), so retrying one that might have gone through is fine
+		delay = store_retry_delay
+		for attempt in range(store_retries + 1):
+			try:
+				await executor_manager.run('jobs', self.store.finish_items_sync, waiters, http_code, result)
+				return True
+			except Exception:
+				self.stats['store_errors'] += 1
+				if attempt < store_retries:
+					await asyncio.sleep(delay)
+					delay *= 2
+		return False
+
+	def requeue(self, key: tuple, waiters: list[tuple[str, int]]) -> None:
+		# The same ID might have been queued again by another job in the meantime, then it's converted once for all of them
+		if key in self.waiting:
+			self.waiting[key].extend(waiters)
+		else:
+			self.waiting[key] = list(waiters)
+			self.put(key)
+
+	def notify(self, job_id: str, item: dict | None) -> None:
+		for updates in self.listeners.get(job_id, ()):
+			updates.put_nowait(item)
+
+	def loaded(self, item: dict) -> dict:
+		# Results are stored as JSON, so they don't have to be rendered again for every poll
+		return {**item, 'result': json.loads(item['result']) if item['result'] is not None else None}
+
+	async def get(self, job_id: str, include_items: bool = True) -> dict | None:
+		"""
+			Get a job and (optionally) its items along with their results, or None if there's no such job.
+
+			:param job_id: The job ID.
+			:param include_items: Optional. Whether to include the items.
+		"""
+		job = await executor_manager.run('jobs', self.store.get_sync, job_id)
+		if job is None:
+			return None
+		job['status'] = 'done' if job['done'] >= job['total'] else 'running'
+		if include_items:
+			job['items'] = [self.loaded(item) for item in job['items']]
+		else:
+			del job['items']
+		return job
+
+	async def delete(self, job_id: str) -> bool:
+		"""
+			Delete a job along with its results. Returns whether there was such a job.
+			Items that are already being converted finish anyway, other jobs might be waiting on them.
+
+			:param job_id: The job ID.
+		"""
+		deleted = await executor_manager.run('jobs', self.store.delete_sync, job_id)
+		if deleted:
+			self.notify(job_id, None)
+		return deleted
+
+	async def progress(self, job_id: str):
+		"""
+			Every item of a job as it gets done (the ones that already are come first), then the job itself once all of them are.
+			Yields (event name, content) tuples.
+
+			:param job_id: The job ID.
+		"""
+		updates = asyncio.Queue()
+		# Listen before looking at the store, so nothing that gets done in between goes missing
+		self.listeners.setdefault(job_id, set()).add(updates)
+		try:
+			job = await self.get(job_id)
+			if job is None:
+				return
+			reported = set()
+			for item in job['items']:
+				if item['http_code'] is not None:
+					reported.add(item['position'])
+					yield 'item', item
+			while len(reported) < job['total']:
+				item = await updates.get()
+				if item is None: # The job got deleted
+					return
+				if item['position'] not in reported:
+					reported.add(item['position'])
+					yield 'item', self.loaded(item)
+			job = await self.get(job_id, include_items = False)
+			if job is not None:
+				yield 'job', job
+		finally:
+			listeners = self.listeners.get(job_id)
+			listeners.discard(updates)
+			if not listeners:
+				del self.listeners[job_id]
+
+
+
+job_manager = JobManager(job_store)
+
+print('[ServiceCatalogAPI] Job manager initialized')
@@ -0,0 +1,167 @@
+from AstroAPI.InternalComponents.Legacy.ini import config
+from time import time
+import threading
+import sqlite3
+
+
+
+"""
+	--- THE JOB STORE ---
+
+	Conversion jobs can take minutes and their results are fetched whenever the client gets
+	around to it, so they can't live in memory only. The job store keeps every job, every item
+	in it and the result of every item that's done in a SQLite database, so they survive restarts
+	(items that weren't done yet get picked back up) and can be polled from any worker.
+
+	Results are kept until the client deletes the job, or for a day after the job is done.
+
+	More than one process (ex. uvicorn --workers) can share the store, so every unfinished item is
+	leased to the process that converts it. A process keeps renewing its leases while it runs, and
+	only items that aren't leased to anyone (or whose lease ran out because their process is gone)
+	get claimed by another one, so every item only gets converted by one process.
+"""
+
+
+
+keep_for = 24 * 60 * 60 # Seconds a finished job is kept around for
+jobs_path = config.get('jobs', 'path', fallback = 'AstroAPI/jobs.sqlite3')
+
+
+
+class JobStore:
+	def __init__(self, path: str):
+		self.path = path
+		self.local = threading.local() # SQLite connections can't be shared between threads
+
+	@property
+	def connection(self) -> sqlite3.Connection:
+		connection = getattr(self.local, 'connection', None)
+		if connection is None:
+			connection = sqlite3.connect(self.path, timeout = 5)
+			connection.execute('PRAGMA journal_mode = WAL')
+			connection.execute('PRAGMA synchronous = NORMAL')
+			connection.execute('''
+				CREATE TABLE IF NOT EXISTS jobs (
+					job_id TEXT PRIMARY KEY,
+					country_code TEXT NOT NULL,
+					total INTEGER NOT NULL,
+					done INTEGER NOT NULL,
+					created REAL NOT NULL,
+					finished REAL
+				)
+			''')
+			connection.execute('''
+				CREATE TABLE IF NOT EXISTS job_items (
+					job_id TEXT NOT NULL,
+					position INTEGER NOT NULL,
+					media_type TEXT NOT NULL,
+					service TEXT NOT NULL,
+					id TEXT NOT NULL,
+					http_code INTEGER,
+					result TEXT,
+					owner TEXT,
+					lease REAL,
+					PRIMARY KEY (job_id, position)
+				)
+			''')
+			# Stores from before leases don't have the columns yet
+			columns = [column[1] for column in connection.execute('PRAGMA table_info(job_items)').fetchall()]
+			for column, kind in [('owner', 'TEXT'), ('lease', 'REAL')]:
+				if column not in columns:
+					connection.execute(f'ALTER TABLE job_items ADD COLUMN {column} {kind}')
+			connection.execute('CREATE INDEX IF NOT EXISTS jobs_finished ON jobs (finished)')
+			connection.commit()
+			self.local.connection = connection
+		return connection
+
+	def create_sync(self, job_id: str, items: list[dict], country_code: str, owner: str, lease: float) -> None:
+		with self.connection as connection:
+			# Get rid of jobs nobody came back for while we're at it
+			expired = time() - keep_for
+			connection.execute('DELETE FROM job_items WHERE job_id IN (SELECT job_id FROM jobs WHERE finished < ?)', (expired,))
+			connection.execute('DELETE FROM jobs WHERE finished < ?', (expired,))
+			connection.execute(
+				'INSERT INTO jobs (job_id, country_code, total, done, created, finished) VALUES (?, ?, ?, 0, ?, NULL)',
+				(job_id, country_code, len(items), time())
+			)
+			connection.executemany(
+				'INSERT INTO job_items (job_id, position, media_type, service, id, http_code, result, owner, lease) VALUES (?, ?, ?, ?, ?, NULL, NULL, ?, ?)',
+				[(job_id, position, item['media_type'], item['service'], item['id'], owner, time() + lease) for position, item in enumerate(items)]
+			)
+
+	def finish_items_sync(self, items: list[tuple[str, int]], http_code: int, result: str | None) -> None:
+		with self.connection as connection:
+			now = time()
+			for job_id, position in items:
+				updated = connection.execute(
+					'UPDATE job_items SET http_code = ?, result = ? WHERE job_id = ? AND position = ? AND http_code IS NULL',
+					(http_code, result, job_id, position)
+				).rowcount
+				# Deleted jobs don't have items to update anymore
+				if updated:
+					connection.execute(
+						'UPDATE jobs SET done = done + 1, finished = CASE WHEN done + 1 >= total THEN ? ELSE NULL END WHERE job_id = ?',
+						(now, job_id)
+					)
+
+	def get_sync(self, job_id: str) -> dict | None:
+		job = self.connection.execute(
+			'SELECT job_id, country_code, total, done, created, finished FROM jobs WHERE job_id = ?',
+			(job_id,)
+		).fetchone()
+		if job is None:
+			return None
+		items = self.connection.execute(
+			'SELECT position, media_type, service, id, http_code, result FROM job_items WHERE job_id = ? ORDER BY position',
+			(job_id,)
+		).fetchall()
+		return {
+			'job_id': job[0],
+			'country_code': job[1],
+			'total': job[2],
+			'done': job[3],
+			'created': job[4],
+			'finished': job[5],
+			'items': [
+				{'position': item[0], 'media_type': item[1], 'service': item[2], 'id': item[3], 'http_code': item[4], 'result': item[5]}
+				for item in items
+			]
+		}
+
+	def claim_sync(self, owner: str, lease: float) -> list[dict]:
+		# Renews the owner's leases, then takes over unfinished items nobody holds a lease on, and returns those
+		with self.connection as connection:
+			now = time()
+			# Writing first takes the store's write lock, so no other process can claim the same items in between
+			connection.execute('UPDATE job_items SET lease = ? WHERE owner = ? AND http_code IS NULL', (now + lease, owner))
+			rows = connection.execute(
+				'''
+					SELECT job_items.job_id, job_items.position, job_items.media_type, job_items.service, job_items.id, jobs.country_code
+					FROM job_items JOIN jobs ON jobs.job_id = job_items.job_id
+					WHERE job_items.http_code IS NULL AND (job_items.owner IS NULL OR (job_items.owner != ? AND job_items.lease < ?))
+					ORDER BY jobs.created, job_items.position
+				''',
+				(owner, now)
+			).fetchall()
+			connection.executemany(
+				'UPDATE job_items SET owner = ?, lease = ? WHERE job_id = ? AND position = ?',
+				[(owner, now + lease, row[0], row[1]) for row in rows]
+			)
+		return [
+			{'job_id': row[0], 'position': row[1], 'media_type': row[2], 'service': row[3], 'id': row[4], 'country_code': row[5]}
+			for row in rows
+		]
+
+	def release_sync(self, owner: str) -> None:
+		# Hands the owner's unfinished items back, so the next process doesn't have to wait for their leases to run out
+		with self.connection as connection:
+			connection.execute('UPDATE job_items SET owner = NULL, lease = NULL WHERE owner = ? AND http_code IS NULL', (owner,))
+
+	def delete_sync(self, job_id: str) -> bool:
+		with self.connection as connection:
+			connection.execute('DELETE FROM job_items WHERE job_id = ?', (job_id,))
+			return connection.execute('DELETE FROM jobs WHERE job_id = ?', (job_id,)).rowcount > 0
+
+
+
+job_store = JobStore(jobs_path)
@@ -1,8 +1,13 @@
-import discord as discord
-from discord import Webhook
 from AstroAPI.InternalComponents.Legacy.ini import config, keys, text, credentials
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.ServiceManager import lazy_import
+from time import monotonic
+import random as chance
+import asyncio
 import aiohttp
 
+discord = lazy_import('discord') # discord.py only gets imported once the first log gets sent
+
 
 
 """
@@ -18,68 +23,300 @@ import aiohttp
 
 	It leverages Discord's webhook system to send them [logs] into a predefined logging channel.
 
-	This function is right now pretty crude and it could be better, but it works well.
+	Logs don't get sent on the request path. log() drops them into a bounded queue and returns
+	right away, and a single background worker (started on FastAPI startup) sends them out in
+	batches of embeds, throttled by a token bucket so bursts don't trip Discord's rate limits.
+	Identical empty responses get deduplicated and empty responses can be sampled, since
+	they're routine. If the queue is full, logs get dropped and counted instead of piling up.
+	If the worker isn't running (ex. a one-off asyncio.run() during startup), logs get sent inline.
 """
 
 
 
-async def log(media: object, files: list = None):
-	async with aiohttp.ClientSession() as session:
+queue_size = 1000 # Logs waiting to be sent, anything over this gets dropped
+batch_window = 1 # Seconds the worker waits for more logs to pile up before sending a batch
+max_embeds = 10 # Discord's limit of embeds per message
+max_files = 10 # Discord's limit of attachments per message
+max_characters = 6000 # Discord's limit of characters across all embeds in a message
+rate_limit = 0.5 # Webhook messages per second (Discord allows 30 per minute per channel)
+rate_burst = 5 # Webhook messages that can be sent at once before throttling kicks in
+empty_sample_rate = 1.0 # Fraction of empty responses that get logged
+empty_dedup_window = 300 # Seconds during which an identical empty response is only logged once
+
+api_dev_ping = '<@&1330182314831122492>'
+
+
+
+class TokenBucket:
+	def __init__(self, rate: float, capacity: int):
+		self.rate = rate
+		self.capacity = capacity
+		self.tokens = capacity
+		self.updated = monotonic()
+
+	async def acquire(self) -> None:
+		"""
+			Wait until a token is available and take it.
+		"""
+		while True:
+			now = monotonic()
+			self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+			self.updated = now
+			if self.tokens >= 1:
+				self.tokens -= 1
+				return
+			await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+
+class LogPipeline:
+	def __init__(self):
+		self.queue = None
+		self.worker = None
+		self.loop = None
+		self.bucket = TokenBucket(rate_limit, rate_burst)
+		self.recent_empties = {}
+		self.stats = {
+			'queued': 0,
+			'sent': 0,
+			'dropped': 0,
+			'deduplicated': 0,
+			'sampled_out': 0,
+			'failed': 0
+		}
+
+	@property
+	def running(self) -> bool:
+		try:
+			return self.worker is not None and not self.worker.done() and self.loop is asyncio.get_running_loop()
+		except RuntimeError:
+			return False
+
+	async def start(self) -> None:
+		"""
+			Start the background worker. Run on app startup.
+		"""
+		if self.running:
+			return
+		self.loop = asyncio.get_running_loop()
+		self.queue = asyncio.Queue(maxsize = queue_size)
+		self.worker = asyncio.create_task(self.work(), name = 'log_pipeline')
+
+	async def stop(self, timeout: float = 10) -> None:
+		"""
+			Give the worker some time to send what's left in the queue, then stop it. Run on app shutdown.
+
+			:param timeout: Seconds to wait for the queue to empty out.
+		"""
+		if not self.running:
+			return
+		try:
+			await asyncio.wait_for(self.queue.join(), timeout = timeout)
+		except TimeoutError:
+			pass
+		self.worker.cancel()
+		await asyncio.gather(self.worker, return_exceptions = True)
+		self.worker = None
+		self.queue = None
+
+	def is_duplicate(self, media: object) -> bool:
+		"""
+			Whether an identical empty response was already logged within the dedup window.
+
+			:param media: The Empty object.
+		"""
+		now = monotonic()
+		key = f'{media.service}:{media.meta.request}'
+		if now - self.recent_empties.get(key, -empty_dedup_window) < empty_dedup_window:
+			return True
+		self.recent_empties[key] = now
+		# Forget about the expired ones every now and then so this doesn't grow forever
+		if len(self.recent_empties) > queue_size:
+			self.recent_empties = {key: logged for key, logged in self.recent_empties.items() if now - logged < empty_dedup_window}
+		return False
+
+	def submit(self, media: object, files: list = None) -> None:
+		"""
+			Drop a log into the queue without waiting for it to be sent.
+
+			:param media: The Error or Empty object to log.
+			:param files: Optional. Files to attach to the log.
+		"""
+		if media.type == 'empty_response':
+			if chance.random() >= empty_sample_rate:
+				self.stats['sampled_out'] += 1
+				return
+			if self.is_duplicate(media):
+				self.stats['deduplicated'] += 1
+				return
+		try:
+			self.queue.put_nowait((media, files))
+			self.stats['queued'] += 1
+		except asyncio.QueueFull:
+			self.stats['dropped'] += 1
+
+	async def work(self) -> None:
+		while True:
+			batch = [await self.queue.get()]
+			try:
+				# Let a few more logs pile up so they go out in the same message
+				await asyncio.sleep(batch_window)
+				while len(batch) < max_embeds and not self.queue.empty():
+					batch.append(self.queue.get_nowait())
+				await self.send_batch(batch)
+			except asyncio.CancelledError:
+				raise
+			except Exception:
+				self.stats['failed'] += len(batch)
+			finally:
+				for _ in batch:
+					self.queue.task_done()
+
+	def count(self, sent: bool) -> None:
+		self.stats['sent' if sent else 'failed'] += 1
+
+	async def send_batch(self, batch: list) -> None:
+		"""
+			Send a batch of logs, packing as many as Discord allows into each webhook message.
+
+			:param batch: List of (media, files) tuples.
+		"""
+		messages = []
+		for media, files in batch:
+			try:
+				embed = create_embed(media)
+			except Exception:
+				embed = None
+			message = messages[-1] if messages != [] else None
+			if (
+				embed is None
+				or message is None
+				or message['embed_chars'] + len(embed) > max_characters
+				or len(message['files']) + len(files or []) > max_files
+				or len(message['logs']) >= max_embeds
+				or message['embeds'] is None
+			):
+				message = {'logs': [], 'embeds': [] if embed is not None else None, 'files': [], 'embed_chars': 0}
+				messages.append(message)
+			message['logs'].append((media, files))
+			if embed is not None:
+				message['embeds'].append(embed)
+				message['embed_chars'] += len(embed)
+			message['files'] += files or []
+
+		for message in messages:
+			await self.bucket.acquire()
+			# Single logs and ones that can't be turned into an embed go through the regular path with all its fallbacks
+			if len(message['logs']) == 1 or message['embeds'] is None:
+				for media, files in message['logs']:
+					self.count(await send_log(media, files))
+				continue
+			try:
+				async with session_manager.session('discord') as session:
+					ping = api_dev_ping if any(media.type == 'error' for media, files in message['logs']) else ''
+					webhook = discord.Webhook.from_url(url = keys['webhooks'][f'{config['system']['deployment_channel']}'], session = session)
+					if message['files'] != []:
+						await webhook.send(ping, embeds = message['embeds'], username = 'Astro API', avatar_url = text['images']['astro_trans'], files = message['files'])
+					else:
+						await webhook.send(ping, embeds = message['embeds'], username = 'Astro API', avatar_url = text['images']['astro_trans'])
+				self.stats['sent'] += len(message['logs'])
+			except Exception:
+				# If the batch doesn't go through, send them one by one, with fresh copies of files the batch already went through
+				for media, files in message['logs']:
+					await self.bucket.acquire()
+					self.count(await send_log(media, resendable(files)))
+
+
+
+def resendable(files: list | None) -> list | None:
+	"""
+		Fresh copies of files that might've been sent already. discord.py reads files to the end and closes the ones it opened itself,
+		so sending the same discord.File objects again would go out with empty (or no) attachments.
+
+		:param files: The discord.File objects, or None.
+	"""
+	if files is None:
+		return None
+	copies = []
+	for file in files:
+		# Let go of the file, which closes it if discord.py opened it itself (from a path), so it gets opened again
+		file.close()
+		if file.fp.closed:
+			fp = file.fp.name
+		else:
+			file.reset()
+			fp = file.fp
+		copies.append(discord.File(fp = fp, filename = file.filename, spoiler = file.spoiler, description = file.description))
+	return copies
+
+
+
+def create_embed(media: object) -> 'discord.Embed':
+	embed = discord.Embed(
+		title = f'Astro API - `{media.type}`',
+		colour = 0x0097f5,
+	)
+	embed.add_field(
+		name = 'Service',
+		value = f'{text['api_tag'][media.service]}',
+		inline = False
+	)
+	if media.type == 'error':
+		report = [
+			f'HTTP code: `{media.meta.http_code}`',
+			f'Error message: `{media.error_msg}`'
+		]
+		embed.add_field(
+			name = 'Report',
+			value = f'{'\n'.join(report)}',
+			inline = False
+		)
+
+	request = '\n'.join([f'{parameter}: `{media.meta.request[parameter]}`' for parameter in list(media.meta.request.keys())])
+
+	embed.add_field(
+		name = 'Request (parameters)',
+		value = f'{request}',
+		inline = False
+	)
+	return embed
+
+
+
+async def send_log(media: object, files: list = None) -> bool:
+	"""
+		Send a log to the deployment channel's webhook, falling back to plainer messages if it doesn't go through.
+		Returns whether anything made it to Discord.
+
+		:param media: The Error or Empty object to log.
+		:param files: Optional. Files to attach to the log.
+	"""
+	async with session_manager.session('discord') as session:
 		deployment_channel = config['system']['deployment_channel']
-		api_dev_ping = '<@&1330182314831122492>'
+		ping = api_dev_ping
 		try:
-			embed = discord.Embed(
-				title = f'Astro API - `{media.type}`',
-				colour = 0x0097f5,
-			)
-			embed.add_field(
-				name = 'Service',
-				value = f'{text['api_tag'][media.service]}',
-				inline = False
-			)
+			embed = create_embed(media)
 			if media.type == 'error':
-				report = [
-					f'HTTP code: `{media.meta.http_code}`',
-					f'Error message: `{media.error_msg}`'
-				]
-				embed.add_field(
-					name = 'Report',
-					value = f'{'\n'.join(report)}',
-					inline = False
-				)
-
-				request = '\n'.join([f'{parameter}: `{media.meta.request[parameter]}`' for parameter in list(media.meta.request.keys())])
-
-				embed.add_field(
-					name = 'Request (parameters)',
-					value = f'{request}',
-					inline = False
-				)
-				
-				webhook = Webhook.from_url(url = keys['webhooks'][f'{deployment_channel}'], session = session)
+				webhook = discord.Webhook.from_url(url = keys['webhooks'][f'{deployment_channel}'], session = session)
 				if files is not None:
-					await webhook.send(api_dev_ping, embed = embed, username = 'Astro API', avatar_url = text['images']['astro_trans'], files = files)
+					await webhook.send(ping, embed = embed, username = 'Astro API', avatar_url = text['images']['astro_trans'], files = files)
 				else:
-					await webhook.send(api_dev_ping, embed = embed, username = 'Astro API', avatar_url = text['images']['astro_trans'])
-				return
+					await webhook.send(ping, embed = embed, username = 'Astro API', avatar_url = text['images']['astro_trans'])
+				return True
 
 			elif media.type == 'empty_response':
-				request = '\n'.join([f'{parameter}: `{media.meta.request[parameter]}`' for parameter in list(media.meta.request.keys())])
-				embed.add_field(
-					name = 'Request (parameters)',
-					value = f'{request}',
-					inline = False
-				)
-				api_dev_ping = ''
-
-				webhook = Webhook.from_url(url = keys['webhooks'][f'{deployment_channel}'], session = session)
+				ping = ''
+
+				webhook = discord.Webhook.from_url(url = keys['webhooks'][f'{deployment_channel}'], session = session)
 				if files is not None:
-					await webhook.send(api_dev_ping, embed = embed, username = 'Astro API', avatar_url = text['images']['astro_trans'], files = files)
+					await webhook.send(ping, embed = embed, username = 'Astro API', avatar_url = text['images']['astro_trans'], files = files)
 				else:
-					await webhook.send(api_dev_ping, embed = embed, username = 'Astro API', avatar_url = text['images']['astro_trans'])
-				return
+					await webhook.send(ping, embed = embed, username = 'Astro API', avatar_url = text['images']['astro_trans'])
+				return True
 		except:
 			try:
+				# The first attempt might've gotten as far as sending the files
+				files = resendable(files)
 				# For some reason this function can fail in prod
 				# Something something 1024 character limit being tripped
 				# I cannot recreate it locally, so this is my solution
@@ -89,20 +326,20 @@ async def log(media: object, files: list = None):
 				if media.type == 'error':
 					embed_text += f'\n**HTTP code**: `{media.meta.http_code}`'
 					embed_text += f'\n**Error message**: `{media.error_msg}`'
-					
+
 					request = '\n'.join([f'{parameter}: `{media.meta.request[parameter]}`' for parameter in list(media.meta.request.keys())])
 
 					embed_text += f'\n\nRequest (parameters):\n'
 					embed_text += request
 
 
-					
-					webhook = Webhook.from_url(url = keys['webhooks'][f'{deployment_channel}'], session = session)
+
+					webhook = discord.Webhook.from_url(url = keys['webhooks'][f'{deployment_channel}'], session = session)
 					if files is not None:
-						await webhook.send(f'{api_dev_ping}\n{embed_text}', username = 'Astro API', avatar_url = text['images']['astro_trans'], files = files)
+						await webhook.send(f'{ping}\n{embed_text}', username = 'Astro API', avatar_url = text['images']['astro_trans'], files = files)
 					else:
-						await webhook.send(f'{api_dev_ping}\n{embed_text}', username = 'Astro API', avatar_url = text['images']['astro_trans'])
-					return
+						await webhook.send(f'{ping}\n{embed_text}', username = 'Astro API', avatar_url = text['images']['astro_trans'])
+					return True
 
 				elif media.type == 'empty_response':
 					request = '\n'.join([f'{parameter}: `{media.meta.request[parameter]}`' for parameter in list(media.meta.request.keys())])
@@ -110,21 +347,39 @@ async def log(media: object, files: list = None):
 					embed_text += f'\n\nRequest (parameters):\n'
 					embed_text += request
 
-					api_dev_ping = ''
+					ping = ''
 
-					webhook = Webhook.from_url(url = keys['webhooks'][f'{deployment_channel}'], session = session)
+					webhook = discord.Webhook.from_url(url = keys['webhooks'][f'{deployment_channel}'], session = session)
 					if files is not None:
-						await webhook.send(api_dev_ping, username = 'Astro API', avatar_url = text['images']['astro_trans'], files = files)
+						await webhook.send(ping, username = 'Astro API', avatar_url = text['images']['astro_trans'], files = files)
 					else:
-						await webhook.send(api_dev_ping, username = 'Astro API', avatar_url = text['images']['astro_trans'])
-					return
+						await webhook.send(ping, username = 'Astro API', avatar_url = text['images']['astro_trans'])
+					return True
 			except:
 				# Okay if this really REALLY doesn't work just give up
-				webhook = Webhook.from_url(url = keys['webhooks'][f'{deployment_channel}'], session = session)
 				try:
-					await webhook.send(f"{api_dev_ping} Logging keeps failing for some reason, here's the json of the response", username = 'Astro API', avatar_url = text['images']['astro_trans'], files = [media.json])
+					webhook = discord.Webhook.from_url(url = keys['webhooks'][f'{deployment_channel}'], session = session)
+					try:
+						await webhook.send(f"{ping} Logging keeps failing for some reason, here's the json of the response", username = 'Astro API', avatar_url = text['images']['astro_trans'], files = [media.json])
+					except:
+						await webhook.send(f"{ping} Logging keeps failing for some reason, here's the json of the response", username = 'Astro API', avatar_url = text['images']['astro_trans'], files = [media])
+					return True
 				except:
-					await webhook.send(f"{api_dev_ping} Logging keeps failing for some reason, here's the json of the response", username = 'Astro API', avatar_url = text['images']['astro_trans'], files = [media])
-				return
-		
+					return False
+	# Only errors and empty responses get logged
+	return False
+
+
+
+async def log(media: object, files: list = None):
+	# Hand the log over to the background worker and get back to the request
+	if log_pipeline.running:
+		log_pipeline.submit(media, files)
+	else:
+		await send_log(media, files)
+
+
+
+log_pipeline = LogPipeline()
+
 print('[ServiceCatalogAPI] Logging to Discord initialized')
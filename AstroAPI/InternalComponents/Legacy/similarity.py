@@ -0,0 +1,93 @@
+from functools import lru_cache
+
+"""
+	--- SIMILARITY ---
+
+	Every filter scores every candidate's artists and title against the query, and the Global Interface
+	compares every query result against every cluster, so this is the hottest code in the whole API.
+
+	The scores are the same ones difflib.SequenceMatcher(None, reference, input).ratio() gives (times 1000),
+	down to the last bit, so every threshold in the filters keeps making the exact same decisions
+	(benchmarks/similarity_calibration.py checks that). It's the same Ratcliff/Obershelp matching,
+	just without everything SequenceMatcher does that we don't need (junk handling, opcodes, Match tuples,
+	rebuilding the index of the input string on every call).
+
+	The index of where each character shows up in a string is cached, and since the input is usually the query,
+	it only gets built once for all the candidates it's compared against.
+"""
+
+# How many strings have their character index remembered
+INDEX_CACHE_SIZE = 16384
+# How many (reference, input) scores are remembered
+SCORE_CACHE_SIZE = 65536
+# From this length on, SequenceMatcher treats characters that show up in over 1% of the string as junk (autojunk)
+AUTOJUNK_LENGTH = 200
+
+@lru_cache(maxsize = INDEX_CACHE_SIZE)
+def character_index(text: str) -> dict[str, list[int]]:
+	"""Maps each character of the string to the positions it shows up at, leaving out popular characters like SequenceMatcher's autojunk does."""
+	index = {}
+	for position, char in enumerate(text):
+		index.setdefault(char, []).append(position)
+
+	if len(text) >= AUTOJUNK_LENGTH:
+		limit = len(text) // 100 + 1
+		for char in [char for char, positions in index.items() if len(positions) > limit]:
+			del index[char]
+	return index
+
+def matching_characters(reference: str, input_str: str) -> int:
+	"""Counts the characters in all the matching blocks of both strings, the way SequenceMatcher.get_matching_blocks() finds them."""
+	index = character_index(input_str)
+	matches = 0
+	# Ranges of both strings that still need their longest match found
+	queue = [(0, len(reference), 0, len(input_str))]
+
+	while queue:
+		reference_low, reference_high, input_low, input_high = queue.pop()
+
+		# Find the longest matching block, the earliest one in the reference if there's a tie
+		best_reference, best_input, best_size = reference_low, input_low, 0
+		lengths = {}
+		for i in range(reference_low, reference_high):
+			new_lengths = {}
+			for j in index.get(reference[i], ()):
+				if j < input_low:
+					continue
+				if j >= input_high:
+					break
+				size = new_lengths[j] = lengths.get(j - 1, 0) + 1
+				if size > best_size:
+					best_reference, best_input, best_size = i - size + 1, j - size + 1, size
+			lengths = new_lengths
+
+		# Popular characters aren't in the index, but they still count if they're right next to the match
+		while best_reference > reference_low and best_input > input_low and reference[best_reference - 1] == input_str[best_input - 1]:
+			best_reference, best_input, best_size = best_reference - 1, best_input - 1, best_size + 1
+		while best_reference + best_size < reference_high and best_input + best_size < input_high and reference[best_reference + best_size] == input_str[best_input + best_size]:
+			best_size += 1
+
+		if best_size:
+			matches += best_size
+			# Then do the same on both sides of the match
+			if reference_low < best_reference and input_low < best_input:
+				queue.append((reference_low, best_reference, input_low, best_input))
+			if best_reference + best_size < reference_high and best_input + best_size < input_high:
+				queue.append((best_reference + best_size, reference_high, best_input + best_size, input_high))
+
+	return matches
+
+@lru_cache(maxsize = SCORE_CACHE_SIZE)
+def similarity(reference: str, input_str: str) -> float:
+	"""Calculates similarity ratio (0-1000)."""
+	length = len(reference) + len(input_str)
+	if length == 0:
+		return 1000.0
+	# Exact matches are really common (artist names especially), no need to look for blocks
+	if reference == input_str:
+		return 2.0 * len(reference) / length * 1000
+	return 2.0 * matching_characters(reference, input_str) / length * 1000
+
+def similarities(references: list[str], input_str: str) -> list[float]:
+	"""Calculates the similarity ratio (0-1000) of every reference against the same input, ex. every candidate against the query."""
+	return [similarity(reference, input_str) for reference in references]
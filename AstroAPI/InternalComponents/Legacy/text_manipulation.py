@@ -1,8 +1,11 @@
+import os
 import re
-import difflib
+from functools import lru_cache
 from unidecode import unidecode
-from better_profanity import profanity
-from discord.utils import escape_markdown
+from AstroAPI.InternalComponents.Legacy.similarity import similarity
+from AstroAPI.InternalComponents.ServiceManager import lazy_import
+
+discord = lazy_import('discord') # Only needed for escape_markdown(), no point importing discord.py for it up front
 
 """
 	--- TEXT MANIPULATION FUNCTIONS ---
@@ -36,6 +39,10 @@ PUNC_TO_SPACE_PATTERN = re.compile(r'[!()[\];:\'",<>./?^*_`~-]')
 # Matches: (feat. X), [with X], feat. X, with X at the end of strings
 FEAT_PATTERN = re.compile(r'\s*[\(\[]?(?:feat\.|with)\s+.*', re.IGNORECASE)
 
+# How many results of each normalization function are remembered
+# The same artist names and titles keep coming back from every service and across requests
+NORMALIZATION_CACHE_SIZE = 16384
+
 # Music Video Declarations
 MV_DECLARATIONS = [
 	'(official video)',
@@ -65,6 +72,7 @@ def transliterate_to_ascii(text: str) -> str:
 	"""Converts unicode text to its closest ASCII representation."""
 	return unidecode(text)
 
+@lru_cache(maxsize = NORMALIZATION_CACHE_SIZE)
 def bare_bones(text: str, remove_all_punctuation: bool = True) -> str:
 	"""
 	Standardizes text: Transliterates to ASCII, lowers case, removes punctuation,
@@ -79,6 +87,7 @@ def bare_bones(text: str, remove_all_punctuation: bool = True) -> str:
 	# 4. Fix whitespace
 	return ' '.join(text.split())
 
+@lru_cache(maxsize = NORMALIZATION_CACHE_SIZE)
 def optimize_for_search(text: str, encode_special_chars: bool = True) -> str:
 	"""
 	Heavy optimization for API queries. 
@@ -128,6 +137,7 @@ def optimize_string(text: str) -> list[str]:
 
 # --- UTILITIES ---
 
+@lru_cache(maxsize = NORMALIZATION_CACHE_SIZE)
 def remove_feat(text: str) -> str:
 	"""Removes 'feat.' and 'with' credits using regex."""
 	# This also handles the brackets/parentheses logic automatically via the regex pattern
@@ -141,8 +151,8 @@ def split_artists(text: str) -> list[str]:
 	return [p.strip() for p in parts if p.strip()]
 
 def calculate_similarity(reference: str, input_str: str) -> float:
-	"""Calculates similarity ratio (0-1000)."""
-	return difflib.SequenceMatcher(None, reference, input_str).ratio() * 1000
+	"""Calculates similarity ratio (0-1000). Same scores as difflib.SequenceMatcher, see similarity.py."""
+	return similarity(reference, input_str)
 
 def sort_similarity_lists(data_list: list, similarity_index: int = 0) -> list:
 	"""Sorts a list of lists/tuples based on the similarity score at the given index."""
@@ -180,25 +190,64 @@ def clean_up_collection_title(text: str) -> str:
 	"""Removes ' - Single' or ' - EP' suffixes."""
 	return text.replace(' - Single', '').replace(' - EP', '')
 
+# --- PROFANITY CENSORING ---
+
+PROFANITY_WORDLIST_PATH = os.path.join(os.path.dirname(__file__), 'profanity_wordlist.txt')
+
+# Characters commonly swapped in to sneak words past filters (the same ones better_profanity looked for)
+PROFANITY_CHAR_VARIANTS = {
+	'a': 'a@*4',
+	'i': 'i*l1',
+	'o': 'o*0@',
+	'u': 'u*v',
+	'v': 'v*u',
+	'l': 'l1',
+	'e': 'e*3',
+	's': 's$5',
+	't': 't7'
+}
+
+# Characters that are part of a word, anything else splits words apart
+PROFANITY_WORD_CHARS = r'''[\w@$*"']'''
+
+def compile_profanity_pattern(path: str) -> re.Pattern:
+	"""Compiles the whole wordlist (and every variant of each word) into a single regex that matches whole words only."""
+	with open(path, encoding = 'utf-8') as file:
+		words = {line.strip().lower() for line in file if line.strip()}
+
+	if not words:
+		return re.compile(r'(?!)') # Matches nothing
+
+	alternatives = [
+		''.join(f'[{re.escape(PROFANITY_CHAR_VARIANTS[char])}]' if char in PROFANITY_CHAR_VARIANTS else re.escape(char) for char in word)
+		for word in sorted(words, key = len, reverse = True)
+	]
+	return re.compile(f'(?<!{PROFANITY_WORD_CHARS})(?:{'|'.join(alternatives)})(?!{PROFANITY_WORD_CHARS})', re.IGNORECASE)
+
+# Compiled once on startup instead of reloading the wordlist on every call
+PROFANITY_PATTERN = compile_profanity_pattern(PROFANITY_WORDLIST_PATH)
+
+@lru_cache(maxsize = 4096)
 def censor_text(text: str) -> str:
-	"""Censors profanity using the wordlist."""
+	"""Censors profanity using the wordlist. Cached, since the same titles keep coming back from every service."""
 	if not text:
 		return text
-		
-	path_to_file = "AstroAPI/InternalComponents/Legacy/profanity_wordlist.txt"
-	profanity.load_censor_words_from_file(path_to_file)
-	
+
 	words = text.split()
+	# Most titles are clean, so one pass over the whole thing lets us skip going word by word
+	if not PROFANITY_PATTERN.search(text):
+		return ' '.join(words)
+
 	censored_words = []
 	
 	for word in words:
-		if profanity.contains_profanity(word):
+		if PROFANITY_PATTERN.search(word):
 			# Censor format: F**** (First char + * + Last char)
 			if len(word) > 2:
 				new_word = word[0] + '*' * (len(word) - 2) + word[-1]
 			else:
 				new_word = '*' * len(word)
-			censored_words.append(escape_markdown(new_word))
+			censored_words.append(discord.utils.escape_markdown(new_word))
 		else:
 			censored_words.append(word)
 			
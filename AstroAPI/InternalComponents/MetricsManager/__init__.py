@@ -0,0 +1 @@
+from .metrics import metrics, Registry, Counter, Gauge, Histogram, MetricsMiddleware, event_loop_monitor, EventLoopMonitor, observe_component, mirror_stats, mirror_hit_ratio, upstream_requests, upstream_request_duration, upstream_requests_in_flight, internal_state, circuit_breaker_state, circuit_breaker_error_rate, executor_calls_in_flight, executor_calls_waiting, executor_utilization
\ No newline at end of file
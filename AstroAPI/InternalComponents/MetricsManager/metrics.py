@@ -0,0 +1,290 @@
+from bisect import bisect_left
+from time import perf_counter
+import asyncio
+import math
+
+
+
+"""
+	--- THE METRICS REGISTRY ---
+
+	The only telemetry Astro used to have were Discord logs of errors and empty responses, which
+	say that something went wrong, but not how often, how slow things are or where the time goes.
+
+	The metrics registry keeps counters, gauges and histograms in memory and renders them in the
+	Prometheus text format on /metrics. Everything gets fed from what already flows through the
+	app: the ASGI middleware down below sees every request, the stage timer sees every component
+	call and the session manager's trace config sees every upstream request. Stats other parts of
+	the app already keep (caches, single-flight, circuit breakers, pools, queues) get read by
+	collectors when /metrics is scraped, so they don't cost anything in between.
+
+	Everything here runs on the event loop thread, so metrics don't need locks. Label values map to
+	preallocated slots (a histogram's buckets are a fixed list of counts), so recording a value is
+	a dict lookup and an addition.
+"""
+
+
+
+latency_buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30) # Seconds
+confidence_buckets = (10, 20, 30, 40, 50, 60, 70, 80, 90, 95, 100) # Percent
+loop_lag_buckets = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1) # Seconds
+loop_lag_interval = 0.5 # Seconds between event loop lag checks
+
+
+
+def label_string(names: tuple, values: tuple, extra: str = '') -> str:
+	labels = [f'{name}="{escaped(value)}"' for name, value in zip(names, values)]
+	if extra:
+		labels.append(extra)
+	return '{' + ','.join(labels) + '}' if labels else ''
+
+
+
+def escaped(value: object) -> str:
+	return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+
+def number(value: float) -> str:
+	if value == math.inf:
+		return '+Inf'
+	return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+
+class Counter:
+	type = 'counter'
+
+	def __init__(self, name: str, help: str, labels: tuple = ()):
+		self.name = name
+		self.help = help
+		self.labels = labels
+		self.values = {}
+
+	def inc(self, *labels, amount: float = 1) -> None:
+		self.values[labels] = self.values.get(labels, 0) + amount
+
+	def set(self, *labels, value: float) -> None:
+		# For counts something else already keeps (ex. cache hits), copied over by a collector
+		self.values[labels] = value
+
+	def samples(self) -> list[str]:
+		return [f'{self.name}{label_string(self.labels, labels)} {number(value)}' for labels, value in self.values.items()]
+
+
+
+class Gauge(Counter):
+	type = 'gauge'
+
+	def dec(self, *labels, amount: float = 1) -> None:
+		self.values[labels] = self.values.get(labels, 0) - amount
+
+
+
+class Histogram:
+	type = 'histogram'
+
+	def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = latency_buckets):
+		self.name = name
+		self.help = help
+		self.labels = labels
+		self.buckets = buckets
+		self.values = {}
+
+	def observe(self, *labels, value: float) -> None:
+		slots = self.values.get(labels)
+		if slots is None:
+			# Counts per bucket (the last one is +Inf), then the sum and the count
+			slots = [0] * (len(self.buckets) + 3)
+			self.values[labels] = slots
+		slots[bisect_left(self.buckets, value)] += 1
+		slots[-2] += value
+		slots[-1] += 1
+
+	def samples(self) -> list[str]:
+		lines = []
+		for labels, slots in self.values.items():
+			cumulative = 0
+			for bound, count in zip(self.buckets + (math.inf,), slots):
+				cumulative += count
+				lines.append(f'{self.name}_bucket{label_string(self.labels, labels, f'le="{number(bound)}"')} {cumulative}')
+			lines.append(f'{self.name}_sum{label_string(self.labels, labels)} {number(slots[-2])}')
+			lines.append(f'{self.name}_count{label_string(self.labels, labels)} {slots[-1]}')
+		return lines
+
+
+
+class Registry:
+	def __init__(self):
+		self.metrics = []
+		self.collectors = []
+
+	def counter(self, name: str, help: str, labels: tuple = ()) -> Counter:
+		return self.register(Counter(name, help, labels))
+
+	def gauge(self, name: str, help: str, labels: tuple = ()) -> Gauge:
+		return self.register(Gauge(name, help, labels))
+
+	def histogram(self, name: str, help: str, labels: tuple = (), buckets: tuple = latency_buckets) -> Histogram:
+		return self.register(Histogram(name, help, labels, buckets))
+
+	def register(self, metric: object) -> object:
+		self.metrics.append(metric)
+		return metric
+
+	def collector(self, function):
+		"""
+			Decorator that registers a function that updates metrics right before they get rendered.
+		"""
+		self.collectors.append(function)
+		return function
+
+	def render(self) -> str:
+		"""
+			Every metric in the Prometheus text format.
+		"""
+		for collector in self.collectors:
+			try:
+				collector()
+			except Exception:
+				collector_errors.inc(collector.__name__)
+		lines = []
+		for metric in self.metrics:
+			lines.append(f'# HELP {metric.name} {metric.help}')
+			lines.append(f'# TYPE {metric.name} {metric.type}')
+			lines.extend(metric.samples())
+		return '\n'.join(lines) + '\n'
+
+
+
+metrics = Registry()
+
+http_requests = metrics.counter('astro_http_requests_total', 'Requests answered, per endpoint, method and HTTP code.', ('endpoint', 'method', 'code'))
+http_request_duration = metrics.histogram('astro_http_request_duration_seconds', 'Time it took to answer requests (streams included), per endpoint.', ('endpoint',))
+http_requests_in_flight = metrics.gauge('astro_http_requests_in_flight', 'Requests being answered right now.')
+upstream_requests = metrics.counter('astro_upstream_requests_total', 'HTTP requests to upstream services, per service and HTTP code (error if it never got one).', ('service', 'code'))
+upstream_request_duration = metrics.histogram('astro_upstream_request_duration_seconds', 'Time until upstream services sent their response headers, per service.', ('service',))
+upstream_requests_in_flight = metrics.gauge('astro_upstream_requests_in_flight', 'HTTP requests to upstream services that are waiting for a response right now, per service.', ('service',))
+component_calls = metrics.counter('astro_component_calls_total', 'Search and lookup component calls that actually ran (not answered by the cache), per service, component and result (ok, empty_response, error).', ('service', 'component', 'result'))
+component_duration = metrics.histogram('astro_component_duration_seconds', 'Time search and lookup components took, per service and component.', ('service', 'component'))
+filter_confidence = metrics.histogram('astro_filter_confidence_percent', 'Filter confidence of search results, per service and component.', ('service', 'component'), confidence_buckets)
+event_loop_lag = metrics.histogram('astro_event_loop_lag_seconds', 'How late the event loop woke up a task that was sleeping, measured every half a second.', (), loop_lag_buckets)
+internal_events = metrics.counter('astro_internal_events_total', 'Counters the internal components keep (caches, single-flight, batchers, jobs, the log pipeline), per component and event.', ('component', 'event'))
+internal_state = metrics.gauge('astro_internal_state', 'Sizes and queue lengths of the internal components right now, per component and what got measured.', ('component', 'state'))
+cache_hit_ratio = metrics.gauge('astro_cache_hit_ratio', 'Share of lookups that were hits since startup, per cache.', ('cache',))
+circuit_breaker_state = metrics.gauge('astro_circuit_breaker_state', 'State of every service\'s circuit breaker (0 is closed, 1 is half open, 2 is open).', ('service',))
+circuit_breaker_error_rate = metrics.gauge('astro_circuit_breaker_error_rate', 'Rolling error rate every service\'s circuit breaker sees.', ('service',))
+executor_calls_in_flight = metrics.gauge('astro_executor_calls_in_flight', 'Blocking calls running on a thread pool right now, per pool.', ('pool',))
+executor_calls_waiting = metrics.gauge('astro_executor_calls_waiting', 'Blocking calls waiting for a free thread right now, per pool.', ('pool',))
+executor_utilization = metrics.gauge('astro_executor_utilization', 'Share of a thread pool\'s threads that are busy right now, per pool.', ('pool',))
+collector_errors = metrics.counter('astro_metrics_collector_errors_total', 'Collectors that failed while rendering the metrics, per collector.', ('collector',))
+
+
+
+def observe_component(service: str, component: str, result: object, seconds: float) -> None:
+	"""
+		Record a component call. The stage timer calls this for every component that runs.
+
+		:param service: The service the component belongs to.
+		:param component: The component's name.
+		:param result: What the component returned.
+		:param seconds: How long the component took.
+	"""
+	result_type = getattr(result, 'type', None)
+	outcome = result_type if result_type in ('error', 'empty_response') else 'ok'
+	component_calls.inc(service, component, outcome)
+	component_duration.observe(service, component, value = seconds)
+	if outcome == 'ok' and component.startswith('search'):
+		confidence = getattr(result.meta, 'filter_confidence_percentage', None)
+		if isinstance(confidence, dict) and isinstance(confidence.get(service), (int, float)):
+			filter_confidence.observe(service, component, value = confidence[service])
+
+
+
+def mirror_stats(component: str, stats: dict) -> None:
+	"""
+		Copy the counters of a stats dict over to the metrics. Run by collectors.
+
+		:param component: The component the stats belong to.
+		:param stats: The stats dict, ex. the response cache's.
+	"""
+	for event, value in stats.items():
+		if isinstance(value, (int, float)):
+			internal_events.set(component, event, value = value)
+
+
+
+def mirror_hit_ratio(cache: str, hits: int, misses: int) -> None:
+	if hits + misses > 0:
+		cache_hit_ratio.set(cache, value = hits / (hits + misses))
+
+
+
+class EventLoopMonitor:
+	def __init__(self):
+		self.task = None
+
+	async def start(self) -> None:
+		"""
+			Start measuring event loop lag. Run on app startup.
+		"""
+		if self.task is not None and not self.task.done():
+			return
+		self.task = asyncio.create_task(self.work(), name = 'event_loop_monitor')
+
+	async def stop(self) -> None:
+		"""
+			Stop measuring event loop lag. Run on app shutdown.
+		"""
+		if self.task is None:
+			return
+		self.task.cancel()
+		await asyncio.gather(self.task, return_exceptions = True)
+		self.task = None
+
+	async def work(self) -> None:
+		while True:
+			# Anything blocking the loop makes the sleep take longer than it should
+			start = perf_counter()
+			await asyncio.sleep(loop_lag_interval)
+			event_loop_lag.observe(value = max(0.0, perf_counter() - start - loop_lag_interval))
+
+
+
+event_loop_monitor = EventLoopMonitor()
+
+
+
+class MetricsMiddleware:
+	"""
+		ASGI middleware that counts and times every request, per endpoint (the route's path, so IDs and such don't end up in labels).
+	"""
+
+	def __init__(self, app):
+		self.app = app
+
+	async def __call__(self, scope, receive, send):
+		if scope['type'] != 'http':
+			return await self.app(scope, receive, send)
+		status = [500]
+
+		async def send_with_status(message):
+			if message['type'] == 'http.response.start':
+				status[0] = message['status']
+			await send(message)
+
+		http_requests_in_flight.inc()
+		start = perf_counter()
+		try:
+			await self.app(scope, receive, send_with_status)
+		finally:
+			http_requests_in_flight.dec()
+			# The router fills in the route it matched, requests that didn't match any get lumped together
+			route = scope.get('route')
+			endpoint = getattr(route, 'path', 'unmatched')
+			http_requests.inc(endpoint, scope['method'], str(status[0]))
+			http_request_duration.observe(endpoint, value = perf_counter() - start)
+
+
+
+print('[ServiceCatalogAPI] Metrics registry initialized')
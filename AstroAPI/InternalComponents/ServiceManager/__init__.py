@@ -0,0 +1,2 @@
+from .registry import service_registry, ServiceRegistry, resolve, resolve_loaded
+from .lazy import lazy_import
\ No newline at end of file
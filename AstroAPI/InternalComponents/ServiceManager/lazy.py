@@ -0,0 +1,44 @@
+from importlib.util import find_spec, module_from_spec, LazyLoader
+from types import ModuleType
+import sys
+
+
+
+"""
+	--- LAZY IMPORTS ---
+
+	Some dependencies take longer to import than everything else Astro does on startup put together
+	(discord.py alone is a good quarter of a second), and most of them are only needed once in a while,
+	like when a log gets sent or ytmusicapi gets set up.
+
+	lazy_import() hands out a module that only actually gets imported the first time something on it
+	is used, so modules can keep using them like always:
+
+		discord = lazy_import('discord')
+		...
+		embed = discord.Embed(...) # discord.py gets imported here
+
+	Anything that's used at import time (ex. base classes, type hints) still imports the module right
+	away, so those have to stay inside functions or be written as strings.
+"""
+
+
+
+def lazy_import(name: str) -> ModuleType:
+	"""
+		Get a module that gets imported on first use. Modules that are already imported are handed out as they are.
+
+		:param name: The module's name, ex. `discord`.
+	"""
+	module = sys.modules.get(name)
+	if module is not None:
+		return module
+	spec = find_spec(name)
+	if spec is None:
+		raise ModuleNotFoundError(f'No module named {name!r}', name = name)
+	loader = LazyLoader(spec.loader)
+	spec.loader = loader
+	module = module_from_spec(spec)
+	sys.modules[name] = module
+	loader.exec_module(module)
+	return module
@@ -0,0 +1,163 @@
+from importlib import import_module
+from time import perf_counter
+import asyncio
+import sys
+
+
+
+"""
+	--- THE SERVICE REGISTRY ---
+
+	Importing every service up front means a cold start pays for all of them (and everything they
+	import) before the app can answer a single request, even though most requests only need one or two.
+	That hurts on every deploy and every time another instance gets spun up.
+
+	The service registry knows where every service lives and only imports it the first time it's
+	asked for. Endpoints get their services via:
+
+		service_api = service_registry.get('music', 'spotify')
+
+	Services can come with startup hooks (ex. fetching credentials or setting up ytmusicapi), which get
+	awaited when the service is started with start(). On app startup, preload() starts every service in
+	the background, one after the other, so the app takes requests right away and most services are warm
+	by the time anyone asks for them. A service a request needs before that gets imported on the spot,
+	and fetches its credentials on first use like it always has.
+
+	Services and hooks are registered by their `module:attribute` path, so registering them doesn't
+	import anything (main.py registers them all).
+"""
+
+
+
+def resolve(path: str) -> object:
+	"""
+		Import whatever a `module:attribute` path points at. The attribute can be dotted, ex. `...spotify.token:spotify_token.get_token`.
+
+		:param path: The path.
+	"""
+	module, _, attributes = path.partition(':')
+	target = import_module(module)
+	for attribute in attributes.split('.') if attributes else []:
+		target = getattr(target, attribute)
+	return target
+
+
+
+def resolve_loaded(path: str) -> object | None:
+	"""
+		Same as resolve(), but only if the module has been imported already, None otherwise. For reading stats without importing anything.
+
+		:param path: The path.
+	"""
+	return resolve(path) if path.partition(':')[0] in sys.modules else None
+
+
+
+class ServiceRegistry:
+	def __init__(self):
+		self.paths = {}
+		self.hooks = {}
+		self.services = {}
+		self.started = set()
+		self.load_times = {} # Milliseconds every service took to import
+		self.errors = {} # The last startup hook error of every service
+		self.preloader = None
+		self.stats = {
+			'loaded': 0,
+			'started': 0,
+			'startup_errors': 0
+		}
+
+	def register(self, kind: str, name: str, path: str, hooks: list = None) -> None:
+		"""
+			Tell the registry where a service lives. Nothing gets imported until the service is needed.
+
+			:param kind: The kind of service (ex. music, knowledge, snitch).
+			:param name: Name of the service (ex. spotify).
+			:param path: `module:attribute` path of the service's object.
+			:param hooks: Optional. `module:attribute` paths of async functions that get awaited when the service starts.
+		"""
+		self.paths[(kind, name)] = path
+		self.hooks[(kind, name)] = hooks or []
+
+	def registered(self, kind: str, name: str) -> bool:
+		return (kind, name) in self.paths
+
+	def loaded(self, kind: str, name: str) -> bool:
+		return (kind, name) in self.services
+
+	def get(self, kind: str, name: str) -> object:
+		"""
+			Get a service, importing it if it hasn't been yet. Raises KeyError for services that aren't registered.
+
+			:param kind: The kind of service.
+			:param name: Name of the service.
+		"""
+		service = self.services.get((kind, name))
+		if service is None:
+			path = self.paths[(kind, name)]
+			start = perf_counter()
+			service = resolve(path)
+			self.services[(kind, name)] = service
+			self.load_times[f'{kind}/{name}'] = round((perf_counter() - start) * 1000, 1)
+			self.stats['loaded'] += 1
+		return service
+
+	async def start(self, kind: str, name: str) -> object:
+		"""
+			Get a service and await its startup hooks, only the first time it's started.
+
+			:param kind: The kind of service.
+			:param name: Name of the service.
+		"""
+		service = self.get(kind, name)
+		if (kind, name) not in self.started:
+			self.started.add((kind, name))
+			for hook in self.hooks[(kind, name)]:
+				try:
+					await resolve(hook)()
+				except Exception as error:
+					# A service whose hook failed still works, it fetches its credentials again on first use
+					self.errors[f'{kind}/{name}'] = f'{hook}: {error}'
+					self.stats['startup_errors'] += 1
+			self.stats['started'] += 1
+		return service
+
+	async def preload(self) -> None:
+		"""
+			Start every registered service in the background, in the order they were registered. Run on app startup.
+		"""
+		self.preloader = asyncio.create_task(self.preload_all())
+
+	async def preload_all(self) -> None:
+		for kind, name in list(self.paths.keys()):
+			await self.start(kind, name)
+			await asyncio.sleep(0) # Let requests through between services
+
+	async def stop(self) -> None:
+		"""
+			Stop preloading if it's still going. Run on app shutdown.
+		"""
+		if self.preloader is not None and not self.preloader.done():
+			self.preloader.cancel()
+			try:
+				await self.preloader
+			except asyncio.CancelledError:
+				pass
+		self.preloader = None
+
+	@property
+	def json(self) -> dict:
+		return {
+			**self.stats,
+			'registered': len(self.paths),
+			'preloading': self.preloader is not None and not self.preloader.done(),
+			'load_times': self.load_times,
+			'errors': self.errors
+		}
+
+
+
+service_registry = ServiceRegistry()
+
+print('[ServiceCatalogAPI] Service registry initialized')
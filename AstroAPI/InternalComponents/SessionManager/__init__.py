@@ -0,0 +1,2 @@
+from .sessions import session_manager, SessionManager
+from .executors import executor_manager, ExecutorManager
\ No newline at end of file
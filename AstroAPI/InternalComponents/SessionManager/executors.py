@@ -0,0 +1,126 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import asyncio
+
+
+
+"""
+	--- THE BLOCKING CALL EXECUTOR ---
+
+	Some upstreams can only be reached through blocking libraries (ytmusicapi, requests for
+	Genius). Calling them straight from an async function freezes the whole event loop until
+	they return, which stalls every other in-flight request and makes the Global Interface
+	fan-out run one service at a time.
+
+	The executor manager gives every such service its own bounded thread pool, a cap on how
+	many calls may be in flight at once and a per-call timeout. Components await them via:
+
+		result = await executor_manager.run(service, function, *args, **kwargs)
+
+	Calls over the cap wait their turn without holding a thread, and a call that runs past
+	its timeout raises TimeoutError so the component's usual error handling takes over.
+	Threads can't be stopped though, so an abandoned call keeps its slot until its thread is
+	actually done with it.
+"""
+
+
+
+# Worker threads and per-call timeout (seconds) per service
+# Services not listed here use the default limits
+executor_limits = {
+	'default': {'workers': 4, 'timeout': 30},
+	'youtube_music': {'workers': 8, 'timeout': 20},
+	'genius': {'workers': 4, 'timeout': 30},
+	'cache': {'workers': 2, 'timeout': 5},
+	'jobs': {'workers': 1, 'timeout': None} # One writer, so job updates never wait on each other's locks, and never abandoned, since an abandoned write can still commit
+}
+
+
+
+class ExecutorManager:
+	def __init__(self):
+		self.executors = {}
+		self.semaphores = {}
+		self.loop = None
+		self.in_flight = {} # Calls running on a service's threads right now
+		self.waiting = {} # Calls waiting for a free slot right now
+
+	def get(self, service: str) -> ThreadPoolExecutor:
+		"""
+			Get the thread pool of a service, creating one if it doesn't exist yet.
+
+			:param service: The service whose thread pool you need.
+		"""
+		executor = self.executors.get(service)
+		if executor is None:
+			executor = ThreadPoolExecutor(
+				max_workers = executor_limits.get(service, executor_limits['default'])['workers'],
+				thread_name_prefix = f'astro_{service}'
+			)
+			self.executors[service] = executor
+		return executor
+
+	def semaphore(self, service: str) -> asyncio.Semaphore:
+		"""
+			Get the concurrency cap of a service on the running event loop.
+
+			:param service: The service whose concurrency cap you need.
+		"""
+		loop = asyncio.get_running_loop()
+		# Semaphores are bound to the event loop they were first used in, same deal as the HTTP sessions
+		if self.loop is not loop:
+			self.semaphores = {}
+			self.loop = loop
+
+		semaphore = self.semaphores.get(service)
+		if semaphore is None:
+			semaphore = asyncio.Semaphore(executor_limits.get(service, executor_limits['default'])['workers'])
+			self.semaphores[service] = semaphore
+		return semaphore
+
+	async def run(self, service: str, function, *args, timeout: float = None, **kwargs):
+		"""
+			Run a blocking function on a service's thread pool and await its result.
+
+			:param service: The service the call belongs to.
+			:param function: The blocking function.
+			:param timeout: Optional. Seconds before the call gets abandoned. Defaults to the service's configured timeout, services configured with None never abandon calls.
+		"""
+		timeout = timeout if timeout is not None else executor_limits.get(service, executor_limits['default'])['timeout']
+		# Wait for a free slot first, so time spent in line doesn't count towards the call's timeout
+		semaphore = self.semaphore(service)
+		self.waiting[service] = self.waiting.get(service, 0) + 1
+		try:
+			await semaphore.acquire()
+		finally:
+			self.waiting[service] -= 1
+		self.in_flight[service] = self.in_flight.get(service, 0) + 1
+		try:
+			loop = asyncio.get_running_loop()
+			call = loop.run_in_executor(self.get(service), partial(function, *args, **kwargs))
+		except BaseException:
+			self.release(service, semaphore)
+			raise
+		# The slot is given back once the thread is done, not once we stop waiting for it, so abandoned calls still count towards the cap
+		call.add_done_callback(lambda call: self.release(service, semaphore))
+		# Shielded, so timing out (or the request getting cancelled) doesn't mark the call done while its thread is still on it
+		return await asyncio.wait_for(asyncio.shield(call), timeout = timeout)
+
+	def release(self, service: str, semaphore: asyncio.Semaphore) -> None:
+		self.in_flight[service] -= 1
+		semaphore.release()
+
+	def close(self) -> None:
+		"""
+			Shut down every thread pool without waiting for abandoned calls. Run on app shutdown.
+		"""
+		executors = list(self.executors.values())
+		self.executors = {}
+		for executor in executors:
+			executor.shutdown(wait = False, cancel_futures = True)
+
+
+
+executor_manager = ExecutorManager()
+
+print('[ServiceCatalogAPI] Blocking call executor initialized')
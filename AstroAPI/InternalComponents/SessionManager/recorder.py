@@ -0,0 +1,177 @@
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit, parse_qsl, urlencode
+import configparser
+import threading
+import asyncio
+import aiohttp
+import json
+
+
+
+"""
+	--- THE UPSTREAM RECORDER ---
+
+	Nobody can measure whether a change made Astro faster as long as every request goes out to
+	Spotify, iTunes, Deezer and YouTube Music, whose latency and rate limits change by the minute.
+
+	The upstream recorder sits under every HTTP client the services use (the session manager's
+	aiohttp sessions, and the requests sessions ytmusicapi and Genius go through) and has three
+	modes, set by `mode` in the [upstreams] section of config.ini:
+
+		live - requests go to the upstreams like always, the recorder isn't even installed
+		record - requests go to the upstreams, and every response gets appended to the fixtures file
+		replay - requests never leave the machine, they go to the stub server (benchmarks/stub_upstreams.py),
+		         which answers them from the fixtures file
+
+	Fixtures are keyed by the method, host, path and sorted query of the request, plus its body if
+	it's JSON (ytmusicapi's search terms are in there), minus anything that's a secret (API keys in
+	queries, ytmusicapi's client context in bodies). Headers are never recorded, so tokens don't end
+	up in fixtures. The mode can also be changed with configure() before the first request is made.
+"""
+
+
+
+# Read config.ini directly, Legacy.ini can't be imported from here since Discord logging needs the session manager
+config = configparser.ConfigParser()
+config.read('AstroAPI/config.ini')
+
+upstream_modes = ['live', 'record', 'replay']
+secret_params = ['key', 'api_key', 'api_user', 'api_secret', 'client_id', 'client_secret'] # Query parameters that never end up in fixtures
+volatile_body_keys = ['context'] # Top-level JSON body keys that change on their own (ex. ytmusicapi's client version) and don't go into keys
+fixture_header = 'X-Astro-Fixture' # The stub server finds the fixture by the key in this header
+
+
+
+def fixture_key(method: str, url: str, body: bytes | str | None = None) -> str:
+	"""
+		The key a request's fixture is stored and looked up under, ex. `GET api.deezer.com/track/3135556`.
+
+		:param method: The HTTP method.
+		:param url: The full URL, query included.
+		:param body: Optional. The request body.
+	"""
+	parts = urlsplit(str(url))
+	query = urlencode(sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values = True) if name not in secret_params))
+	key = f'{method.upper()} {parts.hostname}{parts.path}' + (f'?{query}' if query else '')
+	if body:
+		try:
+			data = json.loads(body)
+		except (ValueError, UnicodeDecodeError):
+			return key # Form bodies (ex. token requests) are all credentials
+		if isinstance(data, dict):
+			data = {name: value for name, value in data.items() if name not in volatile_body_keys}
+		key += ' ' + json.dumps(data, sort_keys = True, separators = (',', ':'), ensure_ascii = False)
+	return key
+
+
+
+class UpstreamRecorder:
+	def __init__(self, mode: str, fixtures_path: str, stub_url: str):
+		self.mode = mode
+		self.fixtures_path = fixtures_path
+		self.stub_url = stub_url
+		self.recorded = set()
+		self.lock = threading.Lock() # Responses get recorded from the event loop and from executor threads
+		self.stub_sessions = {}
+		self.stats = {
+			'recorded': 0,
+			'replayed': 0
+		}
+
+	@property
+	def live(self) -> bool:
+		return self.mode == 'live'
+
+	def configure(self, mode: str = None, fixtures_path: str = None, stub_url: str = None) -> None:
+		"""
+			Change the recorder's settings. Only sessions opened afterwards pick up a change of mode, so run it before the app starts.
+
+			:param mode: Optional. One of the upstream modes.
+			:param fixtures_path: Optional. The JSON lines file fixtures get recorded to.
+			:param stub_url: Optional. The base URL of the stub server requests get replayed from.
+		"""
+		if mode is not None:
+			if mode not in upstream_modes:
+				raise ValueError(f"mode has to be one of: {', '.join(upstream_modes)}.")
+			self.mode = mode
+		self.fixtures_path = fixtures_path if fixtures_path is not None else self.fixtures_path
+		self.stub_url = stub_url if stub_url is not None else self.stub_url
+
+	def record(self, key: str, status: int, content_type: str, body: bytes) -> None:
+		# Only the first response to every request gets kept, replays answer them all the same anyway
+		with self.lock:
+			if key in self.recorded:
+				return
+			self.recorded.add(key)
+			fixture = {'key': key, 'status': status, 'content_type': content_type, 'body': body.decode('utf-8', errors = 'replace')}
+			with open(self.fixtures_path, 'a', encoding = 'utf-8') as file:
+				file.write(json.dumps(fixture, ensure_ascii = False) + '\n')
+			self.stats['recorded'] += 1
+
+	def middlewares(self) -> tuple:
+		"""
+			The aiohttp client middlewares sessions get opened with, none when the mode is live.
+		"""
+		return () if self.live else (self.middleware,)
+
+	def stub_session(self) -> aiohttp.ClientSession:
+		# Replayed requests go out through a plain session of their own, bound to the running loop like every other session
+		loop = asyncio.get_running_loop()
+		session = self.stub_sessions.get(loop)
+		if session is None or session.closed:
+			session = aiohttp.ClientSession()
+			self.stub_sessions = {loop: session}
+		return session
+
+	async def middleware(self, request: aiohttp.ClientRequest, handler) -> aiohttp.ClientResponse:
+		body = request.body # Requests without a body have b'' instead of a payload
+		key = fixture_key(request.method, request.url, await body.as_bytes() if body else None)
+		if self.mode == 'replay':
+			self.stats['replayed'] += 1
+			return await self.stub_session().post(f'{self.stub_url}/replay', headers = {fixture_header: key})
+		response = await handler(request)
+		self.record(key, response.status, response.content_type, await response.read()) # The body stays readable for whoever made the request
+		return response
+
+	async def close(self) -> None:
+		"""
+			Close the stub session. Run on app shutdown.
+		"""
+		sessions = list(self.stub_sessions.values())
+		self.stub_sessions = {}
+		for session in sessions:
+			if not session.closed:
+				await session.close()
+
+
+
+class RecordingAdapter(HTTPAdapter):
+	"""
+		requests transport adapter that does for requests sessions what the middleware does for aiohttp sessions.
+	"""
+
+	def __init__(self, recorder: UpstreamRecorder, **kwargs):
+		self.recorder = recorder
+		super().__init__(**kwargs)
+
+	def send(self, request, **kwargs):
+		key = fixture_key(request.method, request.url, request.body)
+		if self.recorder.mode == 'replay':
+			self.recorder.stats['replayed'] += 1
+			request = request.copy()
+			request.prepare_url(f'{self.recorder.stub_url}/replay', None)
+			request.headers[fixture_header] = key
+			return super().send(request, **kwargs)
+		response = super().send(request, **kwargs)
+		self.recorder.record(key, response.status_code, response.headers.get('Content-Type', '').split(';')[0], response.content)
+		return response
+
+
+
+upstream_recorder = UpstreamRecorder(
+	mode = config.get('upstreams', 'mode', fallback = 'live'),
+	fixtures_path = config.get('upstreams', 'fixtures', fallback = 'benchmarks/fixtures/upstreams.jsonl'),
+	stub_url = config.get('upstreams', 'stub', fallback = 'http://127.0.0.1:8765')
+)
+
+print('[ServiceCatalogAPI] Upstream recorder initialized')
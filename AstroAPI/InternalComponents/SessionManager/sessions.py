@@ -0,0 +1,158 @@
+from AstroAPI.InternalComponents.TimingManager import network_trace_config
+from .recorder import upstream_recorder, RecordingAdapter
+from contextlib import asynccontextmanager
+import requests
+import asyncio
+import aiohttp
+
+
+
+"""
+	--- THE HTTP SESSION MANAGER ---
+
+	Opening a fresh aiohttp.ClientSession for every single request means paying for DNS,
+	TCP and TLS handshakes every single time, and a Global Interface request fans out to
+	four services at once, so that adds up quick.
+
+	The session manager keeps one long-lived, connection-pooled session per upstream
+	service (keep-alive, DNS cache, per-host connection limits). Sessions are opened
+	lazily on first use, or eagerly by start() on FastAPI startup, and closed by close()
+	on shutdown. Components borrow them via:
+
+		async with session_manager.session(service) as session:
+			...
+
+	Borrowing never closes the session, it just hands out the shared one. Sessions are bound to the
+	event loop they were opened in, so the shared ones belong to the app's loop (or whichever loop
+	asked first, if start() was never run). Other loops (ex. a one-off asyncio.run() during startup)
+	borrow a session of their own that gets closed once they're done with it, so they can't take
+	over the shared sessions and leave them unclosed.
+
+	Upstreams that can only be reached through blocking libraries get a shared requests session per
+	service instead, from blocking_session(). Both kinds go through the upstream recorder when it isn't live.
+"""
+
+
+
+# Maximum amount of simultaneous connections per upstream service
+# Services not listed here use the default limit
+connection_limits = {
+	'default': 20,
+	'spotify': 50,
+	'apple_music': 50,
+	'deezer': 50,
+	'youtube_music': 20,
+	'discord': 5
+}
+
+dns_cache_ttl = 300 # Seconds
+keepalive_timeout = 30 # Seconds
+default_timeout = aiohttp.ClientTimeout(total = 30)
+
+
+
+class SessionManager:
+	def __init__(self):
+		self.sessions = {}
+		self.blocking_sessions = {}
+		self.loop = None # The event loop the shared sessions belong to
+
+	def open(self, service: str) -> aiohttp.ClientSession:
+		connector = aiohttp.TCPConnector(
+			limit = connection_limits.get(service, connection_limits['default']),
+			limit_per_host = connection_limits.get(service, connection_limits['default']),
+			ttl_dns_cache = dns_cache_ttl,
+			keepalive_timeout = keepalive_timeout
+		)
+		# Requests get timed for the stage breakdown of whichever component makes them, and counted for /metrics
+		return aiohttp.ClientSession(connector = connector, timeout = default_timeout, trace_configs = [network_trace_config(service)], middlewares = upstream_recorder.middlewares())
+
+	def owns(self, loop: asyncio.AbstractEventLoop) -> bool:
+		# A loop gets the shared sessions if they're its own, or if nobody (still) has them
+		return self.loop is loop or self.loop is None or self.loop.is_closed()
+
+	def get(self, service: str) -> aiohttp.ClientSession:
+		"""
+			Get the shared session of a service, opening one if it doesn't exist yet. The shared sessions move over to the running loop if they belong to another one.
+
+			:param service: The service (upstream) whose session you need.
+		"""
+		loop = asyncio.get_running_loop()
+		if self.loop is not loop:
+			self.retire()
+			self.loop = loop
+
+		session = self.sessions.get(service)
+		if session is None or session.closed:
+			session = self.open(service)
+			self.sessions[service] = session
+		return session
+
+	def retire(self) -> None:
+		# Sessions can only be closed on their own loop, so they get closed there if it's still running
+		# Ones of a loop that's already closed can't be closed anymore, their sockets went with it
+		sessions = [session for session in self.sessions.values() if not session.closed]
+		self.sessions = {}
+		if self.loop is not None and self.loop.is_running() and not self.loop.is_closed():
+			for session in sessions:
+				asyncio.run_coroutine_threadsafe(session.close(), self.loop)
+
+	def blocking_session(self, service: str) -> requests.Session:
+		"""
+			Get the shared requests session of a service, for blocking libraries (ex. ytmusicapi) to run on the executor manager's threads.
+
+			:param service: The service (upstream) whose session you need.
+		"""
+		session = self.blocking_sessions.get(service)
+		if session is None:
+			session = requests.Session()
+			if not upstream_recorder.live:
+				adapter = RecordingAdapter(upstream_recorder)
+				session.mount('https://', adapter)
+				session.mount('http://', adapter)
+			self.blocking_sessions[service] = session
+		return session
+
+	@asynccontextmanager
+	async def session(self, service: str):
+		"""
+			Borrow the shared session of a service. Drop-in replacement for `async with aiohttp.ClientSession() as session`.
+
+			:param service: The service (upstream) whose session you need.
+		"""
+		if self.owns(asyncio.get_running_loop()):
+			yield self.get(service)
+			return
+		# Not the shared sessions' loop, so this one gets a session of its own for as long as it needs it
+		session = self.open(service)
+		try:
+			yield session
+		finally:
+			await session.close()
+
+	async def start(self, services: list = None) -> None:
+		"""
+			Open sessions ahead of time so the first requests don't pay for it. Run on app startup.
+
+			:param services: The services whose sessions should be opened. Defaults to all services with configured limits.
+		"""
+		for service in (services if services is not None else list(connection_limits.keys())):
+			if service != 'default':
+				self.get(service)
+
+	async def close(self) -> None:
+		"""
+			Close every open session. Run on app shutdown.
+		"""
+		sessions = list(self.sessions.values())
+		self.sessions = {}
+		for session in sessions:
+			if not session.closed:
+				await session.close()
+		await upstream_recorder.close()
+
+
+
+session_manager = SessionManager()
+
+print('[ServiceCatalogAPI] HTTP session manager initialized')
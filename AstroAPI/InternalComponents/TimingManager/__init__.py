@@ -0,0 +1 @@
+from .stages import timed, stage, span, read_json, network_trace_config, stage_stats, include_stage_times, StageStats, StageTimesOptIn
\ No newline at end of file
@@ -0,0 +1,264 @@
+from AstroAPI.InternalComponents.MetricsManager import observe_component, upstream_requests, upstream_request_duration, upstream_requests_in_flight
+from contextvars import ContextVar
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from urllib.parse import parse_qs
+import inspect
+import aiohttp
+
+
+
+"""
+	--- THE STAGE TIMER ---
+
+	processing_time says how long a component took, but not where the time went. When a Global
+	Interface request is slow, it could be any service's round trip, decoding its JSON, building
+	media objects out of it, filtering them or compiling the global object.
+
+	Every search and lookup component runs with a breakdown of its own (a context variable, so
+	the tasks it starts share it, and components it calls get their own). Stages get timed
+	wherever they happen with a monotonic clock:
+
+		network - HTTP round trips and reading the bodies (see the session manager's trace config), and ytmusicapi calls
+		parse - decoding JSON bodies
+		build - building media objects out of upstream data
+		filter - picking the best match out of the candidates
+		compile - matching and compiling results from different services into global ones
+
+	Stages that run at the same time (ex. four Deezer detail requests, or a request made while
+	building objects) count the wall-clock time at least one of them was running, so they can
+	overlap each other but never add up to more than the total. Components the response cache
+	answers don't run, so they don't get a breakdown.
+
+	The breakdown (in milliseconds, per service, with the Global Interface's including the services
+	it waited for) ends up on the media object's metadata, but only shows up in the JSON of
+	requests that ask for it with `stage_times=true`. Every breakdown also goes into the totals
+	/system/stage_times reports, and every component call and upstream request into /metrics.
+"""
+
+
+
+stages = ['network', 'parse', 'build', 'filter', 'compile']
+current_breakdown = ContextVar('current_breakdown', default = None)
+include_stage_times = ContextVar('include_stage_times', default = False)
+
+
+
+class Breakdown:
+	__slots__ = ('service', 'times', 'depths', 'started', 'services')
+
+	def __init__(self, service: str):
+		self.service = service
+		self.times = {}
+		self.depths = {}
+		self.started = {}
+		self.services = {}
+
+	def enter(self, stage: str) -> None:
+		depth = self.depths.get(stage, 0)
+		if depth == 0:
+			self.started[stage] = perf_counter()
+		self.depths[stage] = depth + 1
+
+	def exit(self, stage: str) -> None:
+		depth = self.depths[stage] - 1
+		self.depths[stage] = depth
+		if depth == 0:
+			self.times[stage] = self.times.get(stage, 0.0) + (perf_counter() - self.started[stage]) * 1000
+
+	def absorb(self, other: object) -> None:
+		# A nested call of the same component (ex. a Global Interface lookup running its search) is part of this one
+		for stage, time in other.times.items():
+			self.times[stage] = self.times.get(stage, 0.0) + time
+		self.services.update(other.services)
+
+	def json(self, total: float) -> dict:
+		return {**{stage: round(self.times[stage], 3) for stage in stages if stage in self.times}, 'total': round(total, 3)}
+
+
+
+class StageStats:
+	def __init__(self):
+		self.components = {}
+
+	def record(self, service: str, component: str, breakdown: dict) -> None:
+		totals = self.components.setdefault(service, {}).setdefault(component, {'count': 0, 'stages': {}})
+		totals['count'] += 1
+		for stage, time in breakdown.items():
+			stage_totals = totals['stages'].setdefault(stage, {'total': 0.0, 'max': 0.0})
+			stage_totals['total'] += time
+			stage_totals['max'] = max(stage_totals['max'], time)
+
+	@property
+	def json(self) -> dict:
+		return {
+			service: {
+				component: {
+					'count': totals['count'],
+					'average': {stage: round(times['total'] / totals['count'], 3) for stage, times in totals['stages'].items()},
+					'max': {stage: round(times['max'], 3) for stage, times in totals['stages'].items()}
+				}
+				for component, totals in components.items()
+			}
+			for service, components in self.components.items()
+		}
+
+
+
+stage_stats = StageStats()
+
+
+
+@contextmanager
+def span(stage: str):
+	"""
+		Time a stage of the component that's running, if there is one.
+
+		:param stage: One of the stages.
+	"""
+	breakdown = current_breakdown.get()
+	if breakdown is None:
+		yield
+		return
+	breakdown.enter(stage)
+	try:
+		yield
+	finally:
+		breakdown.exit(stage)
+
+
+
+def stage(name: str):
+	"""
+		Decorator that times every call of a function (sync or async) as a stage.
+
+		:param name: One of the stages.
+	"""
+	def decorator(function):
+		if inspect.iscoroutinefunction(function):
+			@wraps(function)
+			async def wrapper(*args, **kwargs):
+				with span(name):
+					return await function(*args, **kwargs)
+		else:
+			@wraps(function)
+			def wrapper(*args, **kwargs):
+				with span(name):
+					return function(*args, **kwargs)
+		return wrapper
+	return decorator
+
+
+
+def timed(service: str):
+	"""
+		Decorator that gives every call of a component a breakdown of its own and puts it on the metadata of what it returns.
+		Goes under the caching decorators, so only calls that actually run get timed.
+
+		:param service: The service the component belongs to.
+	"""
+	def decorator(function):
+		@wraps(function)
+		async def wrapper(*args, **kwargs):
+			parent = current_breakdown.get()
+			breakdown = Breakdown(service)
+			token = current_breakdown.set(breakdown)
+			start = perf_counter()
+			try:
+				result = await function(*args, **kwargs)
+			finally:
+				current_breakdown.reset(token)
+			total = perf_counter() - start
+			own = breakdown.json(total * 1000)
+			stage_stats.record(service, function.__name__, own)
+			observe_component(service, function.__name__, result, total)
+			# The Global Interface's breakdown includes the ones of the services it waited for
+			if parent is not None:
+				if parent.service == service:
+					parent.absorb(breakdown)
+				else:
+					parent.services[service] = own
+			# Results passed through from another service (ex. the error of the service a lookup started from) keep their own
+			meta = getattr(result, 'meta', None)
+			if meta is not None and meta.service == service:
+				meta.stage_times = {service: own, **breakdown.services}
+			return result
+		return wrapper
+	return decorator
+
+
+
+async def read_json(response: aiohttp.ClientResponse, **kwargs) -> object:
+	"""
+		Drop-in replacement for `await response.json()` that times reading the body and decoding it separately.
+
+		:param response: The aiohttp response.
+	"""
+	with span('network'):
+		await response.read()
+	with span('parse'):
+		return await response.json(**kwargs) # The body's already read, so this only decodes it
+
+
+
+def on_request_start(service: str):
+	async def trace(session: aiohttp.ClientSession, context, params) -> None:
+		breakdown = current_breakdown.get()
+		context.breakdown = breakdown
+		context.start = perf_counter()
+		if breakdown is not None:
+			breakdown.enter('network')
+		upstream_requests_in_flight.inc(service)
+	return trace
+
+
+
+def on_request_end(service: str):
+	async def trace(session: aiohttp.ClientSession, context, params) -> None:
+		if context.breakdown is not None:
+			context.breakdown.exit('network')
+		upstream_requests_in_flight.dec(service)
+		upstream_request_duration.observe(service, value = perf_counter() - context.start)
+		# Requests that never got a response (timeouts, connection errors) don't have a status
+		response = getattr(params, 'response', None)
+		upstream_requests.inc(service, str(response.status) if response is not None else 'error')
+	return trace
+
+
+
+def network_trace_config(service: str) -> aiohttp.TraceConfig:
+	"""
+		Times every request of a session up until the response headers are in, the body gets timed by read_json().
+
+		:param service: The service (upstream) the session belongs to.
+	"""
+	trace_config = aiohttp.TraceConfig()
+	trace_config.on_request_start.append(on_request_start(service))
+	trace_config.on_request_end.append(on_request_end(service))
+	trace_config.on_request_exception.append(on_request_end(service))
+	return trace_config
+
+
+
+class StageTimesOptIn:
+	"""
+		ASGI middleware that shows the stage breakdown in the metadata of requests with `stage_times=true`.
+	"""
+
+	def __init__(self, app):
+		self.app = app
+
+	async def __call__(self, scope, receive, send):
+		query_string = scope.get('query_string', b'') if scope['type'] == 'http' else b''
+		if b'stage_times' not in query_string or parse_qs(query_string.decode('latin-1')).get('stage_times') != ['true']:
+			return await self.app(scope, receive, send)
+		token = include_stage_times.set(True)
+		try:
+			await self.app(scope, receive, send)
+		finally:
+			include_stage_times.reset(token)
+
+
+
+print('[ServiceCatalogAPI] Stage timer initialized')
@@ -1 +1,2 @@
+from AstroAPI.ServiceCatalogAPI.components.filtering.candidate import Candidate
 from AstroAPI.ServiceCatalogAPI.components.filtering.filter import filter_song, filter_mv, filter_collection, filter_query
\ No newline at end of file
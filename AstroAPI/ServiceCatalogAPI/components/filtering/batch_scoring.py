@@ -0,0 +1,109 @@
+from AstroAPI.InternalComponents.Legacy.text_manipulation import bare_bones
+from AstroAPI.InternalComponents.Legacy.similarity import similarity, similarities
+from AstroAPI.ServiceCatalogAPI.components.filtering.candidate import artist_names_of
+from AstroAPI.ServiceCatalogAPI.components.filtering.prepared_query import prepared_title, prepared_collection
+from AstroAPI.InternalComponents.ServiceManager import lazy_import
+from functools import reduce
+from operator import add
+from math import inf
+
+np = lazy_import('numpy') # Only gets imported once a batch is big enough to need it
+
+
+
+"""
+	--- BATCH SCORING ---
+
+	The filters used to score every candidate on its own, stash `[score, candidate]` pairs in a list
+	and sort the whole list just to take its first element. With 200 hits from an Apple Music search,
+	that's a lot of interpreter overhead for one winner.
+
+	Instead, every criteria gets scored for all candidates at once into a column (one score per
+	candidate), the columns get added up into the totals and the winner gets picked in one pass.
+	The scoring rules are the exact same ones the filters always had:
+
+	  - artist: the best scoring artist of the candidate, candidates at 500 or below are thrown out
+	  - title and collection: their similarity with the query, nothing if the candidate has no collection
+	  - explicitness, song type, release year: flat points if they match the query
+
+	Only candidates that made it past the artist cutoff get their other columns scored. Totals are added
+	up in the same order the loops did, and the first of equal totals wins, just like the stable sort,
+	so the same candidate wins with the same score.
+
+	The totals get added up with reduce(), or with NumPy once there are enough candidates. Adding up
+	the totals with NumPy instead of reduce(), over six runs of benchmarks/filter_scoring.py:
+
+	  - 10 candidates: 0.60x to 0.65x, NumPy's overhead costs more than it saves
+	  - 25 and 50 candidates: 0.73x to 1.47x, a wash
+	  - 100 and 200 candidates: usually around 1.6x, but anywhere from 0.94x to 2.14x
+	  - 400 and 1000 candidates: 1.37x to 2.19x, faster on every run
+
+	So NumPy only takes over at 400. No search returns that many results today (Apple Music's 200 is
+	the most), and NumPy doesn't get imported at all until a batch that big comes along. The whole
+	filter is within run-to-run noise of the old loop at 10 to 200 candidates either way.
+"""
+
+
+
+artist_cutoff = 500 # Candidates whose best artist doesn't score above this are covers, bootlegs or fan uploads
+vectorize_threshold = 400 # Candidates needed before NumPy wins every run of benchmarks/filter_scoring.py
+
+
+
+def artist_scores(candidates: list, query_artist: str) -> list[float]:
+	# Each candidate keeps its best scoring artist, candidates without artists score nothing
+	return [max(similarities([bare_bones(name) for name in artist_names_of(candidate)], query_artist), default = 0.0) for candidate in candidates]
+
+
+
+def passing(artists: list[float]) -> list[bool]:
+	return [score > artist_cutoff for score in artists]
+
+
+
+def title_scores(candidates: list, query_title: str, passed: list[bool]) -> list[float]:
+	return [similarity(prepared_title(candidate), query_title) if candidate_passed else 0.0 for candidate, candidate_passed in zip(candidates, passed)]
+
+
+
+def collection_scores(candidates: list, query_collection: str, passed: list[bool]) -> list[float]:
+	# Candidates without a collection score nothing
+	if query_collection == None:
+		return [0.0] * len(candidates)
+	scores = []
+	for candidate, candidate_passed in zip(candidates, passed):
+		collection_reference = prepared_collection(candidate) if candidate_passed else None
+		scores.append(similarity(collection_reference, query_collection) if collection_reference != None else 0.0)
+	return scores
+
+
+
+def match_scores(values: list, query_value: object, points: int) -> list[float]:
+	# Flat points for candidates whose value is known and matches the query
+	if query_value == None:
+		return [0.0] * len(values)
+	return [points if value != None and value == query_value else 0.0 for value in values]
+
+
+
+def best_candidate(artists: list[float], passed: list[bool], *columns: list[float]) -> tuple[int, float] | None:
+	"""
+		Picks the winning candidate out of its score columns.
+		Returns its index and total score, or None if no candidate made it past the artist cutoff.
+
+		:param artists: The artist score column.
+		:param passed: Which candidates made it past the artist cutoff.
+		:param columns: The rest of the score columns, in the order they get added up.
+	"""
+	if not any(passed):
+		return None
+	if len(passed) < vectorize_threshold:
+		# Adds up the scores one after the other, just like the loop did (sum() compensates float rounding, so the totals could differ)
+		totals = [reduce(add, scores) if candidate_passed else -inf for candidate_passed, *scores in zip(passed, artists, *columns)]
+		index = max(range(len(totals)), key = totals.__getitem__) # The first of equal totals, same as the stable sort
+		return index, float(totals[index])
+	table = np.array((artists, *columns), dtype = float) # One row per criteria, one column per candidate
+	totals = np.add.reduce(table, axis = 0) # Adds the rows up one after the other, in the same order the loop did
+	totals[~np.array(passed)] = -np.inf
+	index = int(np.argmax(totals)) # The first of equal totals, same as the stable sort
+	return index, float(totals[index])
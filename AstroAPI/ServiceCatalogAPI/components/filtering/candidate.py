@@ -0,0 +1,59 @@
+"""
+	--- FILTERING CANDIDATES ---
+
+	Searches return anywhere from a handful to 200 hits, and building a full Song (with its own
+	Collection, Cover, Artists and a Meta for each of those) for every single one of them just so
+	the filtering module can throw all but one away is a massive waste.
+
+	A candidate is a view over one raw search hit that only carries what the filtering module
+	actually looks at. The real media object gets built from the raw hit only when a candidate
+	wins filtering, by calling `materialize()`.
+
+	The filtering functions take both candidates and regular media objects, so anything that
+	already has media objects on hand can still filter them.
+"""
+
+
+
+class Candidate:
+	__slots__ = ('type', 'title', 'artist_names', 'collection_title', 'is_explicit', 'release_year', 'build')
+
+	def __init__(self, type: str, title: str, artist_names: list, build, collection_title: str = None, is_explicit: bool = None, release_year: str = None):
+		"""
+			:param type: Type of the media (track, single, album, ep, music_video).
+			:param title: Title of the media.
+			:param artist_names: Names of the media's artists.
+			:param build: Function that builds the real media object out of the raw hit, it takes no arguments.
+			:param collection_title: Optional. Title of the collection the song is from.
+			:param is_explicit: Optional. Whether the media is explicit.
+			:param release_year: Optional. Release year of the collection.
+		"""
+		self.type = type
+		self.title = title
+		self.artist_names = artist_names
+		self.collection_title = collection_title
+		self.is_explicit = is_explicit
+		self.release_year = release_year
+		self.build = build
+
+	def materialize(self) -> object:
+		return self.build()
+
+
+
+def artist_names_of(media: object) -> list:
+	if isinstance(media, Candidate):
+		return media.artist_names
+	return [artist.name for artist in media.artists]
+
+
+
+def collection_title_of(media: object) -> str | None:
+	if isinstance(media, Candidate):
+		return media.collection_title
+	return media.collection.title if media.collection != None else None
+
+
+
+def materialized(media: object) -> object:
+	return media.materialize() if isinstance(media, Candidate) else media
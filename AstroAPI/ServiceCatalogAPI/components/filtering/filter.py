@@ -2,9 +2,13 @@ from AstroAPI.InternalComponents.SystemMediaObjects import *
 from AstroAPI.InternalComponents.Legacy.log import *
 from AstroAPI.InternalComponents.Legacy.text_manipulation import *
 from AstroAPI.InternalComponents.Legacy.time import current_unix_time_ms
+from AstroAPI.InternalComponents.TimingManager import stage
 
 from AstroAPI.ServiceCatalogAPI.components import *
 from AstroAPI.ServiceCatalogAPI.components.media import *
+from AstroAPI.ServiceCatalogAPI.components.filtering.candidate import materialized
+from AstroAPI.ServiceCatalogAPI.components.filtering.prepared_query import PreparedQuery, prepared_artists
+from AstroAPI.ServiceCatalogAPI.components.filtering.batch_scoring import artist_scores, passing, title_scores, collection_scores, match_scores, best_candidate
 
 
 
@@ -26,10 +30,16 @@ from AstroAPI.ServiceCatalogAPI.components.media import *
 	Both of these are equally important, because API output data provides the necessary media to sort and filter through,
 	and search query data provides the guidelines from which the filtering algorithms know what media object is the most
 	accurate out of the ones listed. Don't skimp out on supplying search query data!
+
+	The song, music video and collection filters take either media objects or filtering candidates (see candidate.py),
+	and only the winning candidate gets built into a real media object. The query gets normalized once per call into a
+	prepared query (see prepared_query.py), so the loops only compare already normalized strings. Those three filters
+	score all candidates at once, criteria by criteria, and pick the winner without sorting them (see batch_scoring.py).
 """
 
 
 
+@stage('filter')
 async def filter_song(service: str, query_request: dict, songs: list, query_artists: list, query_title: str, query_song_type: str = None, query_collection: str = None, query_is_explicit: bool = None, query_country_code: str = None) -> Song:
 	"""
 		# Song filtering function
@@ -63,51 +73,27 @@ async def filter_song(service: str, query_request: dict, songs: list, query_arti
 	if query_song_type != None:
 		max_score += 500
 
-	data_with_similarity = [] # Empty list for songs with their similiarity score
-	for song in songs:
-		song_similarity = 0 # Song similarity overall score, the beginning score is always zero
-
-		artist_input = bare_bones(query_artists[0]) # Strip down the artist name of any stylization and convert all characters into their latin counterparts
-		artists_reference = [artist.name for artist in song.artists]
-		artists_with_similarity = []
-
-		# This accounts all the artists in a song: checks their similarity with the query data, sorts that data from the highest to lowest, and then applies the highest score to the song similarity overall score
-		# In the distant future this will be able to use Artist objects but we're not there yet
-		for artist_name in artists_reference:
-			artists_with_similarity.append([calculate_similarity(bare_bones(artist_name), artist_input), artist_name]) 
-		artists_with_similarity = sort_similarity_lists(artists_with_similarity)
-		# If the most accurate artist doesn't have at least 500 points, discard the loop cycle and iterate the next song in the list
-		# This is done to immediately eliminate covers of songs
-		if artists_with_similarity != [] and artists_with_similarity[0][0] > 500:
-			song_similarity += artists_with_similarity[0][0]
-		else:
-			continue
-		
-		title_input = bare_bones(query_title) # Strips down the title
-		title_reference = remove_feat(song.title) # Removes all features included in the title
-		song_similarity += calculate_similarity(bare_bones(title_reference), title_input) # Calculates their similarity and adds it to the overall score
-
-		if query_collection != None and song.collection != None: 
-			collection_input = bare_bones(query_collection)
-			collection_reference = song.collection.title
-			song_similarity += calculate_similarity(bare_bones(collection_reference), collection_input)
-
-		if query_is_explicit != None and song.is_explicit != None: # Since these are boolean values, you can just check them and then add the points or not
-			if query_is_explicit == song.is_explicit:
-				song_similarity += 500
-
-		if query_song_type != None and song.type != None: # Since these are boolean values, you can just check them and then add the points or not
-			if query_song_type == song.type:
-				song_similarity += 500
-
-		data_with_similarity.append([song_similarity, song])
-	
-	data_with_similarity = sort_similarity_lists(data_with_similarity) # Sort the list from the biggest to smallest score
-	if data_with_similarity != []: # Check if the list is empty
-		top_result = data_with_similarity[0]
-		top_data = top_result[1]
+	# Strip down the query of any stylization and convert all characters into their latin counterparts, once for all songs
+	prepared_query = PreparedQuery(artists = query_artists, title = query_title, collection = query_collection)
+
+	# Every criteria gets scored for all songs at once, one column each, and the columns get added up in this order
+	# Songs whose most accurate artist doesn't have more than 500 points are thrown out right away, this immediately eliminates covers of songs
+	artists = artist_scores(songs, prepared_query.artist)
+	passed = passing(artists)
+	best = best_candidate(
+		artists,
+		passed,
+		title_scores(songs, prepared_query.title, passed), # Titles are stripped down and have their features removed
+		collection_scores(songs, prepared_query.collection, passed),
+		match_scores([song.is_explicit for song in songs], query_is_explicit, 500),
+		match_scores([song.type for song in songs], query_song_type, 500)
+	)
+
+	if best != None: # Check if any song has passed filtering
+		top_index, top_score = best
+		top_data = materialized(songs[top_index]) # Only the winner gets built into a real media object
 		filtering_time = current_unix_time_ms() - start_time
-		if percentage(max_score, top_result[0]) > 30: # Check if the similarity percentage is above 30%, if it's not discard the song and return an empty object			
+		if percentage(max_score, top_score) > 30: # Check if the similarity percentage is above 30%, if it's not discard the song and return an empty object			
 			top_song = Song(
 				service = top_data.service,
 				type = top_data.type,
@@ -125,7 +111,7 @@ async def filter_song(service: str, query_request: dict, songs: list, query_arti
 					request = top_data.meta.request,
 					http_code = top_data.meta.http_code,
 					processing_time = top_data.meta.processing_time[top_data.service] + filtering_time,
-					filter_confidence_percentage = {top_data.service: percentage(max_score, top_result[0])}
+					filter_confidence_percentage = {top_data.service: percentage(max_score, top_score)}
 				)
 			)
 			
@@ -138,7 +124,7 @@ async def filter_song(service: str, query_request: dict, songs: list, query_arti
 					request = top_data.meta.request,
 					http_code = 204,
 					processing_time = top_data.meta.processing_time,
-					filter_confidence_percentage = {service: percentage(max_score, top_result[0])}
+					filter_confidence_percentage = {service: percentage(max_score, top_score)}
 				)
 			)
 			await log(response)
@@ -160,6 +146,7 @@ async def filter_song(service: str, query_request: dict, songs: list, query_arti
 
 
 
+@stage('filter')
 async def filter_mv(service: str, query_request: dict, videos: list, query_artists: list, query_title: str, query_is_explicit: bool = None, query_country_code: str = None) -> Song:
 	"""
 		# Music video filtering function
@@ -187,42 +174,25 @@ async def filter_mv(service: str, query_request: dict, videos: list, query_artis
 	if query_is_explicit != None:
 		max_score += 500
 
-	data_with_similarity = [] # Empty list for music videos with their similiarity score
-	for video in videos:
-		song_similarity = 0 # Music video similarity overall score, the beginning score is always zero
-		
-		artist_input = bare_bones(query_artists[0]) # Strip down the artist name of any stylization and convert all characters into their latin counterparts
-		artists_reference = [artist.name for artist in video.artists]
-		artists_with_similarity = []
-
-		# This accounts all the artists in a music video: checks their similarity with the query data, sorts that data from the highest to lowest, and then applies the highest score to the music video similarity overall score
-		# In the distant future this will be able to use Artist objects but we're not there yet
-		for artist_name in artists_reference:
-			artists_with_similarity.append([calculate_similarity(bare_bones(artist_name), artist_input), artist_name])
-		artists_with_similarity = sort_similarity_lists(artists_with_similarity)
-		# If the most accurate artist doesn't have at least 500 points, discard the loop cycle and iterate the next music video in the list
-		# This is done to immediately eliminate covers or fan-made unofficial music videos
-		if artists_with_similarity != [] and artists_with_similarity[0][0] > 500:
-			song_similarity += artists_with_similarity[0][0]
-		else:
-			continue
-
-		title_input = bare_bones(query_title) # Strips down the title
-		title_reference = remove_feat(video.title) # Removes all features included in the title
-		song_similarity += calculate_similarity(bare_bones(title_reference), title_input) # Calculates their similarity and adds it to the overall score
-
-		if query_is_explicit != None and video.is_explicit != None: # Since these are boolean values, you can just check them and then add the points or not
-			if query_is_explicit == video.is_explicit:
-				song_similarity += 500
-
-		data_with_similarity.append([song_similarity, video])
-	
-	data_with_similarity = sort_similarity_lists(data_with_similarity) # Sort the list from the biggest to smallest score
-	if data_with_similarity != []: # Check if the list is empty
-		top_result = data_with_similarity[0]
-		top_data = top_result[1]
+	# Strip down the query of any stylization and convert all characters into their latin counterparts, once for all music videos
+	prepared_query = PreparedQuery(artists = query_artists, title = query_title)
+
+	# Every criteria gets scored for all music videos at once, one column each, and the columns get added up in this order
+	# Music videos whose most accurate artist doesn't have more than 500 points are thrown out right away, this immediately eliminates covers or fan-made unofficial music videos
+	artists = artist_scores(videos, prepared_query.artist)
+	passed = passing(artists)
+	best = best_candidate(
+		artists,
+		passed,
+		title_scores(videos, prepared_query.title, passed), # Titles are stripped down and have their features removed
+		match_scores([video.is_explicit for video in videos], query_is_explicit, 500)
+	)
+
+	if best != None: # Check if any music video has passed filtering
+		top_index, top_score = best
+		top_data = materialized(videos[top_index]) # Only the winner gets built into a real media object
 		filtering_time = current_unix_time_ms() - start_time
-		if percentage(max_score, top_result[0]) > 30: # Check if the similarity percentage is above 30%, if it's not discard the music video and return an empty object
+		if percentage(max_score, top_score) > 30: # Check if the similarity percentage is above 30%, if it's not discard the music video and return an empty object
 			top_video = MusicVideo(
 				service = top_data.service,
 				urls = top_data.urls,
@@ -238,7 +208,7 @@ async def filter_mv(service: str, query_request: dict, videos: list, query_artis
 					request = top_data.meta.request,
 					http_code = top_data.meta.http_code,
 					processing_time = top_data.meta.processing_time[top_data.service] + filtering_time,
-					filter_confidence_percentage = {top_data.service: percentage(max_score, top_result[0])}
+					filter_confidence_percentage = {top_data.service: percentage(max_score, top_score)}
 				)
 			)
 
@@ -251,7 +221,7 @@ async def filter_mv(service: str, query_request: dict, videos: list, query_artis
 					request = top_data.meta.request,
 					http_code = 204,
 					processing_time = top_data.meta.processing_time,
-					filter_confidence_percentage = {service: percentage(max_score, top_result[0])}
+					filter_confidence_percentage = {service: percentage(max_score, top_score)}
 				)
 			)
 			await log(response)
@@ -273,6 +243,7 @@ async def filter_mv(service: str, query_request: dict, videos: list, query_artis
 
 
 
+@stage('filter')
 async def filter_collection(service: str, query_request: dict, collections: list, query_artists: list, query_title: str, query_year: str = None, query_country_code: str = None) -> Collection:
 	"""
 		# Collection filtering function
@@ -301,42 +272,25 @@ async def filter_collection(service: str, query_request: dict, collections: list
 	if query_year != None:
 		max_score += 1000
 
-	data_with_similarity = [] # Empty list for collections with their similiarity score
-	for collection in collections:
-		collection_similarity = 0 # Collection similarity overall score, the beginning score is always zero
-
-		artist_input = bare_bones(query_artists[0]) # Strip down the artist name of any stylization and convert all characters into their latin counterparts
-		artists_reference = [artist.name for artist in collection.artists]
-		artists_with_similarity = []
-
-		# This accounts all the artists in a collection: checks their similarity with the query data, sorts that data from the highest to lowest, and then applies the highest score to the music video similarity overall score
-		# In the distant future this will be able to use Artist objects but we're not there yet
-		for artist_name in artists_reference:
-			artists_with_similarity.append([calculate_similarity(bare_bones(artist_name), artist_input), artist_name])
-		artists_with_similarity = sort_similarity_lists(artists_with_similarity)
-		# If the most accurate artist doesn't have at least 500 points, discard the loop cycle and iterate the next collection in the list
-		# This is done to immediately eliminate covers or bootlegs of collections
-		if artists_with_similarity != [] and artists_with_similarity[0][0] > 500:
-			collection_similarity += artists_with_similarity[0][0]
-		else:
-			continue
-
-		title_input = bare_bones(query_title) # Strips down the title
-		title_reference = remove_feat(collection.title) # Removes all features included in the title
-		collection_similarity += calculate_similarity(bare_bones(title_reference), title_input) # Calculates their similarity and adds it to the overall score
-
-		if query_year != None and collection.release_year != None: # Since these are boolean values, you can just check them and then add the points or not
-			if query_year == collection.release_year:
-				collection_similarity += 1000
-
-		data_with_similarity.append([collection_similarity, collection])
-
-	data_with_similarity = sort_similarity_lists(data_with_similarity) # Sort the list from the biggest to smallest score
-	if data_with_similarity != []: # Check if the list is empty
-		top_result = data_with_similarity[0]
-		top_data = top_result[1]
+	# Strip down the query of any stylization and convert all characters into their latin counterparts, once for all collections
+	prepared_query = PreparedQuery(artists = query_artists, title = query_title)
+
+	# Every criteria gets scored for all collections at once, one column each, and the columns get added up in this order
+	# Collections whose most accurate artist doesn't have more than 500 points are thrown out right away, this immediately eliminates covers or bootlegs of collections
+	artists = artist_scores(collections, prepared_query.artist)
+	passed = passing(artists)
+	best = best_candidate(
+		artists,
+		passed,
+		title_scores(collections, prepared_query.title, passed), # Titles are stripped down and have their features removed
+		match_scores([collection.release_year for collection in collections], query_year, 1000)
+	)
+
+	if best != None: # Check if any collection has passed filtering
+		top_index, top_score = best
+		top_data = materialized(collections[top_index]) # Only the winner gets built into a real media object
 		filtering_time = current_unix_time_ms() - start_time
-		if percentage(max_score, top_result[0]) > 30: # Check if the similarity percentage is above 30%, if it's not discard the collection and return an empty object
+		if percentage(max_score, top_score) > 30: # Check if the similarity percentage is above 30%, if it's not discard the collection and return an empty object
 			top_collection = Collection(
 				service = top_data.service,
 				type = top_data.type,
@@ -352,7 +306,7 @@ async def filter_collection(service: str, query_request: dict, collections: list
 					request = top_data.meta.request,
 					http_code = top_data.meta.http_code,
 					processing_time = top_data.meta.processing_time[top_data.service] + filtering_time,
-					filter_confidence_percentage = {service: percentage(max_score, top_result[0])}
+					filter_confidence_percentage = {service: percentage(max_score, top_score)}
 				)
 			)
 			
@@ -364,7 +318,7 @@ async def filter_collection(service: str, query_request: dict, collections: list
 					service = top_data[1].service,
 					request = top_data[1].meta.request,
 					processing_time = top_data[1].meta.processing_time,
-					filter_confidence_percentage = {service: percentage(max_score, top_result[0])},
+					filter_confidence_percentage = {service: percentage(max_score, top_score)},
 					http_code = 204
 				)
 			)
@@ -387,6 +341,7 @@ async def filter_collection(service: str, query_request: dict, collections: list
 
 
 
+@stage('filter')
 async def filter_query(service: str, query_request: dict, items: list, query: str, query_is_explicit: bool = None, query_country_code: str = None) -> Song :
 	"""
 		# Query filtering function
@@ -420,27 +375,29 @@ async def filter_query(service: str, query_request: dict, items: list, query: st
 	collection_types = ['album', 'ep']
 	video_types = ['music_video']
 
+	# Strip down the query of any stylization and convert all characters into their latin counterparts, once for all items
+	prepared_query = PreparedQuery(query = query)
+
 	data_with_similarity = [] # Empty list for items with their similiarity score
 	for item in items:
 		item_similarity = 0 # Song similarity overall score, the beginning score is always zero
 
-		artist_names = []
-		for artist in item.artists:
-			artist_names.append(bare_bones(artist.name))
+		artist_names = prepared_artists(item)
+		all_artists = ' '.join(artist_names)
+		title = bare_bones(item.title)
 
-		query_input = bare_bones(query) # Strip down the query of any stylization and convert all characters into their latin counterparts
 		possible_queries = [ # Some possible queries
-			f'{bare_bones(item.title)}',
-			f'{bare_bones(item.title)}{' song' if item.type in song_types else ''}',
-			f'{bare_bones(item.title)}{f' {item.type}' if item.type in collection_types else ''}',
-			f'{bare_bones(item.title)}{' music video' if item.type in video_types else ''}',
-			f'{' '.join(artist_names)} {bare_bones(item.title)}',
-			f'{artist_names[0]} {bare_bones(item.title)}',
-			f'{bare_bones(item.title)} {' '.join(artist_names)}',
-			f'{bare_bones(item.title)} {artist_names[0]}',
-			f'{' '.join(artist_names)} {bare_bones(item.title)}{' song' if item.type in song_types else ''}',
-			f'{' '.join(artist_names)} {bare_bones(item.title)}{f' {item.type}' if item.type in collection_types else ''}',
-			f'{' '.join(artist_names)} {bare_bones(item.title)}{' music video' if item.type in video_types else ''}'
+			f'{title}',
+			f'{title}{' song' if item.type in song_types else ''}',
+			f'{title}{f' {item.type}' if item.type in collection_types else ''}',
+			f'{title}{' music video' if item.type in video_types else ''}',
+			f'{all_artists} {title}',
+			f'{artist_names[0]} {title}',
+			f'{title} {all_artists}',
+			f'{title} {artist_names[0]}',
+			f'{all_artists} {title}{' song' if item.type in song_types else ''}',
+			f'{all_artists} {title}{f' {item.type}' if item.type in collection_types else ''}',
+			f'{all_artists} {title}{' music video' if item.type in video_types else ''}'
 		]
 		possible_queries = remove_duplicates(possible_queries)
 		queries_with_similarity = []
@@ -448,7 +405,7 @@ async def filter_query(service: str, query_request: dict, items: list, query: st
 		# This accounts all the artists in a song: checks their similarity with the query data, sorts that data from the highest to lowest, and then applies the highest score to the song similarity overall score
 		# In the distant future this will be able to use Artist objects but we're not there yet
 		for possible_query in possible_queries:
-			queries_with_similarity.append([calculate_similarity(possible_query, query_input), possible_query]) 
+			queries_with_similarity.append([calculate_similarity(possible_query, prepared_query.query), possible_query]) 
 		queries_with_similarity = sort_similarity_lists(queries_with_similarity)
 
 		winning_query = queries_with_similarity[0]
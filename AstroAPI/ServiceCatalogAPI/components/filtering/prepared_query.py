@@ -0,0 +1,50 @@
+from AstroAPI.InternalComponents.Legacy.text_manipulation import bare_bones, remove_feat
+from AstroAPI.ServiceCatalogAPI.components.filtering.candidate import artist_names_of, collection_title_of
+
+
+
+"""
+	--- PREPARED QUERIES ---
+
+	The filtering functions compare the same query against every candidate, so the query only
+	gets normalized once per filter call, into a prepared query that carries every normalized
+	form of it the filters need.
+
+	The candidates' strings get normalized through the functions below. bare_bones and
+	remove_feat are memoized (see text_manipulation.py), and since the same artist names and
+	titles come back from every service and across requests, most of them are already done.
+"""
+
+
+
+class PreparedQuery:
+	__slots__ = ('artist', 'title', 'collection', 'query')
+
+	def __init__(self, artists: list = None, title: str = None, collection: str = None, query: str = None):
+		"""
+			:param artists: Optional. The artists provided in the API search function query. Only the first one is used.
+			:param title: Optional. The title provided in the API search function query.
+			:param collection: Optional. The collection provided in the API search function query.
+			:param query: Optional. The free-form query provided in the API search function query.
+		"""
+		self.artist = bare_bones(artists[0]) if artists else None
+		self.title = bare_bones(title) if title != None else None
+		self.collection = bare_bones(collection) if collection != None else None
+		self.query = bare_bones(query) if query != None else None
+
+
+
+def prepared_artists(media: object) -> list[str]:
+	return [bare_bones(name) for name in artist_names_of(media)]
+
+
+
+def prepared_title(media: object) -> str:
+	# Features are left out of titles, the query usually doesn't have them
+	return bare_bones(remove_feat(media.title))
+
+
+
+def prepared_collection(media: object) -> str | None:
+	collection_title = collection_title_of(media)
+	return bare_bones(collection_title) if collection_title != None else None
@@ -1,5 +1,7 @@
 from AstroAPI.InternalComponents.Legacy.ini import text
+from AstroAPI.InternalComponents.TimingManager import include_stage_times
 from AstroAPI.InternalComponents.Legacy.text_manipulation import censor_text
+from AstroAPI.ServiceCatalogAPI.components.serialization import lite
 
 missing_image = text['images']['missing_image']
 
@@ -37,17 +39,21 @@ class Meta:
 		 :param http_code: The HTTP code returned by an Astro component.
 		 :param processing_time: The amount of time in milliseconds that an Astro component took to form the orignial media object.
 		 :param filter_confidence_percentage: Optional. Astro's confidence in how accurately it got the correct media object.
+		 :param timed_out: Optional. Services that didn't answer before the request's deadline, and were left out of the result.
+		 :param stage_times: Optional. Milliseconds the component (and every service it waited for) spent in each stage, see the stage timer.
 	"""
 
-	def __init__(self, service: str, request: dict, processing_time: int | dict, http_code: int | dict, filter_confidence_percentage: int | float | dict | None = None):
+	__slots__ = ('_service', '_request', '_http_code', '_processing_time', '_filter_confidence_percentage', '_timed_out', '_stage_times')
+
+	def __init__(self, service: str, request: dict, processing_time: int | dict, http_code: int | dict, filter_confidence_percentage: int | float | dict | None = None, timed_out: list | None = None, stage_times: dict | None = None):
 		self._service = service
 		self._request = request
 		self._http_code = http_code
-		self._processing_time = processing_time if isinstance(processing_time, dict) else {service: processing_time}
-		if isinstance(filter_confidence_percentage, dict):
-			self._filter_confidence_percentage = filter_confidence_percentage
-		else:
-			self._filter_confidence_percentage = {service: 0.0} if filter_confidence_percentage is None else {service: filter_confidence_percentage}
+		# Plain values get wrapped into {service: value} dicts on first access, most metas of artists and covers never get read
+		self._processing_time = processing_time
+		self._filter_confidence_percentage = filter_confidence_percentage if filter_confidence_percentage is not None else 0.0
+		self._timed_out = timed_out # Only requests with a deadline have any, so the empty list isn't allocated until it's needed
+		self._stage_times = stage_times
 
 	@property
 	def service(self):
@@ -75,6 +81,8 @@ class Meta:
 
 	@property
 	def processing_time(self):
+		if not isinstance(self._processing_time, dict):
+			self._processing_time = {self._service: self._processing_time}
 		return self._processing_time
 
 	@processing_time.setter
@@ -88,6 +96,8 @@ class Meta:
 
 	@property
 	def filter_confidence_percentage(self):
+		if not isinstance(self._filter_confidence_percentage, dict):
+			self._filter_confidence_percentage = {self._service: self._filter_confidence_percentage}
 		return self._filter_confidence_percentage
 
 	@filter_confidence_percentage.setter
@@ -99,14 +109,38 @@ class Meta:
 			service = self._service
 			self._filter_confidence_percentage = {service: value}
 
+	@property
+	def timed_out(self):
+		if self._timed_out is None:
+			self._timed_out = []
+		return self._timed_out
+
+	@timed_out.setter
+	def timed_out(self, value: list | None):
+		self._timed_out = value
+
+	@property
+	def stage_times(self):
+		# Metas pickled into the response cache before stage times existed don't have the slot set
+		return getattr(self, '_stage_times', None) or {}
+
+	@stage_times.setter
+	def stage_times(self, value: dict | None):
+		self._stage_times = value
+
 	@property
 	def json(self):
-		return {
+		meta = {
 			'request': self._request,
 			'http_code': self._http_code,
-			'processing_time': self._processing_time,
-			'filter_confidence_percentage': self._filter_confidence_percentage,
+			'processing_time': self.processing_time,
+			'filter_confidence_percentage': self.filter_confidence_percentage,
+			'timed_out': self._timed_out if self._timed_out is not None else [],
 		}
+		# Only requests that ask for the stage breakdown get it
+		if include_stage_times.get():
+			meta['stage_times'] = self.stage_times
+		return meta
 
 
 
@@ -135,11 +169,12 @@ class Song:
 		 :param meta: The technical metadata of the song.
 	"""
 
+	__slots__ = ('_service', '_type', '_urls', '_ids', '_previews', '_title', '_censored_title', '_artists', '_collection', '_cover', '_genre', '_is_explicit', '_meta')
+
 	def __init__(self, service: str, type: str, urls: str | dict, ids: str | dict, title: str, artists: list[object], cover: object, meta: object, previews: str | dict = None, collection: object = None, genre: str = None, is_explicit: bool = None) -> object:
 		urls = {service: urls} if not isinstance(urls, dict) else urls
 		ids = {service: str(ids)} if not isinstance(ids, dict) else ids
 		previews = {service: previews} if not isinstance(previews, dict) or previews == None else previews
-		censored_title = censor_text(title)
 		
 		self._service = service
 		self._type = type
@@ -147,7 +182,7 @@ class Song:
 		self._ids = ids
 		self._previews = {k: v for k, v in previews.items() if v is not None}
 		self._title = title
-		self._censored_title = censored_title
+		self._censored_title = None # Censored on first access
 		self._artists = artists
 		self._collection = collection
 		self._cover = cover
@@ -211,10 +246,14 @@ class Song:
 	@title.setter
 	def title(self, value: str):
 		self._title = value
+		self._censored_title = None
 
 	# Censored title
 	@property
 	def censored_title(self):
+		# Censoring is done lazily, most objects get thrown out by filtering before anyone needs it
+		if self._censored_title is None:
+			self._censored_title = censor_text(self._title)
 		return self._censored_title
 
 	@censored_title.setter
@@ -295,10 +334,10 @@ class Song:
 			'ids': self._ids,
 			'previews': self._previews,
 			'title': self._title,
-			'censored_title': self._censored_title,
-			'artists': [artist.json_lite for artist in self.artists],
-			'collection': self._collection.json_lite if self._collection else None,
-			'cover': self._cover.json_lite if self.cover else None,
+			'censored_title': self.censored_title,
+			'artists': [lite(artist) for artist in self.artists],
+			'collection': lite(self._collection) if self._collection else None,
+			'cover': lite(self._cover) if self.cover else None,
 			'genre': self._genre,
 			'is_explicit': self.is_explicit,
 			'meta': meta
@@ -314,10 +353,10 @@ class Song:
 			'ids': self._ids,
 			'previews': self._previews,
 			'title': self._title,
-			'censored_title': self._censored_title,
-			'artists': [artist.json_lite for artist in self.artists],
-			'collection': self._collection.json_lite if self._collection else None,
-			'cover': self._cover.json_lite if self.cover else None,
+			'censored_title': self.censored_title,
+			'artists': [lite(artist) for artist in self.artists],
+			'collection': lite(self._collection) if self._collection else None,
+			'cover': lite(self._cover) if self.cover else None,
 			'genre': self._genre,
 			'is_explicit': self.is_explicit
 		}
@@ -344,12 +383,13 @@ class MusicVideo:
 		 :param meta: The technical metadata of the music video.
 	"""
 
+	__slots__ = ('_service', '_type', '_urls', '_ids', '_previews', '_title', '_censored_title', '_artists', '_cover', '_genre', '_is_explicit', '_meta')
+
 	def __init__(self, service: str, urls: str | dict, ids: str | dict, title: str, artists: list[object], cover: object, meta: object, previews: str | dict = None, is_explicit: bool = None, genre: str = None) -> object:
 		type = 'music_video'
 		urls = {service: urls} if not isinstance(urls, dict) else urls
 		ids = {service: str(ids)} if not isinstance(ids, dict) else ids
 		previews = {service: previews} if not isinstance(previews, dict) or previews == None else previews
-		censored_title = censor_text(title)
 		
 		self._service = service
 		self._type = type
@@ -357,7 +397,7 @@ class MusicVideo:
 		self._ids = ids
 		self._previews = {k: v for k, v in previews.items() if v is not None}
 		self._title = title
-		self._censored_title = censored_title
+		self._censored_title = None # Censored on first access
 		self._artists = artists
 		self._cover = cover
 		self._genre = genre
@@ -416,10 +456,14 @@ class MusicVideo:
 	@title.setter
 	def title(self, value: str):
 		self._title = value
+		self._censored_title = None
 
 	# Censored title
 	@property
 	def censored_title(self):
+		# Censoring is done lazily, most objects get thrown out by filtering before anyone needs it
+		if self._censored_title is None:
+			self._censored_title = censor_text(self._title)
 		return self._censored_title
 
 	@censored_title.setter
@@ -482,9 +526,9 @@ class MusicVideo:
 			'ids': self._ids,
 			'previews': self._previews,
 			'title': self._title,
-			'censored_title': self._censored_title,
-			'artists': [artist.json_lite for artist in self.artists],
-			'cover': self.cover.json_lite,
+			'censored_title': self.censored_title,
+			'artists': [lite(artist) for artist in self.artists],
+			'cover': lite(self.cover),
 			'genre': self.genre,
 			'is_explicit': self.is_explicit,
 			'meta': meta
@@ -500,9 +544,9 @@ class MusicVideo:
 			'ids': self._ids,
 			'previews': self._previews,
 			'title': self._title,
-			'censored_title': self._censored_title,
-			'artists': [artist.json_lite for artist in self.artists],
-			'cover': self.cover.json_lite,
+			'censored_title': self.censored_title,
+			'artists': [lite(artist) for artist in self.artists],
+			'cover': lite(self.cover),
 			'genre': self.genre,
 			'is_explicit': self.is_explicit
 		}
@@ -530,17 +574,18 @@ class Collection:
 		 :param meta: The technical metadata of the collection.
 	"""
 
+	__slots__ = ('_service', '_type', '_urls', '_ids', '_title', '_censored_title', '_artists', '_release_year', '_cover', '_genre', '_meta')
+
 	def __init__(self, service: str, type: str, urls: str | dict, ids: str | dict, title: str, artists: list[object], cover: object, meta: object, release_year: int = None, genre: str = None) -> object:
 		urls = {service: urls} if not isinstance(urls, dict) else urls
 		ids = {service: str(ids)} if not isinstance(ids, dict) else ids
-		censored_title = censor_text(title)
 
 		self._service = service
 		self._type = type
 		self._urls = urls
 		self._ids = ids
 		self._title = title
-		self._censored_title = censored_title
+		self._censored_title = None # Censored on first access
 		self._artists = artists
 		self._release_year = release_year if isinstance(release_year, int) or release_year == None else int(release_year)
 		self._cover = cover
@@ -591,10 +636,14 @@ class Collection:
 	@title.setter
 	def title(self, value: str):
 		self._title = value
+		self._censored_title = None
 
 	# Censored title
 	@property
 	def censored_title(self):
+		# Censoring is done lazily, most objects get thrown out by filtering before anyone needs it
+		if self._censored_title is None:
+			self._censored_title = censor_text(self._title)
 		return self._censored_title
 
 	@censored_title.setter
@@ -656,10 +705,10 @@ class Collection:
 			'urls': self._urls,
 			'ids': self._ids,
 			'title': self._title,
-			'censored_title': self._censored_title,
-			'artists': [artist.json_lite for artist in self._artists],
+			'censored_title': self.censored_title,
+			'artists': [lite(artist) for artist in self._artists],
 			'release_year': self._release_year,
-			'cover': self._cover.json_lite if self._cover else None,
+			'cover': lite(self._cover) if self._cover else None,
 			'genre': self._genre,
 			'meta': meta
 		}
@@ -673,10 +722,10 @@ class Collection:
 			'urls': self._urls,
 			'ids': self._ids,
 			'title': self._title,
-			'censored_title': self._censored_title,
-			'artists': [artist.json_lite for artist in self._artists],
+			'censored_title': self.censored_title,
+			'artists': [lite(artist) for artist in self._artists],
 			'release_year': self._release_year,
-			'cover': self._cover.json_lite if self._cover else None,
+			'cover': lite(self._cover) if self._cover else None,
 			'genre': self._genre
 		}
 
@@ -699,6 +748,8 @@ class Artist:
 		 :param meta: The technical metadata of the artist.
 	"""
 
+	__slots__ = ('_service', '_type', '_urls', '_ids', '_name', '_genre', '_profile_picture', '_meta')
+
 	def __init__(self, service: str, urls: str | dict, ids: str | dict, name: str, meta: object, profile_picture: object = None, genre: str = None) -> object:
 		type = 'artist'
 		urls = {service: urls} if not isinstance(urls, dict) else urls
@@ -792,7 +843,7 @@ class Artist:
 			'ids': self._ids,
 			'name': self._name,
 			'genre': self._genre,
-			'profile_picture': self._profile_picture.json_lite if self._profile_picture else None,
+			'profile_picture': lite(self._profile_picture) if self._profile_picture else None,
 			'meta': meta
 		}
 
@@ -805,7 +856,7 @@ class Artist:
 			'ids': self._ids,
 			'name': self._name,
 			'genre': self._genre,
-			'profile_picture': self._profile_picture.json_lite if self._profile_picture else None
+			'profile_picture': lite(self._profile_picture) if self._profile_picture else None
 		}
 
 
@@ -827,18 +878,19 @@ class Cover:
 		 :param meta: The technical metadata of the artist.
 	"""
 
+	__slots__ = ('_service', '_type', '_media_type', '_title', '_censored_title', '_artists', '_hq_urls', '_lq_urls', '_meta')
+
 	def __init__(self, service: str, media_type: str, title: str, artists: list[object], hq_urls: str | dict | None, lq_urls: str | dict | None, meta: object) -> object:
 		hq_urls = {service: hq_urls} if not isinstance(hq_urls, dict) else hq_urls
 		hq_urls = {service: missing_image} if hq_urls is None else hq_urls
 		lq_urls = {service: lq_urls} if not isinstance(lq_urls, dict) else lq_urls
 		lq_urls = {service: missing_image} if lq_urls is None else lq_urls
-		censored_title = censor_text(title)
 
 		self._service = service
 		self._type = 'cover'  # constant, no setter per request
 		self._media_type = media_type
 		self._title = title
-		self._censored_title = censored_title
+		self._censored_title = None # Censored on first access
 		self._artists = artists
 		self._hq_urls = hq_urls
 		self._lq_urls = lq_urls
@@ -875,10 +927,14 @@ class Cover:
 	@title.setter
 	def title(self, value: str):
 		self._title = value
+		self._censored_title = None
 
 	# Censored title
 	@property
 	def censored_title(self):
+		# Censoring is done lazily, most objects get thrown out by filtering before anyone needs it
+		if self._censored_title is None:
+			self._censored_title = censor_text(self._title)
 		return self._censored_title
 
 	@censored_title.setter
@@ -932,8 +988,8 @@ class Cover:
 			'type': self._type,
 			'media_type': self._media_type,
 			'title': self._title,
-			'censored_title': self._censored_title,
-			'artists': [artist.json_lite for artist in self._artists],
+			'censored_title': self.censored_title,
+			'artists': [lite(artist) for artist in self._artists],
 			'hq_urls': self._hq_urls,
 			'lq_urls': self._lq_urls,
 			'meta': meta_val
@@ -966,6 +1022,8 @@ class ProfilePicture:
 		 :param meta: The technical metadata of the profile picture.
 	"""
 
+	__slots__ = ('_service', '_type', '_user_type', '_hq_urls', '_lq_urls', '_meta')
+
 	def __init__(self, service: str, user_type: str, meta: object, hq_urls: str | dict = None, lq_urls: str | dict = None) -> object:
 		hq_urls = {service: hq_urls} if not isinstance(hq_urls, dict) else hq_urls
 		hq_urls = {service: missing_image} if hq_urls is None else hq_urls
@@ -1101,12 +1159,12 @@ class SongKnowledge:
 		None: None
 	}
 
+	__slots__ = ('_service', '_type', '_media_type', '_urls', '_ids', '_title', '_censored_title', '_artists', '_collection', '_description', '_censored_description', '_release_date', '_cover', '_genre', '_is_explicit', '_bpm', '_key', '_length', '_time_signature', '_meta')
+
 	def __init__(self, service: str, media_type: str, urls: str | dict, ids: str | dict, title: str, artists: list[object], cover: object, meta: object, description: str = None, collection: object = None, release_date: str = None, is_explicit: bool = None, genre: str = None, bpm: float = None, key: int = None, length: int = None, time_signature: int = None) -> object:
 		urls = {service: urls} if not isinstance(urls, dict) else urls
 		ids = {service: str(ids)} if not isinstance(ids, dict) else ids
 		description = description if description != '?' and description != '' else None
-		censored_title = censor_text(title)
-		censored_description = censor_text(description)
 		time_signature = f'1/{time_signature}' if time_signature is not None else None
 		key_mapped = self._PITCH_CLASS.get(key, None)
 
@@ -1116,11 +1174,11 @@ class SongKnowledge:
 		self._urls = urls
 		self._ids = ids
 		self._title = title
-		self._censored_title = censored_title
+		self._censored_title = None # Censored on first access
 		self._artists = artists
 		self._collection = collection
 		self._description = description
-		self._censored_description = censored_description
+		self._censored_description = None # Censored on first access
 		self._release_date = release_date
 		self._cover = cover
 		self._genre = genre
@@ -1184,10 +1242,14 @@ class SongKnowledge:
 	@title.setter
 	def title(self, value: str):
 		self._title = value
+		self._censored_title = None
 
 	# Censored title
 	@property
 	def censored_title(self):
+		# Censoring is done lazily, most objects get thrown out by filtering before anyone needs it
+		if self._censored_title is None:
+			self._censored_title = censor_text(self._title)
 		return self._censored_title
 
 	@censored_title.setter
@@ -1220,11 +1282,13 @@ class SongKnowledge:
 	@description.setter
 	def description(self, value: str):
 		self._description = value
-		self._censored_description = censor_text(value)
+		self._censored_description = None
 
 	# Censored description
 	@property
 	def censored_description(self):
+		if self._censored_description is None:
+			self._censored_description = censor_text(self._description)
 		return self._censored_description
 
 	@censored_description.setter
@@ -1343,13 +1407,13 @@ class SongKnowledge:
 			'urls': self._urls,
 			'ids': self._ids,
 			'title': self._title,
-			'censored_title': self._censored_title,
-			'artists': [artist.json_lite for artist in self._artists],
-			'collection': self._collection.json_lite if self._collection else None,
+			'censored_title': self.censored_title,
+			'artists': [lite(artist) for artist in self._artists],
+			'collection': lite(self._collection) if self._collection else None,
 			'description': self._description,
-			'censored_description': self._censored_description,
+			'censored_description': self.censored_description,
 			'release_date': self._release_date,
-			'cover': self._cover.json_lite if self._cover else None,
+			'cover': lite(self._cover) if self._cover else None,
 			'genre': self._genre,
 			'is_explicit': self._is_explicit,
 			'bpm': self._bpm,
@@ -1368,13 +1432,13 @@ class SongKnowledge:
 			'urls': self._urls,
 			'ids': self._ids,
 			'title': self._title,
-			'censored_title': self._censored_title,
-			'artists': [artist.json_lite for artist in self._artists],
-			'collection': self._collection.json_lite if self._collection else None,
+			'censored_title': self.censored_title,
+			'artists': [lite(artist) for artist in self._artists],
+			'collection': lite(self._collection) if self._collection else None,
 			'description': self._description,
-			'censored_description': self._censored_description,
+			'censored_description': self.censored_description,
 			'release_date': self._release_date,
-			'cover': self._cover.json_lite if self._cover else None,
+			'cover': lite(self._cover) if self._cover else None,
 			'genre': self._genre,
 			'is_explicit': self._is_explicit,
 			'bpm': self._bpm,
@@ -1407,12 +1471,12 @@ class CollectionKnowledge:
 		 :param meta: The technical metadata of the song.
 	"""
 
+	__slots__ = ('_service', '_type', '_media_type', '_urls', '_ids', '_title', '_censored_title', '_artists', '_description', '_censored_description', '_release_date', '_cover', '_genre', '_meta')
+
 	def __init__(self, service: str, media_type: str, urls: str | dict, ids: str | dict, title: str, artists: list[object], cover: object, meta: object, description: str = None, release_date: str = None, genre: str = None) -> object:
 		urls = {service: urls} if not isinstance(urls, dict) else urls
 		ids = {service: str(ids)} if not isinstance(ids, dict) else ids
 		description = description if description != '?' and description != '' else None
-		censored_title = censor_text(title)
-		censored_description = censor_text(description)
 
 		self._service = service
 		self._type = 'knowledge'
@@ -1420,10 +1484,10 @@ class CollectionKnowledge:
 		self._urls = urls
 		self._ids = ids
 		self._title = title
-		self._censored_title = censored_title
+		self._censored_title = None # Censored on first access
 		self._artists = artists
 		self._description = description
-		self._censored_description = censored_description
+		self._censored_description = None # Censored on first access
 		self._release_date = release_date
 		self._cover = cover
 		self._genre = genre
@@ -1482,10 +1546,14 @@ class CollectionKnowledge:
 	@title.setter
 	def title(self, value: str):
 		self._title = value
+		self._censored_title = None
 
 	# Censored title
 	@property
 	def censored_title(self):
+		# Censoring is done lazily, most objects get thrown out by filtering before anyone needs it
+		if self._censored_title is None:
+			self._censored_title = censor_text(self._title)
 		return self._censored_title
 
 	@censored_title.setter
@@ -1509,11 +1577,13 @@ class CollectionKnowledge:
 	@description.setter
 	def description(self, value: str):
 		self._description = value
-		self._censored_description = censor_text(value)
+		self._censored_description = None
 
 	# Censored description
 	@property
 	def censored_description(self):
+		if self._censored_description is None:
+			self._censored_description = censor_text(self._description)
 		return self._censored_description
 
 	@censored_description.setter
@@ -1567,12 +1637,12 @@ class CollectionKnowledge:
 			'urls': self._urls,
 			'ids': self._ids,
 			'title': self._title,
-			'censored_title': self._censored_title,
-			'artists': [artist.json_lite for artist in self._artists],
+			'censored_title': self.censored_title,
+			'artists': [lite(artist) for artist in self._artists],
 			'description': self._description,
-			'censored_description': self._censored_description,
+			'censored_description': self.censored_description,
 			'release_date': self._release_date,
-			'cover': self._cover.json_lite if self._cover else None,
+			'cover': lite(self._cover) if self._cover else None,
 			'genre': self._genre,
 			'meta': meta_val
 		}
@@ -1586,18 +1656,20 @@ class CollectionKnowledge:
 			'urls': self._urls,
 			'ids': self._ids,
 			'title': self._title,
-			'censored_title': self._censored_title,
-			'artists': [artist.json_lite for artist in self._artists],
+			'censored_title': self.censored_title,
+			'artists': [lite(artist) for artist in self._artists],
 			'description': self._description,
-			'censored_description': self._censored_description,
+			'censored_description': self.censored_description,
 			'release_date': self._release_date,
-			'cover': self._cover.json_lite if self._cover else None,
+			'cover': lite(self._cover) if self._cover else None,
 			'genre': self._genre,
 		}
 
 
 
 class Query:
+	__slots__ = ('_service', '_type', '_songs', '_music_videos', '_collections', '_artists', '_meta')
+
 	def __init__(self, service: str, meta: object, songs: list[object] = None, music_videos: list[object] = None, collections: list[object] = None, artists: list[object] = None, knowledge: list[object] = None):
 		self._service = service
 		self._type = 'query'
@@ -1673,10 +1745,10 @@ class Query:
 		return {
 			'service': self._service,
 			'type': self._type,
-			'songs': [song.json_lite for song in self._songs] if self._songs != [] else [],
-			'music_videos': [mv.json_lite for mv in self._music_videos] if self._music_videos != [] else [],
-			'collections': [collection.json_lite for collection in self._collections] if self._collections != [] else [],
-			'artists': [artist.json_lite for artist in self._artists] if self._artists != [] else [],
+			'songs': [lite(song) for song in self._songs] if self._songs != [] else [],
+			'music_videos': [lite(mv) for mv in self._music_videos] if self._music_videos != [] else [],
+			'collections': [lite(collection) for collection in self._collections] if self._collections != [] else [],
+			'artists': [lite(artist) for artist in self._artists] if self._artists != [] else [],
 			'meta': meta_val
 		}
 	
@@ -1686,10 +1758,10 @@ class Query:
 		return {
 			'service': self._service,
 			'type': self._type,
-			'songs': [song.json_lite for song in self._songs] if self._songs != [] else [],
-			'music_videos': [mv.json_lite for mv in self._music_videos] if self._music_videos != [] else [],
-			'collections': [collection.json_lite for collection in self._collections] if self._collections != [] else [],
-			'artists': [artist.json_lite for artist in self._artists] if self._artists != [] else [],
+			'songs': [lite(song) for song in self._songs] if self._songs != [] else [],
+			'music_videos': [lite(mv) for mv in self._music_videos] if self._music_videos != [] else [],
+			'collections': [lite(collection) for collection in self._collections] if self._collections != [] else [],
+			'artists': [lite(artist) for artist in self._artists] if self._artists != [] else [],
 		}
 	
 print('[ServiceCatalogAPI] Media objects initialized')
\ No newline at end of file
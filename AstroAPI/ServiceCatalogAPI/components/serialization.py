@@ -0,0 +1,82 @@
+from starlette.responses import Response
+from contextvars import ContextVar
+import json
+
+
+
+"""
+	--- THE SERIALIZER ---
+
+	Returning `object.json` from an endpoint means FastAPI walks the whole dict through
+	jsonable_encoder (in pure Python, value by value) before it even gets to json.dumps, and
+	a query search without filtering can have hundreds of objects in it. On top of that, the
+	same artists show up in a song, its collection and its cover, and their JSON gets rebuilt
+	for every single one of those.
+
+	Endpoints return a MediaResponse instead, which renders the media object straight into bytes
+	with the C JSON encoder and the exact same settings FastAPI uses, so the output doesn't change.
+	While an object is rendered, the light JSON representation of every sub-object gets built only
+	once, no matter how many times it shows up. The memo only lives as long as the render does,
+	so objects that get changed afterwards never get stale JSON.
+"""
+
+
+
+render_memo = ContextVar('render_memo', default = None)
+
+
+
+def fallback(value: object) -> object:
+	# Media objects inside of plain responses (ex. batch lookups), and whatever jsonable_encoder used to turn into lists
+	if hasattr(value, 'json'):
+		return value.json
+	if isinstance(value, (set, frozenset, tuple)):
+		return list(value)
+	raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+
+encoder = json.JSONEncoder(ensure_ascii = False, allow_nan = False, separators = (',', ':'), default = fallback)
+
+
+
+def lite(media: object) -> dict:
+	"""
+		The light JSON representation of a media object, only built once per render.
+
+		:param media: The media object.
+	"""
+	memo = render_memo.get()
+	if memo is None:
+		return media.json_lite
+	key = id(media)
+	representation = memo.get(key)
+	if representation is None:
+		representation = media.json_lite
+		memo[key] = representation
+	return representation
+
+
+
+def render(content: object) -> bytes:
+	"""
+		Render the JSON representation of a media object into bytes.
+
+		:param content: The media object, or a dict or list with media objects in it.
+	"""
+	token = render_memo.set({})
+	try:
+		return encoder.encode(content.json if hasattr(content, 'json') else content).encode('utf-8')
+	finally:
+		render_memo.reset(token)
+
+
+
+class MediaResponse(Response):
+	media_type = 'application/json'
+
+	def render(self, content: object) -> bytes:
+		# Takes media objects (on their own or in a dict or list), or bytes that have already been rendered
+		if isinstance(content, bytes):
+			return content
+		return render(content)
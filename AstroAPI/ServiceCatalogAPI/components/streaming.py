@@ -0,0 +1,102 @@
+from .serialization import render
+from starlette.responses import StreamingResponse
+from contextvars import ContextVar
+import asyncio
+
+
+
+"""
+	--- THE STREAMER ---
+
+	A Global Interface request doesn't answer until every service is done (or the deadline runs
+	out) and their results are compiled, so clients like the Discord bot show "linking..." for as
+	long as the slowest service takes, even when the fastest one had a link a second earlier.
+
+	Requests with `stream=ndjson` or `stream=sse` get the answer as a stream of events instead:
+	a `service_result` event for every service's result as soon as it comes in (and for premade
+	media, like the song a lookup started from, right away), then one `result` event with the
+	compiled object once it's done, after which the stream ends.
+
+	The fan-out finds out who to tell about results through a context variable, which the request
+	sets before it starts the call, so it flows into every task the call creates. A request that
+	gets coalesced into an identical one that's already running only gets the `result` event,
+	same as requests to services that don't fan out.
+"""
+
+
+
+stream_formats = ['ndjson', 'sse']
+stream_media_types = {
+	'ndjson': 'application/x-ndjson',
+	'sse': 'text/event-stream'
+}
+service_listener = ContextVar('service_listener', default = None)
+
+
+
+def announce(service: str, result: object) -> None:
+	"""
+		Tell the streaming request (if there is one) about a service's result.
+
+		:param service: The service the result is from.
+		:param result: The media object, empty response or error.
+	"""
+	listener = service_listener.get()
+	if listener is not None:
+		listener(service, result)
+
+
+
+def event(stream_format: str, name: str, content: dict) -> bytes:
+	# NDJSON is one JSON object per line, SSE also needs the event name and a blank line after every event
+	data = render({'event': name, **content})
+	if stream_format == 'sse':
+		return b'event: ' + name.encode('utf-8') + b'\ndata: ' + data + b'\n\n'
+	return data + b'\n'
+
+
+
+async def call_events(call):
+	"""
+		Run a call and yield every service result it announces, then the result of the call itself.
+		Yields (event name, content) tuples.
+
+		:param call: The coroutine of the call, not awaited yet.
+	"""
+	updates = asyncio.Queue()
+	token = service_listener.set(lambda service, result: updates.put_nowait((service, result)))
+	try:
+		task = asyncio.create_task(call) # The task gets a copy of the context, listener included
+	finally:
+		service_listener.reset(token)
+	task.add_done_callback(lambda task: updates.put_nowait(None))
+
+	announced = set()
+	while (update := await updates.get()) is not None:
+		service, result = update
+		# Media found by ID gets announced when it comes in and again when the search gets it as premade media, clients only need it once
+		if id(result) in announced:
+			continue
+		announced.add(id(result))
+		yield 'service_result', {'service': service, 'result': result}
+
+	result = task.result()
+	http_code = result.meta.http_code if result.type in ['error', 'empty_response'] else 200
+	yield 'result', {'service': result.service, 'http_code': http_code, 'result': result}
+
+
+
+async def rendered(updates, stream_format: str):
+	async for name, content in updates:
+		yield event(stream_format, name, content)
+
+
+
+class MediaStream(StreamingResponse):
+	def __init__(self, updates, stream_format: str):
+		"""
+			:param updates: Async iterator of (event name, content) tuples, ex. call_events().
+			:param stream_format: One of the stream formats.
+		"""
+		headers = {'Cache-Control': 'no-cache'} if stream_format == 'sse' else None
+		super().__init__(rendered(updates, stream_format), media_type = stream_media_types[stream_format], headers = headers)
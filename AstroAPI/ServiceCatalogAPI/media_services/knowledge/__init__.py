@@ -1,12 +1,8 @@
 """
 	# Knowledge Services
 
-	Summons and initializes the Spotify and Genius knowledge API-s, alongside the Global Knowledge API Interface.
-"""
-
-
-from AstroAPI.ServiceCatalogAPI.media_services.knowledge.global_io import global_io
-from AstroAPI.ServiceCatalogAPI.media_services.knowledge.spotify import spotify
-from AstroAPI.ServiceCatalogAPI.media_services.knowledge.genius import genius
+	Home of the Spotify and Genius knowledge API-s, alongside the Global Knowledge API Interface.
 
-print('[ServiceCatalogAPI] Knowledge services summoned')
+	The services aren't imported here, they get imported the first time they're needed (or preloaded
+	in the background on startup) through the service registry. See InternalComponents/ServiceManager.
+"""
\ No newline at end of file
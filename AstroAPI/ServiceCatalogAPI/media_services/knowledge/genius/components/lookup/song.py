@@ -3,7 +3,7 @@ from AstroAPI.InternalComponents.SystemMediaObjects import *
 from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.InternalComponents.CredentialsManager.media_services.genius.credentials import genius_credentials
 from AstroAPI.ServiceCatalogAPI.media_services.knowledge.genius.components.generic import *
-import requests
+from AstroAPI.InternalComponents.SessionManager import executor_manager, session_manager
 
 
 
@@ -20,7 +20,7 @@ async def lookup_song(id: str, country_code: str = 'us') -> object:
 		api_headers = {'Authorization': f'Bearer {genius_credentials.client_token}'}
 		# For some reason Genius does not like the way aiohttp forms its headers so we stick to requests for HTTP
 		# I am not a fan of this but you gotta get it working somehow, I'll figure out a workaround someday
-		result = requests.get(api_url, headers = api_headers)
+		result = await executor_manager.run(service, session_manager.blocking_session(service).get, api_url, headers = api_headers)
 			
 		if result.status_code == 200:
 			song = result.json()['response']['song'] # Extract the song object from the API response
@@ -4,7 +4,7 @@ from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.InternalComponents.CredentialsManager.media_services.genius.credentials import genius_credentials
 from AstroAPI.ServiceCatalogAPI.media_services.knowledge.genius.components.generic import *
 from AstroAPI.ServiceCatalogAPI.media_services.knowledge.genius.components.lookup.song import lookup_song as lookup_song_knowledge
-import requests
+from AstroAPI.InternalComponents.SessionManager import executor_manager, session_manager
 
 
 
@@ -24,7 +24,7 @@ async def search_query(query: str, country_code: str = 'us') -> object:
 		api_headers = {'Authorization': f'Bearer {genius_credentials.client_token}'}
 		# For some reason Genius does not like the way aiohttp forms its headers so we stick to requests for HTTP
 		# I am not a fan of this but you gotta get it working somehow, I'll figure out a workaround someday
-		results = requests.get(api_url, api_params, headers = api_headers)
+		results = await executor_manager.run(service, session_manager.blocking_session(service).get, api_url, api_params, headers = api_headers)
 
 		if results.status_code == 200:
 			results_json = results.json()['response'] # Parse the JSON response to get the search results
@@ -5,6 +5,7 @@ from AstroAPI.InternalComponents.CredentialsManager.media_services.spotify.token
 from AstroAPI.ServiceCatalogAPI.media_services.knowledge.spotify.components.generic import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.spotify.components.lookup.song import lookup_song as lookup_song_music_metadata
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
 
 
 
@@ -15,7 +16,7 @@ async def lookup_song(id: str, country_code: str = 'us') -> object:
 	# Try to perform the song knowledge lookup operation
 	try:
 		# Create an aiohttp session for HTTP requests
-		async with aiohttp.ClientSession() as session:
+		async with session_manager.session(service) as session:
 			# Prepare request data and Spotify API endpoint
 			api_url = f'{api}/audio-features/{id}'
 			api_params = {
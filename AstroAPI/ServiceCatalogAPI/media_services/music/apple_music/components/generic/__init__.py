@@ -1,3 +1,4 @@
 from .about import service, component, api
 from .get_search_wrapper import get_search_wrapper
-from .create_objects import *
\ No newline at end of file
+from .create_objects import *
+from .bulk_lookup import track_batcher, collection_batcher
\ No newline at end of file
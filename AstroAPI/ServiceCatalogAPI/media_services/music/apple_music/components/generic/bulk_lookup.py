@@ -0,0 +1,48 @@
+from .about import service, api
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.CacheManager import Batcher
+import aiohttp
+from AstroAPI.InternalComponents.TimingManager import read_json
+
+
+
+"""
+	The iTunes API can look up a whole bunch of IDs in one request (`/lookup?id=a,b,c`). Lookups
+	that run at the same time get batched into those (see batcher.py), grouped by country code
+	since that's the storefront all of them get looked up in.
+
+	Every result gets handed out wrapped like the response of a single lookup would be, so the
+	lookups can read it the exact same way. Songs and music videos are both tracks.
+"""
+
+
+
+async def get_in_bulk(wrapper_type: str, id_key: str, country_code: str, ids: list[str]) -> dict:
+	async with session_manager.session(service) as session:
+		api_url = f'{api}/lookup'
+		api_params = {
+			'id': ','.join(ids),
+			'country': country_code.lower()
+		}
+		timeout = aiohttp.ClientTimeout(total = 30)
+
+		async with session.get(url = api_url, params = api_params, timeout = timeout) as response:
+			if response.status != 200:
+				return {}
+			results = (await read_json(response, content_type = 'text/javascript'))['results']
+			return {str(result[id_key]): {'resultCount': 1, 'results': [result]} for result in results if result.get('wrapperType') == wrapper_type and id_key in result}
+
+
+
+async def get_tracks(country_code: str, ids: list[str]) -> dict:
+	return await get_in_bulk('track', 'trackId', country_code, ids)
+
+
+
+async def get_collections(country_code: str, ids: list[str]) -> dict:
+	return await get_in_bulk('collection', 'collectionId', country_code, ids)
+
+
+
+track_batcher = Batcher(get_tracks, max_size = 100)
+collection_batcher = Batcher(get_collections, max_size = 100)
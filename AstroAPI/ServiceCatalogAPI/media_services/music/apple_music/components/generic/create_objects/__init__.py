@@ -1,3 +1,3 @@
-from .create_song_objects import create_song_objects
-from .create_music_video_objects import create_music_video_objects
-from .create_collection_objects import create_collection_objects
\ No newline at end of file
+from .create_song_objects import create_song_objects, create_song_candidates
+from .create_music_video_objects import create_music_video_objects, create_music_video_candidates
+from .create_collection_objects import create_collection_objects, create_collection_candidates
\ No newline at end of file
@@ -1,76 +1,99 @@
 from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.components import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.apple_music.components.generic import *
+from AstroAPI.InternalComponents.TimingManager import stage
 
 
 
+@stage('build')
+def create_collection_object(collection: dict, request: dict, processing_time: int, http_code: int) -> Collection:
+	# Determine if the collection is an album or EP
+	collection_type = ('album' if ' - EP' not in collection['collectionName'] else 'ep')
+	collection_url = collection['collectionViewUrl']
+	collection_id = collection['collectionId']
+	collection_title = clean_up_collection_title(collection['collectionName'])
+	collection_year = collection['releaseDate'][:4]
+	collection_genre = collection['primaryGenreName'] if 'primaryGenreName' in collection else None
+
+	# Build the list of artist objects for the collection
+	# This is pretty scuffed due to the way the iTunes API handles artists
+	# but it doesn't throw off filtering so it's okay
+	collection_artists = [
+		Artist(
+			service = service,
+			urls = collection['artistViewUrl'] if 'artistViewUrl' in collection else f'https://music.apple.com/{request['country_code']}/artist/{collection['artistId']}', # Additional edge case if artistViewUrl is missing... this API is so weird
+			ids = collection['artistId'],
+			name = artist,
+			meta = Meta(
+				service = service,
+				request = request,
+				processing_time = processing_time,
+				filter_confidence_percentage = {service: 100.0},
+				http_code = http_code
+			)
+		) for artist in split_artists(collection['artistName'])
+	]
+
+	# Create the cover object for the collection
+	collection_cover = Cover(
+		service = service,
+		media_type = collection_type,
+		title = collection_title,
+		artists = collection_artists,
+		hq_urls = collection['artworkUrl100'],
+		lq_urls = collection['artworkUrl60'],
+		meta = Meta(
+			service = service,
+			request = request,
+			processing_time = processing_time,
+			filter_confidence_percentage = {service: 100.0},
+			http_code = http_code
+		)
+	)
+
+	return Collection(
+		service = service,
+		type = collection_type,
+		urls = collection_url,
+		ids = collection_id,
+		title = collection_title,
+		artists = collection_artists,
+		release_year = collection_year,
+		cover = collection_cover,
+		genre = collection_genre,
+		meta = Meta(
+			service = service,
+			request = request,
+			processing_time = processing_time,
+			http_code = http_code
+		)
+	)
+
+
+
+@stage('build')
 async def create_collection_objects(json_response: dict, request: dict, start_time: int, http_code: int):
 	collections = []
 
 	# Iterate over each collection in the results
 	for collection in json_response['results']:
 		if collection['kind'] == 'album':
-			# Determine if the collection is an album or EP
-			collection_type = ('album' if ' - EP' not in collection['collectionName'] else 'ep')
-			collection_url = collection['collectionViewUrl']
-			collection_id = collection['collectionId']
-			collection_title = clean_up_collection_title(collection['collectionName'])
-			collection_year = collection['releaseDate'][:4]
-			collection_genre = collection['primaryGenreName'] if 'primaryGenreName' in collection else None
+			collections.append(create_collection_object(collection, request, current_unix_time_ms() - start_time, http_code))
 
-			# Build the list of artist objects for the collection
-			# This is pretty scuffed due to the way the iTunes API handles artists
-			# but it doesn't throw off filtering so it's okay
-			collection_artists = [
-				Artist(
-					service = service,
-					urls = collection['artistViewUrl'] if 'artistViewUrl' in collection else f'https://music.apple.com/{request['country_code']}/artist/{collection['artistId']}', # Additional edge case if artistViewUrl is missing... this API is so weird
-					ids = collection['artistId'],
-					name = artist,
-					meta = Meta(
-						service = service,
-						request = request,
-						processing_time = current_unix_time_ms() - start_time,
-						filter_confidence_percentage = {service: 100.0},
-						http_code = http_code
-					)
-				) for artist in split_artists(collection['artistName'])
-			]
+	return collections
 
-			# Create the cover object for the collection
-			collection_cover = Cover(
-				service = service,
-				media_type = collection_type,
-				title = collection_title,
-				artists = collection_artists,
-				hq_urls = collection['artworkUrl100'],
-				lq_urls = collection['artworkUrl60'],
-				meta = Meta(
-					service = service,
-					request = request,
-					processing_time = current_unix_time_ms() - start_time,
-					filter_confidence_percentage = {service: 100.0},
-					http_code = http_code
-				)
-			)
 
-			# Append the constructed Collection object to the collections list
-			collections.append(Collection(
-				service = service,
-				type = collection_type,
-				urls = collection_url,
-				ids = collection_id,
-				title = collection_title,
-				artists = collection_artists,
-				release_year = collection_year,
-				cover = collection_cover,
-				genre = collection_genre,
-				meta = Meta(
-					service = service,
-					request = request,
-					processing_time = current_unix_time_ms() - start_time,
-					http_code = http_code
-				)
-			))
 
-	return collections
\ No newline at end of file
+@stage('build')
+async def create_collection_candidates(json_response: dict, request: dict, start_time: int, http_code: int):
+	# Only the candidate that wins filtering gets converted into a Collection object
+	processing_time = current_unix_time_ms() - start_time
+	return [
+		Candidate(
+			type = 'album' if ' - EP' not in collection['collectionName'] else 'ep',
+			title = clean_up_collection_title(collection['collectionName']),
+			artist_names = split_artists(collection['artistName']),
+			release_year = collection['releaseDate'][:4],
+			build = lambda collection = collection: create_collection_object(collection, request, processing_time, http_code)
+		) for collection in json_response['results'] if collection['kind'] == 'album'
+	]
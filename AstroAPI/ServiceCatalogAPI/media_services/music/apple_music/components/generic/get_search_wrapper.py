@@ -4,6 +4,8 @@ from AstroAPI.ServiceCatalogAPI.media_services.music.apple_music.components.gene
 from AstroAPI.ServiceCatalogAPI.components import *
 
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.TimingManager import read_json
 
 
 
@@ -35,12 +37,12 @@ async def get_search_wrapper(term: str, country: str, media: str = 'all', entity
 	start_time = current_unix_time_ms()
 	
 	try:
-		async with aiohttp.ClientSession() as session:
+		async with session_manager.session(service) as session:
 			api_url = f'{api}/search'
 			api_params = request
 			timeout = aiohttp.ClientTimeout(total = 30) # Set a timeout for the HTTP request
 			async with session.get(url = api_url, timeout = timeout, params = api_params) as response:
-				lookup_json = await response.json(content_type = 'text/javascript')
+				lookup_json = await read_json(response, content_type = 'text/javascript')
 				return lookup_json
 
 	# Handle any exceptions that occur during the process
@@ -4,9 +4,14 @@ from AstroAPI.ServiceCatalogAPI.media_services.music.apple_music.components.gene
 from AstroAPI.ServiceCatalogAPI.components import *
 
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.CacheManager import response_cache
+from AstroAPI.InternalComponents.TimingManager import timed, read_json
 
 
 
+@response_cache.cached(service)
+@timed(service)
 async def lookup_artist(id: str, country_code: str = 'us') -> object:
 	# Prepare the request metadata
 	request = {'request': 'lookup_artist', 'id': id, 'country_code': country_code}
@@ -17,7 +22,7 @@ async def lookup_artist(id: str, country_code: str = 'us') -> object:
 
 	try:
 		# Create an aiohttp session
-		async with aiohttp.ClientSession() as session:
+		async with session_manager.session(service) as session:
 			# Prepare for API call
 			api_url = f'{api}/lookup'
 			api_params = {
@@ -28,7 +33,7 @@ async def lookup_artist(id: str, country_code: str = 'us') -> object:
 
 			# Make the GET request to the API endpoint
 			async with session.get(url = api_url, params = api_params, timeout = timeout) as response:
-				lookup_json = await response.json(content_type = 'text/javascript')
+				lookup_json = await read_json(response, content_type = 'text/javascript')
 				# Check if the response status is OK
 				if response.status == 200:
 					# Parse the JSON response
@@ -0,0 +1,85 @@
+from AstroAPI.InternalComponents.SystemMediaObjects import *
+from AstroAPI.InternalComponents.Legacy import *
+from AstroAPI.ServiceCatalogAPI.media_services.music.apple_music.components.generic import *
+from AstroAPI.ServiceCatalogAPI.components import *
+
+import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.TimingManager import timed, read_json
+
+
+
+@timed(service)
+async def lookup_collection_tracks(id: str, country_code: str = 'us') -> list[str] | Empty | Error:
+	# Prepare the request metadata
+	request = {'request': 'lookup_collection_tracks', 'id': id, 'country_code': country_code}
+	# Lookup JSON variable for later debugging
+	lookup_json = None
+	# Record the start time for processing time calculation
+	start_time = current_unix_time_ms()
+
+	try:
+		# Create an aiohttp session
+		async with session_manager.session(service) as session:
+			# Prepare for API call
+			# The collection comes first in the results, then every one of its songs
+			api_url = f'{api}/lookup'
+			api_params = {
+				'id': id,
+				'entity': 'song',
+				'limit': 200,
+				'country': country_code.lower()
+			}
+			timeout = aiohttp.ClientTimeout(total = 30)  # Set a timeout for the request
+
+			# Make the GET request to the API
+			async with session.get(url = api_url, params = api_params, timeout = timeout) as response:
+				lookup_json = await read_json(response, content_type = 'text/javascript')
+				status = response.status
+
+		if status == 200:
+			tracks = [result for result in lookup_json['results'] if result.get('wrapperType') == 'track']
+			# The songs aren't always in album order
+			tracks.sort(key = lambda track: (track.get('discNumber', 1), track.get('trackNumber', 0)))
+			if tracks == []:
+				return Empty(
+					service = service,
+					meta = Meta(
+						service = service,
+						request = request,
+						processing_time = current_unix_time_ms() - start_time,
+						http_code = 204
+					)
+				)
+			return [str(track['trackId']) for track in tracks]
+
+		else:
+			error = Error(
+				service = service,
+				component = component,
+				error_msg = "HTTP error when looking up collection tracks",
+				meta = Meta(
+					service = service,
+					request = request,
+					processing_time = current_unix_time_ms() - start_time,
+					http_code = status
+				)
+			)
+			await log(error, [discord.File(fp = StringIO(json.dumps(lookup_json, indent = 4)), filename = f'{id}.json')])
+			return error
+
+	# If sinister things happen
+	except Exception as error:
+		error = Error(
+			service = service,
+			component = component,
+			error_msg = f'Error when looking up collection tracks: "{error}"',
+			meta = Meta(
+				service = service,
+				request = request,
+				http_code = 500,
+				processing_time = {service: current_unix_time_ms() - start_time}
+			)
+		)
+		await log(error, [discord.File(fp = StringIO(json.dumps(lookup_json, indent = 4)), filename = f'{id}.json')])
+		return error
@@ -4,9 +4,14 @@ from AstroAPI.ServiceCatalogAPI.media_services.music.apple_music.components.gene
 from AstroAPI.ServiceCatalogAPI.components import *
 
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.CacheManager import response_cache
+from AstroAPI.InternalComponents.TimingManager import timed, read_json
 
 
 
+@response_cache.cached(service)
+@timed(service)
 async def search_collection(artists: list, title: str, year: int = None, country_code: str = 'us') -> object:
 	# Prepare the request dictionary with search parameters
 	request = {'request': 'search_collection', 'artists': artists, 'title': title, 'year': year, 'country_code': country_code}
@@ -17,7 +22,7 @@ async def search_collection(artists: list, title: str, year: int = None, country
 	
 	try:
 		# Create an aiohttp session
-		async with aiohttp.ClientSession() as session:
+		async with session_manager.session(service) as session:
 			# Optimize strings for query search
 			artists = [optimize_for_search(artist) for artist in artists]
 			title = clean_up_collection_title(optimize_for_search(transliterate_to_ascii(title)))
@@ -36,12 +41,12 @@ async def search_collection(artists: list, title: str, year: int = None, country
 
 			# Make the GET request to the API endpoint
 			async with session.get(url = api_url, timeout = timeout, params = api_params) as response:
-				lookup_json = await response.json(content_type = 'text/javascript')
+				lookup_json = await read_json(response, content_type = 'text/javascript')
 				if response.status == 200:
 					if 'results' in lookup_json:
 						if len(lookup_json['results']) > 0:
 							# Iterate through each song in the results
-							collections = await create_collection_objects(
+							collections = await create_collection_candidates(
 								json_response = lookup_json,
 								request = request,
 								start_time = start_time,
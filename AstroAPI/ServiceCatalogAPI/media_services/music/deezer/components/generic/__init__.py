@@ -1,4 +1,6 @@
-from .about import service, component, api
+from .about import service, component, api, enrichment_limit
 from .get_artists_of_media import *
+from .rank_search_results import rank_search_results
+from .get_details_wrapper import get_details_wrapper
 from .create_objects import *
 from .get_search_wrapper import get_search_wrapper
\ No newline at end of file
@@ -1,3 +1,4 @@
 service = 'deezer'
 component = 'Deezer Music API'
-api = 'https://api.deezer.com'
\ No newline at end of file
+api = 'https://api.deezer.com'
+enrichment_limit = 10 # How many of the top search results get their details fetched
\ No newline at end of file
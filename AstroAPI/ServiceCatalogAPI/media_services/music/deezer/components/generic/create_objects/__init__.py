@@ -1,2 +1,2 @@
-from .create_song_objects import create_song_objects
-from .create_collection_objects import create_collection_objects
\ No newline at end of file
+from .create_song_objects import create_song_objects, create_song_candidates
+from .create_collection_objects import create_collection_objects, create_collection_candidates
\ No newline at end of file
@@ -1,75 +1,115 @@
 from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.components import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.deezer.components.generic import *
+from AstroAPI.InternalComponents.TimingManager import stage
 
 
 
-async def create_collection_objects(json_response: dict, request: dict, start_time: int, http_code: int):
+@stage('build')
+def create_collection_object(collection: dict, request: dict, processing_time: int, http_code: int) -> Collection:
+
+	"""
+		Convert a single album from Deezer's album details JSON into a Collection object.
+
+		:param collection: The album details JSON.
+		:param request: Request dict.
+		:param processing_time: How long it took to get the album, in milliseconds.
+	"""
+
+	# Determine the collection type (album or ep)
+	collection_type = 'album' if collection['record_type'] != 'ep' else 'ep'
+	collection_url = collection['link']
+	collection_id = collection['id']
+	collection_title = remove_feat(collection['title'])
+	collection_year = collection['release_date'][:4]
+	collection_genre = collection['genres']['data'][0]['name'] if collection['genres']['data'] != [] else None
+	collection_artists = get_artists_of_media(request, collection['contributors'])
+
+	# Create a Cover object for the collection
+	collection_cover = Cover(
+		service = service,
+		media_type = collection_type,
+		title = collection_title,
+		artists = collection_artists,
+		hq_urls = collection['cover_xl'],
+		lq_urls = collection['cover_medium'],
+		meta = Meta(
+			service = service,
+			request = request,
+			processing_time = processing_time,
+			filter_confidence_percentage = {service: 100.0},
+			http_code = http_code
+		)
+	)
+
+	return Collection(
+		service = service,
+		type = collection_type,
+		urls = collection_url,
+		ids = collection_id,
+		title = collection_title,
+		artists = collection_artists,
+		release_year = collection_year,
+		cover = collection_cover,
+		genre = collection_genre,
+		meta = Meta(
+			service = service,
+			request = request,
+			processing_time = processing_time,
+			http_code = http_code
+		)
+	)
+
+
+
+async def get_collection_results(json_response: dict, query_artists: list = None, query_title: str = None, enrichment_limit: int = None) -> list:
+	# Fetch detailed album information by album ID because the base results don't have much artist info needed for accurate filtering
+	# Only the candidates that are most likely to win filtering get fetched, and they're all fetched at once
+	candidates = rank_search_results(json_response['data'], query_artists, query_title, enrichment_limit)
+	details = await get_details_wrapper('album', [data['id'] for data in candidates])
+	# Skip the albums whose details couldn't be fetched
+	return [collection for collection in details if collection is not None]
+
+
+
+@stage('build')
+async def create_collection_objects(json_response: dict, request: dict, start_time: int, http_code: int, query_artists: list = None, query_title: str = None, enrichment_limit: int = None):
 
 	"""
 		Iterate through Deezer's albums list in their JSON response and convert all of it into Collection objects.
-		
+
 		:param json_response: Deezer's JSON response.
 		:param request: Request dict.
+		:param query_artists: Optional. The artists provided in the API search function query, used to pre-rank results before fetching their details.
+		:param query_title: Optional. The title provided in the API search function query, used to pre-rank results before fetching their details.
+		:param enrichment_limit: Optional. How many of the top pre-ranked results get their details fetched. Fetches all of them if `None`.
 	"""
 
 	collections = []
 
-	# Iterate through each song in the response
-	for data in json_response['data']:
-		async with aiohttp.ClientSession() as session:
-			api_headers = {
-				'Content-Type': 'application/json'
-			}
-			# Fetch detailed album information by album ID because the base results don't have much artist info needed for accurate filtering
-			async with session.get(url = f'{api}/album/{data["id"]}', headers = api_headers) as result:
-				# Parse the album details
-				collection_json = await result.json()
-				collection = collection_json
-
-				# Determine the collection type (album or ep)
-				collection_type = 'album' if collection['record_type'] != 'ep' else 'ep'
-				collection_url = collection['link']
-				collection_id = collection['id']
-				collection_title = remove_feat(collection['title'])
-				collection_year = collection['release_date'][:4]
-				collection_genre = collection['genres']['data'][0]['name'] if collection['genres']['data'] != [] else None
-				collection_artists = get_artists_of_media(request, collection['contributors'])
-
-				# Create a Cover object for the collection
-				collection_cover = Cover(
-					service = service,
-					media_type = collection_type,
-					title = collection_title,
-					artists = collection_artists,
-					hq_urls = collection['cover_xl'],
-					lq_urls = collection['cover_medium'],
-					meta = Meta(
-						service = service,
-						request = request,
-						processing_time = current_unix_time_ms() - start_time,
-						filter_confidence_percentage = {service: 100.0},
-						http_code = http_code
-					)
-				)
-
-				# Append the collection object to the collections list
-				collections.append(Collection(
-					service = service,
-					type = collection_type,
-					urls = collection_url,
-					ids = collection_id,
-					title = collection_title,
-					artists = collection_artists,
-					release_year = collection_year,
-					cover = collection_cover,
-					genre = collection_genre,
-					meta = Meta(
-						service = service,
-						request = request,
-						processing_time = current_unix_time_ms() - start_time,
-						http_code = http_code
-					)
-				))
-	
-	return collections
\ No newline at end of file
+	for collection in await get_collection_results(json_response, query_artists, query_title, enrichment_limit):
+		collections.append(create_collection_object(collection, request, current_unix_time_ms() - start_time, http_code))
+
+	return collections
+
+
+
+@stage('build')
+async def create_collection_candidates(json_response: dict, request: dict, start_time: int, http_code: int, query_artists: list = None, query_title: str = None, enrichment_limit: int = None):
+
+	"""
+		Iterate through Deezer's albums list in their JSON response and turn it into filtering candidates.
+		Only the candidate that wins filtering gets converted into a Collection object. Takes the same parameters as `create_collection_objects`.
+	"""
+
+	results = await get_collection_results(json_response, query_artists, query_title, enrichment_limit)
+	processing_time = current_unix_time_ms() - start_time
+	return [
+		Candidate(
+			type = 'album' if collection['record_type'] != 'ep' else 'ep',
+			title = remove_feat(collection['title']),
+			artist_names = [artist['name'] for artist in collection['contributors']],
+			release_year = collection['release_date'][:4],
+			build = lambda collection = collection: create_collection_object(collection, request, processing_time, http_code)
+		) for collection in results
+	]
@@ -0,0 +1,41 @@
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from .about import service, api
+
+from asyncio import Semaphore, gather
+import aiohttp
+from AstroAPI.InternalComponents.TimingManager import read_json
+
+
+
+async def get_details_wrapper(media: str, ids: list, concurrency: int = 10) -> list[dict | None]:
+
+	"""
+		Fetch the details of multiple Deezer objects concurrently (ex. `/track/{id}`, `/album/{id}`) over the shared session.
+		The amount of simultaneous requests is capped so bursts don't trip Deezer's rate limits.
+		Failed fetches are returned as `None` in their place, so the order of the returned list matches `ids`.
+
+		:param media: The Deezer object type (`track`, `album`, etc.).
+		:param ids: A list of Deezer object IDs.
+		:param concurrency: The maximum amount of simultaneous requests.
+	"""
+
+	semaphore = Semaphore(concurrency)
+	api_headers = {
+		'Content-Type': 'application/json'
+	}
+	timeout = aiohttp.ClientTimeout(total = 30) # Set a timeout for the HTTP request
+
+	async def get_details(id: str) -> dict | None:
+		async with semaphore:
+			try:
+				async with session_manager.session(service) as session:
+					async with session.get(url = f'{api}/{media}/{id}', headers = api_headers, timeout = timeout) as response:
+						details = await read_json(response)
+						# Deezer returns quota and not found errors as an `error` object with a 200
+						if response.status == 200 and 'error' not in details:
+							return details
+			except Exception:
+				pass
+			return None
+
+	return await gather(*[get_details(id) for id in ids])
@@ -4,6 +4,8 @@ from AstroAPI.ServiceCatalogAPI.media_services.music.deezer.components.generic i
 from AstroAPI.ServiceCatalogAPI.components import *
 
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.TimingManager import read_json
 
 
 
@@ -20,7 +22,7 @@ async def get_search_wrapper(media: str, query: str):
 	start_time = current_unix_time_ms()
 	
 	try:
-		async with aiohttp.ClientSession() as session:
+		async with session_manager.session(service) as session:
 			api_url = f'{api}/search/{media}'
 			api_headers = {
 				'Content-Type': 'application/json'
@@ -28,7 +30,7 @@ async def get_search_wrapper(media: str, query: str):
 			api_params = request
 			timeout = aiohttp.ClientTimeout(total = 30) # Set a timeout for the HTTP request
 			async with session.get(url = api_url, timeout = timeout, params = api_params) as response:
-				lookup_json = await response.json()
+				lookup_json = await read_json(response)
 				return lookup_json
 
 	# Handle any exceptions that occur during the process
@@ -0,0 +1,30 @@
+from AstroAPI.InternalComponents.Legacy.text_manipulation import bare_bones, remove_feat, calculate_similarity
+
+
+
+def rank_search_results(results: list, query_artists: list = None, query_title: str = None, limit: int = None) -> list:
+
+	"""
+		Pre-rank Deezer's base search results (tracks or albums) using the cheap data that's already in them,
+		so only the candidates that are most likely to win filtering get their details fetched.
+		Results are scored the same way the filtering module scores artists and titles. Ties keep Deezer's order.
+		If there is no query data, the results are kept in Deezer's order.
+
+		:param results: The `data` list of Deezer's search response.
+		:param query_artists: The artists provided in the API search function query.
+		:param query_title: The title provided in the API search function query.
+		:param limit: How many of the top results to keep. Keeps all of them if `None`.
+	"""
+
+	if query_artists and query_title is not None:
+		artist_input = bare_bones(query_artists[0])
+		title_input = bare_bones(query_title)
+
+		def score(result: dict) -> float:
+			artist_score = calculate_similarity(bare_bones(result['artist']['name']), artist_input) if 'artist' in result else 0
+			title_score = calculate_similarity(bare_bones(remove_feat(result['title'])), title_input)
+			return artist_score + title_score
+
+		results = sorted(results, key = score, reverse = True)
+
+	return results[:limit] if limit is not None else results
@@ -4,9 +4,14 @@ from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.deezer.components.generic import *
 
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.CacheManager import response_cache
+from AstroAPI.InternalComponents.TimingManager import timed, read_json
 
 
 
+@response_cache.cached(service)
+@timed(service)
 async def lookup_artist(id: str, country_code: str = 'us') -> object:
 	# Prepare the request metadata
 	request = {'request': 'lookup_artist', 'id': id, 'country_code': country_code}
@@ -16,7 +21,7 @@ async def lookup_artist(id: str, country_code: str = 'us') -> object:
 	start_time = current_unix_time_ms()
 	
 	try:
-		async with aiohttp.ClientSession() as session:
+		async with session_manager.session(service) as session:
 			# Prepare for API call
 			api_url = f'{api}/artist/{id}'
 			api_headers = {
@@ -26,7 +31,7 @@ async def lookup_artist(id: str, country_code: str = 'us') -> object:
 
 			# Make an asynchronous GET request to the API
 			async with session.get(url = api_url, headers = api_headers, timeout = timeout) as response:
-				lookup_json = await response.json()
+				lookup_json = await read_json(response)
 				if response.status == 200:
 					# Parse the JSON response for the artist data
 					artist = get_artists_of_media(request, [lookup_json])
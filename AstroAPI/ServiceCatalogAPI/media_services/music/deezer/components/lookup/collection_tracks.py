@@ -0,0 +1,90 @@
+from AstroAPI.ServiceCatalogAPI.components import *
+from AstroAPI.InternalComponents.SystemMediaObjects import *
+from AstroAPI.InternalComponents.Legacy import *
+from AstroAPI.ServiceCatalogAPI.media_services.music.deezer.components.generic import *
+
+import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.TimingManager import timed, read_json
+
+
+
+page_size = 100 # Tracks asked for per page
+
+
+
+@timed(service)
+async def lookup_collection_tracks(id: str, country_code: str = 'us') -> list[str] | Empty | Error:
+	# Prepare the request dictionary with relevant information
+	request = {'request': 'lookup_collection_tracks', 'id': id, 'country_code': country_code, 'url': f'https://www.deezer.com/album/{id}'}
+	# Lookup JSON variable for later debugging
+	lookup_json = None
+	# Record the start time for processing time calculation
+	start_time = current_unix_time_ms()
+
+	try:
+		track_ids = []
+		# Create an aiohttp session
+		async with session_manager.session(service) as session:
+			# Prepare for API call
+			api_url = f'{api}/album/{id}/tracks'
+			api_params = {
+				'limit': page_size
+			}
+			api_headers = {
+				'Content-Type': 'application/json'
+			}
+			timeout = aiohttp.ClientTimeout(total = 30)
+
+			# Albums with more tracks than fit on a page link to the next one
+			while api_url is not None:
+				async with session.get(url = api_url, headers = api_headers, timeout = timeout, params = api_params) as response:
+					lookup_json = await read_json(response)
+					status = response.status
+				# Deezer returns quota and not found errors as an `error` object with a 200
+				if status != 200 or 'error' in lookup_json:
+					error = Error(
+						service = service,
+						component = component,
+						error_msg = "HTTP error when looking up collection tracks",
+						meta = Meta(
+							service = service,
+							request = request,
+							processing_time = current_unix_time_ms() - start_time,
+							http_code = status if status != 200 else 404
+						)
+					)
+					await log(error, [discord.File(fp = StringIO(json.dumps(lookup_json, indent = 4)), filename = f'{id}.json')])
+					return error
+				track_ids += [str(track['id']) for track in lookup_json['data']]
+				# The next page's URL already has every parameter in it
+				api_url = lookup_json.get('next')
+				api_params = None
+
+		if track_ids == []:
+			return Empty(
+				service = service,
+				meta = Meta(
+					service = service,
+					request = request,
+					processing_time = current_unix_time_ms() - start_time,
+					http_code = 204
+				)
+			)
+		return track_ids
+
+	# If sinister things happen
+	except Exception as error:
+		error = Error(
+			service = service,
+			component = component,
+			error_msg = f'Error when looking up collection tracks: "{error}"',
+			meta = Meta(
+				service = service,
+				request = request,
+				http_code = 500,
+				processing_time = {service: current_unix_time_ms() - start_time}
+			)
+		)
+		await log(error, [discord.File(fp = StringIO(json.dumps(lookup_json, indent = 4)), filename = f'{id}.json')])
+		return error
@@ -4,9 +4,14 @@ from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.deezer.components.generic import *
 
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.CacheManager import response_cache
+from AstroAPI.InternalComponents.TimingManager import timed, read_json
 
 
 
+@response_cache.cached(service)
+@timed(service)
 async def lookup_song(id: str, country_code: str = 'us') -> object:
 	# Prepare the request dictionary with song lookup parameters
 	request = {'request': 'lookup_song', 'id': id, 'country_code': country_code}
@@ -17,7 +22,7 @@ async def lookup_song(id: str, country_code: str = 'us') -> object:
 	
 	try:
 		# Create an aiohttp session
-		async with aiohttp.ClientSession() as session:
+		async with session_manager.session(service) as session:
 			# Prepare for API call
 			api_url = f'{api}/track/{id}'
 			api_headers = {
@@ -27,7 +32,7 @@ async def lookup_song(id: str, country_code: str = 'us') -> object:
 
 			# Make an asynchronous GET request to the API
 			async with session.get(url = api_url, headers = api_headers, timeout = timeout) as response:
-				lookup_json = await response.json()
+				lookup_json = await read_json(response)
 				if response.status == 200:
 					# Parse the JSON response for the song data
 					song = lookup_json
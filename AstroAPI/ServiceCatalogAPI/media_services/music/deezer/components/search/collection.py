@@ -4,9 +4,14 @@ from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.deezer.components.generic import *
 
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.CacheManager import response_cache
+from AstroAPI.InternalComponents.TimingManager import timed, read_json
 
 
 
+@response_cache.cached(service)
+@timed(service)
 async def search_collection(artists: list, title: str, year: int = None, country_code: str = 'us') -> object:
 	# Prepare the request dictionary with search parameters
 	request = {'request': 'search_collection', 'artists': artists, 'title': title, 'year': year, 'country_code': country_code}
@@ -18,7 +23,7 @@ async def search_collection(artists: list, title: str, year: int = None, country
 
 	try:
 		# Create an aiohttp session
-		async with aiohttp.ClientSession() as session:
+		async with session_manager.session(service) as session:
 			# Optimize strings for query search
 			artists = [optimize_for_search(artist) for artist in artists]
 			title = clean_up_collection_title(optimize_for_search(title))
@@ -36,14 +41,17 @@ async def search_collection(artists: list, title: str, year: int = None, country
 
 			# Make an asynchronous GET request to the search endpoint
 			async with session.get(url = api_url, headers = api_headers, timeout = timeout, params = api_params) as response:
-				lookup_json = await response.json()
+				lookup_json = await read_json(response)
 				if response.status == 200:
 					# Parse the JSON response
-					collections = await create_collection_objects(
+					collections = await create_collection_candidates(
 						json_response = lookup_json,
 						request = request,
 						start_time = start_time,
-						http_code = response.status
+						http_code = response.status,
+						query_artists = artists,
+						query_title = title,
+						enrichment_limit = enrichment_limit
 					)
 					
 					# Filter and return the collection based on the query
@@ -4,9 +4,11 @@ from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.deezer.components.generic import *
 
 from asyncio import create_task, gather
+from AstroAPI.InternalComponents.TimingManager import timed
 
 
 
+@timed(service)
 async def search_query(query: str, filter_for_best_match: bool = True, media_types: list = None, is_explicit: bool = None, country_code: str = 'us'):
 	# Prepare the request dictionary with search parameters
 	request = {'request': 'search_query', 'query': query, 'country_code': country_code}
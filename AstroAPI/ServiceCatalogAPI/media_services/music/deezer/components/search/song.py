@@ -4,9 +4,14 @@ from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.deezer.components.generic import *
 
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.CacheManager import response_cache
+from AstroAPI.InternalComponents.TimingManager import timed, read_json
 
 
 
+@response_cache.cached(service)
+@timed(service)
 async def search_song(artists: list, title: str, song_type: str = None, collection: str = None, is_explicit: bool = None, country_code: str = 'us', advanced_data_lookup: bool = True) -> object:
 	# Prepare the request dictionary with all input parameters
 	request = {'request': 'search_song', 'artists': artists, 'title': title, 'song_type': song_type, 'collection': collection, 'is_explicit': is_explicit, 'country_code': country_code}
@@ -17,7 +22,7 @@ async def search_song(artists: list, title: str, song_type: str = None, collecti
 
 	try:
 		# Create an aiottp session
-		async with aiohttp.ClientSession() as session:
+		async with session_manager.session(service) as session:
 			# Optimize strings for query search
 			artists = [artist for artist in artists]
 			title = remove_feat(title)
@@ -36,16 +41,19 @@ async def search_song(artists: list, title: str, song_type: str = None, collecti
 
 			# Make the GET request to the Deezer search API
 			async with session.get(url = api_url, headers = api_headers, timeout = timeout, params = api_params) as response:
-				lookup_json = await response.json()
+				lookup_json = await read_json(response)
 				if response.status == 200:
 
 					# Iterate over each track in the response data
-					songs = await create_song_objects(
+					songs = await create_song_candidates(
 						json_response = lookup_json,
 						request = request,
 						start_time = start_time,
 						http_code = response.status,
-						incomplete_artist_info = advanced_data_lookup
+						incomplete_artist_info = advanced_data_lookup,
+						query_artists = artists,
+						query_title = title,
+						enrichment_limit = enrichment_limit
 					)
 
 					# Filter and return the best matching song
@@ -19,7 +19,7 @@ class GlobalIO:
 		self.component = component
 		self.exclude_services = []
 
-	async def search_song(self, artists: list, title: str, song_type: str = None, collection: str = None, is_explicit: bool = None, country_code: str = 'us', include_premade_media: list = [], exclude_services: list = []) -> Song | Empty | Error:
+	async def search_song(self, artists: list, title: str, song_type: str = None, collection: str = None, is_explicit: bool = None, country_code: str = 'us', include_premade_media: list = [], exclude_services: list = [], deadline: float = None) -> Song | Empty | Error:
 		"""
 			# Global Interface Song Music Search
 
@@ -33,15 +33,16 @@ class GlobalIO:
 			:param country_code: The country code of the country in which you want to conduct the search.
 			:param include_premade_media: Include premade media object with the search if available. This reduces processing time.
 			:param exclude_services: Discriminators of services that will not be queried.
+			:param deadline: Seconds to wait for services before answering with whatever came back in time. Defaults to the Global Interface's default deadline.
 		"""
 		exclude_services.extend(self.exclude_services)
 		exclude_services = remove_duplicates(exclude_services)
 		for premade in include_premade_media:
 			if premade.service not in exclude_services:
 				exclude_services.append(premade.service)
-		return await search_song_music(artists, title, song_type, collection, is_explicit, country_code, include_premade_media, exclude_services)
+		return await search_song_music(artists, title, song_type, collection, is_explicit, country_code, include_premade_media, exclude_services, deadline = deadline)
 	
-	async def search_music_video(self, artists: list, title: str, is_explicit: bool = None, country_code: str = 'us', include_premade_media: list = [], exclude_services: list = []) -> MusicVideo | Empty | Error:
+	async def search_music_video(self, artists: list, title: str, is_explicit: bool = None, country_code: str = 'us', include_premade_media: list = [], exclude_services: list = [], deadline: float = None) -> MusicVideo | Empty | Error:
 		"""
 			# Global Interface Music Video Music Search
 
@@ -53,15 +54,16 @@ class GlobalIO:
 			:param country_code: The country code of the country in which you want to conduct the search.
 			:param include_premade_media: Include premade media object with the search if available. This reduces processing time.
 			:param exclude_services: Discriminators of services that will not be queried.
+			:param deadline: Seconds to wait for services before answering with whatever came back in time. Defaults to the Global Interface's default deadline.
 		"""
 		exclude_services.extend(self.exclude_services)
 		exclude_services = remove_duplicates(exclude_services)
 		for premade in include_premade_media:
 			if premade.service not in exclude_services:
 				exclude_services.append(premade.service)
-		return await search_music_video_music(artists, title, is_explicit, country_code, include_premade_media, exclude_services)
+		return await search_music_video_music(artists, title, is_explicit, country_code, include_premade_media, exclude_services, deadline = deadline)
 	
-	async def search_collection(self, artists: list, title: str, year: int = None, country_code: str = 'us', include_premade_media: list = [], exclude_services: list = []) -> Collection | Song | Empty | Error:
+	async def search_collection(self, artists: list, title: str, year: int = None, country_code: str = 'us', include_premade_media: list = [], exclude_services: list = [], deadline: float = None) -> Collection | Song | Empty | Error:
 		"""
 			# Global Interface Collection Music Search
 
@@ -73,15 +75,16 @@ class GlobalIO:
 			:param country_code: The country code of the country in which you want to conduct the search.
 			:param include_premade_media: Include premade media object with the search if available. This reduces processing time.
 			:param exclude_services: Discriminators of services that will not be queried.
+			:param deadline: Seconds to wait for services before answering with whatever came back in time. Defaults to the Global Interface's default deadline.
 		"""
 		exclude_services.extend(self.exclude_services)
 		exclude_services = remove_duplicates(exclude_services)
 		for premade in include_premade_media:
 			if premade.service not in exclude_services:
 				exclude_services.append(premade.service)
-		return await search_collection_music(artists, title, year, country_code, include_premade_media, exclude_services)
+		return await search_collection_music(artists, title, year, country_code, include_premade_media, exclude_services, deadline = deadline)
 
-	async def search_query(self, query: str, filter_for_best_match: bool = True, media_types: list = None, is_explicit: bool = None, country_code: str = 'us', exclude_services: list = []) -> Song | MusicVideo | Collection | Empty | Error:
+	async def search_query(self, query: str, filter_for_best_match: bool = True, media_types: list = None, is_explicit: bool = None, country_code: str = 'us', exclude_services: list = [], deadline: float = None) -> Song | MusicVideo | Collection | Empty | Error:
 		"""
 			# Global Interface Query Music Search
 
@@ -90,12 +93,13 @@ class GlobalIO:
 			:param query: Your search query.
 			:param country_code: The country code of the country in which you want to conduct the search.
 			:param exclude_services: Discriminators of services that will not be queried.
+			:param deadline: Seconds to wait for services before answering with whatever came back in time. Defaults to the Global Interface's default deadline.
 		"""
 		exclude_services.extend(self.exclude_services)
 		exclude_services = remove_duplicates(exclude_services)
-		return await search_query_music(query, filter_for_best_match, media_types, is_explicit, country_code, exclude_services)
+		return await search_query_music(query, filter_for_best_match, media_types, is_explicit, country_code, exclude_services, deadline = deadline)
 	
-	async def lookup_song(self, service: object, id: str, song_country_code: str = None, lookup_country_code: str = 'us') -> Song | Empty | Error:
+	async def lookup_song(self, service: object, id: str, song_country_code: str = None, lookup_country_code: str = 'us', deadline: float = None) -> Song | Empty | Error:
 		"""
 			# Global Interface Song Music Lookup
 
@@ -105,10 +109,11 @@ class GlobalIO:
 			:param id: Song ID.
 			:param song_country_code: The country code of the country this ID is from.
 			:param lookup_country_code: The country code of the country in which you want to conduct the lookup.
+			:param deadline: Seconds to wait for services before answering with whatever came back in time. Defaults to the Global Interface's default deadline.
 		"""
-		return await lookup_song_music(service = service, id = id, song_country_code = song_country_code, lookup_country_code = lookup_country_code)
+		return await lookup_song_music(service = service, id = id, song_country_code = song_country_code, lookup_country_code = lookup_country_code, deadline = deadline)
 	
-	async def lookup_music_video(self, service: object, id: str, mv_country_code: str = None, lookup_country_code: str = 'us') -> MusicVideo | Empty | Error:
+	async def lookup_music_video(self, service: object, id: str, mv_country_code: str = None, lookup_country_code: str = 'us', deadline: float = None) -> MusicVideo | Empty | Error:
 		"""
 			# Global Interface Music Video Music Lookup
 
@@ -118,10 +123,11 @@ class GlobalIO:
 			:param id: Song ID.
 			:param song_country_code: The country code of the country this ID is from.
 			:param lookup_country_code: The country code of the country in which you want to conduct the lookup.
+			:param deadline: Seconds to wait for services before answering with whatever came back in time. Defaults to the Global Interface's default deadline.
 		"""
-		return await lookup_music_video_music(service = service, id = id, mv_country_code = mv_country_code, lookup_country_code = lookup_country_code)
+		return await lookup_music_video_music(service = service, id = id, mv_country_code = mv_country_code, lookup_country_code = lookup_country_code, deadline = deadline)
 	
-	async def lookup_collection(self, service: object, id: str, collection_country_code: str = None, lookup_country_code: str= 'us') -> Collection | Song | Empty | Error:
+	async def lookup_collection(self, service: object, id: str, collection_country_code: str = None, lookup_country_code: str= 'us', deadline: float = None) -> Collection | Song | Empty | Error:
 		"""
 			# Global Interface Collection Music Lookup
 
@@ -131,8 +137,9 @@ class GlobalIO:
 			:param id: Song ID.
 			:param song_country_code: The country code of the country this ID is from.
 			:param lookup_country_code: The country code of the country in which you want to conduct the lookup.
+			:param deadline: Seconds to wait for services before answering with whatever came back in time. Defaults to the Global Interface's default deadline.
 		"""
-		return await lookup_collection_music(service = service, id = id, collection_country_code = collection_country_code, lookup_country_code = lookup_country_code)
+		return await lookup_collection_music(service = service, id = id, collection_country_code = collection_country_code, lookup_country_code = lookup_country_code, deadline = deadline)
 
 
 	
@@ -1,8 +1,11 @@
-from .about import service, component
+from .about import service, component, default_deadline
 from ......components.global_io.excluded_services_with_premades import excluded_services_with_premades
 from ......components.sort_dicts import sort_dicts
 
 from AstroAPI.ServiceCatalogAPI.media_services.music.spotify import spotify
 from AstroAPI.ServiceCatalogAPI.media_services.music.apple_music import apple_music
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music import youtube_music
-from AstroAPI.ServiceCatalogAPI.media_services.music.deezer import deezer
\ No newline at end of file
+from AstroAPI.ServiceCatalogAPI.media_services.music.deezer import deezer
+from .known_media import lookup_known_media, record_known_media
+from .circuit_breaker import circuit_breakers
+from .fan_out import gather_within_deadline, announce
\ No newline at end of file
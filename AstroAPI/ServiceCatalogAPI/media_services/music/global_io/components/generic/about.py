@@ -1,2 +1,3 @@
 service = 'global_io'
-component = 'Astro Service Catalog Global Music Interface'
\ No newline at end of file
+component = 'Astro Service Catalog Global Music Interface'
+default_deadline = 8 # Seconds the Global Interface waits for services before answering with whatever came back in time
\ No newline at end of file
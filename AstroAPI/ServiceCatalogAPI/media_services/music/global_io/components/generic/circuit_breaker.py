@@ -0,0 +1,153 @@
+from collections import deque
+from time import monotonic, time
+
+
+
+"""
+	--- THE CIRCUIT BREAKERS ---
+
+	When a service is having a bad day (Spotify rate limiting us, the YouTube cookie expiring,
+	iTunes throwing 5xx), every Global Interface request would still wait on it, just to get an
+	error back and log it.
+
+	Every service gets a circuit breaker that keeps a rolling window of how its calls went.
+	If too many of them fail (or take way too long), the breaker opens and the service gets
+	skipped like it was in exclude_services. After a cooldown, the breaker goes half-open and
+	lets a single probe call through. If it goes well, the breaker closes again, if not, it
+	opens for another cooldown.
+
+	  closed -> open -> half_open -> closed
+	                        |
+	                        -> open
+"""
+
+
+
+window = 60 # Seconds of calls the error rate is calculated over
+window_calls = 50 # Maximum amount of calls kept in the window
+minimum_calls = 10 # Calls needed in the window before the breaker can open
+error_rate_threshold = 0.5 # Fraction of failed calls in the window that opens the breaker
+slow_call_threshold = 5000 # Milliseconds after which a call counts as failed even if it went through
+cooldown = 30 # Seconds the breaker stays open before letting a probe through
+probe_timeout = 60 # Seconds after which a probe that never reported back is given up on
+transition_history = 50 # Amount of past state changes kept per breaker
+
+
+
+class CircuitBreaker:
+	def __init__(self, service: str):
+		self.service = service
+		self.state = 'closed'
+		self.calls = deque(maxlen = window_calls)
+		self.opened_at = None
+		self.probe_started_at = None
+		self.transitions = deque(maxlen = transition_history)
+
+	def transition(self, state: str, reason: str) -> None:
+		self.transitions.append({'time': time(), 'from': self.state, 'to': state, 'reason': reason})
+		self.state = state
+		if state == 'open':
+			self.opened_at = monotonic()
+		elif state == 'closed':
+			self.calls.clear()
+		self.probe_started_at = None
+
+	def prune(self) -> None:
+		now = monotonic()
+		while self.calls and now - self.calls[0][0] > window:
+			self.calls.popleft()
+
+	@property
+	def error_rate(self) -> float:
+		self.prune()
+		return sum(1 for call in self.calls if not call[1]) / len(self.calls) if self.calls else 0.0
+
+	@property
+	def average_latency(self) -> float:
+		self.prune()
+		return sum(call[2] for call in self.calls) / len(self.calls) if self.calls else 0.0
+
+	def allow(self) -> bool:
+		"""
+			Whether a call to the service should go through right now. Claims the probe slot if the breaker is ready to be probed.
+		"""
+		now = monotonic()
+		if self.state == 'open' and now - self.opened_at >= cooldown:
+			self.transition('half_open', 'Cooldown over, probing')
+		if self.state == 'half_open':
+			# Only one probe at a time
+			if self.probe_started_at is None or now - self.probe_started_at >= probe_timeout:
+				self.probe_started_at = now
+				return True
+			return False
+		return self.state == 'closed'
+
+	def record(self, success: bool, latency: float) -> None:
+		"""
+			Record how a call went.
+
+			:param success: Whether the call went through without an error.
+			:param latency: How long the call took in milliseconds.
+		"""
+		success = success and latency <= slow_call_threshold
+		if self.state == 'half_open':
+			if success:
+				self.transition('closed', 'Probe went through')
+			else:
+				self.transition('open', 'Probe failed' if latency <= slow_call_threshold else f'Probe took {round(latency)} ms')
+			return
+
+		self.calls.append((monotonic(), success, latency))
+		if self.state == 'closed':
+			self.prune()
+			if len(self.calls) >= minimum_calls and self.error_rate >= error_rate_threshold:
+				self.transition('open', f'{round(self.error_rate * 100)}% of the last {len(self.calls)} calls failed')
+
+	@property
+	def json(self) -> dict:
+		return {
+			'state': self.state,
+			'calls': len(self.calls),
+			'error_rate': self.error_rate,
+			'average_latency': self.average_latency,
+			'transitions': list(self.transitions)
+		}
+
+
+
+class CircuitBreakers:
+	def __init__(self):
+		self.breakers = {}
+
+	def get(self, service: str) -> CircuitBreaker:
+		breaker = self.breakers.get(service)
+		if breaker is None:
+			breaker = CircuitBreaker(service)
+			self.breakers[service] = breaker
+		return breaker
+
+	def allow(self, service: str) -> bool:
+		"""
+			Whether a service should be called right now, or skipped like it was in exclude_services.
+
+			:param service: The service.
+		"""
+		return self.get(service).allow()
+
+	def record(self, service: str, success: bool, latency: float) -> None:
+		"""
+			Record how a call to a service went.
+
+			:param service: The service.
+			:param success: Whether the call went through without an error.
+			:param latency: How long the call took in milliseconds.
+		"""
+		self.get(service).record(success, latency)
+
+	@property
+	def json(self) -> dict:
+		return {service: breaker.json for service, breaker in self.breakers.items()}
+
+
+
+circuit_breakers = CircuitBreakers()
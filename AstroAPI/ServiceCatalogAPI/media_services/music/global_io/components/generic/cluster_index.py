@@ -0,0 +1,74 @@
+"""
+	--- THE CLUSTER INDEX ---
+
+	Matching content from different services used to compare every item against every cluster made
+	so far, so a query search with a couple hundred results per service did tens of thousands of
+	similarity checks, almost all of them between things that had nothing in common.
+
+	An item only joins a cluster if both its title and its first artist are more than 800 points
+	similar to the cluster's. Two strings that similar always share at least one bigram (two
+	characters next to each other): the matching characters are in the same order in both strings,
+	and to not form a single shared bigram, every two of them would need an unmatched character
+	in between, which caps the similarity at 666 points, unless both strings together are shorter
+	than 5 characters. So clusters get indexed by the bigrams of their title and artist (short
+	strings all share an extra key), and items only get compared with clusters that share a bigram
+	with them in both. No cluster that could match ever gets left out, so the clusters come out
+	exactly the same.
+"""
+
+
+
+short_length = 5 # Two strings this long (together) can be similar without sharing a bigram
+
+
+
+def signature(text: str) -> set:
+	# Every bigram of the text, plus a key all short texts share
+	keys = {text[index:index + 2] for index in range(len(text) - 1)}
+	if len(text) < short_length:
+		keys.add(None)
+	return keys
+
+
+
+def within_reach(text: str, other_text: str, threshold: int) -> bool:
+	# Similarity can't be higher than if all characters of the shorter text matched, computed the same way similarity.py does
+	length = len(text) + len(other_text)
+	return length == 0 or 2.0 * min(len(text), len(other_text)) / length * 1000 > threshold
+
+
+
+class ClusterIndex:
+	def __init__(self):
+		self.titles = {}
+		self.artists = {}
+
+	def add(self, cluster: int, title: str, artist: str) -> None:
+		"""
+			Index a cluster by its representative's normalized title and first artist.
+
+			:param cluster: The index of the cluster.
+			:param title: The normalized title of its representative.
+			:param artist: The normalized name of its representative's first artist.
+		"""
+		for key in signature(title):
+			self.titles.setdefault(key, []).append(cluster)
+		for key in signature(artist):
+			self.artists.setdefault(key, []).append(cluster)
+
+	def candidates(self, title: str, artist: str) -> list[int]:
+		"""
+			The clusters an item could match, in the order they were made.
+
+			:param title: The normalized title of the item.
+			:param artist: The normalized name of the item's first artist.
+		"""
+		title_matches = set()
+		for key in signature(title):
+			title_matches.update(self.titles.get(key, ()))
+		if not title_matches:
+			return []
+		artist_matches = set()
+		for key in signature(artist):
+			artist_matches.update(self.artists.get(key, ()))
+		return sorted(title_matches & artist_matches)
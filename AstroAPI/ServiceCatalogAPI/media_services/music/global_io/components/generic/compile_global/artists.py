@@ -4,10 +4,12 @@ from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic.about import service as gservice, component as gcomponent
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic import *
 from AstroAPI.ServiceCatalogAPI.components.sort_dicts import sort_dicts
+from AstroAPI.InternalComponents.TimingManager import stage
 
 
 
 
+@stage('compile')
 def compiled_artists(request: dict, unlabeled_artists: dict) -> list[Artist]:	
 	# Results order based on service priority
 	# Some services have lesser quality or straight-up do not carry certain information, so we prioritize the ones who do
@@ -6,10 +6,12 @@ from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generi
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic.compile_global.artists import compiled_artists
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic.compile_global.cover import compiled_cover
 from AstroAPI.ServiceCatalogAPI.components.sort_dicts import sort_dicts
+from AstroAPI.InternalComponents.TimingManager import stage
 
 
 
 
+@stage('compile')
 def compiled_collection(request: dict, unlabeled_collections: list) -> Collection:
 	while None in unlabeled_collections:
 		unlabeled_collections.remove(None)
@@ -5,9 +5,11 @@ from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generi
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic.compile_global.artists import compiled_artists
 from AstroAPI.ServiceCatalogAPI.components.sort_dicts import sort_dicts
+from AstroAPI.InternalComponents.TimingManager import stage
 
 
 
+@stage('compile')
 def compiled_cover(request: dict, unlabeled_results: list) -> Cover:
     labeled_results = {result.service: result for result in unlabeled_results}
 
@@ -0,0 +1,69 @@
+from .about import default_deadline
+from .circuit_breaker import circuit_breakers
+from AstroAPI.ServiceCatalogAPI.components.streaming import announce
+from asyncio import Task, wait
+from time import monotonic
+
+
+
+# Service calls that missed their deadline but are still running
+# Kept around so they don't get garbage collected before they finish
+late_tasks = set()
+
+
+
+def forget_late_task(task: Task) -> None:
+	late_tasks.discard(task)
+	# Retrieve the exception (if any) so asyncio doesn't complain about it never being retrieved
+	if not task.cancelled():
+		task.exception()
+
+
+
+def record_outcome(task: Task, started: float) -> None:
+	# Cancelled calls don't say anything about how the service is doing
+	if task.cancelled():
+		return
+	failed = task.exception() is not None or getattr(task.result(), 'type', None) == 'error'
+	circuit_breakers.record(task.get_name(), not failed, (monotonic() - started) * 1000)
+
+
+
+def report_result(task: Task, waiting: dict) -> None:
+	# Streaming requests hear about results as they come in, but not about the late ones that didn't make it into the response
+	if waiting['open'] and not task.cancelled() and task.exception() is None:
+		announce(task.get_name(), task.result())
+
+
+
+async def gather_within_deadline(tasks: list[Task], deadline: float | None = None, return_exceptions: bool = False) -> tuple[list, list[str]]:
+	"""
+		Wait for service calls until the deadline runs out, and return the results of the ones that made it in time, along with the names of the ones that didn't.
+		Late calls keep running in the background, so their results still end up in the response cache for the next request.
+		Every call's outcome goes to its service's circuit breaker once it finishes, late or not.
+		Results that come in before the deadline get announced to streaming requests right away.
+
+		:param tasks: The service call tasks, named after their service.
+		:param deadline: Optional. Seconds to wait for. Defaults to the Global Interface's default deadline.
+		:param return_exceptions: Optional. Return the exceptions of calls that crashed instead of raising them, like gather() does.
+	"""
+	if tasks == []:
+		return [], []
+
+	started = monotonic()
+	waiting = {'open': True}
+	for task in tasks:
+		task.add_done_callback(lambda task: record_outcome(task, started))
+		task.add_done_callback(lambda task: report_result(task, waiting))
+
+	done, pending = await wait(tasks, timeout = deadline if deadline is not None else default_deadline)
+	waiting['open'] = False
+
+	for task in pending:
+		late_tasks.add(task)
+		task.add_done_callback(forget_late_task)
+
+	# Keep the order the tasks were given in
+	results = [task.exception() or task.result() if return_exceptions else task.result() for task in tasks if task in done]
+	timed_out = [task.get_name() for task in tasks if task in pending]
+	return results, timed_out
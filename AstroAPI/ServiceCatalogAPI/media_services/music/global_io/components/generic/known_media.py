@@ -0,0 +1,92 @@
+from AstroAPI.ServiceCatalogAPI.media_services.music.spotify import spotify
+from AstroAPI.ServiceCatalogAPI.media_services.music.apple_music import apple_music
+from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music import youtube_music
+from AstroAPI.ServiceCatalogAPI.media_services.music.deezer import deezer
+from AstroAPI.InternalComponents.CacheManager import id_map
+from .about import default_deadline
+from .circuit_breaker import circuit_breakers
+from .fan_out import gather_within_deadline
+
+from asyncio import create_task
+from time import monotonic
+
+
+
+# Result types that count as a successful lookup for each media type
+legal_types = {
+	'song': ['track', 'single'],
+	'music_video': ['music_video'],
+	'collection': ['album', 'ep']
+}
+
+
+
+async def lookup_by_id(media_type: str, service: object, id: str, country_code: str) -> object:
+	if media_type == 'song':
+		return await service.lookup_song(id = id, country_code = country_code)
+	elif media_type == 'music_video':
+		# YouTube Music doesn't have a separate music video lookup, videos are looked up as songs
+		if service == youtube_music:
+			return await service.lookup_song(id = id, country_code = country_code)
+		return await service.lookup_music_video(id = id, country_code = country_code)
+	elif media_type == 'collection':
+		return await service.lookup_collection(id = id, country_code = country_code)
+
+
+
+async def lookup_known_media(media_type: str, reference: object, country_code: str, deadline: float = None) -> tuple[list, list[str], float]:
+	"""
+		Look up the media on every service whose ID for it is already in the ID map, by ID instead of searching for it.
+		Mapped IDs that don't resolve to the right thing anymore get forgotten, so those services get searched again.
+		The lookups go through the same deadline and circuit breakers as searches, services whose breaker is open get searched (or skipped) like usual.
+		Returns the media that was found, the services that didn't answer before the deadline, and the seconds of the deadline that are left for the search.
+
+		:param media_type: Type of media (song, music_video, collection).
+		:param reference: The media object the lookup started from. Its service doesn't get looked up again.
+		:param country_code: The country code of the country in which you want to conduct the lookups.
+		:param deadline: Optional. Seconds to wait for the lookups. Defaults to the Global Interface's default deadline.
+	"""
+	deadline = deadline if deadline is not None else default_deadline
+	if reference.service not in reference.ids:
+		return [], [], deadline
+	started = monotonic()
+	known_ids = await id_map.get(media_type, reference.service, reference.ids[reference.service], country_code)
+	service_objs = [obj for obj in [spotify, apple_music, youtube_music, deezer] if obj.service in known_ids and obj.service != reference.service and circuit_breakers.allow(obj.service)]
+
+	tasks = []
+	for obj in service_objs:
+		tasks.append(
+			create_task(
+				lookup_by_id(media_type, obj, known_ids[obj.service], country_code),
+				name = obj.service
+			)
+		)
+	results, timed_out = await gather_within_deadline(tasks, deadline)
+
+	known_media = []
+	for obj, result in zip([obj for obj in service_objs if obj.service not in timed_out], results):
+		if result.type in legal_types[media_type]:
+			known_media.append(result)
+		# Errors are probably just the service having a moment, anything else means the mapping is no good
+		elif result.type != 'error':
+			await id_map.forget(media_type, obj.service, known_ids[obj.service], country_code)
+	return known_media, timed_out, max(0, deadline - (monotonic() - started))
+
+
+
+async def record_known_media(media_type: str, media: object, country_code: str, reference: object = None) -> None:
+	"""
+		Add the IDs of a successful Global Interface result to the ID map.
+
+		:param media_type: Type of media (song, music_video, collection).
+		:param media: The Global Interface media object.
+		:param country_code: The country code of the country the result is for.
+		:param reference: Optional. The media object a lookup started from. The search already recorded the result's IDs, so this only maps the reference's own ID if the result doesn't carry it.
+	"""
+	if media.type not in legal_types[media_type]:
+		return
+	if reference is None:
+		await id_map.record(media_type, media.ids, country_code)
+	elif reference.type in legal_types[media_type] and media.ids.get(reference.service) != reference.ids[reference.service]:
+		# The ID the lookup started from should lead back to this result too, even if the search came up with a different one for its service
+		await id_map.record(media_type, {**media.ids, reference.service: reference.ids[reference.service]}, country_code)
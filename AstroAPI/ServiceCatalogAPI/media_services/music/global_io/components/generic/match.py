@@ -4,7 +4,69 @@ from AstroAPI.InternalComponents.Legacy.text_manipulation import calculate_simil
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic.about import service as gservice
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic.compile_global.artists import compiled_artists
 from AstroAPI.ServiceCatalogAPI.components.sort_dicts import sort_dicts
+from AstroAPI.InternalComponents.TimingManager import stage
+from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic.cluster_index import ClusterIndex, within_reach
 
+# Title and first artist similarity an item needs with a cluster to join it
+match_threshold = 800
+
+def years_match(item: object, representative: object) -> bool:
+    if hasattr(item, 'release_year') and hasattr(representative, 'release_year'):
+        if item.release_year and representative.release_year:
+            if abs(item.release_year - representative.release_year) > 1:
+                return False
+    return True
+
+def cluster_items(items: list[object]) -> list[list[object]]:
+    """
+        Groups items that are the same content into clusters. Each item joins the first cluster whose
+        first item (representative) has a similar enough title and first artist, or starts a new one.
+        Only clusters the cluster index considers in reach get compared, see cluster_index.py.
+    """
+
+    clusters = []
+    keys = [] # Normalized title and first artist of every cluster's representative
+    index = ClusterIndex()
+
+    for item in items:
+        match_found = False
+
+        # Items without artists can't match anything, and neither can clusters of them
+        if item.artists:
+            title = bare_bones(item.title)
+            artist = bare_bones(item.artists[0].name)
+
+            for cluster in index.candidates(title, artist):
+                representative_title, representative_artist = keys[cluster]
+                representative = clusters[cluster][0]
+
+                # SIMILARITY CHECK
+                # Exactly the same normalized title and artist always match, no need to score them
+                if (title, artist) == keys[cluster]:
+                    similar = True
+                else:
+                    similar = (
+                        within_reach(title, representative_title, match_threshold)
+                        and within_reach(artist, representative_artist, match_threshold)
+                        and calculate_similarity(title, representative_title) > match_threshold
+                        and calculate_similarity(artist, representative_artist) > match_threshold
+                    )
+
+                if similar and years_match(item, representative):
+                    clusters[cluster].append(item)
+                    match_found = True
+                    break
+
+        if not match_found:
+            clusters.append([item])
+            keys.append(None)
+            if item.artists:
+                keys[-1] = (title, artist)
+                index.add(len(clusters) - 1, title, artist)
+
+    return clusters
+
+@stage('compile')
 async def match_content(request: dict, results_lists: list[list[object]]) -> list[object]:
     """
         Takes lists of media objects from different services, finds matches based on content similarity,
@@ -31,40 +93,9 @@ async def match_content(request: dict, results_lists: list[list[object]]) -> lis
                 service_buckets['other'] = []
             service_buckets['other'].extend(result_list)
 
-    clusters = []
-
     # Iterate through services in metadata priority order to establish the "base" of clusters
     processing_order = [s for s in metadata_priority if s in service_buckets]
-    
-    for service in processing_order:
-        items = service_buckets[service]
-        
-        for item in items:
-            match_found = False
-            
-            for cluster in clusters:
-                representative = cluster[0]
-                
-                # SIMILARITY CHECK
-                title_sim = calculate_similarity(bare_bones(item.title), bare_bones(representative.title))
-                
-                artist_sim = 0
-                if item.artists and representative.artists:
-                    artist_sim = calculate_similarity(bare_bones(item.artists[0].name), bare_bones(representative.artists[0].name))
-                
-                year_match = True
-                if hasattr(item, 'release_year') and hasattr(representative, 'release_year'):
-                    if item.release_year and representative.release_year:
-                        if abs(item.release_year - representative.release_year) > 1:
-                            year_match = False
-
-                if title_sim > 800 and artist_sim > 800 and year_match:
-                    cluster.append(item)
-                    match_found = True
-                    break
-            
-            if not match_found:
-                clusters.append([item])
+    clusters = cluster_items([item for service in processing_order for item in service_buckets[service]])
 
     global_objects = []
 
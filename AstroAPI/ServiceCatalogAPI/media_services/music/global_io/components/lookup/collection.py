@@ -6,10 +6,14 @@ from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generi
 
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.search.song import search_song as search_song_music
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.search.collection import search_collection as search_collection_music
+from AstroAPI.InternalComponents.CacheManager import single_flight
+from AstroAPI.InternalComponents.TimingManager import timed
 
 
 
-async def lookup_collection(service: object, id: str, collection_country_code: str = None, lookup_country_code: str = 'us') -> object:
+@single_flight.coalesced(gservice)
+@timed(gservice)
+async def lookup_collection(service: object, id: str, collection_country_code: str = None, lookup_country_code: str = 'us', deadline: float = None) -> object:
 	# Prepare the request metadata
 	request = {'request': 'lookup_collection', 'service': service.service, 'id': id, 'collection_country_code': collection_country_code, 'lookup_country_code': lookup_country_code}
 	# Record the start time for processing time calculation
@@ -28,21 +32,32 @@ async def lookup_collection(service: object, id: str, collection_country_code: s
 				collection = collection_reference.collection.title,
 				is_explicit = collection_reference.is_explicit,
 				country_code = lookup_country_code,
-				include_premade_media = [collection_reference]
+				include_premade_media = [collection_reference],
+				deadline = deadline
 			) 
 
 		# This would usually trigger had an error happened inside the lookup collection function, so we can just return that empty or error object
 		if collection_reference.type != 'album' and collection_reference.type != 'ep':
 			return collection_reference
 
+		# Look up the collection by ID on every service we already know its ID on, so only the rest get searched
+		known_media, known_timed_out, deadline = await lookup_known_media('collection', collection_reference, lookup_country_code, deadline)
+
 		# Make the call to the Global Interface's collection-searching function
-		collection = await search_collection_music(
+		# Searches are coalesced, so the result might be shared with other callers, and its meta gets changed down below
+		collection = single_flight.own(await search_collection_music(
 			[artist.name for artist in collection_reference.artists],
 			collection_reference.title,
 			collection_reference.release_year,
 			lookup_country_code,
-			[collection_reference]
-		)
+			[collection_reference] + known_media,
+			deadline = deadline
+		))
+		# Services that were too slow to be looked up by ID and didn't turn up in the search either got left out because of the deadline
+		late = [service for service in known_timed_out if service not in getattr(collection, 'ids', {}) and service not in collection.meta.timed_out]
+		if late != []:
+			collection.meta.timed_out = late + collection.meta.timed_out
+		await record_known_media('collection', collection, lookup_country_code, collection_reference)
 
 		# Replace the request dict of the search one with the lookup one
 		collection.meta.request = request
@@ -5,10 +5,14 @@ from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generi
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic import service as gservice, component as gcomponent
 
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.search.music_video import search_music_video as search_music_video_music
+from AstroAPI.InternalComponents.CacheManager import single_flight
+from AstroAPI.InternalComponents.TimingManager import timed
 
 
 
-async def lookup_music_video(service: object, id: str, mv_country_code: str = None, lookup_country_code: str = 'us') -> object:
+@single_flight.coalesced(gservice)
+@timed(gservice)
+async def lookup_music_video(service: object, id: str, mv_country_code: str = None, lookup_country_code: str = 'us', deadline: float = None) -> object:
 	# Prepare the request metadata
 	request = {'request': 'lookup_song', 'service': service.service, 'id': id, 'mv_country_code': mv_country_code, 'lookup_country_code': lookup_country_code}
 	# Record the start time for processing time calculation
@@ -25,14 +29,24 @@ async def lookup_music_video(service: object, id: str, mv_country_code: str = No
 		if video_reference.type != 'music_video':
 			return video_reference
 
+		# Look up the music video by ID on every service we already know its ID on, so only the rest get searched
+		known_media, known_timed_out, deadline = await lookup_known_media('music_video', video_reference, lookup_country_code, deadline)
+
 		# Make the call to the Global Interface's song-searching function
-		music_video = await search_music_video_music(
+		# Searches are coalesced, so the result might be shared with other callers, and its meta gets changed down below
+		music_video = single_flight.own(await search_music_video_music(
 			artists = [artist.name for artist in video_reference.artists],
 			title = video_reference.title,
 			is_explicit = video_reference.is_explicit,
 			country_code = lookup_country_code,
-			include_premade_media = [video_reference] # Include the media from the original call
-		)
+			include_premade_media = [video_reference] + known_media, # Include the media from the original call
+			deadline = deadline
+		))
+		# Services that were too slow to be looked up by ID and didn't turn up in the search either got left out because of the deadline
+		late = [service for service in known_timed_out if service not in getattr(music_video, 'ids', {}) and service not in music_video.meta.timed_out]
+		if late != []:
+			music_video.meta.timed_out = late + music_video.meta.timed_out
+		await record_known_media('music_video', music_video, lookup_country_code, video_reference)
 
 		# Replace the request dict of the search one with the lookup one
 		music_video.meta.request = request
@@ -5,10 +5,14 @@ from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generi
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic import service as gservice, component as gcomponent
 
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.search.song import search_song as search_song_music
+from AstroAPI.InternalComponents.CacheManager import single_flight
+from AstroAPI.InternalComponents.TimingManager import timed
 
 
 
-async def lookup_song(service: object, id: str, song_country_code: str = None, lookup_country_code: str = 'us') -> object:
+@single_flight.coalesced(gservice)
+@timed(gservice)
+async def lookup_song(service: object, id: str, song_country_code: str = None, lookup_country_code: str = 'us', deadline: float = None) -> object:
 	# Prepare the request metadata
 	request = {'request': 'lookup_song', 'service': service.service, 'id': id, 'song_country_code': song_country_code, 'lookup_country_code': lookup_country_code}
 	# Record the start time for processing time calculation
@@ -35,17 +39,27 @@ async def lookup_song(service: object, id: str, song_country_code: str = None, l
 		else:
 			song_reference_collection_title = None
 
+		# Look up the song by ID on every service we already know its ID on, so only the rest get searched
+		known_media, known_timed_out, deadline = await lookup_known_media('song', song_reference, lookup_country_code, deadline)
+
 		# Make the call to the Global Interface's song-searching function
-		song = await search_song_music(
+		# Searches are coalesced, so the result might be shared with other callers, and its meta gets changed down below
+		song = single_flight.own(await search_song_music(
 			artists = [artist.name for artist in song_reference.artists],
 			title = song_reference.title,
 			song_type = song_reference.type if song_reference.type != 'knowledge' else song_reference.media_type,
 			collection = song_reference_collection_title,
 			is_explicit = song_reference.is_explicit,
 			country_code = lookup_country_code,
-			include_premade_media = [song_reference] if song_reference.type in compatible_results and song_reference.service != 'youtube_music' else [],  # Include the media from the original call unless it's a knowledge result or anything from YouTube, because YT's data can be unreliable
-			incomplete_artist_info = False
-		)
+			include_premade_media = ([song_reference] if song_reference.type in compatible_results and song_reference.service != 'youtube_music' else []) + known_media,  # Include the media from the original call unless it's a knowledge result or anything from YouTube, because YT's data can be unreliable
+			incomplete_artist_info = False,
+			deadline = deadline
+		))
+		# Services that were too slow to be looked up by ID and didn't turn up in the search either got left out because of the deadline
+		late = [service for service in known_timed_out if service not in getattr(song, 'ids', {}) and service not in song.meta.timed_out]
+		if late != []:
+			song.meta.timed_out = late + song.meta.timed_out
+		await record_known_media('song', song, lookup_country_code, song_reference)
 
 		# Replace the request dict of the search one with the lookup one
 		song.meta.request = request
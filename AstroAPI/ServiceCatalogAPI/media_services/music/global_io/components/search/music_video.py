@@ -8,11 +8,15 @@ from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generi
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic.compile_global.artists import compiled_artists
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic.compile_global.cover import compiled_cover
 
-from asyncio import create_task, gather
+from asyncio import create_task
+from AstroAPI.InternalComponents.CacheManager import single_flight
+from AstroAPI.InternalComponents.TimingManager import timed
 
 
 
-async def search_music_video(artists: list, title: str, is_explicit: bool = None, country_code: str = 'us', include_premade_media: list = None, exclude_services: list = None) -> object:
+@single_flight.coalesced(gservice)
+@timed(gservice)
+async def search_music_video(artists: list, title: str, is_explicit: bool = None, country_code: str = 'us', include_premade_media: list = None, exclude_services: list = None, deadline: float = None) -> object:
 	# SINCE WHEN ARE FUNCTION VARIABLES PERSISTENT??????
 	if include_premade_media is None:
 		include_premade_media = []
@@ -36,7 +40,8 @@ async def search_music_video(artists: list, title: str, is_explicit: bool = None
 
 		tasks = []
 		for obj in service_objs:
-			if obj.service not in exclude_services:
+			# Services whose circuit breaker is open get skipped like they were excluded
+			if obj.service not in exclude_services and circuit_breakers.allow(obj.service):
 				tasks.append(
 					create_task(
 						obj.search_music_video(
@@ -46,7 +51,12 @@ async def search_music_video(artists: list, title: str, is_explicit: bool = None
 					)
 				)
 		
-		results = await gather(*tasks)
+		# Premade media is already here, so streaming requests get it before anything else
+		for premade in include_premade_media:
+			announce(premade.service, premade)
+
+		# Only wait for the services until the deadline, the slow ones get left out of the result
+		results, timed_out = await gather_within_deadline(tasks, deadline)
 
 		# Create labeled and unlabeled lists of results, used for 
 		unlabeled_results = [result for result in results if result.type in legal_results] + [premade for premade in include_premade_media if premade.type in legal_results]
@@ -139,9 +149,12 @@ async def search_music_video(artists: list, title: str, is_explicit: bool = None
 					request = request,
 					processing_time = result_processing_time,
 					filter_confidence_percentage = result_confidence,
-					http_code = 200
+					http_code = 200,
+					timed_out = timed_out
 				)
 			)
+			# Remember which IDs belong together, so lookups of any of them can skip searching next time
+			await record_known_media('music_video', music_video, country_code)
 			return music_video
 		else:
 			empty_response = Empty(
@@ -151,7 +164,8 @@ async def search_music_video(artists: list, title: str, is_explicit: bool = None
 					request = request,
 					processing_time = current_unix_time_ms() - start_time,
 					filter_confidence_percentage = {gservice: 0.0},
-					http_code = 204
+					http_code = 504 if results == [] and timed_out != [] else 204, # Nobody answering in time isn't the same as nobody having it
+					timed_out = timed_out
 				)
 			)
 			await log(empty_response)
@@ -14,34 +14,38 @@ from AstroAPI.ServiceCatalogAPI.media_services.music.deezer.components.search.qu
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic.match import match_content
 from AstroAPI.ServiceCatalogAPI.components.filtering.filter import filter_query
 
-from asyncio import create_task, gather
+from asyncio import create_task
+from AstroAPI.InternalComponents.CacheManager import single_flight
+from AstroAPI.InternalComponents.TimingManager import timed
 
 
 
-async def search_query(query: str, filter_for_best_match: bool = True, media_types: list = None, is_explicit: bool = None, country_code: str = 'us', exclude_services: list = []) -> object:
+@single_flight.coalesced(gservice)
+@timed(gservice)
+async def search_query(query: str, filter_for_best_match: bool = True, media_types: list = None, is_explicit: bool = None, country_code: str = 'us', exclude_services: list = [], deadline: float = None) -> object:
 	# Prepare the request metadata
 	request = {'request': 'search_query', 'query': query, 'country_code': country_code}
 	start_time = current_unix_time_ms()
 
 	try:
-		# Define tasks for all services, checking exclude_services
+		# Define tasks for all services, checking exclude_services and the circuit breakers
 		# We pass False for filtering because we want raw lists to aggregate ourselves
 		tasks = []
 		
-		if 'spotify' not in exclude_services:
-			tasks.append(create_task(search_spotify(query, False, media_types, is_explicit, country_code)))
+		if 'spotify' not in exclude_services and circuit_breakers.allow('spotify'):
+			tasks.append(create_task(search_spotify(query, False, media_types, is_explicit, country_code), name = 'spotify'))
 		
-		if 'apple_music' not in exclude_services:
-			tasks.append(create_task(search_apple(query, False, media_types, is_explicit, country_code)))
+		if 'apple_music' not in exclude_services and circuit_breakers.allow('apple_music'):
+			tasks.append(create_task(search_apple(query, False, media_types, is_explicit, country_code), name = 'apple_music'))
 			
-		if 'youtube_music' not in exclude_services:
-			tasks.append(create_task(search_ytm(query, False, media_types, is_explicit, country_code)))
+		if 'youtube_music' not in exclude_services and circuit_breakers.allow('youtube_music'):
+			tasks.append(create_task(search_ytm(query, False, media_types, is_explicit, country_code), name = 'youtube_music'))
 			
-		if 'deezer' not in exclude_services:
-			tasks.append(create_task(search_deezer(query, False, media_types, is_explicit, country_code)))
+		if 'deezer' not in exclude_services and circuit_breakers.allow('deezer'):
+			tasks.append(create_task(search_deezer(query, False, media_types, is_explicit, country_code), name = 'deezer'))
 
-		# Execute searches in parallel
-		results = await gather(*tasks, return_exceptions=True)
+		# Execute searches in parallel, but only wait for them until the deadline
+		results, timed_out = await gather_within_deadline(tasks, deadline, return_exceptions = True)
 
 		# Containers for raw objects from all services
 		raw_songs = []
@@ -99,13 +103,14 @@ async def search_query(query: str, filter_for_best_match: bool = True, media_typ
 						request = request,
 						processing_time = total_time,
 						filter_confidence_percentage = 0.0,
-						http_code = 204
+						http_code = 504 if results == [] and timed_out != [] else 204,
+						timed_out = timed_out
 					)
 				)
 				await log(empty_response)
 				return empty_response
 
-			return await filter_query(
+			best_match = await filter_query(
 				service = gservice, 
 				query_request = request, 
 				items = all_items, 
@@ -113,6 +118,8 @@ async def search_query(query: str, filter_for_best_match: bool = True, media_typ
 				query_is_explicit = is_explicit, 
 				query_country_code = country_code
 			)
+			best_match.meta.timed_out = timed_out
+			return best_match
 		
 		else:
 			# Return a Query object containing all global results
@@ -126,7 +133,8 @@ async def search_query(query: str, filter_for_best_match: bool = True, media_typ
 					request = request,
 					processing_time = total_time,
 					filter_confidence_percentage = 0.0,
-					http_code = 200
+					http_code = 200,
+					timed_out = timed_out
 				)
 			)
 
@@ -7,6 +7,7 @@ from .components.search.collection import search_collection
 from .components.search.query import search_query
 from .components.lookup.song import lookup_song
 from .components.lookup.collection import lookup_collection
+from .components.lookup.collection_tracks import lookup_collection_tracks
 from .components.lookup.artist import lookup_artist
 
 
@@ -80,6 +81,17 @@ class Spotify:
 		"""
 		return await lookup_collection(id = id, country_code = country_code)
 	
+	async def lookup_collection_tracks(self, id: str, country_code: str = 'us') -> list[str] | Empty | Error:
+		"""
+			# Spotify Collection Tracks Music Lookup
+
+			Lookup for the IDs of every track on a collection on Spotify via collection ID, in the order they're on the collection.
+
+			:param id: Collection ID.
+			:param country_code: The country code of the country in which you want to conduct the lookup.
+		"""
+		return await lookup_collection_tracks(id = id, country_code = country_code)
+	
 	async def lookup_artist(self, id: str, country_code: str = 'us') -> Song | Empty | Error:
 		"""
 			# Spotify Artist Music Lookup
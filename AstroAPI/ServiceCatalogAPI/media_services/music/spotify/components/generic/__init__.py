@@ -1,3 +1,4 @@
 from .about import service, component, api
 from .get_artists_of_media import *
-from .create_objects import *
\ No newline at end of file
+from .create_objects import *
+from .bulk_lookup import track_batcher, album_batcher
\ No newline at end of file
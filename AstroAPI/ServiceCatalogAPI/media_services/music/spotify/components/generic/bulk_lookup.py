@@ -0,0 +1,47 @@
+from .about import service, api
+from AstroAPI.InternalComponents.CredentialsManager.media_services.spotify.token import spotify_token
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.CacheManager import Batcher
+import aiohttp
+from AstroAPI.InternalComponents.TimingManager import read_json
+
+
+
+"""
+	Spotify can look up 50 tracks or 20 albums in one request. Lookups that run at the same
+	time get batched into those (see batcher.py), grouped by country code since that's the
+	market all of them get looked up in.
+"""
+
+
+
+async def get_in_bulk(endpoint: str, key: str, country_code: str, ids: list[str]) -> dict:
+	async with session_manager.session(service) as session:
+		api_url = f'{api}/{endpoint}'
+		api_params = {
+			'ids': ','.join(ids),
+			'market': country_code.upper(),
+		}
+		api_headers = {'Authorization': f'Bearer {await spotify_token.get_token()}'}
+		timeout = aiohttp.ClientTimeout(total = 30)
+
+		async with session.get(url = api_url, headers = api_headers, timeout = timeout, params = api_params) as response:
+			if response.status != 200:
+				return {}
+			# Results come back in the same order as the IDs (relinked tracks have a different ID than the one asked for), and IDs that don't exist come back as null
+			return {id: result for id, result in zip(ids, (await read_json(response))[key]) if result is not None}
+
+
+
+async def get_tracks(country_code: str, ids: list[str]) -> dict:
+	return await get_in_bulk('tracks', 'tracks', country_code, ids)
+
+
+
+async def get_albums(country_code: str, ids: list[str]) -> dict:
+	return await get_in_bulk('albums', 'albums', country_code, ids)
+
+
+
+track_batcher = Batcher(get_tracks, max_size = 50)
+album_batcher = Batcher(get_albums, max_size = 20)
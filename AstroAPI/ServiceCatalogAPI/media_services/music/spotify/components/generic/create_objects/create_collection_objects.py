@@ -1,9 +1,66 @@
 from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.components import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.spotify.components.generic import *
+from AstroAPI.InternalComponents.TimingManager import stage
 
 
 
+@stage('build')
+def create_collection_object(collection: dict, request: dict, processing_time: int, http_code: int) -> Collection:
+
+	"""
+		Convert a single album from Spotify's JSON response into a Collection object.
+
+		:param collection: The album JSON.
+		:param request: Request dict.
+		:param processing_time: How long it took to get the album, in milliseconds.
+	"""
+
+	# Determine the collection type (album or ep)
+	collection_type = ('album' if collection['album_type'] != 'single' else 'ep')
+	collection_url = collection['external_urls']['spotify']
+	collection_id = collection['id']
+	collection_title = remove_feat(collection['name'])
+	collection_artists = get_artists_of_media(request, collection['artists'])
+	collection_year = collection['release_date'][:4]
+
+	# Create a Cover object for the collection's artwork
+	media_cover = Cover(
+		service = service,
+		media_type = collection_type,
+		title = collection_title,
+		artists = collection_artists,
+		hq_urls = collection['images'][0]['url'] if collection['images'] != [] else None,
+		lq_urls = collection['images'][len(collection['images']) - 1]['url'] if collection['images'] != [] else None,
+		meta = Meta(
+			service = service,
+			request = request,
+			processing_time = 0,
+			filter_confidence_percentage = 100.0,
+			http_code = 200
+		)
+	)    
+
+	return Collection(
+		service = service,
+		type = collection_type,
+		urls = collection_url,
+		ids = collection_id,
+		title = collection_title,
+		artists = collection_artists,
+		release_year = collection_year,
+		cover = media_cover,
+		meta = Meta(
+			service = service,
+			request = request,
+			processing_time = processing_time,
+			http_code = http_code
+		)
+	)
+
+
+
+@stage('build')
 async def create_collection_objects(json_response: dict, request: dict, start_time: int, http_code: int):
 
 	"""
@@ -18,50 +75,36 @@ async def create_collection_objects(json_response: dict, request: dict, start_ti
 	# Iterate through each song in the response
 	if 'albums' in json_response:
 		for collection in json_response['albums']['items']:
-			# Determine the collection type (album or ep)
-			collection_type = ('album' if collection['album_type'] != 'single' else 'ep')
-			collection_url = collection['external_urls']['spotify']
-			collection_id = collection['id']
-			collection_title = remove_feat(collection['name'])
-			collection_artists = get_artists_of_media(request, collection['artists'])
-			collection_year = collection['release_date'][:4]
-
-			# Create a Cover object for the collection's artwork
-			media_cover = Cover(
-				service = service,
-				media_type = collection_type,
-				title = collection_title,
-				artists = collection_artists,
-				hq_urls = collection['images'][0]['url'] if collection['images'] != [] else None,
-				lq_urls = collection['images'][len(collection['images']) - 1]['url'] if collection['images'] != [] else None,
-				meta = Meta(
-					service = service,
-					request = request,
-					processing_time = 0,
-					filter_confidence_percentage = 100.0,
-					http_code = 200
-				)
-			)    
-
-			# Create a Collection object and add it to the list
-			collections.append(Collection(
-				service = service,
-				type = collection_type,
-				urls = collection_url,
-				ids = collection_id,
-				title = collection_title,
-				artists = collection_artists,
-				release_year = collection_year,
-				cover = media_cover,
-				meta = Meta(
-					service = service,
-					request = request,
-					processing_time = current_unix_time_ms() - start_time,
-					http_code = http_code
-				)
-			))
+			collections.append(create_collection_object(collection, request, current_unix_time_ms() - start_time, http_code))
 		
 		return collections
 	
 	else:
-		return [] 
\ No newline at end of file
+		return [] 
+
+
+
+@stage('build')
+async def create_collection_candidates(json_response: dict, request: dict, start_time: int, http_code: int):
+
+	"""
+		Iterate through Spotify's albums list in their JSON response and turn it into filtering candidates.
+		Only the candidate that wins filtering gets converted into a Collection object.
+		
+		:param json_response: Spotify's JSON response.
+		:param request: Request dict.
+	"""
+
+	if 'albums' not in json_response:
+		return []
+
+	processing_time = current_unix_time_ms() - start_time
+	return [
+		Candidate(
+			type = 'album' if collection['album_type'] != 'single' else 'ep',
+			title = remove_feat(collection['name']),
+			artist_names = [artist['name'] for artist in collection['artists']],
+			release_year = collection['release_date'][:4],
+			build = lambda collection = collection: create_collection_object(collection, request, processing_time, http_code)
+		) for collection in json_response['albums']['items']
+	]
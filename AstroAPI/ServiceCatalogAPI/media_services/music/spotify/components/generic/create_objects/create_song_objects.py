@@ -1,9 +1,94 @@
 from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.components import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.spotify.components.generic import *
+from AstroAPI.InternalComponents.TimingManager import stage
 
 
 
+@stage('build')
+def create_song_object(song: dict, request: dict, processing_time: int, http_code: int) -> Song:
+
+	"""
+		Convert a single track from Spotify's JSON response into a Song object.
+
+		:param song: The track JSON.
+		:param request: Request dict.
+		:param processing_time: How long it took to get the track, in milliseconds.
+	"""
+
+	# Extract song details
+	song_type = ('track' if song['album']['album_type'] != 'single' else 'single')
+	song_url = song['external_urls']['spotify']
+	song_id = song['id']
+	song_title = song['name']
+	song_artists = get_artists_of_media(request, song['artists'])
+	song_is_explicit = song['explicit']
+	
+	# Extract collection details
+	collection_type = 'album' if song['album']['album_type'] != 'single' else 'ep'
+	collection_url = song['album']['external_urls']['spotify']
+	collection_id = song['album']['id']
+	collection_title = remove_feat(song['album']['name'])
+	collection_artists = get_artists_of_media(request, song['album']['artists'])
+	collection_year = song['album']['release_date'][:4]
+
+	# Create Cover object for the collection
+	media_cover = Cover(
+		service = service,
+		media_type = collection_type,
+		title = collection_title,
+		artists = collection_artists,
+		hq_urls = song['album']['images'][0]['url'] if song['album']['images'] != [] else None,
+		lq_urls = song['album']['images'][len(song['album']['images']) - 1]['url'] if song['album']['images'] != [] else None,
+		meta = Meta(
+			service = service,
+			request = request,
+			processing_time = 0,
+			filter_confidence_percentage = 100.0,
+			http_code = 200
+		)
+	)
+
+	# Create Collection object for the song's album/EP
+	song_collection = Collection(
+		service = service,
+		type = collection_type,
+		urls = collection_url,
+		ids = collection_id,
+		title = collection_title,
+		artists = collection_artists,
+		release_year = collection_year,
+		cover = media_cover,
+		meta = Meta(
+			service = service,
+			request = request,
+			processing_time = 0,
+			filter_confidence_percentage = 100.0,
+			http_code = 200
+		)
+	)
+
+	return Song(
+		service = service,
+		type = song_type,
+		urls = song_url,
+		ids = song_id,
+		title = song_title,
+		artists = song_artists,
+		collection = song_collection,
+		is_explicit = song_is_explicit,
+		cover = media_cover,
+		meta = Meta(
+			service = service,
+			request = request,
+			processing_time = processing_time,
+			http_code = http_code
+		)
+	)
+
+
+
+@stage('build')
 async def create_song_objects(json_response: dict, request: dict, start_time: int, http_code: int):
 
 	"""
@@ -18,78 +103,37 @@ async def create_song_objects(json_response: dict, request: dict, start_time: in
 	# Iterate through each song in the response
 	if 'tracks' in json_response:
 		for song in json_response['tracks']['items']:
-			# Extract song details
-			song_type = ('track' if song['album']['album_type'] != 'single' else 'single')
-			song_url = song['external_urls']['spotify']
-			song_id = song['id']
-			song_title = song['name']
-			song_artists = get_artists_of_media(request, song['artists'])
-			song_is_explicit = song['explicit']
-			
-			# Extract collection details
-			collection_type = 'album' if song['album']['album_type'] != 'single' else 'ep'
-			collection_url = song['album']['external_urls']['spotify']
-			collection_id = song['album']['id']
-			collection_title = remove_feat(song['album']['name'])
-			collection_artists = get_artists_of_media(request, song['album']['artists'])
-			collection_year = song['album']['release_date'][:4]
-
-			# Create Cover object for the collection
-			media_cover = Cover(
-				service = service,
-				media_type = collection_type,
-				title = collection_title,
-				artists = collection_artists,
-				hq_urls = song['album']['images'][0]['url'] if song['album']['images'] != [] else None,
-				lq_urls = song['album']['images'][len(song['album']['images']) - 1]['url'] if song['album']['images'] != [] else None,
-				meta = Meta(
-					service = service,
-					request = request,
-					processing_time = 0,
-					filter_confidence_percentage = 100.0,
-					http_code = 200
-				)
-			)
-
-			# Create Collection object for the song's album/EP
-			song_collection = Collection(
-				service = service,
-				type = collection_type,
-				urls = collection_url,
-				ids = collection_id,
-				title = collection_title,
-				artists = collection_artists,
-				release_year = collection_year,
-				cover = media_cover,
-				meta = Meta(
-					service = service,
-					request = request,
-					processing_time = 0,
-					filter_confidence_percentage = 100.0,
-					http_code = 200
-				)
-			)
-
-			# Append the Song object to the songs list
-			songs.append(Song(
-				service = service,
-				type = song_type,
-				urls = song_url,
-				ids = song_id,
-				title = song_title,
-				artists = song_artists,
-				collection = song_collection,
-				is_explicit = song_is_explicit,
-				cover = media_cover,
-				meta = Meta(
-					service = service,
-					request = request,
-					processing_time = current_unix_time_ms() - start_time,
-					http_code = http_code
-				)
-			))
+			songs.append(create_song_object(song, request, current_unix_time_ms() - start_time, http_code))
 		
 		return songs
 	
 	else:
-		return [] 
\ No newline at end of file
+		return [] 
+
+
+
+@stage('build')
+async def create_song_candidates(json_response: dict, request: dict, start_time: int, http_code: int):
+
+	"""
+		Iterate through Spotify's tracks list in their JSON response and turn it into filtering candidates.
+		Only the candidate that wins filtering gets converted into a Song object.
+		
+		:param json_response: Spotify's JSON response.
+		:param request: Request dict.
+	"""
+
+	if 'tracks' not in json_response:
+		return []
+
+	processing_time = current_unix_time_ms() - start_time
+	return [
+		Candidate(
+			type = 'track' if song['album']['album_type'] != 'single' else 'single',
+			title = song['name'],
+			artist_names = [artist['name'] for artist in song['artists']],
+			collection_title = remove_feat(song['album']['name']),
+			is_explicit = song['explicit'],
+			build = lambda song = song: create_song_object(song, request, processing_time, http_code)
+		) for song in json_response['tracks']['items']
+	]
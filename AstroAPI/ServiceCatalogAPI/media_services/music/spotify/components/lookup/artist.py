@@ -4,9 +4,14 @@ from AstroAPI.ServiceCatalogAPI.media_services.music.spotify.components.generic.
 from AstroAPI.InternalComponents.CredentialsManager.media_services.spotify.token import spotify_token
 from AstroAPI.ServiceCatalogAPI.media_services.music.spotify.components.generic import *
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.CacheManager import response_cache
+from AstroAPI.InternalComponents.TimingManager import timed, read_json
 
 
 
+@response_cache.cached(service)
+@timed(service)
 async def lookup_artist(id: str, country_code: str = 'us') -> object:
 	# Prepare the request metadata
 	request = {'request': 'lookup_artist', 'id': id, 'country_code': country_code}
@@ -16,7 +21,7 @@ async def lookup_artist(id: str, country_code: str = 'us') -> object:
 	start_time = current_unix_time_ms()
 	
 	try:
-		async with aiohttp.ClientSession() as session:
+		async with session_manager.session(service) as session:
 			# Prepare request data and Spotify API endpoint
 			api_url = f'{api}/artists/{id}'
 			api_headers = {'Authorization': f'Bearer {await spotify_token.get_token()}'}
@@ -24,7 +29,7 @@ async def lookup_artist(id: str, country_code: str = 'us') -> object:
 
 			# Make the GET request to the Spotify API
 			async with session.get(url = api_url, headers = api_headers, timeout = timeout) as response:
-				lookup_json = await response.json()
+				lookup_json = await read_json(response)
 				if response.status == 200:
 					# Parse the JSON response if the request was successful
 					artist = lookup_json
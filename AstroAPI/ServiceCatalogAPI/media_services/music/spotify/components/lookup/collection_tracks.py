@@ -0,0 +1,88 @@
+from AstroAPI.InternalComponents.SystemMediaObjects import *
+from AstroAPI.InternalComponents.Legacy import *
+from AstroAPI.ServiceCatalogAPI.components import *
+from AstroAPI.InternalComponents.CredentialsManager.media_services.spotify.token import spotify_token
+from AstroAPI.ServiceCatalogAPI.media_services.music.spotify.components.generic import *
+import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.TimingManager import timed, read_json
+
+
+
+page_size = 50 # Most tracks Spotify returns per page
+
+
+
+@timed(service)
+async def lookup_collection_tracks(id: str, country_code: str = 'us') -> list[str] | Empty | Error:
+	# Prepare the request metadata
+	request = {'request': 'lookup_collection_tracks', 'id': id, 'country_code': country_code}
+	# Lookup JSON variable for later debugging
+	lookup_json = None
+	# Record the start time for processing time calculation
+	start_time = current_unix_time_ms()
+
+	try:
+		track_ids = []
+		# Create an aiohttp session
+		async with session_manager.session(service) as session:
+			# Prepare for API call
+			api_url = f'{api}/albums/{id}/tracks'
+			api_params = {
+				'market': country_code.upper(),
+				'limit': page_size
+			}
+			timeout = aiohttp.ClientTimeout(total = 30) # Set a timeout for the HTTP request
+
+			# Albums with more tracks than fit on a page link to the next one
+			while api_url is not None:
+				api_headers = {'Authorization': f'Bearer {await spotify_token.get_token()}'}
+				async with session.get(url = api_url, headers = api_headers, timeout = timeout, params = api_params) as response:
+					lookup_json = await read_json(response)
+					status = response.status
+				if status != 200:
+					error = Error(
+						service = service,
+						component = component,
+						error_msg = "HTTP error when looking up collection tracks",
+						meta = Meta(
+							service = service,
+							request = request,
+							processing_time = current_unix_time_ms() - start_time,
+							http_code = status
+						)
+					)
+					await log(error, [discord.File(fp = StringIO(json.dumps(lookup_json, indent = 4)), filename = f'{id}.json')])
+					return error
+				track_ids += [track['id'] for track in lookup_json['items'] if track['id'] is not None]
+				# The next page's URL already has every parameter in it
+				api_url = lookup_json['next']
+				api_params = None
+
+		if track_ids == []:
+			return Empty(
+				service = service,
+				meta = Meta(
+					service = service,
+					request = request,
+					processing_time = current_unix_time_ms() - start_time,
+					http_code = 204
+				)
+			)
+		return track_ids
+
+	# If sinister things happen
+	except Exception as error:
+		error = Error(
+			service = service,
+			component = component,
+			error_msg = f'Error when looking up collection tracks: "{error}"',
+			meta = Meta(
+				service = service,
+				request = request,
+				http_code = 500,
+				processing_time = {service: current_unix_time_ms() - start_time}
+			)
+		)
+		await log(error, [discord.File(fp = StringIO(json.dumps(lookup_json, indent = 4)), filename = f'{id}.json')])
+		return error
@@ -4,9 +4,12 @@ from AstroAPI.InternalComponents.CredentialsManager.media_services.spotify.token
 from AstroAPI.ServiceCatalogAPI.media_services.music.spotify.components.generic import *
 
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.TimingManager import timed, read_json
 
 
 
+@timed(service)
 async def search_query(query: str, filter_for_best_match: bool = True, media_types: list = None, is_explicit: bool = None, country_code: str = 'us') -> object:
 	# Prepare the request dictionary with search parameters
 	request = {'request': 'search_query', 'query': query, 'country_code': country_code}
@@ -16,7 +19,7 @@ async def search_query(query: str, filter_for_best_match: bool = True, media_typ
 	start_time = current_unix_time_ms()
 	
 	try:
-		async with aiohttp.ClientSession() as session:
+		async with session_manager.session(service) as session:
 			# Prepare for API call
 			if media_types == None:
 				query_media = 'track,album'
@@ -42,7 +45,7 @@ async def search_query(query: str, filter_for_best_match: bool = True, media_typ
 
 			# Make an asynchronous GET request to the Spotify API
 			async with session.get(url = api_url, headers = api_headers, timeout = timeout, params = api_params) as response:
-				lookup_json = await response.json()
+				lookup_json = await read_json(response)
 				if response.status == 200:
 					songs = await create_song_objects(
 						json_response = lookup_json,
@@ -3,9 +3,14 @@ from AstroAPI.ServiceCatalogAPI.components import *
 from AstroAPI.InternalComponents.CredentialsManager.media_services.spotify.token import spotify_token
 from AstroAPI.ServiceCatalogAPI.media_services.music.spotify.components.generic import *
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.CacheManager import response_cache
+from AstroAPI.InternalComponents.TimingManager import timed, read_json
 
 
 
+@response_cache.cached(service)
+@timed(service)
 async def search_song(artists: list, title: str, song_type: str = None, collection: str = None, is_explicit: bool = None, country_code: str = 'us') -> object:
 	# Prepare the request dictionary with search parameters
 	request = {'request': 'search_song', 'artists': artists, 'title': title, 'song_type': song_type, 'collection': collection, 'is_explicit': is_explicit, 'country_code': country_code}
@@ -17,7 +22,7 @@ async def search_song(artists: list, title: str, song_type: str = None, collecti
 	# Try to perform the song search operation
 	try:
 		# Create an aiohttp session for making HTTP requests
-		async with aiohttp.ClientSession() as session:
+		async with session_manager.session(service) as session:
 			# Remove any special characters from artists and title thay may throw off the search
 			artists = [artist for artist in artists]
 			title = title
@@ -42,9 +47,9 @@ async def search_song(artists: list, title: str, song_type: str = None, collecti
 
 			# Make the GET request to Spotify API
 			async with session.get(url = api_url, headers = api_headers, timeout = timeout, params = api_params) as response:
-				lookup_json = await response.json()
+				lookup_json = await read_json(response)
 				if response.status == 200:
-					songs = await create_song_objects(
+					songs = await create_song_candidates(
 						json_response = lookup_json,
 						request = request,
 						start_time = start_time,
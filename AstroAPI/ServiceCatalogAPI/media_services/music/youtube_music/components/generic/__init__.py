@@ -1,2 +1,3 @@
 from .about import service, component, api
+from .ytmusic import ytmusic
 from .create_objects import *
\ No newline at end of file
@@ -1,9 +1,80 @@
 from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.components import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.generic import *
+from AstroAPI.InternalComponents.TimingManager import stage
 
 
 
+@stage('build')
+def create_collection_object(collection: dict, request: dict, processing_time: int, http_code: int) -> Collection:
+
+	"""
+		Convert a single album from YouTube Music's JSON response into a Collection object.
+
+		:param collection: The album JSON.
+		:param request: Request dict.
+		:param processing_time: How long it took to get the album, in milliseconds.
+	"""
+
+	# Determine if the collection is an album or EP
+	collection_type = ('album' if collection['type'] == 'Album' else 'ep')
+	collection_url = f'https://music.youtube.com/playlist?list={collection["playlistId"]}'
+	collection_id = collection['playlistId']
+	collection_title = collection['title']
+	collection_year = collection['year']
+
+	# Build a list of Artist objects for the collection
+	collection_artists = [
+		Artist(
+			service = service,
+			urls = f'https://music.youtube.com/channel/{artist["id"]}',
+			ids = artist['id'],
+			name = artist['name'],
+			meta = Meta(
+				service = service,
+				request = request,
+				processing_time = processing_time,
+				http_code = 200,
+				filter_confidence_percentage = 100.0
+			)
+		) for artist in collection['artists']]
+
+	# Create a Cover object for the collection
+	collection_cover = Cover(
+		service = service,
+		media_type = collection_type,
+		title = collection_title,
+		artists = collection_artists,
+		hq_urls = collection['thumbnails'][0]['url'],
+		lq_urls = collection['thumbnails'][len(collection['thumbnails'])-1]['url'],
+		meta = Meta(
+			service = service,
+			request = request,
+			processing_time = processing_time,
+			http_code = 200
+		)
+	)
+
+	return Collection(
+		service = service,
+		type = collection_type,
+		urls = collection_url,
+		ids = collection_id,
+		title = collection_title,
+		artists = collection_artists,
+		release_year = collection_year,
+		cover = collection_cover,
+		meta = Meta(
+			service = service,
+			request = request,
+			processing_time = processing_time,
+			http_code = 200
+		)
+	)
+
+
+
+@stage('build')
 async def create_collection_objects(results: dict, request: dict, start_time: int, http_code: int):
 
 	"""
@@ -18,61 +89,30 @@ async def create_collection_objects(results: dict, request: dict, start_time: in
 	# Iterate over each collection result
 	for collection in results:
 		if collection['resultType'] == 'album':
-			# Determine if the collection is an album or EP
-			collection_type = ('album' if collection['type'] == 'Album' else 'ep')
-			collection_url = f'https://music.youtube.com/playlist?list={collection["playlistId"]}'
-			collection_id = collection['playlistId']
-			collection_title = collection['title']
-			collection_year = collection['year']
-
-			# Build a list of Artist objects for the collection
-			collection_artists = [
-				Artist(
-					service = service,
-					urls = f'https://music.youtube.com/channel/{artist["id"]}',
-					ids = artist['id'],
-					name = artist['name'],
-					meta = Meta(
-						service = service,
-						request = request,
-						processing_time = current_unix_time_ms() - start_time,
-						http_code = 200,
-						filter_confidence_percentage = 100.0
-					)
-				) for artist in collection['artists']]
-
-			# Create a Cover object for the collection
-			collection_cover = Cover(
-				service = service,
-				media_type = collection_type,
-				title = collection_title,
-				artists = collection_artists,
-				hq_urls = collection['thumbnails'][0]['url'],
-				lq_urls = collection['thumbnails'][len(collection['thumbnails'])-1]['url'],
-				meta = Meta(
-					service = service,
-					request = request,
-					processing_time = current_unix_time_ms() - start_time,
-					http_code = 200
-				)
-			)
-
-			# Append the Collection object to the collections list
-			collections.append(Collection(
-				service = service,
-				type = collection_type,
-				urls = collection_url,
-				ids = collection_id,
-				title = collection_title,
-				artists = collection_artists,
-				release_year = collection_year,
-				cover = collection_cover,
-				meta = Meta(
-					service = service,
-					request = request,
-					processing_time = current_unix_time_ms() - start_time,
-					http_code = 200
-				)
-			))
+			collections.append(create_collection_object(collection, request, current_unix_time_ms() - start_time, http_code))
 	
-	return collections
\ No newline at end of file
+	return collections
+
+
+
+@stage('build')
+async def create_collection_candidates(results: dict, request: dict, start_time: int, http_code: int):
+
+	"""
+		Iterate through YouTube Music's albums list in their JSON response and turn it into filtering candidates.
+		Only the candidate that wins filtering gets converted into a Collection object.
+		
+		:param json_response: YouTube Music's JSON response.
+		:param request: Request dict.
+	"""
+
+	processing_time = current_unix_time_ms() - start_time
+	return [
+		Candidate(
+			type = 'album' if collection['type'] == 'Album' else 'ep',
+			title = collection['title'],
+			artist_names = [artist['name'] for artist in collection['artists']],
+			release_year = collection['year'],
+			build = lambda collection = collection: create_collection_object(collection, request, processing_time, http_code)
+		) for collection in results if collection['resultType'] == 'album'
+	]
@@ -0,0 +1,52 @@
+from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.generic.about import service
+from AstroAPI.InternalComponents.CredentialsManager.media_services.youtube.credentials import youtube_credentials
+from AstroAPI.InternalComponents.SessionManager import executor_manager
+from AstroAPI.InternalComponents.TimingManager import span
+
+
+
+class YTMusic:
+	"""
+		Awaitable wrapper around ytmusicapi. ytmusicapi is fully blocking, so every call
+		runs on YouTube Music's own thread pool instead of freezing the event loop.
+	"""
+
+	async def call(self, method: str, *args, **kwargs):
+		"""
+			Call a ytmusicapi method on the thread pool.
+
+			:param method: Name of the ytmusicapi method.
+		"""
+		ytmusicapi = await youtube_credentials.initialize()
+		# ytmusicapi makes the request and decodes it in one go, so all of it counts as network time
+		with span('network'):
+			return await executor_manager.run(service, getattr(ytmusicapi, method), *args, **kwargs)
+
+	async def search(self, query: str, filter: str = None) -> list:
+		"""
+			:param query: The search query.
+			:param filter: Optional. What kind of results to return (songs, videos, albums...).
+		"""
+		return await self.call('search', query = query, filter = filter)
+
+	async def get_album(self, browse_id: str) -> dict:
+		"""
+			:param browse_id: The album's browse ID.
+		"""
+		return await self.call('get_album', browse_id)
+
+	async def get_album_browse_id(self, id: str) -> str:
+		"""
+			:param id: The album's playlist ID.
+		"""
+		return await self.call('get_album_browse_id', id)
+
+	async def get_artist(self, id: str) -> dict:
+		"""
+			:param id: The artist's channel ID.
+		"""
+		return await self.call('get_artist', id)
+
+
+
+ytmusic = YTMusic()
@@ -5,9 +5,14 @@ from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.ge
 from AstroAPI.InternalComponents.CredentialsManager.media_services.youtube.credentials import youtube_credentials
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.generic.is_kpop import is_kpop
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.generic.cleanup_mv_title import get_kpop_artist_name, devevoify
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.CacheManager import response_cache
+from AstroAPI.InternalComponents.TimingManager import timed, read_json
 
 
 
+@response_cache.cached(service)
+@timed(service)
 async def lookup_artist(id: str = None, video_id: str = None, country_code: str = 'us') -> object:
 	# Build the request dictionary with provided parameters
 	request = {'request': 'lookup_artist', 'id': id, 'video_id': video_id, 'country_code': country_code}
@@ -17,6 +22,8 @@ async def lookup_artist(id: str = None, video_id: str = None, country_code: str
 	start_time = current_unix_time_ms()
 	
 	try:
+		# Make sure the API key has been fetched
+		await youtube_credentials.initialize()
 		try:
 			# If both video_id and id are None, return an Empty response
 			if video_id == None and id == None:
@@ -26,7 +33,7 @@ async def lookup_artist(id: str = None, video_id: str = None, country_code: str
 				)
 			# If video_id is provided but id is not, extract artist id from the song's video details
 			elif video_id != None and id == None:
-				async with aiohttp.ClientSession() as session:
+				async with session_manager.session(service) as session:
 				# Prepare request data and YouTube Data API endpoint
 					api_url = f'{api}/videos'
 					api_params = {
@@ -40,10 +47,10 @@ async def lookup_artist(id: str = None, video_id: str = None, country_code: str
 					async with session.get(url = api_url, params = api_params, timeout = timeout) as response:
 						if response.status == 200:
 							# Parse the JSON response if the request was successful
-							lookup_json = await response.json()
+							lookup_json = await read_json(response)
 							id = lookup_json['items'][0]['snippet']['channelId']
 			# Lookup artist information using the artist id
-			artist = youtube_credentials.ytmusicapi.get_artist(id)
+			artist = await ytmusic.get_artist(id)
 			lookup_json = id # Save the JSON for future debugging if necessary
 
 
@@ -67,7 +74,7 @@ async def lookup_artist(id: str = None, video_id: str = None, country_code: str
 			)
 		except:
 			# If the above fails, fallback to extracting artist info from the song's video details
-			async with aiohttp.ClientSession() as session:
+			async with session_manager.session(service) as session:
 				# Prepare request data and YouTube Data API endpoint
 					api_url = f'{api}/videos'
 					api_params = {
@@ -81,7 +88,7 @@ async def lookup_artist(id: str = None, video_id: str = None, country_code: str
 					async with session.get(url = api_url, params = api_params, timeout = timeout) as response:
 						if response.status == 200:
 							# Parse the JSON response if the request was successful
-							lookup_json = await response.json()
+							lookup_json = await read_json(response)
 
 			song = lookup_json['items'][0]
 
@@ -3,10 +3,13 @@ from AstroAPI.InternalComponents.SystemMediaObjects import *
 from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.generic import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.lookup.artist import lookup_artist
-from AstroAPI.InternalComponents.CredentialsManager.media_services.youtube.credentials import youtube_credentials
+from AstroAPI.InternalComponents.CacheManager import response_cache
+from AstroAPI.InternalComponents.TimingManager import timed
 
 
 
+@response_cache.cached(service)
+@timed(service)
 async def lookup_collection(id: str = None, browse_id: str = None, country_code: str = 'us') -> object:
 	# Prepare the request dictionary with lookup details
 	request = {'request': 'lookup_collection', 'id': id, 'browse_id': browse_id, 'country_code': country_code}
@@ -18,11 +21,11 @@ async def lookup_collection(id: str = None, browse_id: str = None, country_code:
 	try:
 		# If id is provided but browse_id is not, fetch browse_id and collection info
 		if id is not None and browse_id is None:
-			browse_id = youtube_credentials.ytmusicapi.get_album_browse_id(id)
-			collection = youtube_credentials.ytmusicapi.get_album(browse_id)
+			browse_id = await ytmusic.get_album_browse_id(id)
+			collection = await ytmusic.get_album(browse_id)
 		# If browse_id is provided, fetch collection info directly
 		elif browse_id is not None:
-			collection = youtube_credentials.ytmusicapi.get_album(browse_id)
+			collection = await ytmusic.get_album(browse_id)
 		# If neither id nor browse_id is provided, return an error
 		elif id is None and browse_id is None:
 			return Error(
@@ -0,0 +1,53 @@
+from AstroAPI.ServiceCatalogAPI.components import *
+from AstroAPI.InternalComponents.SystemMediaObjects import *
+from AstroAPI.InternalComponents.Legacy import *
+from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.generic import *
+from AstroAPI.InternalComponents.TimingManager import timed
+
+
+
+@timed(service)
+async def lookup_collection_tracks(id: str, country_code: str = 'us') -> list[str] | Empty | Error:
+	# Prepare the request dictionary with lookup details
+	request = {'request': 'lookup_collection_tracks', 'id': id, 'country_code': country_code}
+	# Lookup JSON variable for later debugging
+	lookup_json = None
+	# Record the start time for processing time calculation
+	start_time = current_unix_time_ms()
+
+	try:
+		# Collection IDs are playlist IDs, the album itself has to be fetched by its browse ID
+		browse_id = await ytmusic.get_album_browse_id(id)
+		collection = await ytmusic.get_album(browse_id)
+		# Save the JSON for future debugging if necessary
+		lookup_json = collection
+
+		# Tracks that aren't available have no video ID
+		track_ids = [track['videoId'] for track in collection['tracks'] if track.get('videoId') is not None]
+		if track_ids == []:
+			return Empty(
+				service = service,
+				meta = Meta(
+					service = service,
+					request = request,
+					processing_time = current_unix_time_ms() - start_time,
+					http_code = 204
+				)
+			)
+		return track_ids
+
+	# If sinister things happen
+	except Exception as msg:
+		error = Error(
+			service = service,
+			component = component,
+			error_msg = f'Error while looking up the tracks of collection {id} on {component}: "{msg}"',
+			meta = Meta(
+				service = service,
+				request = request,
+				processing_time = current_unix_time_ms() - start_time,
+				http_code = 500
+			)
+		)
+		await log(error, [discord.File(fp = StringIO(json.dumps(lookup_json, indent = 4)), filename = f'{id}.json')])
+		return error
@@ -6,9 +6,14 @@ from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.lo
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.generic.classify import classify
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.generic.cleanup_mv_title import cleanup_mv_title
 from AstroAPI.InternalComponents.CredentialsManager.media_services.youtube.credentials import youtube_credentials
+from AstroAPI.InternalComponents.SessionManager import session_manager
+from AstroAPI.InternalComponents.CacheManager import response_cache
+from AstroAPI.InternalComponents.TimingManager import timed, read_json
 
 
 
+@response_cache.cached(service)
+@timed(service)
 async def lookup_song(id: str, country_code: str = 'us') -> object:
 	# Prepare request metadata
 	request = {'request': 'lookup_song', 'id': id, 'country_code': country_code}
@@ -19,8 +24,10 @@ async def lookup_song(id: str, country_code: str = 'us') -> object:
 
     # Try to perform the song lookup operation
 	try:
+		# Make sure the API key has been fetched
+		await youtube_credentials.initialize()
 		# Create an aiohttp session for making HTTP requests
-		async with aiohttp.ClientSession() as session:
+		async with session_manager.session(service) as session:
 			# Prepare request data and YouTube Data API endpoint
 			api_url = f'{api}/videos'
 			api_params = {
@@ -32,7 +39,7 @@ async def lookup_song(id: str, country_code: str = 'us') -> object:
 
 			# Make the GET request to the YouTube Data API
 			async with session.get(url = api_url, params = api_params, timeout = timeout) as response:
-				lookup_json = await response.json()
+				lookup_json = await read_json(response)
 				if response.status == 200:
 					# Parse the JSON response if the request was successful
 					if lookup_json['items'] != []: # Check if the items list is empty, effectively an empty response
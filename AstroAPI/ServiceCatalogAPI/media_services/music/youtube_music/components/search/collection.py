@@ -3,10 +3,13 @@ from AstroAPI.InternalComponents.SystemMediaObjects import *
 from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.generic import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.lookup.artist import lookup_artist
-from AstroAPI.InternalComponents.CredentialsManager.media_services.youtube.credentials import youtube_credentials
+from AstroAPI.InternalComponents.CacheManager import response_cache
+from AstroAPI.InternalComponents.TimingManager import timed
 
 
 
+@response_cache.cached(service)
+@timed(service)
 async def search_collection(artists: list, title: str, year: int = None, country_code: str = 'us') -> object:
 	# Prepare the request dictionary with input parameters
 	request = {'request': 'search_collection', 'artists': artists, 'title': title, 'year': year, 'country_code': country_code}
@@ -22,7 +25,7 @@ async def search_collection(artists: list, title: str, year: int = None, country
 
 		collections = []
 		# Perform a search on YouTube Music for albums matching the first artist and title
-		results = youtube_credentials.ytmusicapi.search(
+		results = await ytmusic.search(
 			query = f'{artists[0]} {title}',
 			filter = 'albums'
 		)
@@ -30,7 +33,7 @@ async def search_collection(artists: list, title: str, year: int = None, country
 		lookup_json = results
 
 		# Iterate over each collection result
-		collections = await create_collection_objects(
+		collections = await create_collection_candidates(
 			results = lookup_json,
 			request = request,
 			start_time = start_time,
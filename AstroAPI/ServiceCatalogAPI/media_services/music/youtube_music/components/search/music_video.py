@@ -3,10 +3,13 @@ from AstroAPI.InternalComponents.SystemMediaObjects import *
 from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.generic import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.lookup.artist import lookup_artist
-from AstroAPI.InternalComponents.CredentialsManager.media_services.youtube.credentials import youtube_credentials
+from AstroAPI.InternalComponents.CacheManager import response_cache
+from AstroAPI.InternalComponents.TimingManager import timed
 
 
 
+@response_cache.cached(service)
+@timed(service)
 async def search_music_video(artists: list, title: str, is_explicit: bool = None, country_code: str = 'us') -> object:
 	# Prepare the request dictionary with search parameters
 	request = {'request': 'search_music_video', 'artists': artists, 'title': title, 'is_explicit': is_explicit, 'country_code': country_code}
@@ -22,7 +25,7 @@ async def search_music_video(artists: list, title: str, is_explicit: bool = None
 		
 		videos = []
 		# Perform a search on YouTube Music for videos matching the first artist and the title
-		results = youtube_credentials.ytmusicapi.search(
+		results = await ytmusic.search(
 			query = f'{artists[0]} {title}',
 			filter = 'videos'
 		)
@@ -31,7 +34,7 @@ async def search_music_video(artists: list, title: str, is_explicit: bool = None
 
 		# Iterate over each video result
 		
-		videos = await create_music_video_objects(
+		videos = await create_music_video_candidates(
 			results = lookup_json,
 			request = request,
 			start_time = start_time,
@@ -2,10 +2,11 @@ from AstroAPI.ServiceCatalogAPI.components import *
 from AstroAPI.InternalComponents.SystemMediaObjects import *
 from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.generic import *
-from AstroAPI.InternalComponents.CredentialsManager.media_services.youtube.credentials import youtube_credentials
+from AstroAPI.InternalComponents.TimingManager import timed
 
 
 
+@timed(service)
 async def search_query(query: str, filter_for_best_match: bool = True, media_types: list = None, is_explicit: bool = None, country_code: str = 'us') -> object:
 	# Prepare the request dictionary with query details
 	request = {'request': 'search_query', 'query': query, 'country_code': country_code}
@@ -16,7 +17,7 @@ async def search_query(query: str, filter_for_best_match: bool = True, media_typ
 
 	try:
 		# Perform the search using ytm (YouTube Music API wrapper)
-		results = youtube_credentials.ytmusicapi.search(
+		results = await ytmusic.search(
 			query = query
 		)
 		# Save the JSON for future debugging if necessary
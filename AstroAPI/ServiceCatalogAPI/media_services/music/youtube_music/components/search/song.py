@@ -4,10 +4,13 @@ from AstroAPI.InternalComponents.Legacy import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.generic import *
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.lookup.artist import lookup_artist
 from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.lookup.collection import lookup_collection
-from AstroAPI.InternalComponents.CredentialsManager.media_services.youtube.credentials import youtube_credentials
+from AstroAPI.InternalComponents.CacheManager import response_cache
+from AstroAPI.InternalComponents.TimingManager import timed
 
 
 
+@response_cache.cached(service)
+@timed(service)
 async def search_song(artists: list, title: str, song_type: str = None, collection: str = None, is_explicit: bool = None, country_code: str = 'us') -> object:
 	# Build the request dictionary with all input parameters
 	request = {'request': 'search_song', 'artists': artists, 'title': title, 'song_type': song_type, 'collection': collection, 'is_explicit': is_explicit, 'country_code': country_code}
@@ -24,7 +27,7 @@ async def search_song(artists: list, title: str, song_type: str = None, collecti
 			
 		songs = []
 		# Search for songs using the first artist and the title
-		results = youtube_credentials.ytmusicapi.search(
+		results = await ytmusic.search(
 			query = f'{artists[0]} {title}',
 			filter = 'songs'
 		)
@@ -32,7 +35,7 @@ async def search_song(artists: list, title: str, song_type: str = None, collecti
 		lookup_json = results
 
 		# Iterate through each song result
-		songs = await create_song_objects(
+		songs = await create_song_candidates(
 			results = lookup_json,
 			request = request,
 			start_time = start_time,
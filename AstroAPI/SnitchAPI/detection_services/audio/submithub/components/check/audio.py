@@ -6,6 +6,7 @@ from AstroAPI.InternalComponents.CredentialsManager.snitch_services.submithub.cr
 from AstroAPI.SnitchAPI.detection_services.audio.submithub.components.generic import *
 
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
 
 
 
@@ -19,7 +20,7 @@ async def check_audio(audio_url: str) -> object:
 
 	try:
 		if audio_url != None:
-			async with aiohttp.ClientSession() as session:
+			async with session_manager.session(service) as session:
 				# Prepare request data and SubmitHub API endpoint
 				await submithub_credentials.get_credentials()
 				api_url = f'{api}/detect'
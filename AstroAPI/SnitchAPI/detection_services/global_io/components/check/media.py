@@ -6,7 +6,10 @@ from AstroAPI.SnitchAPI.detection_services.audio.submithub.components.check.audi
 from AstroAPI.SnitchAPI.detection_services.image.sightengine.components.check.image import check_image as sightengine_ai
 from AstroAPI.SnitchAPI.components.generic import service as gservice, component as gcomponent
 
-from AstroAPI.ServiceCatalogAPI.media_services.music import spotify, apple_music, youtube_music, deezer
+from AstroAPI.ServiceCatalogAPI.media_services.music.spotify import spotify
+from AstroAPI.ServiceCatalogAPI.media_services.music.apple_music import apple_music
+from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music import youtube_music
+from AstroAPI.ServiceCatalogAPI.media_services.music.deezer import deezer
 
 from asyncio import create_task, gather
 
@@ -7,7 +7,8 @@ from AstroAPI.SnitchAPI.detection_services.image.sightengine.components.check.im
 from AstroAPI.SnitchAPI.components.generic import service as gservice, component as gcomponent
 
 from AstroAPI.ServiceCatalogAPI.media_services.music.global_io import global_io
-from AstroAPI.ServiceCatalogAPI.media_services.music import apple_music, youtube_music
+from AstroAPI.ServiceCatalogAPI.media_services.music.apple_music import apple_music
+from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music import youtube_music
 
 from asyncio import create_task, gather
 
@@ -5,6 +5,7 @@ from AstroAPI.InternalComponents.CredentialsManager.snitch_services.sightengine.
 from AstroAPI.SnitchAPI.detection_services.image.sightengine.components.generic import *
 
 import aiohttp
+from AstroAPI.InternalComponents.SessionManager import session_manager
 
 from aiocache import cached
 
@@ -19,7 +20,7 @@ async def check_image(image_url: str) -> object:
 	start_time = current_unix_time_ms()
 
 	try:
-		async with aiohttp.ClientSession() as session:
+		async with session_manager.session(service) as session:
 			# Prepare request data and SightEngine API endpoint
 			await sightengine_credentials.get_credentials()
 			api_url = f'{api}'
@@ -0,0 +1,128 @@
+from benchmarks.endpoints import credentials_path, placeholder_credentials
+import subprocess
+import argparse
+import json
+import sys
+
+
+
+"""
+	--- COLD START BENCHMARK ---
+
+	Profiles how long `import main` takes in a fresh interpreter, which is what every deploy and every
+	new instance pays before the app can take a single request, and what takes that long.
+
+	Every run starts a new process with Python's -X importtime, and the fastest run gets reported:
+
+	  - the total import time of main, and how many lines got printed on the way
+	  - the modules that took the longest, counting everything they imported (cumulative) and on their own (self)
+	  - whether the heavy dependencies that are supposed to load on demand (discord.py, NumPy, ytmusicapi)
+	    got imported anyway, and what the ones that can't be avoided (FastAPI, aiohttp) cost
+	  - how long every registered service takes to import the first time it's needed, in the order
+	    they get preloaded in (see the service registry), so services that share code look cheaper
+	    the later they come
+
+	If there's no credentials.json, a placeholder one is put in place for the run.
+
+	Run it from the root of the repo:
+
+		python -m benchmarks.cold_start [--repeats 5] [--top 15] [--json]
+"""
+
+
+
+watched_modules = ['discord', 'numpy', 'ytmusicapi', 'fastapi', 'aiohttp', 'requests'] # Reported even if they're not in the top
+marker = '--- cold start done ---'
+child = f'''
+import sys, json
+import main
+print({marker!r}, file = sys.stderr, flush = True)
+for kind, name in list(main.service_registry.paths.keys()):
+	main.service_registry.get(kind, name)
+print({marker!r} + json.dumps(main.service_registry.load_times), flush = True)
+'''
+
+
+
+def parse_importtime(lines: list[str]) -> list[dict]:
+	# Lines look like `import time:       575 |     180679 |           aiohttp`, in microseconds
+	modules = []
+	for line in lines:
+		if not line.startswith('import time:') or 'self [us]' in line:
+			continue
+		own, cumulative, name = line[len('import time:'):].split('|')
+		modules.append({'module': name.strip(), 'self': int(own) / 1000, 'cumulative': int(cumulative) / 1000})
+	return modules
+
+
+
+def profile_once() -> dict:
+	run = subprocess.run([sys.executable, '-X', 'importtime', '-c', child], capture_output = True, text = True)
+	if run.returncode != 0:
+		raise RuntimeError(f'Importing main failed:\n{run.stderr[-2000:]}')
+	import_lines = run.stderr.split(marker)[0].splitlines()
+	output = run.stdout.splitlines()
+	modules = parse_importtime(import_lines)
+	printed = next(index for index, line in enumerate(output) if line.startswith(marker))
+	return {
+		'total': next(module['cumulative'] for module in modules if module['module'] == 'main'),
+		'printed_lines': len([line for line in output[:printed] if line.strip()]),
+		'modules': modules,
+		'service_loads': json.loads(output[printed][len(marker):])
+	}
+
+
+
+def profile(repeats: int, top: int) -> dict:
+	runs = [profile_once() for _ in range(repeats)]
+	fastest = min(runs, key = lambda run: run['total'])
+	modules = fastest['modules']
+	imported = {module['module']: module for module in modules}
+	return {
+		'total': fastest['total'],
+		'runs': [run['total'] for run in runs],
+		'printed_lines': fastest['printed_lines'],
+		'modules_imported': len(modules),
+		'top_cumulative': sorted([module for module in modules if module['module'] != 'main'], key = lambda module: module['cumulative'], reverse = True)[:top],
+		'top_self': sorted(modules, key = lambda module: module['self'], reverse = True)[:top],
+		'watched': {name: imported[name]['cumulative'] if name in imported else None for name in watched_modules},
+		'service_loads': fastest['service_loads']
+	}
+
+
+
+def report(results: dict) -> None:
+	print(f"import main: {results['total']:.1f} ms (fastest of {', '.join(f'{total:.1f}' for total in results['runs'])})")
+	print(f"{results['modules_imported']} modules imported, {results['printed_lines']} lines printed")
+	for title, key in [('cumulative', 'top_cumulative'), ('self', 'top_self')]:
+		print(f'\nslowest modules ({title})')
+		for module in results[key]:
+			print(f"{module[title]:>10.1f} ms  {module['module']}")
+	print('\nheavy dependencies')
+	for name, cumulative in results['watched'].items():
+		print(f"{name:<14}{'not imported' if cumulative is None else f'{cumulative:.1f} ms':>14}")
+	print('\nfirst service loads')
+	for service, load_time in results['service_loads'].items():
+		print(f'{service:<24}{load_time:>10.1f} ms')
+
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = 'Profile the cold start of the app.')
+	parser.add_argument('--repeats', type = int, default = 5, help = 'fresh processes to time, the fastest gets reported')
+	parser.add_argument('--top', type = int, default = 15, help = 'slowest modules to list')
+	parser.add_argument('--json', action = 'store_true', help = 'print the results as JSON')
+	options = parser.parse_args()
+
+	placeholder = not credentials_path.exists()
+	if placeholder:
+		credentials_path.write_text(json.dumps(placeholder_credentials), encoding = 'utf-8')
+	try:
+		results = profile(options.repeats, options.top)
+	finally:
+		if placeholder:
+			credentials_path.unlink()
+	if options.json:
+		print(json.dumps(results, indent = 4))
+	else:
+		report(results)
@@ -0,0 +1,215 @@
+from benchmarks.stub_upstreams import arguments, stub_from, start_stub
+from pathlib import Path
+from time import perf_counter
+import subprocess
+import argparse
+import asyncio
+import aiohttp
+import json
+import math
+import sys
+
+
+
+"""
+	--- ENDPOINT BENCHMARK ---
+
+	Drives the app's endpoints with a bunch of requests at once and reports the throughput and
+	the p50, p95 and p99 latency of every scenario, with the upstreams replaced by the stub
+	upstreams, so it runs offline and two runs can be compared.
+
+	The app runs in a process of its own (uvicorn, with the upstream recorder in replay mode) and
+	the stub upstreams run in this one. The response cache is turned off unless --cache is given,
+	otherwise everything after the first request of a scenario is a cache hit. If there's no
+	credentials.json, a placeholder one is put in place for the run, nothing gets sent anywhere.
+
+	The fixtures in benchmarks/fixtures are hand-written and cover Spotify, Apple Music and Deezer
+	(YouTube Music's responses are too big to write by hand, so its requests get 404s unless you
+	record them). To record real ones, run it with --record and real credentials, which sends every
+	scenario to the real upstreams once and appends what they answered to the fixtures file.
+
+	Run it from the root of the repo:
+
+		python -m benchmarks.endpoints [--scenario search_song] [--concurrency 16] [--requests 200] [--cache] [stub options, see stub_upstreams]
+		python -m benchmarks.endpoints --record
+"""
+
+
+
+scenarios = {
+	'search_song': ('GET', '/music/global_io/search_song', {'artist': 'Weezer', 'title': 'Buddy Holly'}),
+	'lookup_song': ('GET', '/music/global_io/lookup_song', {'id': '3mwvKOyMmG77zZRunnxp9E', 'id_service': 'spotify'}),
+	'search_query': ('GET', '/music/global_io/search_query', {'query': 'weezer buddy holly'}),
+	'snitch_song': ('GET', '/snitch/song', {'id': '3mwvKOyMmG77zZRunnxp9E', 'id_service': 'spotify'})
+}
+credentials_path = Path('AstroAPI/InternalComponents/Legacy/credentials.json')
+placeholder_credentials = {
+	'servicecatalogapi': {
+		'spotify': {'id': 'placeholder', 'secret': 'placeholder'},
+		'tidal': {'id': 'placeholder', 'secret': 'placeholder'},
+		'genius': {'token': 'placeholder'},
+		'youtube': {
+			# ytmusicapi only needs something that looks like browser headers, and a visitor ID so it doesn't go get one
+			'browser': {'authorization': 'SAPISIDHASH placeholder', 'cookie': '__Secure-3PAPISID=placeholder', 'x-goog-authuser': '0', 'origin': 'https://music.youtube.com', 'X-Goog-Visitor-Id': 'placeholder'},
+			'oauth': {},
+			'credentials': {'id': 'placeholder', 'secret': 'placeholder', 'api_key': 'placeholder'}
+		}
+	},
+	'snitchapi': {
+		'sightengine': {'id': 'placeholder', 'secret': 'placeholder'},
+		'submithub': {'key': 'placeholder'}
+	}
+}
+startup_timeout = 60 # Seconds the app gets to start
+
+
+
+def serve(options: argparse.Namespace) -> None:
+	# Runs in the app's process, the recorder and the cache have to be set up before the app handles anything
+	from AstroAPI.InternalComponents.SessionManager.recorder import upstream_recorder
+	from AstroAPI.InternalComponents.CacheManager import response_cache
+	import uvicorn
+	import main
+
+	upstream_recorder.configure(mode = options.mode, fixtures_path = options.fixtures, stub_url = options.stub_url)
+	if not options.cache:
+		response_cache.memory.max_entries = 0
+		response_cache.disk = None
+	uvicorn.run(main.app, host = '127.0.0.1', port = options.port, log_level = 'warning')
+
+
+
+def percentile(latencies: list[float], share: float) -> float:
+	# Nearest rank, on latencies that are already sorted
+	return latencies[max(0, math.ceil(share * len(latencies)) - 1)]
+
+
+
+async def wait_for_app(session: aiohttp.ClientSession, base_url: str, app: subprocess.Popen) -> None:
+	start = perf_counter()
+	while perf_counter() - start < startup_timeout:
+		if app.poll() is not None:
+			raise RuntimeError('The app exited before it was ready')
+		try:
+			async with session.get(f'{base_url}/system/cache') as response:
+				if response.status == 200:
+					return
+		except aiohttp.ClientError:
+			pass
+		await asyncio.sleep(0.2)
+	raise RuntimeError(f'The app was not ready after {startup_timeout} seconds')
+
+
+
+async def run_scenario(session: aiohttp.ClientSession, base_url: str, scenario: str, concurrency: int, requests: int) -> dict:
+	method, path, params = scenarios[scenario]
+	latencies = []
+	codes = {}
+	remaining = iter(range(requests))
+
+	async def worker():
+		for _ in remaining:
+			start = perf_counter()
+			try:
+				async with session.request(method, f'{base_url}{path}', params = params) as response:
+					await response.read()
+					code = str(response.status)
+			except aiohttp.ClientError as error:
+				code = type(error).__name__
+			latencies.append(perf_counter() - start)
+			codes[code] = codes.get(code, 0) + 1
+
+	start = perf_counter()
+	await asyncio.gather(*[worker() for _ in range(concurrency)])
+	elapsed = perf_counter() - start
+	latencies.sort()
+	return {
+		'scenario': scenario,
+		'requests': requests,
+		'throughput': requests / elapsed,
+		'p50': percentile(latencies, 0.50) * 1000,
+		'p95': percentile(latencies, 0.95) * 1000,
+		'p99': percentile(latencies, 0.99) * 1000,
+		'codes': codes
+	}
+
+
+
+async def benchmark(options: argparse.Namespace) -> list[dict]:
+	stub = None if options.record else stub_from(options)
+	runner = await start_stub(stub, options.stub_port) if stub is not None else None
+	app = subprocess.Popen([
+		sys.executable, '-m', 'benchmarks.endpoints', '--serve',
+		'--mode', 'record' if options.record else 'replay',
+		'--port', str(options.port),
+		'--fixtures', options.fixtures,
+		'--stub-url', f'http://127.0.0.1:{options.stub_port}',
+		*(['--cache'] if options.cache else [])
+	], stdout = subprocess.DEVNULL)
+	base_url = f'http://127.0.0.1:{options.port}'
+	results = []
+	try:
+		connector = aiohttp.TCPConnector(limit = options.concurrency)
+		async with aiohttp.ClientSession(connector = connector, timeout = aiohttp.ClientTimeout(total = 120)) as session:
+			await wait_for_app(session, base_url, app)
+			for scenario in options.scenario or list(scenarios.keys()):
+				if options.record:
+					results.append(await run_scenario(session, base_url, scenario, 1, 1))
+					continue
+				if options.warmup:
+					await run_scenario(session, base_url, scenario, 1, options.warmup)
+				results.append(await run_scenario(session, base_url, scenario, options.concurrency, options.requests))
+	finally:
+		app.terminate()
+		app.wait()
+		if runner is not None:
+			await runner.cleanup()
+	if stub is not None and stub.missing:
+		print(f'{len(stub.missing)} upstream requests had no fixture:')
+		for key in sorted(stub.missing):
+			print(f'  {key}')
+	return results
+
+
+
+def report(results: list[dict]) -> None:
+	print(f"{'scenario':<16}{'requests':>10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}  codes")
+	for result in results:
+		codes = ', '.join(f'{code}: {count}' for code, count in sorted(result['codes'].items()))
+		print(f"{result['scenario']:<16}{result['requests']:>10}{result['throughput']:>10.1f}{result['p50']:>10.1f}{result['p95']:>10.1f}{result['p99']:>10.1f}  {codes}")
+
+
+
+if __name__ == '__main__':
+	parser = arguments(argparse.ArgumentParser(description = 'Benchmark the endpoints against the stub upstreams.'))
+	parser.add_argument('--scenario', action = 'append', choices = list(scenarios.keys()), help = 'scenario to run, can be repeated, defaults to all of them')
+	parser.add_argument('--concurrency', type = int, default = 16, help = 'requests in flight at the same time')
+	parser.add_argument('--requests', type = int, default = 200, help = 'requests per scenario')
+	parser.add_argument('--warmup', type = int, default = 5, help = 'requests per scenario before measuring')
+	parser.add_argument('--cache', action = 'store_true', help = 'keep the response cache on')
+	parser.add_argument('--record', action = 'store_true', help = 'send every scenario to the real upstreams once and record the fixtures')
+	parser.add_argument('--port', type = int, default = 8700, help = 'port of the app')
+	parser.add_argument('--stub-port', type = int, default = 8765, help = 'port of the stub upstreams')
+	parser.add_argument('--json', action = 'store_true', help = 'print the results as JSON')
+	# What the app's process gets started with
+	parser.add_argument('--serve', action = 'store_true', help = argparse.SUPPRESS)
+	parser.add_argument('--mode', default = 'replay', help = argparse.SUPPRESS)
+	parser.add_argument('--stub-url', default = None, help = argparse.SUPPRESS)
+	options = parser.parse_args()
+
+	if options.serve:
+		serve(options)
+		sys.exit(0)
+
+	placeholder = not options.record and not credentials_path.exists()
+	if placeholder:
+		credentials_path.write_text(json.dumps(placeholder_credentials), encoding = 'utf-8')
+	try:
+		results = asyncio.run(benchmark(options))
+	finally:
+		if placeholder:
+			credentials_path.unlink()
+	if options.json:
+		print(json.dumps(results, indent = 4))
+	else:
+		report(results)
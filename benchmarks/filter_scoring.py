@@ -0,0 +1,168 @@
+from AstroAPI.InternalComponents.Legacy.text_manipulation import calculate_similarity, sort_similarity_lists
+from AstroAPI.InternalComponents.Legacy.similarity import similarity
+from AstroAPI.ServiceCatalogAPI.components.filtering.candidate import Candidate
+from AstroAPI.ServiceCatalogAPI.components.filtering.prepared_query import PreparedQuery, prepared_artists, prepared_title, prepared_collection
+from AstroAPI.ServiceCatalogAPI.components.filtering.batch_scoring import artist_scores, passing, title_scores, collection_scores, match_scores, best_candidate
+import AstroAPI.ServiceCatalogAPI.components.filtering.batch_scoring as batch_scoring_module
+from time import perf_counter
+from math import inf
+import random
+import sys
+
+
+
+"""
+	--- FILTER SCORING BENCHMARK ---
+
+	Scores search results of 10, 50 and 200 song candidates (the usual page sizes, 200 being
+	Apple Music's) against a query, both with the per-candidate loop filter_song used to run and
+	with the batch scoring it runs now. Checks that both of them pick the same winner with the same
+	score, for a bunch of queries with and without the optional parameters, then times both.
+
+	Then it times adding up the score columns into the totals both ways best_candidate() can, with the
+	plain reduce() and with NumPy, for a range of candidate counts. That's what vectorize_threshold
+	in batch_scoring.py is tuned from.
+
+	Run it from the root of the repo, it exits with 1 if any result changed:
+
+		python -m benchmarks.filter_scoring
+"""
+
+
+
+sizes = [10, 50, 200]
+threshold_sizes = [10, 25, 50, 100, 200, 400, 1000]
+rounds = 200
+repeats = 5
+
+artists = ['Adele', 'The Weeknd', 'Taylor Swift', 'Beyoncé', 'Drake', 'Kendrick Lamar', 'Billie Eilish', 'Dua Lipa', 'Daft Punk', 'Weezer']
+titles = ['Hello', 'Blinding Lights', 'Anti-Hero', 'Halo', "God's Plan", 'HUMBLE.', 'bad guy', 'Levitating', 'Get Lucky', 'Buddy Holly']
+suffixes = ['', ' - Remix', ' (Live)', ' - Remastered 2011', ' (Acoustic)', ' (feat. Someone)', ' - Sped Up', ' (Karaoke Version)']
+collections = ['Weezer (Blue Album)', 'Weezer (Green Album)', 'After Hours', 'Midnights', 'Random Access Memories', 'Greatest Hits', '25']
+types = ['track', 'single']
+
+
+
+def fixture_candidates(amount: int, generator: random.Random) -> list[Candidate]:
+	candidates = []
+	for _ in range(amount):
+		title = generator.choice(titles) + generator.choice(suffixes)
+		artist_names = generator.sample(artists, generator.choice([1, 1, 1, 2, 3]))
+		if generator.random() < 0.2:
+			artist_names = [f'{artist_names[0]} Tribute Band'] # Covers
+		candidates.append(Candidate(
+			type = generator.choice(types),
+			title = title,
+			artist_names = artist_names,
+			build = lambda: None,
+			collection_title = generator.choice(collections + [None]),
+			is_explicit = generator.choice([True, False, None])
+		))
+	return candidates
+
+
+
+def fixture_query(generator: random.Random) -> dict:
+	return {
+		'artists': [generator.choice(artists)],
+		'title': generator.choice(titles),
+		'collection': generator.choice(collections + [None]),
+		'is_explicit': generator.choice([True, False, None]),
+		'song_type': generator.choice(types + [None])
+	}
+
+
+
+def loop_scoring(songs: list, query: dict) -> tuple[int, float] | None:
+	# What filter_song used to do, minus building the winner
+	prepared_query = PreparedQuery(artists = query['artists'], title = query['title'], collection = query['collection'])
+	data_with_similarity = []
+	for index, song in enumerate(songs):
+		song_similarity = 0
+		artists_with_similarity = sort_similarity_lists([[calculate_similarity(artist_name, prepared_query.artist), artist_name] for artist_name in prepared_artists(song)])
+		if artists_with_similarity != [] and artists_with_similarity[0][0] > 500:
+			song_similarity += artists_with_similarity[0][0]
+		else:
+			continue
+		song_similarity += calculate_similarity(prepared_title(song), prepared_query.title)
+		if query['collection'] != None:
+			collection_reference = prepared_collection(song)
+			if collection_reference != None:
+				song_similarity += calculate_similarity(collection_reference, prepared_query.collection)
+		if query['is_explicit'] != None and song.is_explicit != None and query['is_explicit'] == song.is_explicit:
+			song_similarity += 500
+		if query['song_type'] != None and song.type != None and query['song_type'] == song.type:
+			song_similarity += 500
+		data_with_similarity.append([song_similarity, index])
+	data_with_similarity = sort_similarity_lists(data_with_similarity)
+	return (data_with_similarity[0][1], data_with_similarity[0][0]) if data_with_similarity != [] else None
+
+
+
+def batch_scoring(songs: list, query: dict) -> tuple[int, float] | None:
+	# What filter_song does now, minus building the winner
+	prepared_query = PreparedQuery(artists = query['artists'], title = query['title'], collection = query['collection'])
+	artist_column = artist_scores(songs, prepared_query.artist)
+	passed = passing(artist_column)
+	return best_candidate(
+		artist_column,
+		passed,
+		title_scores(songs, prepared_query.title, passed),
+		collection_scores(songs, prepared_query.collection, passed),
+		match_scores([song.is_explicit for song in songs], query['is_explicit'], 500),
+		match_scores([song.type for song in songs], query['song_type'], 500)
+	)
+
+
+
+def timed(scoring, cases: list) -> float:
+	# Best of a few runs, every run starts out with an empty score cache
+	times = []
+	for _ in range(repeats):
+		similarity.cache_clear()
+		start = perf_counter()
+		for songs, query in cases:
+			scoring(songs, query)
+		times.append((perf_counter() - start) / len(cases))
+	return min(times)
+
+
+
+def totals_time(columns: list, passed: list, vectorized: bool) -> float:
+	# Best of a few runs of best_candidate() forced down one path, on score columns that are already there
+	threshold = batch_scoring_module.vectorize_threshold
+	batch_scoring_module.vectorize_threshold = 0 if vectorized else inf
+	times = []
+	for _ in range(repeats):
+		start = perf_counter()
+		for _ in range(rounds):
+			best_candidate(columns[0], passed, *columns[1:])
+		times.append((perf_counter() - start) / rounds)
+	batch_scoring_module.vectorize_threshold = threshold
+	return min(times)
+
+
+
+if __name__ == '__main__':
+	generator = random.Random(0)
+	mismatches = 0
+	for size in sizes:
+		cases = [(fixture_candidates(size, generator), fixture_query(generator)) for _ in range(rounds)]
+		for songs, query in cases:
+			expected, result = loop_scoring(songs, query), batch_scoring(songs, query)
+			if expected != result:
+				mismatches += 1
+				print(f'{size} candidates, {query}: loop {expected}, batch {result}')
+		loop_time = timed(loop_scoring, cases)
+		batch_time = timed(batch_scoring, cases)
+		print(f'{size} candidates: loop {loop_time * 1000:.3f} ms, batch {batch_time * 1000:.3f} ms ({loop_time / batch_time:.2f}x), best of {repeats} runs over {rounds} searches')
+	print(f'{mismatches} changed results over {len(sizes) * rounds} searches')
+
+	for size in threshold_sizes:
+		# Artist, title, collection, explicitness and song type columns, like filter_song has
+		columns = [[generator.choice([0.0, 0.0, 600.0, 850.0, 1000.0]) for _ in range(size)] for _ in range(2)] + [[generator.random() * 1000 for _ in range(size)]] + [[generator.choice([0.0, 500.0]) for _ in range(size)] for _ in range(2)]
+		passed = passing(columns[0])
+		reduce_time = totals_time(columns, passed, vectorized = False)
+		numpy_time = totals_time(columns, passed, vectorized = True)
+		print(f'{size} candidates: totals with reduce() {reduce_time * 1000000:.1f} µs, with NumPy {numpy_time * 1000000:.1f} µs ({reduce_time / numpy_time:.2f}x), threshold is {batch_scoring_module.vectorize_threshold}')
+	sys.exit(1 if mismatches else 0)
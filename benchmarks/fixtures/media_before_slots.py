@@ -0,0 +1,777 @@
+from AstroAPI.InternalComponents.Legacy.ini import text
+from AstroAPI.InternalComponents.Legacy.text_manipulation import censor_text
+
+missing_image = text['images']['missing_image']
+
+
+
+"""
+	--- MEDIA OBJECTS BEFORE SLOTS ---
+
+	A frozen copy of Meta, Song, Collection, Artist and Cover from media.py, as they were before
+	they got __slots__ and Meta started building its per-service dicts on first read. Only here so
+	benchmarks/media_memory.py has something to compare the current ones against, don't use
+	them anywhere else and don't update them.
+"""
+
+
+
+class Meta:
+
+	"""
+		# Service Catalog API (Technical) Metadata Object
+
+		This is a built-in Service Catalog API object which identifies technical metadata.
+		In it are shoved in stats and values useful for debugging or general handling.
+		JSON representation available.
+
+		 :param service: The API service in which the parent object was formed.
+		 :param request: The request dictionary (json) of all the data used to make the request.
+		 :param http_code: The HTTP code returned by an Astro component.
+		 :param processing_time: The amount of time in milliseconds that an Astro component took to form the orignial media object.
+		 :param filter_confidence_percentage: Optional. Astro's confidence in how accurately it got the correct media object.
+		 :param timed_out: Optional. Services that didn't answer before the request's deadline, and were left out of the result.
+	"""
+
+	def __init__(self, service: str, request: dict, processing_time: int | dict, http_code: int | dict, filter_confidence_percentage: int | float | dict | None = None, timed_out: list | None = None):
+		self._service = service
+		self._request = request
+		self._http_code = http_code
+		self._processing_time = processing_time if isinstance(processing_time, dict) else {service: processing_time}
+		if isinstance(filter_confidence_percentage, dict):
+			self._filter_confidence_percentage = filter_confidence_percentage
+		else:
+			self._filter_confidence_percentage = {service: 0.0} if filter_confidence_percentage is None else {service: filter_confidence_percentage}
+		self._timed_out = timed_out if timed_out is not None else []
+
+	@property
+	def service(self):
+		return self._service
+
+	@service.setter
+	def service(self, value):
+		self._service = value
+
+	@property
+	def request(self):
+		return self._request
+
+	@request.setter
+	def request(self, value):
+		self._request = value
+
+	@property
+	def http_code(self):
+		return self._http_code
+
+	@http_code.setter
+	def http_code(self, value):
+		self._http_code = value
+
+	@property
+	def processing_time(self):
+		return self._processing_time
+
+	@processing_time.setter
+	def processing_time(self, value):
+		# If given a dict, store it directly.
+		if isinstance(value, dict):
+			self._processing_time = value
+		else:
+			service = self._service
+			self._processing_time = {service: value}
+
+	@property
+	def filter_confidence_percentage(self):
+		return self._filter_confidence_percentage
+
+	@filter_confidence_percentage.setter
+	def filter_confidence_percentage(self, value: int | float | dict | None):
+		# If given a dict, store it directly.
+		if isinstance(value, dict):
+			self._filter_confidence_percentage = value
+		else:
+			service = self._service
+			self._filter_confidence_percentage = {service: value}
+
+	@property
+	def timed_out(self):
+		return self._timed_out
+
+	@timed_out.setter
+	def timed_out(self, value: list | None):
+		self._timed_out = value if value is not None else []
+
+	@property
+	def json(self):
+		return {
+			'request': self._request,
+			'http_code': self._http_code,
+			'processing_time': self._processing_time,
+			'filter_confidence_percentage': self._filter_confidence_percentage,
+			'timed_out': self._timed_out,
+		}
+
+
+
+class Song:
+
+	"""
+		# Service Catalog API Song Object
+
+		This is a built-in Service Catalog API object which identifies songs.
+		Service Catalog API identifies two types of songs: tracks and singles.
+		It's an unwritten rule, but Service Catalog API should sort tracks as songs off albums, while
+		singles are standalone tracks and sometimes tracks from EP-s.
+		JSON representation available.
+
+		 :param	service: The API service in which the object was formed.
+		 :param type: The song type, should either be `track` or `single`.
+		 :param urls: The song's URL(s). To put multiple URL-s in an object, use dicts.
+		 :param ids: The song's ID(s). To put multiple ID-s in an object, use dicts.
+		 :param previews: Optional. The song's preview URL(s). To put multiple preview URL-s in an object, use dicts.
+		 :param title: The song's title.
+		 :param artists: The song's artists.
+		 :param collection: Optional. The song's collection (album or EP).
+		 :param cover: The song's cover art.
+		 :param genre: Optional. The song's genre.
+		 :param is_explicit: Optional. Whether the song is explicit or not.
+		 :param meta: The technical metadata of the song.
+	"""
+
+	def __init__(self, service: str, type: str, urls: str | dict, ids: str | dict, title: str, artists: list[object], cover: object, meta: object, previews: str | dict = None, collection: object = None, genre: str = None, is_explicit: bool = None) -> object:
+		urls = {service: urls} if not isinstance(urls, dict) else urls
+		ids = {service: str(ids)} if not isinstance(ids, dict) else ids
+		previews = {service: previews} if not isinstance(previews, dict) or previews == None else previews
+		
+		self._service = service
+		self._type = type
+		self._urls = urls
+		self._ids = ids
+		self._previews = {k: v for k, v in previews.items() if v is not None}
+		self._title = title
+		self._censored_title = None # Censored on first access
+		self._artists = artists
+		self._collection = collection
+		self._cover = cover
+		self._genre = genre
+		self._is_explicit = is_explicit
+		self._meta = meta
+
+	# Service
+	@property
+	def service(self):
+		return self._service
+
+	@service.setter
+	def service(self, value: str):
+		self._service = value
+
+	# Type
+	@property
+	def type(self):
+		return self._type
+
+	@type.setter
+	def type(self, value: str):
+		self._type = value
+
+	# URL-s
+	@property
+	def urls(self):
+		return self._urls
+
+	@urls.setter
+	def urls(self, value: str):
+		self._urls = {self._service: value} if not isinstance(value, dict) else value
+
+	# ID-s
+	@property
+	def ids(self):
+		return self._ids
+
+	@ids.setter
+	def ids(self, value: str):
+		self._ids = {self._service: value} if not isinstance(value, dict) else value
+
+	# Previews
+	@property
+	def previews(self):
+		return self._previews
+
+	@previews.setter
+	def previews(self, value: str | dict):
+		if not isinstance(value, dict):
+			value = {self._service: value}
+		# Automatically remove None values from the dictionary
+		self._previews = {k: v for k, v in value.items() if v is not None}
+
+	# Title
+	@property
+	def title(self):
+		return self._title
+
+	@title.setter
+	def title(self, value: str):
+		self._title = value
+		self._censored_title = None
+
+	# Censored title
+	@property
+	def censored_title(self):
+		# Censoring is done lazily, most objects get thrown out by filtering before anyone needs it
+		if self._censored_title is None:
+			self._censored_title = censor_text(self._title)
+		return self._censored_title
+
+	@censored_title.setter
+	def censored_title(self, value: str):
+		self._censored_title = value
+
+	# Artists
+	@property
+	def artists(self):
+		return self._artists
+
+	@artists.setter
+	def artists(self, value: list):
+		self._artists = value
+
+	# Collection
+	@property
+	def collection(self):
+		return self._collection
+
+	@collection.setter
+	def collection(self, value: list):
+		self._collection = value
+
+	# Cover
+	@property
+	def cover(self):
+		return self._cover
+
+	@cover.setter
+	def cover(self, value: object):
+		self._cover = value
+
+	# Genre
+	@property
+	def genre(self):
+		return self._genre
+
+	@genre.setter
+	def genre(self, value: list):
+		self._genre = value
+
+	# Genre
+	@property
+	def genre(self):
+		return self._genre
+
+	@genre.setter
+	def genre(self, value: str):
+		self._genre = value
+
+	# Explicitness
+	@property
+	def is_explicit(self):
+		return self._is_explicit
+
+	@is_explicit.setter
+	def is_explicit(self, value: bool):
+		self._is_explicit = value
+
+	# Metadata
+	@property
+	def meta(self):
+		return self._meta
+
+	@meta.setter
+	def meta(self, value: object):
+		self._meta = value
+
+	# JSON representation
+	@property
+	def json(self):
+		meta = self._meta.json if hasattr(self._meta, 'json') else self._meta
+		return {
+			'service': self._service,
+			'type': self._type,
+			'urls': self._urls,
+			'ids': self._ids,
+			'previews': self._previews,
+			'title': self._title,
+			'censored_title': self.censored_title,
+			'artists': [artist.json_lite for artist in self.artists],
+			'collection': self._collection.json_lite if self._collection else None,
+			'cover': self._cover.json_lite if self.cover else None,
+			'genre': self._genre,
+			'is_explicit': self.is_explicit,
+			'meta': meta
+		}
+	
+	# Light JSON representation (without technical metadata)
+	@property
+	def json_lite(self):
+		return {
+			'service': self._service,
+			'type': self._type,
+			'urls': self._urls,
+			'ids': self._ids,
+			'previews': self._previews,
+			'title': self._title,
+			'censored_title': self.censored_title,
+			'artists': [artist.json_lite for artist in self.artists],
+			'collection': self._collection.json_lite if self._collection else None,
+			'cover': self._cover.json_lite if self.cover else None,
+			'genre': self._genre,
+			'is_explicit': self.is_explicit
+		}
+	
+
+
+class Collection:
+
+	"""
+		# Service Catalog API Collection Object
+
+		This is a built-in Service Catalog API object which identifies collections.
+		Service Catalog API identifies two different collection types: albums and EP-s.
+		JSON representation available.
+
+		 :param	service: The API service in which the object was formed.
+		 :param type: The collection type, should either be `album` or `ep`.
+		 :param urls: The collection's URL(s).
+		 :param ids: The collection's ID(s).
+		 :param title: The collection's title.
+		 :param artists: The collection's artists.
+		 :param release_year: Optional. The collection's release year.
+		 :param cover: The collection's cover art.
+		 :param genre: Optional. The collection's genre.
+		 :param meta: The technical metadata of the collection.
+	"""
+
+	def __init__(self, service: str, type: str, urls: str | dict, ids: str | dict, title: str, artists: list[object], cover: object, meta: object, release_year: int = None, genre: str = None) -> object:
+		urls = {service: urls} if not isinstance(urls, dict) else urls
+		ids = {service: str(ids)} if not isinstance(ids, dict) else ids
+
+		self._service = service
+		self._type = type
+		self._urls = urls
+		self._ids = ids
+		self._title = title
+		self._censored_title = None # Censored on first access
+		self._artists = artists
+		self._release_year = release_year if isinstance(release_year, int) or release_year == None else int(release_year)
+		self._cover = cover
+		self._genre = genre
+		self._meta = meta
+
+	# Service
+	@property
+	def service(self):
+		return self._service
+
+	@service.setter
+	def service(self, value: str):
+		self._service = value
+
+	# Type
+	@property
+	def type(self):
+		return self._type
+
+	@type.setter
+	def type(self, value: str):
+		self._type = value
+
+	# URL-s
+	@property
+	def urls(self):
+		return self._urls
+
+	@urls.setter
+	def urls(self, value: str):
+		self._urls = {self._service: value} if not isinstance(value, dict) else value
+
+	# ID-s
+	@property
+	def ids(self):
+		return self._ids
+
+	@ids.setter
+	def ids(self, value: str):
+		self._ids = {self._service: value} if not isinstance(value, dict) else value
+
+	# Title
+	@property
+	def title(self):
+		return self._title
+
+	@title.setter
+	def title(self, value: str):
+		self._title = value
+		self._censored_title = None
+
+	# Censored title
+	@property
+	def censored_title(self):
+		# Censoring is done lazily, most objects get thrown out by filtering before anyone needs it
+		if self._censored_title is None:
+			self._censored_title = censor_text(self._title)
+		return self._censored_title
+
+	@censored_title.setter
+	def censored_title(self, value: str):
+		self._censored_title = value
+
+	# Artists
+	@property
+	def artists(self):
+		return self._artists
+
+	@artists.setter
+	def artists(self, value: list):
+		self._artists = value
+
+	# Release year
+	@property
+	def release_year(self):
+		return self._release_year
+
+	@release_year.setter
+	def release_year(self, value: int):
+		self._release_year = value if isinstance(value, int) else int(value)
+
+	# Cover
+	@property
+	def cover(self):
+		return self._cover
+
+	@cover.setter
+	def cover(self, value: object):
+		self._cover = value
+
+	# Genre
+	@property
+	def genre(self):
+		return self._genre
+
+	@genre.setter
+	def genre(self, value: str):
+		self._genre = value
+
+	# Metadata
+	@property
+	def meta(self):
+		return self._meta
+
+	@meta.setter
+	def meta(self, value: object):
+		self._meta = value
+
+	# JSON representation
+	@property
+	def json(self):
+		meta = self._meta.json if hasattr(self._meta, 'json') else self._meta
+		return {
+			'service': self._service,
+			'type': self._type,
+			'urls': self._urls,
+			'ids': self._ids,
+			'title': self._title,
+			'censored_title': self.censored_title,
+			'artists': [artist.json_lite for artist in self._artists],
+			'release_year': self._release_year,
+			'cover': self._cover.json_lite if self._cover else None,
+			'genre': self._genre,
+			'meta': meta
+		}
+
+	# Light JSON representation (without technical metadata)
+	@property
+	def json_lite(self):
+		return {
+			'service': self._service,
+			'type': self._type,
+			'urls': self._urls,
+			'ids': self._ids,
+			'title': self._title,
+			'censored_title': self.censored_title,
+			'artists': [artist.json_lite for artist in self._artists],
+			'release_year': self._release_year,
+			'cover': self._cover.json_lite if self._cover else None,
+			'genre': self._genre
+		}
+
+
+
+class Artist:
+
+	"""
+		# Service Catalog API Artist Object
+
+		This is a built-in Service Catalog API object which identifies artists.
+		JSON representation available.
+
+		 :param	service: The API service in which the object was formed.
+		 :param urls: The artist's URL(s).
+		 :param ids: The artist's ID(s).
+		 :param name: The artist's name.
+		 :param genre: Optional. The artist's main genre.
+		 :param profile_picture: The artist's profile picture.
+		 :param meta: The technical metadata of the artist.
+	"""
+
+	def __init__(self, service: str, urls: str | dict, ids: str | dict, name: str, meta: object, profile_picture: object = None, genre: str = None) -> object:
+		type = 'artist'
+		urls = {service: urls} if not isinstance(urls, dict) else urls
+		ids = {service: str(ids)} if not isinstance(ids, dict) else ids
+
+		self._service = service
+		self._type = type
+		self._urls = urls
+		self._ids = ids
+		self._name = name
+		self._genre = genre
+		self._profile_picture = profile_picture
+		self._meta = meta
+
+	# Service
+	@property
+	def service(self):
+		return self._service
+
+	@service.setter
+	def service(self, value: str):
+		self._service = value
+
+	# Type
+	@property
+	def type(self):
+		return self._type
+
+	# URL-s
+	@property
+	def urls(self):
+		return self._urls
+
+	@urls.setter
+	def urls(self, value: str):
+		self._urls = {self._service: value} if not isinstance(value, dict) else value
+
+	# ID-s
+	@property
+	def ids(self):
+		return self._ids
+
+	@ids.setter
+	def ids(self, value: str):
+		self._ids = {self._service: value} if not isinstance(value, dict) else value
+
+	# Name
+	@property
+	def name(self):
+		return self._name
+
+	@name.setter
+	def name(self, value: str):
+		self._name = value
+
+	# Profile picture
+	@property
+	def profile_picture(self):
+		return self._profile_picture
+
+	@profile_picture.setter
+	def profile_picture(self, value: object):
+		self._profile_picture = value
+
+	# Genre
+	@property
+	def genre(self):
+		return self._genre
+
+	@genre.setter
+	def genre(self, value: str):
+		self._genre = value
+
+	# Metadata
+	@property
+	def meta(self):
+		return self._meta
+
+	@meta.setter
+	def meta(self, value: object):
+		self._meta = value
+
+	# JSON representation
+	@property
+	def json(self):
+		meta = self._meta.json if hasattr(self._meta, 'json') else self._meta
+		return {
+			'service': self._service,
+			'type': self._type,
+			'urls': self._urls,
+			'ids': self._ids,
+			'name': self._name,
+			'genre': self._genre,
+			'profile_picture': self._profile_picture.json_lite if self._profile_picture else None,
+			'meta': meta
+		}
+
+	# Light JSON representation (without technical metadata)
+	@property
+	def json_lite(self):
+		return {
+			'type': self._type,
+			'urls': self._urls,
+			'ids': self._ids,
+			'name': self._name,
+			'genre': self._genre,
+			'profile_picture': self._profile_picture.json_lite if self._profile_picture else None
+		}
+
+
+
+class Cover:
+
+	"""
+		# Service Catalog API Cover Object
+
+		This is a built-in Service Catalog API object which identifies covers and thumbnails.
+		JSON representation available.
+
+		 :param	service: The API service in which the object was formed.
+		 :param media_type: The cover's media type.
+		 :param title: The media's title.
+		 :param artists: The media's artists.
+		 :param hq_urls: The cover's high quality URL(s).
+		 :param lq_urls: The cover's low quality URL(s).
+		 :param meta: The technical metadata of the artist.
+	"""
+
+	def __init__(self, service: str, media_type: str, title: str, artists: list[object], hq_urls: str | dict | None, lq_urls: str | dict | None, meta: object) -> object:
+		hq_urls = {service: hq_urls} if not isinstance(hq_urls, dict) else hq_urls
+		hq_urls = {service: missing_image} if hq_urls is None else hq_urls
+		lq_urls = {service: lq_urls} if not isinstance(lq_urls, dict) else lq_urls
+		lq_urls = {service: missing_image} if lq_urls is None else lq_urls
+
+		self._service = service
+		self._type = 'cover'  # constant, no setter per request
+		self._media_type = media_type
+		self._title = title
+		self._censored_title = None # Censored on first access
+		self._artists = artists
+		self._hq_urls = hq_urls
+		self._lq_urls = lq_urls
+		self._meta = meta
+
+	# Service
+	@property
+	def service(self):
+		return self._service
+
+	@service.setter
+	def service(self, value: str):
+		self._service = value
+
+	# Type
+	@property
+	def type(self):
+		return self._type
+
+	# Media type
+	@property
+	def media_type(self):
+		return self._media_type
+
+	@media_type.setter
+	def media_type(self, value: str):
+		self._media_type = value
+
+	# Title
+	@property
+	def title(self):
+		return self._title
+
+	@title.setter
+	def title(self, value: str):
+		self._title = value
+		self._censored_title = None
+
+	# Censored title
+	@property
+	def censored_title(self):
+		# Censoring is done lazily, most objects get thrown out by filtering before anyone needs it
+		if self._censored_title is None:
+			self._censored_title = censor_text(self._title)
+		return self._censored_title
+
+	@censored_title.setter
+	def censored_title(self, value: str):
+		self._censored_title = value
+
+	# Artists
+	@property
+	def artists(self):
+		return self._artists
+
+	@artists.setter
+	def artists(self, value: list):
+		self._artists = value
+
+	# High-quality URLs
+	@property
+	def hq_urls(self):
+		return self._hq_urls
+
+	@hq_urls.setter
+	def hq_urls(self, value: str | dict | None):
+		value = {self._service: value} if not isinstance(value, dict) else value
+		self._hq_urls = {self._service: missing_image} if value is None else value
+
+	# Low-quality URLs
+	@property
+	def lq_urls(self):
+		return self._lq_urls
+
+	@lq_urls.setter
+	def lq_urls(self, value: str | dict | None):
+		value = {self._service: value} if not isinstance(value, dict) else value
+		self._lq_urls = {self._service: missing_image} if value is None else value
+
+	# Metadata
+	@property
+	def meta(self):
+		return self._meta
+
+	@meta.setter
+	def meta(self, value: object):
+		self._meta = value
+
+	# JSON representation
+	@property
+	def json(self):
+		meta_val = self._meta.json if hasattr(self._meta, 'json') else self._meta
+		return {
+			'service': self._service,
+			'type': self._type,
+			'media_type': self._media_type,
+			'title': self._title,
+			'censored_title': self.censored_title,
+			'artists': [artist.json_lite for artist in self._artists],
+			'hq_urls': self._hq_urls,
+			'lq_urls': self._lq_urls,
+			'meta': meta_val
+		}
+
+	# Light JSON representation (without technical metadata)
+	@property
+	def json_lite(self):
+		return {
+			'type': self._type,
+			'hq_urls': self._hq_urls,
+			'lq_urls': self._lq_urls
+		}
@@ -0,0 +1,359 @@
+from AstroAPI.InternalComponents.Legacy.text_manipulation import bare_bones, optimize_for_search, remove_feat, censor_text
+from AstroAPI.InternalComponents.Legacy.similarity import similarity, character_index
+from AstroAPI.ServiceCatalogAPI.components.filtering.filter import filter_song, filter_query
+from AstroAPI.ServiceCatalogAPI.media_services.music.apple_music.components.generic.create_objects.create_song_objects import create_song_candidates, create_song_objects
+from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.generic.cleanup_mv_title import cleanup_mv_title
+from AstroAPI.ServiceCatalogAPI.media_services.music.youtube_music.components.generic.classify import classify
+from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic.match import cluster_items
+from benchmarks.match_clustering import fixture_results
+from pathlib import Path
+from time import perf_counter
+import tracemalloc
+import argparse
+import asyncio
+import random
+import json
+import sys
+
+
+
+"""
+	--- HOT PATH BENCHMARK ---
+
+	Times the pure CPU code every request goes through (text normalization, profanity censoring,
+	YouTube title cleanup and classification, filtering and Global Interface clustering) over fixture
+	corpora that look like what the upstreams actually send: multilingual titles, K-pop music video
+	titles with Hangul in them, titles with a pile of features, and Apple Music's 200-result searches.
+
+	Every case reports how many operations it gets through per second (best of a few runs, every run
+	starts out with empty normalization and score caches, so nothing is free) and how many bytes an
+	operation allocates at its peak (tracemalloc, on a separate run, since tracing slows everything down).
+
+	Both get compared to the baseline file, and a case that got slower or allocates more than the
+	threshold allows fails the run. The first run (or one with --save) writes the baseline instead.
+	Timings only mean something against a baseline taken on the same machine, so it isn't committed.
+
+	Run it from the root of the repo, it exits with 1 if any case regressed:
+
+		python -m benchmarks.hot_paths [--case bare_bones] [--threshold 0.2] [--save]
+"""
+
+
+
+default_baseline = 'benchmarks/hot_paths_baseline.json'
+repeats = 5
+run_time = 0.2 # Seconds every run goes for at least, going over the corpus as many times as that takes
+
+multilingual_titles = [
+	'Despacito', 'Dákiti', 'Tití Me Preguntó', 'Bésame Mucho', 'La Bicicleta', 'Ça plane pour moi', 'Non, je ne regrette rien',
+	'Les Champs-Élysées', 'Alors on danse', '99 Luftballons', 'Über den Wolken', 'Du hast', 'Hoppípolla', 'Jóga', 'Şımarık',
+	'Żywioły', 'Tak mało wiem', 'Группа крови', 'Кукла колдуна', 'Тает лёд', 'Τα παιδιά του Πειραιά', 'حبيبي يا نور العين',
+	'תן לי סימן', 'तुम ही हो', 'Kal Ho Naa Ho', '夜に駆ける', '残酷な天使のテーゼ', 'アイドル', '紅蓮華', 'うっせぇわ', 'Lemon',
+	'月亮代表我的心', '晴天', '稻香', '봄날', '밤편지', '좋은 날', '사건의 지평선', 'Gangnam Style', 'Hotel California',
+	"Don't Stop Me Now", 'Smells Like Teen Spirit', "Sweet Child O' Mine", 'Buddy Holly', 'Mr. Brightside', 'HUMBLE.',
+	'Anti-Hero', 'Blinding Lights', 'bad guy', "God's Plan", 'Levitating', 'Get Lucky', 'Hello', 'Halo', 'Creep', 'Yellow'
+]
+multilingual_artists = [
+	'Luis Fonsi', 'Bad Bunny', 'Rosalía', 'Stromae', 'Édith Piaf', 'Joe Dassin', 'Nena', 'Rammstein', 'Sigur Rós', 'Björk',
+	'Tarkan', 'Mötley Crüe', 'Beyoncé', 'Кино', 'Король и Шут', 'Μελίνα Μερκούρη', 'Amr Diab', 'Arijit Singh', 'YOASOBI',
+	'米津玄師', 'Ado', 'LiSA', '周杰倫', '鄧麗君', '아이유', '윤하', 'BTS', 'PSY', 'Eagles', 'Queen', 'Nirvana', "Guns N' Roses",
+	'Weezer', 'The Killers', 'Kendrick Lamar', 'Taylor Swift', 'The Weeknd', 'Billie Eilish', 'Drake', 'Dua Lipa', 'Daft Punk'
+]
+feats = [
+	' (feat. {})', ' [feat. {}]', ' feat. {}', ' (with {})', ' [with {}]', ' (feat. {} & {})', ' (feat. {}, {} & {})',
+	' - Remix (feat. {})', ' (Remix) [feat. {} & {}]', ' (feat. {}) [Remastered 2011]', ' (Live) [with {}]'
+]
+suffixes = ['', '', '', ' - Remastered 2011', ' (Live)', ' (Acoustic)', ' - Sped Up', ' (Radio Edit)', ' (Karaoke Version)', ' (Instrumental)', ' - 2019 Remaster']
+explicit_titles = [
+	'Fuck Tha Police', "Bitch Don't Kill My Vibe", 'Holy Shit', 'Bad Bitch', 'Damn Shit', 'Shit Happens', 'Motherfucker',
+	'Fuckin\' Perfect', 'F*ck It', 'Sh!t', 'Goddamn', 'Bullshit', 'Ass Like That', 'Fuck the Pain Away'
+]
+
+kpop_videos = [
+	("IU(아이유) _ Palette(팔레트) (Feat. G-DRAGON) MV", '1theK (원더케이)'),
+	("BTS (방탄소년단) 'Dynamite' Official MV", 'HYBE LABELS'),
+	("BLACKPINK - '뚜두뚜두 (DDU-DU DDU-DU)' M/V", 'BLACKPINK'),
+	('TWICE "FANCY" M/V', 'JYP Entertainment'),
+	("(G)I-DLE - '퀸카 (Queencard)' Official Music Video", '(G)I-DLE (여자)아이들 (Official YouTube Channel)'),
+	("NewJeans (뉴진스) 'Super Shy' Official MV", 'HYBE LABELS'),
+	("aespa 에스파 'Supernova' MV", 'SMTOWN'),
+	("IVE 아이브 'LOVE DIVE' MV", 'STARSHIP'),
+	("SEVENTEEN (세븐틴) '손오공' Official MV", 'HYBE LABELS'),
+	("LE SSERAFIM (르세라핌) 'ANTIFRAGILE' OFFICIAL M/V", 'HYBE LABELS'),
+	('Stray Kids "락 (樂) (LALALALA)" M/V', 'JYP Entertainment'),
+	('ITZY "WANNABE" M/V @ITZY', 'JYP Entertainment'),
+	("Red Velvet 레드벨벳 '빨간 맛 (Red Flavor)' MV", 'SMTOWN'),
+	('PSY - GANGNAM STYLE(강남스타일) M/V', 'officialpsy'),
+	("EXO 엑소 'Love Shot' MV", 'SMTOWN'),
+	('MAMAMOO (마마무) - HIP MV', 'MAMAMOO'),
+	("TAEYEON 태연 'INVU' MV", 'SMTOWN'),
+	('[MV] IU(아이유) _ Good Day(좋은 날)', '1theK (원더케이)'),
+	('볼빨간사춘기 - 우주를 줄게 (Galaxy) MV', 'Stone Music Entertainment'),
+	("KISS OF LIFE (키스오브라이프) 'Sticky' Official MV", 'KISS OF LIFE'),
+	("BOYNEXTDOOR (보이넥스트도어) '오늘만 I LOVE YOU' Official MV", 'KOZ ENTERTAINMENT')
+]
+western_videos = [
+	('Weezer - Buddy Holly (Official Music Video)', 'Weezer'),
+	('Rick Astley - Never Gonna Give You Up (Official Music Video)', 'Rick Astley'),
+	('The Weeknd - Blinding Lights (Official Video)', 'TheWeekndVEVO'),
+	('Adele - Hello (Official Music Video)', 'AdeleVEVO'),
+	('Taylor Swift - Anti-Hero (Official Music Video)', 'TaylorSwiftVEVO'),
+	('Daft Punk - Get Lucky (Official Audio) ft. Pharrell Williams, Nile Rodgers', 'Daft Punk'),
+	('Billie Eilish - bad guy', 'BillieEilishVEVO'),
+	('Dua Lipa - Levitating Featuring DaBaby (Official Music Video)', 'Dua Lipa'),
+	('Queen – Bohemian Rhapsody (Official Video Remastered)', 'Queen Official'),
+	('a-ha - Take On Me (Official Video) [4K]', 'a-ha'),
+	('Luis Fonsi - Despacito ft. Daddy Yankee', 'LuisFonsiVEVO'),
+	('Bad Bunny - DÁKITI (Video Oficial)', 'Bad Bunny'),
+	('Stromae - Alors On Danse (Official Music Video)', 'Stromae'),
+	('YOASOBI「夜に駆ける」Official Music Video', 'Ayase / YOASOBI'),
+	('米津玄師 MV「Lemon」', '米津玄師'),
+	('Rammstein - Du Hast (Official 4K Video)', 'Rammstein Official'),
+	('Nirvana - Smells Like Teen Spirit (Official Music Video)', 'NirvanaVEVO'),
+	('"Weird Al" Yankovic - White & Nerdy (Official Music Video)', 'alyankovicVEVO'),
+	('Kendrick Lamar - HUMBLE.', 'KendrickLamarVEVO'),
+	('My cat reacts to Buddy Holly lol', 'random cat videos'),
+	('Top 10 Weezer songs ranked', 'Music Rankings Daily')
+]
+
+apple_queries = [
+	('Weezer', 'Buddy Holly', 'Weezer (Blue Album)'),
+	('Taylor Swift', 'Anti-Hero', 'Midnights'),
+	('The Weeknd', 'Blinding Lights', 'After Hours'),
+	('Bad Bunny', 'Tití Me Preguntó', 'Un Verano Sin Ti'),
+	('Rosalía', 'DESPECHÁ', 'MOTOMAMI +'),
+	('Stromae', 'Alors on danse', 'Cheese'),
+	('YOASOBI', '夜に駆ける', 'THE BOOK'),
+	('米津玄師', 'Lemon', 'STRAY SHEEP'),
+	('BTS', 'Dynamite', 'BE'),
+	('아이유', '밤편지', 'Palette'),
+	('Sigur Rós', 'Hoppípolla', 'Takk...'),
+	('Daft Punk', 'Get Lucky (feat. Pharrell Williams & Nile Rodgers)', 'Random Access Memories')
+]
+cover_artists = ['Vitamin String Quartet', 'Rockabye Baby!', 'The Karaoke Channel', 'Piano Dreamers', 'Lullaby Renditions', '8-Bit Arcade', 'Guitar Tribute Players', 'Ukulele Covers', 'Various Artists', 'Sing2Piano']
+
+
+
+def feat_title(generator: random.Random) -> str:
+	feat = generator.choice(feats)
+	names = generator.sample(multilingual_artists, feat.count('{}'))
+	return generator.choice(multilingual_titles) + feat.format(*names) + generator.choice(suffixes)
+
+
+
+def fixture_titles(generator: random.Random) -> list[str]:
+	# Titles and artist names the way they come back from every service, a third of them with features
+	texts = []
+	for _ in range(600):
+		roll = generator.random()
+		if roll < 0.35:
+			texts.append(feat_title(generator))
+		elif roll < 0.7:
+			texts.append(generator.choice(multilingual_titles) + generator.choice(suffixes))
+		else:
+			texts.append(', '.join(generator.sample(multilingual_artists, generator.choice([1, 1, 2, 3]))))
+	return texts
+
+
+
+def fixture_censor_titles(generator: random.Random) -> list[str]:
+	# Mostly clean titles, which is what censor_text sees the most of
+	return [generator.choice(explicit_titles) + generator.choice(suffixes) if generator.random() < 0.1 else feat_title(generator) for _ in range(600)]
+
+
+
+def fixture_videos(generator: random.Random) -> list[dict]:
+	# YouTube Data API videos, music videos from K-pop labels and VEVO, art tracks and the odd regular video
+	videos = []
+	for _ in range(300):
+		roll = generator.random()
+		if roll < 0.4:
+			title, channel = generator.choice(kpop_videos)
+			category, description = '10', 'Official music video.'
+		elif roll < 0.8:
+			title, channel = generator.choice(western_videos)
+			category, description = generator.choice(['10', '10', '24', '22']), 'Listen to the new album, out now. Follow on Instagram, TikTok and X.'
+		else:
+			title, channel = generator.choice(multilingual_titles), f'{generator.choice(multilingual_artists)} - Topic'
+			category, description = '10', 'Provided to YouTube by Universal Music Group\n\nAuto-generated by YouTube.'
+		videos.append({
+			'snippet': {'title': title, 'channelTitle': channel, 'categoryId': category, 'description': description},
+			'contentDetails': {'licensedContent': generator.random() < 0.8}
+		})
+	return videos
+
+
+
+def apple_result(generator: random.Random, index: int, artist: str, title: str, collection: str) -> dict:
+	explicit = generator.random() < 0.2
+	return {
+		'wrapperType': 'track',
+		'kind': 'song',
+		'artistId': 1000 + index,
+		'collectionId': 2000 + index,
+		'trackId': 3000 + index,
+		'artistName': artist,
+		'collectionName': collection,
+		'trackName': title,
+		'artistViewUrl': f'https://music.apple.com/us/artist/{1000 + index}',
+		'collectionViewUrl': f'https://music.apple.com/us/album/{2000 + index}?i={3000 + index}',
+		'trackViewUrl': f'https://music.apple.com/us/album/{2000 + index}?i={3000 + index}',
+		'previewUrl': f'https://audio-ssl.itunes.apple.com/itunes-assets/preview/{3000 + index}.m4a',
+		'artworkUrl60': f'https://is1-ssl.mzstatic.com/image/thumb/{2000 + index}/60x60bb.jpg',
+		'artworkUrl100': f'https://is1-ssl.mzstatic.com/image/thumb/{2000 + index}/100x100bb.jpg',
+		'trackExplicitness': 'explicit' if explicit else 'notExplicit',
+		'primaryGenreName': 'Pop'
+	}
+
+
+
+def fixture_apple_search(generator: random.Random, artist: str, title: str, collection: str) -> dict:
+	# A 200-result song search: the song itself and its other versions, the artist's other songs, and a pile of covers
+	results = [apple_result(generator, 0, artist, title, collection)]
+	while len(results) < 200:
+		index = len(results)
+		roll = generator.random()
+		if roll < 0.15:
+			results.append(apple_result(generator, index, artist, title + generator.choice(suffixes[3:]), generator.choice([collection, f'{title} - Single', f'{collection} (Deluxe Edition)', 'Greatest Hits'])))
+		elif roll < 0.3:
+			results.append(apple_result(generator, index, f'{artist} & {generator.choice(multilingual_artists)}', feat_title(generator), generator.choice([collection, f'{title} - EP'])))
+		elif roll < 0.5:
+			results.append(apple_result(generator, index, artist, generator.choice(multilingual_titles), generator.choice([collection, 'Greatest Hits', f'{generator.choice(multilingual_titles)} - Single'])))
+		else:
+			cover_artist = generator.choice(cover_artists)
+			results.append(apple_result(generator, index, cover_artist, title + generator.choice(['', ' (Instrumental)', ' (Lullaby Version)', ' [Karaoke Version]']), f'{cover_artist} Performs {artist}, Vol. {generator.randint(1, 9)}'))
+	generator.shuffle(results)
+	return {'resultCount': len(results), 'results': results}
+
+
+
+async def fixture_filter_cases(generator: random.Random) -> tuple[list, list]:
+	# Built the same way the Apple Music search functions build them, candidates for filter_song and songs for filter_query
+	song_cases = []
+	query_cases = []
+	for artist, title, collection in apple_queries:
+		request = {'request': 'search_song', 'artists': [artist], 'title': title, 'country_code': 'us'}
+		json_response = fixture_apple_search(generator, artist, title, collection)
+		query = {'artists': [optimize_for_search(artist)], 'title': optimize_for_search(title), 'collection': optimize_for_search(collection), 'is_explicit': False, 'song_type': 'track'}
+		song_cases.append((await create_song_candidates(json_response, request, 0, 200), query))
+		query_cases.append((await create_song_objects(json_response, request, 0, 200), f'{artist} {title}'))
+	return song_cases, query_cases
+
+
+
+def clear_caches() -> None:
+	for cached in [similarity, character_index, bare_bones, optimize_for_search, remove_feat, censor_text]:
+		cached.cache_clear()
+
+
+
+def fixture_cases() -> dict:
+	"""
+		Every case, as a function that does one operation and the inputs it goes over.
+	"""
+	generator = random.Random(0)
+	loop = asyncio.new_event_loop()
+	titles = fixture_titles(generator)
+	videos = fixture_videos(generator)
+	song_cases, query_cases = loop.run_until_complete(fixture_filter_cases(generator))
+	clusters = [[item for results in fixture_results(50, generator) for item in results] for _ in range(10)]
+	return {
+		'bare_bones': (bare_bones, titles),
+		'optimize_for_search': (optimize_for_search, titles),
+		'remove_feat': (remove_feat, titles),
+		'censor_text': (censor_text, fixture_censor_titles(generator)),
+		'cleanup_mv_title': (cleanup_mv_title, videos),
+		'classify': (classify, videos),
+		'filter_song': (lambda case: loop.run_until_complete(filter_song(service = 'apple_music', query_request = {}, songs = case[0], query_artists = case[1]['artists'], query_title = case[1]['title'], query_song_type = case[1]['song_type'], query_collection = case[1]['collection'], query_is_explicit = case[1]['is_explicit'])), song_cases),
+		'filter_query': (lambda case: loop.run_until_complete(filter_query(service = 'apple_music', query_request = {}, items = case[0], query = case[1])), query_cases),
+		'cluster_items': (cluster_items, clusters)
+	}
+
+
+
+def ops_per_second(operation, inputs: list) -> float:
+	# Best of a few runs, every pass over the inputs starts out with empty caches
+	results = []
+	for _ in range(repeats):
+		operations = 0
+		elapsed = 0
+		while elapsed < run_time:
+			clear_caches()
+			start = perf_counter()
+			for value in inputs:
+				operation(value)
+			elapsed += perf_counter() - start
+			operations += len(inputs)
+		results.append(operations / elapsed)
+	return max(results)
+
+
+
+def bytes_per_op(operation, inputs: list) -> float:
+	# Average of how far every operation pushed the traced memory over where it started
+	clear_caches()
+	tracemalloc.start()
+	total = 0
+	for value in inputs:
+		before = tracemalloc.get_traced_memory()[0]
+		tracemalloc.reset_peak()
+		operation(value)
+		total += tracemalloc.get_traced_memory()[1] - before
+	tracemalloc.stop()
+	return total / len(inputs)
+
+
+
+def column(value: float | None) -> str:
+	return f'{value:.0f}' if value is not None else '-'
+
+
+
+def regressions(name: str, result: dict, baseline: dict, threshold: float) -> list[str]:
+	if name not in baseline:
+		return []
+	found = []
+	if result['ops_per_second'] < baseline[name]['ops_per_second'] * (1 - threshold):
+		found.append(f"{name}: {result['ops_per_second']:.0f} ops/s, down from {baseline[name]['ops_per_second']:.0f}")
+	if result['bytes_per_op'] > baseline[name]['bytes_per_op'] * (1 + threshold):
+		found.append(f"{name}: {result['bytes_per_op']:.0f} bytes/op, up from {baseline[name]['bytes_per_op']:.0f}")
+	return found
+
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = 'Benchmark the filtering and text normalization hot paths.')
+	parser.add_argument('--case', action = 'append', help = 'case to run, can be repeated, defaults to all of them')
+	parser.add_argument('--threshold', type = float, default = 0.2, help = 'share a case can get slower or allocate more by before it fails')
+	parser.add_argument('--baseline', default = default_baseline, help = 'JSON file with the baseline')
+	parser.add_argument('--save', action = 'store_true', help = 'write the results as the new baseline')
+	options = parser.parse_args()
+
+	cases = fixture_cases()
+	for name in options.case or []:
+		if name not in cases:
+			parser.error(f"unknown case {name}, pick from: {', '.join(cases.keys())}")
+	baseline_path = Path(options.baseline)
+	baseline = json.loads(baseline_path.read_text(encoding = 'utf-8')) if baseline_path.exists() else {}
+
+	results = {}
+	found = []
+	print(f"{'case':<22}{'inputs':>8}{'ops/s':>12}{'baseline':>12}{'bytes/op':>12}{'baseline':>12}")
+	for name in options.case or list(cases.keys()):
+		operation, inputs = cases[name]
+		results[name] = {'ops_per_second': ops_per_second(operation, inputs), 'bytes_per_op': bytes_per_op(operation, inputs)}
+		if regressions(name, results[name], baseline, options.threshold):
+			# Timings are noisy, so a case only fails if it's still slow the second time around
+			results[name]['ops_per_second'] = max(results[name]['ops_per_second'], ops_per_second(operation, inputs))
+		previous = baseline.get(name, {})
+		print(f"{name:<22}{len(inputs):>8}{results[name]['ops_per_second']:>12.0f}{column(previous.get('ops_per_second')):>12}{results[name]['bytes_per_op']:>12.0f}{column(previous.get('bytes_per_op')):>12}")
+		found += regressions(name, results[name], baseline, options.threshold)
+
+	if options.save or not baseline:
+		baseline_path.write_text(json.dumps({**baseline, **results}, indent = 4), encoding = 'utf-8')
+		print(f'Saved the baseline to {baseline_path}')
+		sys.exit(0)
+	for regression in found:
+		print(regression)
+	print(f'{len(found)} regressions over {len(results)} cases, at a {options.threshold:.0%} threshold')
+	sys.exit(1 if found else 0)
@@ -0,0 +1,110 @@
+from AstroAPI.InternalComponents.Legacy.text_manipulation import calculate_similarity, bare_bones
+from AstroAPI.InternalComponents.Legacy.similarity import similarity
+from AstroAPI.ServiceCatalogAPI.components.media import Song, Collection, Artist, Meta
+from AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic.match import cluster_items
+from time import perf_counter
+import random
+import sys
+
+
+
+"""
+	--- CONTENT MATCHING BENCHMARK ---
+
+	Clusters Global Interface query search results (songs and collections from four services, with
+	the usual title and artist variants between them, songs without artists and a bunch of unrelated
+	results) both with the scan over every cluster match_content used to run and with the cluster
+	index it uses now. Checks that both of them come up with the exact same clusters, then times both.
+
+	Run it from the root of the repo, it exits with 1 if any cluster changed:
+
+		python -m benchmarks.match_clustering [results per service]
+"""
+
+
+
+services = ['spotify', 'deezer', 'youtube_music', 'apple_music']
+rounds = 5
+repeats = 3
+
+artists = ['Adele', 'The Weeknd', 'Taylor Swift', 'Beyoncé', 'Drake', 'Kendrick Lamar', 'Billie Eilish', 'Dua Lipa', 'Daft Punk', 'Weezer', 'ABBA', 'BTS', 'SZA', 'Queen', 'Metallica']
+titles = ['Hello', 'Blinding Lights', 'Anti-Hero', 'Halo', "God's Plan", 'HUMBLE.', 'bad guy', 'Levitating', 'Get Lucky', 'Buddy Holly', 'Yellow', 'Creep', 'Nights', 'Halo', 'Hey']
+suffixes = ['', '', '', ' - Remix', ' (Live)', ' - Remastered 2011', ' (Acoustic)', ' (feat. Someone)', ' - Sped Up', ' (Radio Edit)']
+artist_variants = ['{}', '{}', '{}', '{} & Friends', 'The {}', '{}.', '{} Tribute Band']
+
+
+
+def fixture_results(amount: int, generator: random.Random) -> list[list[object]]:
+	results_lists = []
+	for service in services:
+		results = []
+		for index in range(amount):
+			artist = generator.choice(artist_variants).format(generator.choice(artists))
+			title = generator.choice(titles) + generator.choice(suffixes)
+			if generator.random() < 0.3:
+				title = f'{title} {generator.randint(1, 99)}' # Unrelated results
+			song_artists = [] if generator.random() < 0.05 else [Artist(service = service, urls = '', ids = '', name = artist, meta = None)]
+			meta = Meta(service = service, request = {}, processing_time = 0, http_code = 200)
+			if generator.random() < 0.3:
+				results.append(Collection(service = service, type = 'album', urls = {service: str(index)}, ids = {service: str(index)}, title = title, artists = song_artists, release_year = generator.choice([None, 2019, 2020, 2023]), cover = None, meta = meta))
+			else:
+				results.append(Song(service = service, type = 'track', urls = {service: str(index)}, ids = {service: str(index)}, title = title, artists = song_artists, collection = None, is_explicit = False, cover = None, meta = meta))
+		results_lists.append(results)
+	return results_lists
+
+
+
+def scan_clusters(items: list[object]) -> list[list[object]]:
+	# What match_content used to do, every item against every cluster
+	clusters = []
+	for item in items:
+		match_found = False
+		for cluster in clusters:
+			representative = cluster[0]
+			title_sim = calculate_similarity(bare_bones(item.title), bare_bones(representative.title))
+			artist_sim = 0
+			if item.artists and representative.artists:
+				artist_sim = calculate_similarity(bare_bones(item.artists[0].name), bare_bones(representative.artists[0].name))
+			year_match = True
+			if hasattr(item, 'release_year') and hasattr(representative, 'release_year'):
+				if item.release_year and representative.release_year:
+					if abs(item.release_year - representative.release_year) > 1:
+						year_match = False
+			if title_sim > 800 and artist_sim > 800 and year_match:
+				cluster.append(item)
+				match_found = True
+				break
+		if not match_found:
+			clusters.append([item])
+	return clusters
+
+
+
+def timed(clustering, cases: list) -> float:
+	# Best of a few runs, every run starts out with an empty score cache
+	times = []
+	for _ in range(repeats):
+		similarity.cache_clear()
+		start = perf_counter()
+		for items in cases:
+			clustering(items)
+		times.append((perf_counter() - start) / len(cases))
+	return min(times)
+
+
+
+if __name__ == '__main__':
+	amount = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+	generator = random.Random(0)
+	cases = [[item for results in fixture_results(amount, generator) for item in results] for _ in range(rounds)]
+	changed = 0
+	for items in cases:
+		expected = [[id(item) for item in cluster] for cluster in scan_clusters(items)]
+		result = [[id(item) for item in cluster] for cluster in cluster_items(items)]
+		if expected != result:
+			changed += 1
+	scan_time = timed(scan_clusters, cases)
+	index_time = timed(cluster_items, cases)
+	print(f'{amount} results per service: scan {scan_time * 1000:.1f} ms, cluster index {index_time * 1000:.1f} ms ({scan_time / index_time:.1f}x), best of {repeats} runs over {rounds} searches')
+	print(f'{changed} searches with changed clusters out of {rounds}')
+	sys.exit(1 if changed else 0)
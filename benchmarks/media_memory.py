@@ -0,0 +1,88 @@
+import AstroAPI.ServiceCatalogAPI.components.media as current_media
+import benchmarks.fixtures.media_before_slots as media_before_slots
+import tracemalloc
+import sys
+
+
+
+"""
+	--- MEDIA OBJECT MEMORY BENCHMARK ---
+
+	Measures how many bytes a Song takes up, along with everything a search hit hangs off of it
+	(its Collection, Cover, Artist and a Meta for each of them), the same way the services build them.
+	It does that for the current media objects and for a frozen copy of the ones from before they got
+	__slots__ (benchmarks/fixtures/media_before_slots.py), so it prints the before and after.
+
+	Run it from the root of the repo:
+
+		python -m benchmarks.media_memory [amount of songs]
+"""
+
+
+
+def build_song(media: object, request: dict, index: int) -> object:
+	service = 'spotify'
+	artists = [
+		media.Artist(
+			service = service,
+			urls = f'https://open.spotify.com/artist/{index}',
+			ids = str(index),
+			name = f'Artist {index}',
+			meta = media.Meta(service = service, request = request, processing_time = 0, filter_confidence_percentage = 100.0, http_code = 200)
+		)
+	]
+	cover = media.Cover(
+		service = service,
+		media_type = 'album',
+		title = f'Album {index}',
+		artists = artists,
+		hq_urls = f'https://i.scdn.co/image/hq{index}',
+		lq_urls = f'https://i.scdn.co/image/lq{index}',
+		meta = media.Meta(service = service, request = request, processing_time = 0, filter_confidence_percentage = 100.0, http_code = 200)
+	)
+	collection = media.Collection(
+		service = service,
+		type = 'album',
+		urls = f'https://open.spotify.com/album/{index}',
+		ids = str(index),
+		title = f'Album {index}',
+		artists = artists,
+		release_year = '2020',
+		cover = cover,
+		meta = media.Meta(service = service, request = request, processing_time = 0, filter_confidence_percentage = 100.0, http_code = 200)
+	)
+	return media.Song(
+		service = service,
+		type = 'track',
+		urls = f'https://open.spotify.com/track/{index}',
+		ids = str(index),
+		title = f'Song {index}',
+		artists = artists,
+		collection = collection,
+		is_explicit = False,
+		cover = cover,
+		meta = media.Meta(service = service, request = request, processing_time = 5, http_code = 200)
+	)
+
+
+
+def measure(media: object, amount: int) -> float:
+	# Every song of a search shares the same request dict, just like in the real thing
+	request = {'request': 'search_song', 'artists': ['Artist'], 'title': 'Song', 'country_code': 'us'}
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	songs = [build_song(media, request, index) for index in range(amount)]
+	after = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	del songs
+	return (after - before) / amount
+
+
+
+if __name__ == '__main__':
+	amount = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+	before = measure(media_before_slots, amount)
+	after = measure(current_media, amount)
+	print(f'Bytes per Song (with its Collection, Cover, Artist and Metas), {amount} songs:')
+	print(f'  before slots: {before:.0f}')
+	print(f'  now: {after:.0f} ({(1 - after / before) * 100:.0f}% less)')
@@ -0,0 +1,69 @@
+from AstroAPI.ServiceCatalogAPI.components.media import Query, Meta
+from AstroAPI.ServiceCatalogAPI.components.serialization import MediaResponse
+from benchmarks.media_memory import build_song
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from time import perf_counter
+import sys
+
+
+
+"""
+	--- SERIALIZATION BENCHMARK ---
+
+	Renders query search results of 10, 100 and 500 songs (with their collections, covers and
+	artists) both the way FastAPI does it when an endpoint returns `object.json`
+	(jsonable_encoder, then json.dumps) and with MediaResponse. Checks that both of them come
+	out as the exact same bytes, then times both.
+
+	Run it from the root of the repo, it exits with 1 if any response changed:
+
+		python -m benchmarks.serialization
+"""
+
+
+
+sizes = [10, 100, 500]
+repeats = 20
+
+
+
+def fixture_query(amount: int) -> Query:
+	request = {'request': 'search_query', 'query': 'song', 'filter_for_best_match': False, 'country_code': 'us'}
+	return Query(
+		service = 'spotify',
+		songs = [build_song(request, index) for index in range(amount)],
+		meta = Meta(service = 'spotify', request = request, processing_time = 120, http_code = 200)
+	)
+
+
+
+def fastapi_response(query: Query) -> bytes:
+	return JSONResponse(jsonable_encoder(query.json)).body
+
+
+
+def media_response(query: Query) -> bytes:
+	return MediaResponse(query).body
+
+
+
+def timed(rendering, query: Query) -> float:
+	start = perf_counter()
+	for _ in range(repeats):
+		rendering(query)
+	return (perf_counter() - start) / repeats
+
+
+
+if __name__ == '__main__':
+	changed = 0
+	for size in sizes:
+		query = fixture_query(size)
+		if fastapi_response(query) != media_response(query):
+			changed += 1
+			print(f'{size} songs: responses differ')
+		fastapi_time = timed(fastapi_response, query)
+		media_time = timed(media_response, query)
+		print(f'{size} songs: jsonable_encoder + json.dumps {fastapi_time * 1000:.2f} ms, MediaResponse {media_time * 1000:.2f} ms ({fastapi_time / media_time:.1f}x)')
+	sys.exit(1 if changed else 0)
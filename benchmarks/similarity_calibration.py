@@ -0,0 +1,116 @@
+from AstroAPI.InternalComponents.Legacy.similarity import similarity, similarities
+from itertools import product
+from difflib import SequenceMatcher
+from time import perf_counter
+import sys
+
+
+
+"""
+	--- SIMILARITY CALIBRATION ---
+
+	Checks that the similarity module makes the exact same decisions difflib.SequenceMatcher made
+	at every threshold the API relies on, over a fixture corpus of (already bare-boned) artist names
+	and titles, their usual variants (remixes, remasters, features...) and unrelated pairs. Then it
+	times both of them.
+
+	  - 500: the artist cutoff in the filters (covers get thrown out below it)
+	  - 600: 30% of the 2000 points an artist + title search is scored out of (the acceptance cutoff)
+	  - 800: title and artist similarity for clustering Global Interface query results
+
+	Run it from the root of the repo, it exits with 1 if any decision changed:
+
+		python -m benchmarks.similarity_calibration
+"""
+
+
+
+artists = [
+	'adele', 'the weeknd', 'taylor swift', 'beyonce', 'drake', 'kendrick lamar', 'billie eilish', 'ed sheeran', 'bts', 'blackpink',
+	'dua lipa', 'the beatles', 'queen', 'daft punk', 'coldplay', 'kanye west', 'ariana grande', 'post malone', 'bad bunny', 'rosalia',
+	'sza', 'olivia rodrigo', 'harry styles', 'arctic monkeys', 'radiohead', 'metallica', 'eminem', 'rihanna', 'lady gaga', 'bruno mars',
+	'the killers', 'imagine dragons', 'lana del rey', 'frank ocean', 'tyler the creator', 'travis scott', 'weezer', 'nirvana', 'abba', 'michael jackson'
+]
+
+titles = [
+	'hello', 'blinding lights', 'anti hero', 'halo', 'gods plan', 'humble', 'bad guy', 'shape of you', 'dynamite', 'how you like that',
+	'levitating', 'hey jude', 'bohemian rhapsody', 'get lucky', 'yellow', 'stronger', '7 rings', 'circles', 'titi me pregunto', 'despecha',
+	'kill bill', 'drivers license', 'as it was', 'do i wanna know', 'creep', 'enter sandman', 'lose yourself', 'umbrella', 'bad romance', 'uptown funk',
+	'mr brightside', 'believer', 'summertime sadness', 'nights', 'see you again', 'sicko mode', 'buddy holly', 'smells like teen spirit', 'dancing queen', 'billie jean'
+]
+
+suffixes = ['remix', 'live', 'remastered 2011', 'acoustic', 'radio edit', 'sped up', 'instrumental', 'demo', '2019 remaster', 'extended mix', 'version', 'taylors version']
+
+thresholds = [500, 600, 800]
+
+
+
+def fixture_pairs() -> list[tuple[str, str]]:
+	strings = artists + titles
+	# Everything against everything, mostly unrelated pairs that have to stay below the cutoffs
+	pairs = list(product(strings, strings))
+	# Variants of the same song that usually have to stay above them
+	for title, suffix in product(titles, suffixes):
+		pairs.append((f'{title} {suffix}', title))
+		pairs.append((title, f'{title} {suffix}'))
+	for artist in artists:
+		pairs.append((artist.replace('the ', ''), artist))
+		pairs.append((f'{artist} and friends', artist))
+		pairs.append((artist[:-1], artist))
+	# Artist + title strings like the ones filter_query and the Global Interface compare
+	for artist, title in zip(artists, titles):
+		pairs.append((f'{artist} {title}', f'{title} {artist}'))
+		pairs.append((f'{artist} {title}', f'{artist} {title} remix'))
+	return pairs
+
+
+
+def difflib_similarity(reference: str, input_str: str) -> float:
+	return SequenceMatcher(None, reference, input_str).ratio() * 1000
+
+
+
+def calibrate(pairs: list[tuple[str, str]]) -> list:
+	mismatches = []
+	for reference, input_str in pairs:
+		expected = difflib_similarity(reference, input_str)
+		score = similarity(reference, input_str)
+		for threshold in thresholds:
+			if (expected > threshold) != (score > threshold):
+				mismatches.append((reference, input_str, threshold, expected, score))
+	return mismatches
+
+
+
+def benchmark(pairs: list[tuple[str, str]]) -> None:
+	start = perf_counter()
+	for reference, input_str in pairs:
+		difflib_similarity(reference, input_str)
+	difflib_time = perf_counter() - start
+
+	similarity.cache_clear() # Time the scoring, not the score cache
+	start = perf_counter()
+	for reference, input_str in pairs:
+		similarity(reference, input_str)
+	similarity_time = perf_counter() - start
+
+	# The usual filtering case, one query against a whole search worth of candidates
+	similarity.cache_clear()
+	references = [f'{title} {suffix}' for title, suffix in product(titles, suffixes)][:200]
+	start = perf_counter()
+	similarities(references, 'blinding lights')
+	batch_time = perf_counter() - start
+
+	print(f'difflib: {difflib_time * 1000:.1f} ms, similarity: {similarity_time * 1000:.1f} ms ({difflib_time / similarity_time:.1f}x faster), over {len(pairs)} pairs')
+	print(f'200 candidates against one query: {batch_time * 1000:.2f} ms')
+
+
+
+if __name__ == '__main__':
+	pairs = fixture_pairs()
+	mismatches = calibrate(pairs)
+	for reference, input_str, threshold, expected, score in mismatches:
+		print(f'"{reference}" vs "{input_str}" at {threshold}: difflib {expected:.1f}, similarity {score:.1f}')
+	print(f'{len(mismatches)} changed decisions over {len(pairs)} pairs and {len(thresholds)} thresholds')
+	benchmark(pairs)
+	sys.exit(1 if mismatches else 0)
@@ -0,0 +1,179 @@
+from AstroAPI.InternalComponents.SessionManager.recorder import fixture_header
+from aiohttp import web
+from fnmatch import fnmatchcase
+import argparse
+import asyncio
+import random
+import json
+
+
+
+"""
+	--- STUB UPSTREAMS ---
+
+	Answers the requests of an app whose upstream recorder is in replay mode with the fixtures
+	it recorded (or hand-written ones), so the whole app can be benchmarked without a network.
+
+	Fixtures are JSON lines with the key of the request they answer (see fixture_key() in the
+	upstream recorder), the status, the content type and the body. Keys can be glob patterns
+	(ex. `GET api.deezer.com/track/*`), which answer every request that doesn't have a fixture of
+	its own, in the order they're in the file. Requests without any fixture get a 404.
+
+	Every response can be held back for a while to stand in for the upstream's round trip, and
+	a share of them can be swapped for errors to see how the app copes with a flaky upstream.
+	Hits, misses and injected errors are on /_stub/stats.
+
+	Run it from the root of the repo:
+
+		python -m benchmarks.stub_upstreams [--port 8765] [--latency ms] [--jitter ms] [--host-latency host=ms] [--error-rate 0.01] [--error-status 503]
+"""
+
+
+
+default_fixtures = 'benchmarks/fixtures/upstreams.jsonl'
+
+
+
+class StubUpstreams:
+	def __init__(self, fixtures: list[dict], latency: float = 0, jitter: float = 0, host_latency: dict = None, error_rate: float = 0, error_status: int = 503, seed: int = None):
+		"""
+			:param fixtures: The fixtures, as they're in the file.
+			:param latency: Milliseconds every response gets held back for.
+			:param jitter: Up to this many milliseconds more (uniformly random) on top of that.
+			:param host_latency: Milliseconds responses of specific upstream hosts get held back for instead, ex. {'api.deezer.com': 120}.
+			:param error_rate: Share of responses that get swapped for an error.
+			:param error_status: The HTTP code of injected errors.
+			:param seed: Optional. Seed of the jitter and the error injection, for runs that can be compared.
+		"""
+		self.exact = {}
+		self.patterns = []
+		for fixture in fixtures:
+			if any(character in fixture['key'] for character in '*?['):
+				self.patterns.append(fixture)
+			else:
+				self.exact.setdefault(fixture['key'], fixture)
+		self.latency = latency
+		self.jitter = jitter
+		self.host_latency = host_latency or {}
+		self.error_rate = error_rate
+		self.error_status = error_status
+		self.random = random.Random(seed)
+		self.missing = set()
+		self.stats = {
+			'hits': 0,
+			'pattern_hits': 0,
+			'misses': 0,
+			'injected_errors': 0
+		}
+
+	def find(self, key: str) -> dict | None:
+		fixture = self.exact.get(key)
+		if fixture is not None:
+			self.stats['hits'] += 1
+			return fixture
+		for fixture in self.patterns:
+			if fnmatchcase(key, fixture['key']):
+				self.stats['pattern_hits'] += 1
+				return fixture
+		self.stats['misses'] += 1
+		self.missing.add(key)
+		return None
+
+	def delay(self, key: str) -> float:
+		host = key.split(' ', 2)[1].split('/', 1)[0]
+		latency = self.host_latency.get(host, self.latency)
+		return (latency + self.random.uniform(0, self.jitter)) / 1000
+
+	async def replay(self, request: web.Request) -> web.Response:
+		key = request.headers.get(fixture_header, '')
+		await asyncio.sleep(self.delay(key) if key else 0)
+		if self.error_rate and self.random.random() < self.error_rate:
+			self.stats['injected_errors'] += 1
+			return web.json_response({'error': 'Injected by the stub upstreams'}, status = self.error_status)
+		fixture = self.find(key)
+		if fixture is None:
+			return web.json_response({'error': f'No fixture for {key}'}, status = 404)
+		return web.Response(body = fixture['body'].encode('utf-8'), status = fixture['status'], content_type = fixture['content_type'] or 'application/octet-stream')
+
+	async def report(self, request: web.Request) -> web.Response:
+		return web.json_response({**self.stats, 'missing': sorted(self.missing)})
+
+	def app(self) -> web.Application:
+		app = web.Application()
+		app.router.add_get('/_stub/stats', self.report)
+		app.router.add_route('*', '/replay', self.replay)
+		return app
+
+
+
+def load_fixtures(path: str) -> list[dict]:
+	with open(path, 'r', encoding = 'utf-8') as file:
+		return [json.loads(line) for line in file if line.strip()]
+
+
+
+async def start_stub(stub: StubUpstreams, port: int) -> web.AppRunner:
+	"""
+		Start serving a stub on localhost. Returns the runner, whose cleanup() stops it.
+	"""
+	runner = web.AppRunner(stub.app(), access_log = None)
+	await runner.setup()
+	await web.TCPSite(runner, '127.0.0.1', port).start()
+	return runner
+
+
+
+def host_latencies(values: list[str]) -> dict:
+	latencies = {}
+	for value in values:
+		host, _, latency = value.partition('=')
+		latencies[host] = float(latency)
+	return latencies
+
+
+
+def arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+	# Shared with the endpoint benchmark, which starts a stub of its own
+	parser.add_argument('--fixtures', default = default_fixtures, help = 'JSON lines file with the fixtures')
+	parser.add_argument('--latency', type = float, default = 0, help = 'milliseconds every response gets held back for')
+	parser.add_argument('--jitter', type = float, default = 0, help = 'up to this many random milliseconds on top of the latency')
+	parser.add_argument('--host-latency', action = 'append', default = [], metavar = 'HOST=MS', help = 'latency of a specific upstream host instead, can be repeated')
+	parser.add_argument('--error-rate', type = float, default = 0, help = 'share of responses that get swapped for an error')
+	parser.add_argument('--error-status', type = int, default = 503, help = 'HTTP code of injected errors')
+	parser.add_argument('--seed', type = int, default = None, help = 'seed of the jitter and error injection')
+	return parser
+
+
+
+def stub_from(options: argparse.Namespace) -> StubUpstreams:
+	return StubUpstreams(
+		load_fixtures(options.fixtures),
+		latency = options.latency,
+		jitter = options.jitter,
+		host_latency = host_latencies(options.host_latency),
+		error_rate = options.error_rate,
+		error_status = options.error_status,
+		seed = options.seed
+	)
+
+
+
+async def main() -> None:
+	parser = arguments(argparse.ArgumentParser(description = 'Replay recorded upstream responses.'))
+	parser.add_argument('--port', type = int, default = 8765)
+	options = parser.parse_args()
+	stub = stub_from(options)
+	runner = await start_stub(stub, options.port)
+	print(f'Replaying {len(stub.exact)} fixtures and {len(stub.patterns)} patterns on http://127.0.0.1:{options.port}')
+	try:
+		await asyncio.Event().wait()
+	finally:
+		await runner.cleanup()
+
+
+
+if __name__ == '__main__':
+	try:
+		asyncio.run(main())
+	except KeyboardInterrupt:
+		pass
@@ -1,6 +1,17 @@
-import AstroAPI.ServiceCatalogAPI as ServiceCatalog
-import AstroAPI.SnitchAPI as Snitch
-from fastapi import FastAPI, HTTPException, Request
+from AstroAPI.InternalComponents.SessionManager import session_manager, executor_manager
+from AstroAPI.InternalComponents.SessionManager.executors import executor_limits
+from AstroAPI.InternalComponents.ServiceManager import service_registry, resolve, resolve_loaded
+from AstroAPI.InternalComponents.Legacy.ini import config, version, deployment_channel
+from AstroAPI.InternalComponents.Legacy.log import log_pipeline
+from AstroAPI.InternalComponents.CacheManager import response_cache, id_map, single_flight
+from AstroAPI.InternalComponents.JobManager import job_manager
+from AstroAPI.InternalComponents.TimingManager import stage_stats, StageTimesOptIn
+from AstroAPI.InternalComponents.MetricsManager import metrics, MetricsMiddleware, event_loop_monitor, mirror_stats, mirror_hit_ratio, internal_state, circuit_breaker_state, circuit_breaker_error_rate, executor_calls_in_flight, executor_calls_waiting, executor_utilization
+from AstroAPI.ServiceCatalogAPI.components.serialization import MediaResponse, render
+from AstroAPI.ServiceCatalogAPI.components.streaming import MediaStream, call_events, stream_formats
+from fastapi import FastAPI, HTTPException, Request, Response
+from contextlib import asynccontextmanager
+import asyncio
 
 
 
@@ -8,22 +19,169 @@ music_media_services = ['spotify', 'apple_music', 'youtube_music', 'deezer']
 knowledge_media_services = ['spotify', 'genius']
 snitch_media_types = ['image', 'audio']
 illegal_results = ['error', 'empty_response']
+batch_media_types = ['song', 'music_video', 'collection']
+batch_size_limit = 200 # Most IDs a single batch lookup can have
+job_size_limit = 1000 # Most items a single conversion job can have
+circuit_breaker_states = {'closed': 0, 'half_open': 1, 'open': 2}
+preload_services = config.getboolean('services', 'preload', fallback = True) # Start every service in the background on startup instead of on first use
+circuit_breakers_path = 'AstroAPI.ServiceCatalogAPI.media_services.music.global_io.components.generic.circuit_breaker:circuit_breakers'
+bulk_batchers = {
+	'spotify_tracks': 'AstroAPI.ServiceCatalogAPI.media_services.music.spotify.components.generic.bulk_lookup:track_batcher',
+	'spotify_albums': 'AstroAPI.ServiceCatalogAPI.media_services.music.spotify.components.generic.bulk_lookup:album_batcher',
+	'apple_music_tracks': 'AstroAPI.ServiceCatalogAPI.media_services.music.apple_music.components.generic.bulk_lookup:track_batcher',
+	'apple_music_collections': 'AstroAPI.ServiceCatalogAPI.media_services.music.apple_music.components.generic.bulk_lookup:collection_batcher'
+}
+
+
+
+# Services only get imported when they're first needed (or preloaded on startup), see the service registry
+music_services_path = 'AstroAPI.ServiceCatalogAPI.media_services.music'
+knowledge_services_path = 'AstroAPI.ServiceCatalogAPI.media_services.knowledge'
+credentials_path = 'AstroAPI.InternalComponents.CredentialsManager'
+service_registry.register('music', 'global_io', f'{music_services_path}.global_io:global_io')
+service_registry.register('music', 'spotify', f'{music_services_path}.spotify:spotify', hooks = [f'{credentials_path}.media_services.spotify.token:spotify_token.get_token'])
+service_registry.register('music', 'apple_music', f'{music_services_path}.apple_music:apple_music')
+service_registry.register('music', 'youtube_music', f'{music_services_path}.youtube_music:youtube_music', hooks = [f'{credentials_path}.media_services.youtube.credentials:youtube_credentials.initialize'])
+service_registry.register('music', 'deezer', f'{music_services_path}.deezer:deezer')
+service_registry.register('knowledge', 'global_io', f'{knowledge_services_path}.global_io:global_io')
+service_registry.register('knowledge', 'spotify', f'{knowledge_services_path}.spotify:spotify')
+service_registry.register('knowledge', 'genius', f'{knowledge_services_path}.genius:genius', hooks = [f'{credentials_path}.media_services.genius.credentials:genius_credentials.get_credentials'])
+service_registry.register('snitch', 'global_io', 'AstroAPI.SnitchAPI.detection_services.global_io:global_io', hooks = [
+	f'{credentials_path}.snitch_services.sightengine.credentials:sightengine_credentials.get_credentials',
+	f'{credentials_path}.snitch_services.submithub.credentials:submithub_credentials.get_credentials'
+])
 
 
 
 def get_service_catalog_api(media_type: str, service: str):
-	if media_type == 'music':
-		service_api = getattr(ServiceCatalog.music, service)
-	elif media_type == 'knowledge':
-		service_api = getattr(ServiceCatalog.knowledge, service)
-	return service_api
+	# Imports the service the first time it's asked for
+	return service_registry.get(media_type, service)
 
 
 
-app = FastAPI()
+async def lookup_media(media_type: str, media: str, service: str, id: str, id_service: str = None, country_code: str = 'us', deadline: float = None):
+	# Songs, music videos and collections get looked up the exact same way, only the search that finds them on another service is different
+	lookup_function = f'lookup_{media_type}'
+	# Request from the correct API endpoint
+	if id_service == service or id_service is None: # Check if the supplied ID service is empty or the same as the service in the path
+		# Get the service's correct object variable
+		service_api = get_service_catalog_api(media, service)
+		return await getattr(service_api, lookup_function)(id, country_code) # If so, assume the user wants to query the path service with the ID
+	# If they are different, the user wants to do a Global Interface request or wants to request from a different service
+	# Get the ID service's correct object variable
+	if id_service in music_media_services:
+		id_service_api = get_service_catalog_api('music', id_service)
+	elif id_service in knowledge_media_services:
+		id_service_api = get_service_catalog_api('knowledge', id_service)
+	# Request from the Global Interface if that's what the user wants
+	if service == 'global_io':
+		# Get the service's correct object variable
+		service_api = get_service_catalog_api(media, service)
+		return await getattr(service_api, lookup_function)(id_service_api, id, country_code, country_code, deadline = deadline)
+	# Request for the media from the ID service
+	# We'll use its data to construct a query request for a path service search
+	id_service_object = await getattr(id_service_api, lookup_function)(id = id, country_code = country_code)
+	if id_service_object.type in illegal_results:
+		return id_service_object
+	# Get the service's correct object variable
+	service_api = get_service_catalog_api(media, service)
+	# Query the service for the media
+	if media_type == 'song':
+		return await service_api.search_song(
+			artists = [artist.name for artist in id_service_object.artists],
+			title = id_service_object.title,
+			song_type = id_service_object.type,
+			collection = id_service_object.collection.title if id_service_object.collection != None else None,
+			is_explicit = id_service_object.is_explicit,
+			country_code = country_code,
+		)
+	elif media_type == 'music_video':
+		return await service_api.search_music_video(
+			artists = [artist.name for artist in id_service_object.artists],
+			title = id_service_object.title,
+			is_explicit = id_service_object.is_explicit,
+			country_code = country_code,
+		)
+	elif media_type == 'collection':
+		return await service_api.search_collection(
+			artists = [artist.name for artist in id_service_object.artists],
+			title = id_service_object.title,
+			year = id_service_object.release_year,
+			country_code = country_code
+		)
+
+
+
+async def json_object(request: Request) -> dict:
+	# Bodies that aren't JSON, or are JSON but not an object, are the client's mistake
+	try:
+		body = await request.json()
+	except ValueError:
+		raise HTTPException(status_code = 400, detail = "The body has to be a JSON object.")
+	if not isinstance(body, dict):
+		raise HTTPException(status_code = 400, detail = "The body has to be a JSON object.")
+	return body
+
+
+
+def checked_stream_format(stream: str) -> str:
+	stream = stream.lower()
+	if stream not in stream_formats:
+		raise HTTPException(status_code = 400, detail = f"stream has to be one of: {', '.join(stream_formats)}.")
+	return stream
+
+
+
+def streamed(call, stream: str) -> MediaStream:
+	# Streaming requests get every service's result as soon as it comes in, and the compiled result at the end
+	try:
+		stream = checked_stream_format(stream)
+	except HTTPException:
+		call.close()
+		raise
+	return MediaStream(call_events(call), stream)
+
+
+
+async def convert_media(media_type: str, service: str, id: str, country_code: str) -> tuple[int, str]:
+	# Job items get converted like a Global Interface lookup of their ID would
+	media_object = await lookup_media(media_type, 'music', 'global_io', id, service, country_code)
+	http_code = media_object.meta.http_code if media_object.type in illegal_results else 200
+	return http_code, render(media_object).decode('utf-8')
+
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+	# Open the shared, pooled HTTP sessions on startup and close them on shutdown
+	await session_manager.start()
+	# Import the services and fetch their credentials (ex. set up ytmusicapi) in the background, so the app takes requests right away
+	if preload_services:
+		await service_registry.preload()
+	# Send Discord logs from the background instead of on the request path
+	await log_pipeline.start()
+	# Start converting jobs in the background, including the ones the last run didn't finish
+	await job_manager.start(convert_media)
+	# Keep an eye on how late the event loop runs for /metrics
+	await event_loop_monitor.start()
+	yield
+	await service_registry.stop()
+	await event_loop_monitor.stop()
+	await job_manager.stop()
+	await log_pipeline.stop()
+	await session_manager.close()
+	executor_manager.close()
+
+
+
+app = FastAPI(lifespan = lifespan)
+# Requests with stage_times=true get the stage breakdown in their metadata
+app.add_middleware(StageTimesOptIn)
+# Every request gets counted and timed for /metrics
+app.add_middleware(MetricsMiddleware)
 print("[AstroAPI] Ready!")
-print(f"[AstroAPI] Version: {ServiceCatalog.version}")
-print(f"[AstroAPI] Deployment channel: {ServiceCatalog.deployment_channel}")
+print(f"[AstroAPI] Version: {version}")
+print(f"[AstroAPI] Deployment channel: {deployment_channel}")
 
 
 
@@ -37,7 +195,7 @@ print(f"[AstroAPI] Deployment channel: {ServiceCatalog.deployment_channel}")
 
 # Song Search for media services
 @app.get("/{media}/{service}/search_song")
-async def search_song(media: str, service: str, artist: str, title: str, song_type: str = None, collection_title: str = None, is_explicit: str = None, country_code: str = 'us', exclude_services: str = None):
+async def search_song(media: str, service: str, artist: str, title: str, song_type: str = None, collection_title: str = None, is_explicit: str = None, country_code: str = 'us', exclude_services: str = None, deadline: float = None, stream: str = None):
 	# Prepare everything for the API request
 	media = media.lower()
 	if media == 'knowledge':
@@ -50,17 +208,18 @@ async def search_song(media: str, service: str, artist: str, title: str, song_ty
 
 	# Check if the queried service is the Global Interface, so we know whether we need to plug in the exclude_services parameter into it or not
 	if service == 'global_io': 
-		song_object = await service_api.search_song(
+		song_call = service_api.search_song(
 			artists = [artist],
 			title = title,
 			song_type = song_type,
 			collection = collection_title,
 			is_explicit = is_explicit,
 			country_code = country_code,
-			exclude_services = exclude_services
+			exclude_services = exclude_services,
+			deadline = deadline
 		)
 	else:
-		song_object = await service_api.search_song(
+		song_call = service_api.search_song(
 			artists = [artist],
 			title = title,
 			song_type = song_type,
@@ -68,8 +227,11 @@ async def search_song(media: str, service: str, artist: str, title: str, song_ty
 			is_explicit = is_explicit,
 			country_code = country_code
 		)
+	if stream is not None:
+		return streamed(song_call, stream)
+	song_object = await song_call
 	if song_object.type not in illegal_results:
-		return song_object.json
+		return MediaResponse(song_object)
 	else:
 		raise HTTPException(status_code = song_object.meta.http_code, detail = song_object.error_msg if song_object.type == 'error' else None)
 
@@ -77,7 +239,7 @@ async def search_song(media: str, service: str, artist: str, title: str, song_ty
 
 # Music Video Search for media services
 @app.get("/{media}/{service}/search_music_video")
-async def search_music_video(media: str, service: str, artist: str, title: str, is_explicit: str = None, country_code: str = 'us', exclude_services: str = None):
+async def search_music_video(media: str, service: str, artist: str, title: str, is_explicit: str = None, country_code: str = 'us', exclude_services: str = None, deadline: float = None, stream: str = None):
 	# Prepare everything for the API request
 	media = media.lower()
 	if media == 'knowledge':
@@ -89,22 +251,26 @@ async def search_music_video(media: str, service: str, artist: str, title: str,
 
 	# Check if the queried service is the Global Interface, so we know whether we need to plug in the exclude_services parameter into it or not
 	if service == 'global_io': 
-		music_video_object = await service_api.search_music_video(
+		music_video_call = service_api.search_music_video(
 			artists = [artist],
 			title = title,
 			is_explicit = is_explicit,
 			country_code = country_code,
-			exclude_services = exclude_services
+			exclude_services = exclude_services,
+			deadline = deadline
 		)
 	else:
-		music_video_object = await service_api.search_music_video(
+		music_video_call = service_api.search_music_video(
 			artists = [artist],
 			title = title,
 			is_explicit = is_explicit,
 			country_code = country_code
 		)
+	if stream is not None:
+		return streamed(music_video_call, stream)
+	music_video_object = await music_video_call
 	if music_video_object.type not in illegal_results:
-		return music_video_object.json
+		return MediaResponse(music_video_object)
 	else:
 		raise HTTPException(status_code = music_video_object.meta.http_code, detail = music_video_object.error_msg if music_video_object.type == 'error' else None)
 
@@ -112,7 +278,7 @@ async def search_music_video(media: str, service: str, artist: str, title: str,
 
 # Collection Search for media services
 @app.get("/{media}/{service}/search_collection")
-async def search_collection(media: str, service: str, artist: str, title: str, year: str = None, country_code: str = 'us', exclude_services: str = None):
+async def search_collection(media: str, service: str, artist: str, title: str, year: str = None, country_code: str = 'us', exclude_services: str = None, deadline: float = None, stream: str = None):
 	# Prepare everything for the API request
 	media = media.lower()
 	if media == 'knowledge':
@@ -124,22 +290,26 @@ async def search_collection(media: str, service: str, artist: str, title: str, y
 
 	# Check if the queried service is the Global Interface, so we know whether we need to plug in the exclude_services parameter into it or not
 	if service == 'global_io': 
-		collection_object = await service_api.search_collection(
+		collection_call = service_api.search_collection(
 			artists = [artist],
 			title = title,
 			year = year,
 			country_code = country_code,
-			exclude_services = exclude_services
+			exclude_services = exclude_services,
+			deadline = deadline
 		)
 	else:
-		collection_object = await service_api.search_collection(
+		collection_call = service_api.search_collection(
 			artists = [artist],
 			title = title,
 			year = year,
 			country_code = country_code
 		)
+	if stream is not None:
+		return streamed(collection_call, stream)
+	collection_object = await collection_call
 	if collection_object.type not in illegal_results:
-		return collection_object.json
+		return MediaResponse(collection_object)
 	else:
 		raise HTTPException(status_code = collection_object.meta.http_code, detail = collection_object.error_msg if collection_object.type == 'error' else None)
 
@@ -147,7 +317,7 @@ async def search_collection(media: str, service: str, artist: str, title: str, y
 
 # Query Search for media services
 @app.get("/{media}/{service}/search_query")
-async def search_music_video(media: str, service: str, query: str, filter_for_best_match: str = 'true', media_types: str = None, is_explicit: str = None, country_code: str = 'us', exclude_services: str = None):
+async def search_music_video(media: str, service: str, query: str, filter_for_best_match: str = 'true', media_types: str = None, is_explicit: str = None, country_code: str = 'us', exclude_services: str = None, deadline: float = None, stream: str = None):
 	# Prepare everything for the API request
 	media = media.lower()
 	if media == 'knowledge':
@@ -161,24 +331,28 @@ async def search_music_video(media: str, service: str, query: str, filter_for_be
 
 	# Check if the queried service is the Global Interface, so we know whether we need to plug in the exclude_services parameter into it or not
 	if service == 'global_io':
-		query_object = await service_api.search_query(
+		query_call = service_api.search_query(
 			query = query,
 			filter_for_best_match = filter_for_best_match,
 			media_types = media_types,
 			is_explicit = is_explicit,
 			country_code = country_code,
-			exclude_services = exclude_services
+			exclude_services = exclude_services,
+			deadline = deadline
 		)
 	else:
-		query_object = await service_api.search_query(
+		query_call = service_api.search_query(
 			query = query,
 			filter_for_best_match = filter_for_best_match,
 			media_types = media_types,
 			is_explicit = is_explicit,
 			country_code = country_code
 		)
+	if stream is not None:
+		return streamed(query_call, stream)
+	query_object = await query_call
 	if query_object.type not in illegal_results:
-		return query_object.json
+		return MediaResponse(query_object)
 	else:
 		raise HTTPException(status_code = query_object.meta.http_code, detail = query_object.error_msg if query_object.type == 'error' else None)
 
@@ -194,7 +368,7 @@ async def search_music_video(media: str, service: str, query: str, filter_for_be
 
 # Song Lookup for media services
 @app.get("/{media}/{service}/lookup_song")
-async def lookup_song(media: str, service: str, id: str, id_service: str = None, country_code: str = 'us'):
+async def lookup_song(media: str, service: str, id: str, id_service: str = None, country_code: str = 'us', deadline: float = None, stream: str = None):
 	# Prepare everything for the API request
 	media = media.lower()
 	if media == 'knowledge':
@@ -202,39 +376,12 @@ async def lookup_song(media: str, service: str, id: str, id_service: str = None,
 	service = service.lower()
 	id_service = id_service.lower() if id_service is not None else None
 	country_code = country_code.lower()
-	# Request from the correct API endpoint
-	if id_service == service or id_service is None: # Check if the supplied ID service is empty or the same as the service in the path
-		# Get the service's correct object variable
-		service_api = get_service_catalog_api(media, service)
-		song_object = await service_api.lookup_song(id, country_code) # If so, assume the user wants to query the path service with the ID
-	else: # If they are different, the user wants to do a Global Interface request or wants to request from a different service
-		# Get the ID service's correct object variable
-		if id_service in music_media_services:
-			id_service_api = get_service_catalog_api('music', id_service)
-		elif id_service in knowledge_media_services:
-			id_service_api = get_service_catalog_api('knowledge', id_service)
-		# Request from the Global Interface if that's what the user wants
-		if service == 'global_io':
-			# Get the service's correct object variable
-			service_api = get_service_catalog_api(media, service)
-			song_object = await service_api.lookup_song(id_service_api, id, country_code, country_code)
-		else:
-			# Request for the song from the ID service
-			# We'll use its data to construct a query request for a path service song search 
-			id_service_song_object = await id_service_api.lookup_song(id = id, country_code = country_code)
-			# Get the service's correct object variable
-			service_api = get_service_catalog_api(media, service)
-			# Query the service for the song
-			song_object = await service_api.search_song(
-				artists = [artist.name for artist in id_service_song_object.artists],
-				title = id_service_song_object.title,
-				song_type = id_service_song_object.type,
-				collection = id_service_song_object.collection.title if 'collection' in id_service_song_object.json and id_service_song_object.json['collection'] != None else None,
-				is_explicit = id_service_song_object.is_explicit,
-				country_code = country_code,
-			)
+	song_call = lookup_media('song', media, service, id, id_service, country_code, deadline)
+	if stream is not None:
+		return streamed(song_call, stream)
+	song_object = await song_call
 	if song_object.type not in illegal_results:
-		return song_object.json
+		return MediaResponse(song_object)
 	else:
 		raise HTTPException(status_code = song_object.meta.http_code, detail = song_object.error_msg if song_object.type == 'error' else None)
 
@@ -242,7 +389,7 @@ async def lookup_song(media: str, service: str, id: str, id_service: str = None,
 
 # Music Video Lookup for media services
 @app.get("/{media}/{service}/lookup_music_video")
-async def lookup_music_video(media: str, service: str, id: str, id_service: str = None, country_code: str = 'us'):
+async def lookup_music_video(media: str, service: str, id: str, id_service: str = None, country_code: str = 'us', deadline: float = None, stream: str = None):
 	# Prepare everything for the API request
 	media = media.lower()
 	if media == 'knowledge':
@@ -250,37 +397,12 @@ async def lookup_music_video(media: str, service: str, id: str, id_service: str
 	service = service.lower()
 	id_service = id_service.lower() if id_service is not None else None
 	country_code = country_code.lower()
-	# Request from the correct API endpoint
-	if id_service == service or id_service is None: # Check if the supplied ID service is empty or the same as the service in the path
-		# Get the service's correct object variable
-		service_api = get_service_catalog_api(media, service)
-		music_video_object = await service_api.lookup_music_video(id, country_code) # If so, assume the user wants to query the path service with the ID
-	else: # If they are different, the user wants to do a Global Interface request or wants to request from a different service
-		# Get the ID service's correct object variable
-		if id_service in music_media_services:
-			id_service_api = get_service_catalog_api('music', id_service)
-		elif id_service in knowledge_media_services:
-			id_service_api = get_service_catalog_api('knowledge', id_service)
-		# Request from the Global Interface if that's what the user wants
-		if service == 'global_io':
-			# Get the service's correct object variable
-			service_api = get_service_catalog_api(media, service)
-			music_video_object = await service_api.lookup_music_video(id_service_api, id, country_code, country_code)
-		else:
-			# Request for the music_video from the ID service
-			# We'll use its data to construct a query request for a path service music video search 
-			id_service_music_video_object = await id_service_api.lookup_music_video(id = id, country_code = country_code)
-			# Get the service's correct object variable
-			service_api = get_service_catalog_api(media, service)
-			# Query the service for the music_video
-			music_video_object = await service_api.search_music_video(
-				artists = [artist.name for artist in id_service_music_video_object.artists],
-				title = id_service_music_video_object.title,
-				is_explicit = id_service_music_video_object.is_explicit,
-				country_code = country_code,
-			)
+	music_video_call = lookup_media('music_video', media, service, id, id_service, country_code, deadline)
+	if stream is not None:
+		return streamed(music_video_call, stream)
+	music_video_object = await music_video_call
 	if music_video_object.type not in illegal_results:
-		return music_video_object.json
+		return MediaResponse(music_video_object)
 	else:
 		raise HTTPException(status_code = music_video_object.meta.http_code, detail = music_video_object.error_msg if music_video_object.type == 'error' else None)
 
@@ -288,7 +410,7 @@ async def lookup_music_video(media: str, service: str, id: str, id_service: str
 
 # Collection Lookup for media services
 @app.get("/{media}/{service}/lookup_collection")
-async def lookup_collection(media: str, service: str, id: str, id_service: str = None, country_code: str = 'us'):
+async def lookup_collection(media: str, service: str, id: str, id_service: str = None, country_code: str = 'us', deadline: float = None, stream: str = None):
 	# Prepare everything for the API request
 	media = media.lower()
 	if media == 'knowledge':
@@ -296,42 +418,63 @@ async def lookup_collection(media: str, service: str, id: str, id_service: str =
 	service = service.lower()
 	id_service = id_service.lower() if id_service is not None else None
 	country_code = country_code.lower()
-	# Request from the correct API endpoint
-	if id_service == service or id_service is None: # Check if the supplied ID service is empty or the same as the service in the path
-		# Get the service's correct object variable
-		service_api = get_service_catalog_api(media, service)
-		collection_object = await service_api.lookup_collection(id, country_code) # If so, assume the user wants to query the path service with the ID
-	else: # If they are different, the user wants to do a Global Interface request or wants to request from a different service
-		# Get the ID service's correct object variable
-		if id_service in music_media_services:
-			id_service_api = get_service_catalog_api('music', id_service)
-		elif id_service in knowledge_media_services:
-			id_service_api = get_service_catalog_api('knowledge', id_service)
-		# Request from the Global Interface if that's what the user wants
-		if service == 'global_io':
-			# Get the service's correct object variable
-			service_api = get_service_catalog_api(media, service)
-			collection_object = await service_api.lookup_collection(id_service_api, id, country_code, country_code)
-		else:
-			# Request for the collection from the ID service
-			# We'll use its data to construct a query request for a path service collection search 
-			id_service_collection_object = await id_service_api.lookup_collection(id = id, country_code = country_code)
-			# Get the service's correct object variable
-			service_api = get_service_catalog_api(media, service)
-			# Query the service for the collection
-			collection_object = await service_api.search_collection(
-				artists = [artist.name for artist in id_service_collection_object.artists],
-				title = id_service_collection_object.title,
-				year = id_service_collection_object.release_year,
-				country_code = country_code
-			)
+	collection_call = lookup_media('collection', media, service, id, id_service, country_code, deadline)
+	if stream is not None:
+		return streamed(collection_call, stream)
+	collection_object = await collection_call
 	if collection_object.type not in illegal_results:
-		return collection_object.json
+		return MediaResponse(collection_object)
 	else:
 		raise HTTPException(status_code = collection_object.meta.http_code, detail = collection_object.error_msg if collection_object.type == 'error' else None)
 
 
 
+# Batch Lookup for media services
+@app.post("/{media}/{service}/lookup_batch")
+async def lookup_batch(media: str, service: str, batch: Request):
+	# The body looks like {"media_type": "song", "ids": ["...", "..."], "id_service": "spotify", "country_code": "us", "deadline": 10}
+	# Prepare everything for the API request
+	media = media.lower()
+	if media == 'knowledge':
+		raise HTTPException(status_code=404, detail="The knowledge endpoint has been deprecated as of March 31st, 2026, due to Genius TOS changes.")
+	service = service.lower()
+	if not service_registry.registered(media, service):
+		raise HTTPException(status_code = 404, detail = f"There's no {service} service for {media}.")
+	batch = await json_object(batch)
+	media_type = str(batch.get('media_type', 'song')).lower()
+	ids = batch.get('ids')
+	id_service = str(batch['id_service']).lower() if batch.get('id_service') is not None else None
+	country_code = str(batch.get('country_code', 'us')).lower()
+	deadline = batch.get('deadline')
+	if media_type not in batch_media_types:
+		raise HTTPException(status_code = 400, detail = f"media_type has to be one of: {', '.join(batch_media_types)}.")
+	if not isinstance(ids, list) or ids == [] or len(ids) > batch_size_limit:
+		raise HTTPException(status_code = 400, detail = f"ids has to be a list of 1 to {batch_size_limit} IDs.")
+	if id_service is not None and id_service != service and id_service not in music_media_services:
+		raise HTTPException(status_code = 400, detail = f"id_service has to be one of: {', '.join(music_media_services)}.")
+	# The Global Interface can only look up IDs of other services
+	if service == 'global_io' and id_service not in music_media_services:
+		raise HTTPException(status_code = 400, detail = f"global_io needs an id_service, one of: {', '.join(music_media_services)}.")
+	if deadline is not None and (isinstance(deadline, bool) or not isinstance(deadline, (int, float)) or not 0 < deadline < float('inf')):
+		raise HTTPException(status_code = 400, detail = "deadline has to be a positive number of seconds.")
+
+	async def lookup_item(id: str) -> dict:
+		try:
+			media_object = await lookup_media(media_type, media, service, str(id), id_service, country_code, deadline)
+		except Exception:
+			# Whatever broke is ours to look into, not something to show the client
+			return {'id': id, 'http_code': 500, 'error_msg': 'Internal Server Error', 'result': None}
+		if media_object.type not in illegal_results:
+			return {'id': id, 'http_code': 200, 'error_msg': None, 'result': media_object}
+		return {'id': id, 'http_code': media_object.meta.http_code, 'error_msg': media_object.error_msg if media_object.type == 'error' else None, 'result': None}
+
+	# Every ID gets looked up at the same time, so lookups on services with bulk endpoints get batched into as few requests as possible,
+	# and the same ID (or the same song being searched for on another service) only gets looked up once thanks to the response cache and single-flight
+	results = await asyncio.gather(*[lookup_item(id) for id in ids])
+	return MediaResponse({'type': 'lookup_batch', 'service': service, 'media_type': media_type, 'results': results})
+
+
+
 # Artist Lookup for media services
 @app.get("/{media}/{service}/lookup_artist")
 async def lookup_artist(media: str, service: str, id: str, id_service: str = None, country_code: str = 'us'):
@@ -352,7 +495,7 @@ async def lookup_artist(media: str, service: str, id: str, id_service: str = Non
 	artist_object = await service_api.lookup_artist(id, country_code)
 
 	if artist_object.type not in illegal_results:
-		return artist_object.json
+		return MediaResponse(artist_object)
 	else:
 		raise HTTPException(status_code = artist_object.meta.http_code, detail = artist_object.error_msg if artist_object.type == 'error' else None)
 
@@ -362,6 +505,77 @@ async def lookup_artist(media: str, service: str, id: str, id_service: str = Non
 
 
 
+# --------------------------------
+# --- Conversion Job Endpoints ---
+# --------------------------------
+
+async def collection_items(service: str, id: str, country_code: str) -> list[dict]:
+	# A collection gets converted track by track, in the order they're on the collection
+	tracks = await get_service_catalog_api('music', service).lookup_collection_tracks(id = id, country_code = country_code)
+	if not isinstance(tracks, list):
+		raise HTTPException(status_code = tracks.meta.http_code if tracks.type == 'error' else 404, detail = tracks.error_msg if tracks.type == 'error' else f"The collection {id} on {service} has no tracks.")
+	return [{'media_type': 'song', 'service': service, 'id': track_id} for track_id in tracks]
+
+
+
+@app.post("/jobs", status_code = 202)
+async def submit_job(job: Request):
+	# The body looks like {"items": [{"media_type": "song", "service": "spotify", "id": "..."}, ...], "collections": [{"service": "spotify", "id": "..."}, ...], "country_code": "us"}
+	# Items get converted as they are, collections get expanded into one song item for every track on them, after the items
+	job = await json_object(job)
+	items = job.get('items', [])
+	collections = job.get('collections', [])
+	country_code = str(job.get('country_code', 'us')).lower()
+	if not isinstance(items, list) or not isinstance(collections, list) or items + collections == [] or len(items) > job_size_limit:
+		raise HTTPException(status_code = 400, detail = f"items and collections have to be lists, with 1 to {job_size_limit} items between them.")
+	try:
+		items = [{'media_type': str(item['media_type']).lower(), 'service': str(item['service']).lower(), 'id': str(item['id'])} for item in items]
+		collections = [{'service': str(collection['service']).lower(), 'id': str(collection['id'])} for collection in collections]
+	except (TypeError, KeyError):
+		raise HTTPException(status_code = 400, detail = "Every item has to have a media_type, service and id, and every collection a service and id.")
+	for item in items:
+		if item['media_type'] not in batch_media_types:
+			raise HTTPException(status_code = 400, detail = f"media_type has to be one of: {', '.join(batch_media_types)}.")
+	for item in items + collections:
+		if item['service'] not in music_media_services:
+			raise HTTPException(status_code = 400, detail = f"service has to be one of: {', '.join(music_media_services)}.")
+	if not job_manager.running:
+		raise HTTPException(status_code = 503, detail = "Jobs aren't being converted right now.")
+	for tracks in await asyncio.gather(*[collection_items(collection['service'], collection['id'], country_code) for collection in collections]):
+		items += tracks
+	if len(items) > job_size_limit:
+		raise HTTPException(status_code = 400, detail = f"Jobs can have at most {job_size_limit} items, these collections add up to {len(items)}.")
+	job_id = await job_manager.submit(items, country_code)
+	return {'type': 'job', 'job_id': job_id, 'status': 'running', 'total': len(items), 'done': 0}
+
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str, stream: str = None):
+	# Polling returns the job with every result that's done so far, streaming sends every item as it gets done
+	if stream is not None:
+		stream = checked_stream_format(stream)
+	job = await job_manager.get(job_id, include_items = stream is None)
+	if job is None:
+		raise HTTPException(status_code = 404, detail = "There's no such job, or it expired.")
+	if stream is not None:
+		return MediaStream(job_manager.progress(job_id), stream)
+	return MediaResponse({'type': 'job', **job})
+
+
+
+@app.delete("/jobs/{job_id}", status_code = 204)
+async def delete_job(job_id: str):
+	# Results are kept for a day after the job is done, clients that have them can clean up right away
+	if not await job_manager.delete(job_id):
+		raise HTTPException(status_code = 404, detail = "There's no such job, or it expired.")
+
+
+
+
+
+
+
 # ----------------------------
 # --- Snitch API Endpoints ---
 # ----------------------------
@@ -370,9 +584,9 @@ async def lookup_artist(media: str, service: str, id: str, id_service: str = Non
 async def snitch_media(media: Request):
 	media = await media.json()
 	# Prepare everything for the API request
-	media_object = await Snitch.detection_services.global_io.check_media(media)
+	media_object = await service_registry.get('snitch', 'global_io').check_media(media)
 	if media_object.type not in illegal_results:
-		return media_object.json
+		return MediaResponse(media_object)
 	else:
 		raise HTTPException(status_code = media_object.meta.http_code, detail = media_object.error_msg if media_object.type == 'error' else None)
 
@@ -384,9 +598,9 @@ async def lookup_song(id: str, id_service: str = None, country_code: str = 'us')
 	id_service = id_service.lower() if id_service is not None else None
 	country_code = country_code.lower()
 	service_api = get_service_catalog_api('music', id_service)
-	song_object = await Snitch.detection_services.global_io.check_song(service_api, id, country_code, country_code)
+	song_object = await service_registry.get('snitch', 'global_io').check_song(service_api, id, country_code, country_code)
 	if song_object.type not in illegal_results:
-		return song_object.json
+		return MediaResponse(song_object)
 	else:
 		raise HTTPException(status_code = song_object.meta.http_code, detail = song_object.error_msg if song_object.type == 'error' else None)
 	
@@ -398,9 +612,9 @@ async def lookup_song(id: str, id_service: str = None, country_code: str = 'us')
 	id_service = id_service.lower() if id_service is not None else None
 	country_code = country_code.lower()
 	service_api = get_service_catalog_api('music', id_service)
-	music_video_object = await Snitch.detection_services.global_io.check_music_video(service_api, id, country_code, country_code)
+	music_video_object = await service_registry.get('snitch', 'global_io').check_music_video(service_api, id, country_code, country_code)
 	if music_video_object.type not in illegal_results:
-		return music_video_object.json
+		return MediaResponse(music_video_object)
 	else:
 		raise HTTPException(status_code = music_video_object.meta.http_code, detail = music_video_object.error_msg if music_video_object.type == 'error' else None)
 
@@ -412,8 +626,104 @@ async def lookup_collection(id: str, id_service: str = None, country_code: str =
 	id_service = id_service.lower() if id_service is not None else None
 	country_code = country_code.lower()
 	service_api = get_service_catalog_api('music', id_service)
-	collection_object = await Snitch.detection_services.global_io.check_collection(service_api, id, country_code, country_code)
+	collection_object = await service_registry.get('snitch', 'global_io').check_collection(service_api, id, country_code, country_code)
 	if collection_object.type not in illegal_results:
-		return collection_object.json
+		return MediaResponse(collection_object)
 	else:
-		raise HTTPException(status_code = collection_object.meta.http_code, detail = collection_object.error_msg if collection_object.type == 'error' else None)
\ No newline at end of file
+		raise HTTPException(status_code = collection_object.meta.http_code, detail = collection_object.error_msg if collection_object.type == 'error' else None)
+
+
+
+
+
+
+
+# ----------------------------
+# --- System API Endpoints ---
+# ----------------------------
+
+@app.get("/system/cache")
+async def system_cache():
+	# Hit, miss and eviction counters of the response cache
+	return {**response_cache.stats, 'memory_entries': len(response_cache.memory.entries)}
+
+
+
+@app.get("/system/id_map")
+async def system_id_map():
+	# Hit and miss counters of the cross-service ID map
+	return id_map.stats
+
+
+
+@app.get("/system/single_flight")
+async def system_single_flight():
+	# How many requests ran and how many piggybacked on an identical one that was already running
+	return {**single_flight.stats, 'in_flight': len(single_flight.flights)}
+
+
+
+@app.get("/system/circuit_breakers")
+async def system_circuit_breakers():
+	# State, rolling error rate and latency, and recent state changes of every service's circuit breaker
+	return resolve(circuit_breakers_path).json
+
+
+
+@app.get("/system/services")
+async def system_services():
+	# Which services have been loaded, how long they took to import and whether their startup hooks failed
+	return {**service_registry.json, 'loaded_services': [f'{kind}/{name}' for kind, name in service_registry.services]}
+
+
+
+@app.get("/system/jobs")
+async def system_jobs():
+	# Jobs and items submitted, conversions run and how many items shared a conversion with another job
+	return {**job_manager.stats, 'queued': job_manager.queued, 'pending_conversions': len(job_manager.waiting)}
+
+
+
+@app.get("/system/stage_times")
+async def system_stage_times():
+	# Average and worst milliseconds every component of every service spent in each stage
+	return stage_stats.json
+
+
+
+@metrics.collector
+def collect_internal_stats():
+	# Stats the internal components keep anyway, read only when /metrics gets scraped
+	mirror_stats('response_cache', response_cache.stats)
+	mirror_stats('id_map', id_map.stats)
+	mirror_stats('single_flight', single_flight.stats)
+	mirror_stats('log_pipeline', log_pipeline.stats)
+	mirror_stats('jobs', job_manager.stats)
+	mirror_hit_ratio('response_cache', response_cache.stats['hits'], response_cache.stats['misses'])
+	mirror_hit_ratio('id_map', id_map.stats['hits'], id_map.stats['misses'])
+	# Services that haven't been loaded yet have nothing to report, and scraping shouldn't load them
+	for name, path in bulk_batchers.items():
+		batcher = resolve_loaded(path)
+		if batcher is not None:
+			mirror_stats(f'batcher_{name}', batcher.stats)
+	internal_state.set('response_cache', 'memory_entries', value = len(response_cache.memory.entries))
+	internal_state.set('single_flight', 'in_flight', value = len(single_flight.flights))
+	internal_state.set('jobs', 'queued', value = job_manager.queued)
+	internal_state.set('jobs', 'pending_conversions', value = len(job_manager.waiting))
+	circuit_breakers = resolve_loaded(circuit_breakers_path)
+	for service, breaker in (circuit_breakers.breakers.items() if circuit_breakers is not None else []):
+		circuit_breaker_state.set(service, value = circuit_breaker_states[breaker.state])
+		circuit_breaker_error_rate.set(service, value = breaker.error_rate)
+	for pool in executor_manager.executors:
+		workers = executor_limits.get(pool, executor_limits['default'])['workers']
+		in_flight = executor_manager.in_flight.get(pool, 0)
+		executor_calls_in_flight.set(pool, value = in_flight)
+		executor_calls_waiting.set(pool, value = executor_manager.waiting.get(pool, 0))
+		executor_utilization.set(pool, value = in_flight / workers)
+
+
+
+@app.get("/metrics")
+async def system_metrics():
+	# Request, upstream, component, event loop and internal component metrics in the Prometheus text format
+	return Response(metrics.render(), media_type = 'text/plain; version=0.0.4')
\ No newline at end of file